@@ -2,19 +2,22 @@
 import asyncio
 import json
 import logging
+import sqlite3
 from collections.abc import AsyncGenerator
 
-from fastapi import APIRouter, Request
+from fastapi import APIRouter, Depends, Request
 from fastapi.responses import StreamingResponse
 
-from babylon60.extensions.signals.bus import AsyncSignalBus
+from babylon60.auth import AuthResult, require_permission
+from babylon60.extensions.signals.fanout import get_signal_hub
+from babylon60.routes.events import parse_last_event_id
 
 router = APIRouter(prefix="/v1/public/events", tags=["events"])
 logger = logging.getLogger("babylon60.api.events")
 
 
-async def event_generator(request: Request) -> AsyncGenerator[str, None]:
-    """Polls AsyncSignalBus and yields SSE events to the client."""
+async def event_generator(request: Request, tenant_id: str) -> AsyncGenerator[str, None]:
+    """Streams signals to the client through the process-wide fan-out hub."""
     # Get the shared database pool from app state
     pool = getattr(request.app.state, "pool", None)
     if not pool:
@@ -22,47 +25,48 @@ async def event_generator(request: Request) -> AsyncGenerator[str, None]:
         yield 'data: {"error": "Database pool not available"}\n\n'
         return
 
-    # Use the pool to get a connection and initialize the bus
-    async with pool.acquire() as conn:
-        bus = AsyncSignalBus(conn)
-        consumer_id = f"sse_{id(request)}"
+    stream = get_signal_hub(pool).stream(tenant_id, last_event_id=parse_last_event_id(request))
+    consumer_id = f"sse_{id(request)}"
+    logger.info("SSE: Client connected: %s", consumer_id)
 
-        logger.info("SSE: Client connected: %s", consumer_id)
+    try:
+        async for sig in stream:
+            # Check for disconnection
+            if await request.is_disconnected():
+                logger.info("SSE: Client disconnected: %s", consumer_id)
+                break
 
-        try:
-            while True:
-                # Check for disconnection
-                if await request.is_disconnected():
-                    logger.info("SSE: Client disconnected: %s", consumer_id)
-                    break
+            if isinstance(sig, int):
+                yield f"event: dropped\ndata: {json.dumps({'count': sig})}\n\n"
+                continue
 
-                # Poll for new signals
-                signals = await bus.poll(consumer=consumer_id, limit=10)
+            # Construct SSE message
+            event_data = {
+                "id": sig.id,
+                "event_type": sig.event_type,
+                "payload": sig.payload,
+                "source": sig.source,
+                "created_at": sig.created_at.isoformat()
+                if hasattr(sig.created_at, "isoformat")
+                else sig.created_at,
+            }
+            yield f"id: {sig.id}\nevent: {sig.event_type}\ndata: {json.dumps(event_data)}\n\n"
 
-                for sig in signals:
-                    # Construct SSE message
-                    event_data = {
-                        "id": sig.id,
-                        "event_type": sig.event_type,
-                        "payload": sig.payload,
-                        "source": sig.source,
-                        "created_at": sig.created_at.isoformat()
-                        if hasattr(sig.created_at, "isoformat")
-                        else sig.created_at,
-                    }
-                    yield f"event: {sig.event_type}\ndata: {json.dumps(event_data)}\n\n"
-
-                # 1-second pulse interval for O(1) efficiency
-                await asyncio.sleep(1)
-
-        except asyncio.CancelledError:
-            logger.info("SSE: Stream cancelled for %s", consumer_id)
-        except (ValueError, KeyError, OSError) as e:
-            logger.error("SSE: Stream error: %s", e)
-            yield f'data: {{"error": "{e!s}"}}\n\n'
+    except asyncio.CancelledError:
+        logger.info("SSE: Stream cancelled for %s", consumer_id)
+    except (ValueError, KeyError, OSError, sqlite3.Error) as e:
+        logger.error("SSE: Stream error: %s", e)
+        yield f'data: {{"error": "{e!s}"}}\n\n'
+    finally:
+        await stream.aclose()
 
 
 @router.get("/stream")
-async def stream_events(request: Request):
-    """Server-Sent Events endpoint for real-time CORTEX telemetry."""
-    return StreamingResponse(event_generator(request), media_type="text/event-stream")
+async def stream_events(
+    request: Request,
+    auth: AuthResult = Depends(require_permission("read")),
+):
+    """Server-Sent Events endpoint for real-time CORTEX telemetry (caller's tenant)."""
+    return StreamingResponse(
+        event_generator(request, auth.tenant_id), media_type="text/event-stream"
+    )
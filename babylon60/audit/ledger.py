@@ -7,9 +7,14 @@ a hash-chain to prove immutability of the audit logs.
 """
 
 import logging
+import multiprocessing
 import os
 import time
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -40,6 +45,93 @@ CREATE TABLE IF NOT EXISTS security_audit_log (
 );
 """
 
+_CREATE_WATERMARK_SQL = """
+CREATE TABLE IF NOT EXISTS security_audit_watermark (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    verified_rowid INTEGER NOT NULL,
+    chain_hash TEXT NOT NULL,
+    signature TEXT NOT NULL,
+    verified_at TEXT NOT NULL
+);
+"""
+
+_AUDIT_COLUMNS = (
+    "rowid, audit_id, timestamp, tenant_id, actor_role, actor_id, action, "
+    "resource, status, prev_hash, signature, external_anchor"
+)
+(
+    _ROWID,
+    _AUDIT_ID,
+    _TIMESTAMP,
+    _TENANT_ID,
+    _ACTOR_ROLE,
+    _ACTOR_ID,
+    _ACTION,
+    _RESOURCE,
+    _STATUS,
+    _PREV_HASH,
+    _SIGNATURE,
+    _EXTERNAL_ANCHOR,
+) = range(12)
+
+# Rows fetched per page by verify_chain; each page is one process-pool job.
+_VERIFY_PAGE_SIZE = 5000
+
+# Below this many unverified rows a process pool costs more than it saves.
+_MIN_POOL_ROWS = 50_000
+
+
+@lru_cache(maxsize=1)
+def _legacy_tree() -> Any:
+    from babylon60.audit.smt import LegacyPathTree
+
+    return LegacyPathTree()
+
+
+def _verify_batches(
+    public_key_raw: bytes, batches: list[list[tuple]]
+) -> list[tuple[str | None, tuple[str, str] | None]]:
+    """Check row hashes and the signature of each batch (process-pool worker).
+
+    Returns ``(entry_hash, failure)`` per batch, where ``failure`` is
+    ``(audit_id, reason)``. Chain linkage between batches is left to the caller.
+    The legacy batch root only depends on the batch's last audit id, so each
+    batch is verified independently of the ones before it.
+    """
+    public_key = ed25519.Ed25519PublicKey.from_public_bytes(public_key_raw)
+    tree = _legacy_tree()
+    results: list[tuple[str | None, tuple[str, str] | None]] = []
+    for rows in batches:
+        failure = None
+        for row in rows:
+            fields = row[_TIMESTAMP : _STATUS + 1]
+            if row[_AUDIT_ID] not in (
+                cortex_hash("|".join(fields).encode()),
+                cortex_hash("".join(fields).encode()),
+            ):
+                failure = (row[_AUDIT_ID], "row_hash_mismatch")
+                break
+        if failure:
+            results.append((None, failure))
+            continue
+
+        first = rows[0]
+        if len(rows) == 1 and first[_ACTION] == "COMPACTION_NODE":
+            payload = f"COMPACTION:{first[_PREV_HASH]}:{first[_STATUS]}:{first[_RESOURCE]}"
+            entry_hash, signed, reason = first[_STATUS], payload, "invalid_compaction_signature"
+        else:
+            last_id = rows[-1][_AUDIT_ID]
+            merkle_root = tree.update(cortex_hash(last_id.encode()), last_id)
+            tree.db.clear()
+            entry_hash = cortex_hash(f"merkle_batch:{merkle_root}:{first[_PREV_HASH]}".encode())
+            signed, reason = entry_hash, "invalid_signature"
+        try:
+            public_key.verify(bytes.fromhex(first[_SIGNATURE]), signed.encode())
+        except (InvalidSignature, ValueError):
+            failure = (first[_AUDIT_ID], reason)
+        results.append((entry_hash, failure))
+    return results
+
 
 import asyncio
 import fcntl
@@ -139,6 +231,7 @@ class EnterpriseAuditLedger:
                 if self._ready:
                     return
                 await self._conn.execute(_CREATE_AUDIT_SQL)
+                await self._conn.execute(_CREATE_WATERMARK_SQL)
 
                 try:
                     await self._conn.execute(
@@ -183,195 +276,293 @@ class EnterpriseAuditLedger:
                 pass
             self._batch_task = None
 
-    async def verify_chain(self) -> dict[str, Any]:
-        """Perform a full verification of the cryptographic chain.
-        Returns {'status': 'verified'} if pristine, or {'status': 'tampered', 'corrupted_audit_id': id} if broken.
-        """
-        import json
-
-        await self.ensure_table()
-
-        # [C5-REAL] Verify pinned public key from environment/config if present
+    async def _check_pinned_public_key(self) -> dict[str, Any] | None:
+        """Reject verification when the ledger key differs from the pinned one."""
         pinned_pub_pem = os.environ.get("MOSKV_LEDGER_PUBLIC_KEY") or os.environ.get(
             "CORTEX_LEDGER_PUBLIC_KEY"
         )
-        if pinned_pub_pem:
-            try:
-                pinned_bytes = pinned_pub_pem.encode("utf-8")
-                if b"PUBLIC KEY" in pinned_bytes:
-                    pinned_key = serialization.load_pem_public_key(pinned_bytes)
-                else:
-                    pinned_key = ed25519.Ed25519PublicKey.from_public_bytes(
-                        bytes.fromhex(pinned_pub_pem)
-                    )
-
-                my_bytes = self.public_key.public_bytes(
-                    encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
-                )
-                pinned_raw_bytes = pinned_key.public_bytes(
-                    encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
-                )
-                if my_bytes != pinned_raw_bytes:
-                    return {
-                        "status": "tampered",
-                        "corrupted_audit_id": "GENESIS",
-                        "reason": "ledger_public_key_mismatch",
-                    }
-            except Exception as e:
-                logger.error("Failed to verify pinned ledger public key: %s", e)
-                return {
-                    "status": "tampered",
-                    "corrupted_audit_id": "GENESIS",
-                    "reason": f"invalid_pinned_public_key: {e}",
-                }
-
-        async with self._conn.execute(
-            "SELECT rowid, audit_id, timestamp, tenant_id, actor_role, actor_id, action, resource, status, prev_hash, signature, external_anchor FROM security_audit_log ORDER BY rowid ASC"
-        ) as cursor:
-            description = cursor.description
-            col_map = {col[0]: idx for idx, col in enumerate(description)} if description else {}
-            rows_raw = list(await cursor.fetchall())
-
-        rows = []
-        for r in rows_raw:
-            if hasattr(r, "keys") or isinstance(r, dict):
-                rows.append(r)
+        if not pinned_pub_pem:
+            return None
+        try:
+            pinned_bytes = pinned_pub_pem.encode("utf-8")
+            if b"PUBLIC KEY" in pinned_bytes:
+                pinned_key = serialization.load_pem_public_key(pinned_bytes)
             else:
-                rows.append({col: r[idx] for col, idx in col_map.items()})
-
-        if not rows:
-            return {"status": "verified", "blocks": 0}
-
-        # Group by batch (same prev_hash and signature)
-        batches: list[tuple[str, str, list[Any]]] = []
-        current_batch: list[Any] = []
-        current_prev_hash = rows[0]["prev_hash"]
-        current_sig = rows[0]["signature"]
+                pinned_key = ed25519.Ed25519PublicKey.from_public_bytes(
+                    bytes.fromhex(pinned_pub_pem)
+                )
 
-        for row in rows:
-            # Validate individual audit_id to detect row-level tampering
-            expected_audit_id_v2 = cortex_hash(
-                f"{row['timestamp']}|{row['tenant_id']}|{row['actor_role']}|{row['actor_id']}|{row['action']}|{row['resource']}|{row['status']}".encode()
+            my_bytes = self.public_key.public_bytes(
+                encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
             )
-            expected_audit_id_v1 = cortex_hash(
-                f"{row['timestamp']}{row['tenant_id']}{row['actor_role']}{row['actor_id']}{row['action']}{row['resource']}{row['status']}".encode()
+            pinned_raw_bytes = pinned_key.public_bytes(
+                encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
             )
-            if row["audit_id"] not in (expected_audit_id_v2, expected_audit_id_v1):
+            if my_bytes != pinned_raw_bytes:
                 return {
                     "status": "tampered",
-                    "corrupted_audit_id": row["audit_id"],
-                    "reason": "row_hash_mismatch",
+                    "corrupted_audit_id": "GENESIS",
+                    "reason": "ledger_public_key_mismatch",
                 }
+        except Exception as e:
+            logger.error("Failed to verify pinned ledger public key: %s", e)
+            return {
+                "status": "tampered",
+                "corrupted_audit_id": "GENESIS",
+                "reason": f"invalid_pinned_public_key: {e}",
+            }
+        return None
+
+    async def _iter_batch_pages(
+        self, after_rowid: int, page_size: int
+    ) -> AsyncIterator[list[list[tuple]]]:
+        """Yield complete (prev_hash, signature) batches, one rowid page at a time.
+
+        The trailing batch of a page is held back until the next page shows
+        where it ends, so a batch is never split across two verification jobs.
+        """
+        carry: list[tuple] = []
+        while True:
+            cursor = await self._conn.execute(
+                f"SELECT {_AUDIT_COLUMNS} FROM security_audit_log "
+                "WHERE rowid > ? ORDER BY rowid ASC LIMIT ?",
+                (after_rowid, page_size),
+            )
+            page = [tuple(r) for r in await cursor.fetchall()]
+            if not page:
+                break
+            after_rowid = page[-1][_ROWID]
+
+            batches: list[list[tuple]] = []
+            current = carry
+            for row in page:
+                if current and (
+                    row[_PREV_HASH] != current[0][_PREV_HASH]
+                    or row[_SIGNATURE] != current[0][_SIGNATURE]
+                ):
+                    batches.append(current)
+                    current = []
+                current.append(row)
+            carry = current
+            if batches:
+                yield batches
+            if len(page) < page_size:
+                break
+        if carry:
+            yield [carry]
+
+    async def _load_watermark(self) -> tuple[int, str]:
+        """Return ``(rowid, chain_hash)`` to resume from, or GENESIS if it is stale.
+
+        The watermark is only trusted while the row it points at still carries
+        the signature recorded with it; compaction or truncation resets it.
+        """
+        cursor = await self._conn.execute(
+            "SELECT verified_rowid, chain_hash, signature FROM security_audit_watermark "
+            "WHERE id = 1"
+        )
+        mark = await cursor.fetchone()
+        if not mark:
+            return 0, "GENESIS"
+        cursor = await self._conn.execute(
+            "SELECT signature FROM security_audit_log WHERE rowid = ?", (mark[0],)
+        )
+        row = await cursor.fetchone()
+        if not row or row[0] != mark[2]:
+            logger.warning("[AuditLedger] Verification watermark at rowid %s is stale", mark[0])
+            return 0, "GENESIS"
+        return mark[0], mark[1]
 
-            if row["prev_hash"] == current_prev_hash and row["signature"] == current_sig:
-                current_batch.append(row)
-            else:
-                batches.append((current_prev_hash, current_sig, current_batch))
-                current_prev_hash = row["prev_hash"]
-                current_sig = row["signature"]
-                current_batch = [row]
+    async def _store_watermark(self, rowid: int, chain_hash: str, signature: str) -> None:
+        in_tx_before = self._conn.in_transaction
+        with causal_write(self._conn):
+            await self._conn.execute(
+                """INSERT INTO security_audit_watermark
+                   (id, verified_rowid, chain_hash, signature, verified_at)
+                   VALUES (1, ?, ?, ?, ?)
+                   ON CONFLICT(id) DO UPDATE SET
+                       verified_rowid = excluded.verified_rowid,
+                       chain_hash = excluded.chain_hash,
+                       signature = excluded.signature,
+                       verified_at = excluded.verified_at""",
+                (rowid, chain_hash, signature, datetime.now(timezone.utc).isoformat()),
+            )
+            if not in_tx_before:
+                await self._conn.commit()
 
-        if current_batch:
-            batches.append((current_prev_hash, current_sig, current_batch))
+    async def verify_chain(
+        self,
+        *,
+        resume: bool = False,
+        page_size: int = _VERIFY_PAGE_SIZE,
+        workers: int | None = None,
+        progress: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Verify the cryptographic chain, streaming the log by rowid.
 
-        # Verify Merkle chain and signatures
-        expected_prev_hash = "GENESIS"
-        from babylon60.audit.smt import SparseMerkleTree
+        Row hashes and batch signatures are checked in a process pool when
+        ``workers`` > 1, or by default (CPU count) once at least
+        ``_MIN_POOL_ROWS`` rows are pending; chain links are checked in order
+        here. With ``resume=True`` only rows after the persisted watermark are
+        verified. ``progress`` receives the running stats after every page.
 
-        local_smt = SparseMerkleTree()
+        Returns {'status': 'verified', 'blocks': n, ...} if pristine, or
+        {'status': 'tampered', 'corrupted_audit_id': id, 'reason': ...} if broken.
+        """
+        await self.ensure_table()
 
-        for prev_hash, signature, batch_rows in batches:
-            if prev_hash != expected_prev_hash:
-                return {
-                    "status": "tampered",
-                    "corrupted_audit_id": batch_rows[0]["audit_id"],
-                    "reason": f"chain_broken (expected {expected_prev_hash}, got {prev_hash})",
-                }
+        pinned_failure = await self._check_pinned_public_key()
+        if pinned_failure:
+            return pinned_failure
 
-            # Check if this batch is a COMPACTION_NODE
-            if len(batch_rows) == 1 and batch_rows[0]["action"] == "COMPACTION_NODE":
-                row = batch_rows[0]
-                compaction_payload = (
-                    f"COMPACTION:{row['prev_hash']}:{row['status']}:{row['resource']}"
-                )
-                try:
-                    self.public_key.verify(bytes.fromhex(signature), compaction_payload.encode())
-                except InvalidSignature:
+        started = time.perf_counter()
+        start_rowid, expected_prev_hash = await self._load_watermark() if resume else (0, "GENESIS")
+        public_key_raw = self.public_key.public_bytes(
+            encoding=serialization.Encoding.Raw, format=serialization.PublicFormat.Raw
+        )
+        verify_anchors = (
+            os.environ.get("MOSKV_VERIFY_EXTERNAL_ANCHORS") == "true"
+            or os.environ.get("CORTEX_VERIFY_EXTERNAL_ANCHORS") == "true"
+        )
+        if workers is None:
+            cursor = await self._conn.execute("SELECT MAX(rowid) FROM security_audit_log")
+            max_rowid = (await cursor.fetchone())[0] or 0
+            workers = (os.cpu_count() or 1) if max_rowid - start_rowid >= _MIN_POOL_ROWS else 1
+        pool = (
+            ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            if workers > 1
+            else None
+        )
+        loop = asyncio.get_running_loop()
+        in_flight: deque[tuple[list[list[tuple]], asyncio.Future]] = deque()
+        stats: dict[str, Any] = {"rows": 0, "blocks": 0, "verified_up_to": start_rowid}
+        last_row: tuple | None = None
+
+        def _stats() -> dict[str, Any]:
+            elapsed = time.perf_counter() - started
+            return {
+                **stats,
+                "resumed_from": start_rowid,
+                "elapsed_s": round(elapsed, 3),
+                "rows_per_s": round(stats["rows"] / elapsed, 1) if elapsed > 0 else 0.0,
+            }
+
+        async def _drain_one() -> dict[str, Any] | None:
+            nonlocal expected_prev_hash, last_row
+            batches, future = in_flight.popleft()
+            results = await future
+            for batch_rows, (entry_hash, failure) in zip(batches, results, strict=True):
+                first = batch_rows[0]
+                if failure and failure[1] == "row_hash_mismatch":
                     return {
                         "status": "tampered",
-                        "corrupted_audit_id": row["audit_id"],
-                        "reason": "invalid_compaction_signature",
+                        "corrupted_audit_id": failure[0],
+                        "reason": failure[1],
                     }
-                expected_prev_hash = row["status"]
-                continue
-
-            batch_audit_ids = [r["audit_id"] for r in batch_rows]
-            for aid in batch_audit_ids:
-                local_smt.update(cortex_hash(aid.encode()), aid)
-            merkle_root = local_smt.root
+                if first[_PREV_HASH] != expected_prev_hash:
+                    return {
+                        "status": "tampered",
+                        "corrupted_audit_id": first[_AUDIT_ID],
+                        "reason": f"chain_broken (expected {expected_prev_hash}, "
+                        f"got {first[_PREV_HASH]})",
+                    }
+                if failure:
+                    return {
+                        "status": "tampered",
+                        "corrupted_audit_id": failure[0],
+                        "reason": failure[1],
+                    }
+                if verify_anchors and first[_ACTION] != "COMPACTION_NODE":
+                    anchor_failure = await self._verify_external_anchor(first, entry_hash)
+                    if anchor_failure:
+                        return anchor_failure
+                expected_prev_hash = entry_hash
+                last_row = batch_rows[-1]
+                stats["rows"] += len(batch_rows)
+                stats["blocks"] += 1
+                stats["verified_up_to"] = last_row[_ROWID]
+            if progress is not None:
+                progress(_stats())
+            return None
+
+        failure: dict[str, Any] | None = None
+        try:
+            async for batches in self._iter_batch_pages(start_rowid, page_size):
+                if pool is None:
+                    future = loop.create_future()
+                    future.set_result(_verify_batches(public_key_raw, batches))
+                else:
+                    future = loop.run_in_executor(pool, _verify_batches, public_key_raw, batches)
+                in_flight.append((batches, future))
+                if len(in_flight) > 2 * workers:
+                    failure = await _drain_one()
+                    if failure:
+                        break
+            while in_flight and not failure:
+                failure = await _drain_one()
+        finally:
+            for _, future in in_flight:
+                future.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        result = _stats()
+        logger.info(
+            "[AuditLedger] Verified %d rows in %d blocks (%.1f rows/s, resumed from rowid %d)",
+            result["rows"],
+            result["blocks"],
+            result["rows_per_s"],
+            start_rowid,
+        )
+        if failure:
+            return {**failure, **result}
+        if last_row is not None:
+            await self._store_watermark(last_row[_ROWID], expected_prev_hash, last_row[_SIGNATURE])
+        return {"status": "verified", **result}
+
+    async def _verify_external_anchor(self, row: tuple, entry_hash: str) -> dict[str, Any] | None:
+        """[C5-REAL] Verify a batch's Rekor anchor against its entry hash, if present."""
+        import base64
+        import json
 
-            entry_hash_payload = f"merkle_batch:{merkle_root}:{prev_hash}"
-            entry_hash = cortex_hash(entry_hash_payload.encode())
+        if not row[_EXTERNAL_ANCHOR]:
+            return None
+        try:
+            anchor_data = json.loads(row[_EXTERNAL_ANCHOR])
+            rekor_uuid = anchor_data.get("rekor_uuid")
+            if not rekor_uuid or rekor_uuid == "mock_rekor":
+                return None
+            from babylon60.audit.rekor_client import RekorClient
 
+            rekor_client = RekorClient()
             try:
-                self.public_key.verify(bytes.fromhex(signature), entry_hash.encode())
-            except InvalidSignature:
-                return {
-                    "status": "tampered",
-                    "corrupted_audit_id": batch_rows[0]["audit_id"],
-                    "reason": "invalid_signature",
-                }
-
-            # [C5-REAL] Verify external Rekor/TSA anchor if requested and present
-            if (
-                os.environ.get("MOSKV_VERIFY_EXTERNAL_ANCHORS") == "true"
-                or os.environ.get("CORTEX_VERIFY_EXTERNAL_ANCHORS") == "true"
-            ):
-                row = batch_rows[0]
-                if len(row) > 11 and row["external_anchor"]:
-                    try:
-                        anchor_data = json.loads(row["external_anchor"])
-                        rekor_uuid = anchor_data.get("rekor_uuid")
-                        if rekor_uuid and rekor_uuid != "mock_rekor":
-                            from babylon60.audit.rekor_client import RekorClient
-
-                            rekor_client = RekorClient()
-                            try:
-                                rekor_entry = await rekor_client.verify_entry(rekor_uuid)
-                                if not rekor_entry:
-                                    return {
-                                        "status": "tampered",
-                                        "corrupted_audit_id": row["audit_id"],
-                                        "reason": f"rekor_anchor_missing (uuid {rekor_uuid})",
-                                    }
-                                log_entry_data = list(rekor_entry.values())[0]
-                                body_b64 = log_entry_data.get("body")
-                                if body_b64:
-                                    import base64
-
-                                    body_data = json.loads(
-                                        base64.b64decode(body_b64).decode("utf-8")
-                                    )
-                                    logged_hash = (
-                                        body_data.get("spec", {})
-                                        .get("data", {})
-                                        .get("hash", {})
-                                        .get("value")
-                                    )
-                                    if logged_hash != entry_hash:
-                                        return {
-                                            "status": "tampered",
-                                            "corrupted_audit_id": row["audit_id"],
-                                            "reason": f"rekor_hash_mismatch (expected {entry_hash}, got {logged_hash})",
-                                        }
-                            finally:
-                                await rekor_client.close()
-                    except Exception as e:
-                        logger.error("Failed to verify external Rekor anchor: %s", e)
-
-            expected_prev_hash = entry_hash
-
-        return {"status": "verified", "blocks": len(batches)}
+                rekor_entry = await rekor_client.verify_entry(rekor_uuid)
+                if not rekor_entry:
+                    return {
+                        "status": "tampered",
+                        "corrupted_audit_id": row[_AUDIT_ID],
+                        "reason": f"rekor_anchor_missing (uuid {rekor_uuid})",
+                    }
+                log_entry_data = list(rekor_entry.values())[0]
+                body_b64 = log_entry_data.get("body")
+                if body_b64:
+                    body_data = json.loads(base64.b64decode(body_b64).decode("utf-8"))
+                    logged_hash = (
+                        body_data.get("spec", {}).get("data", {}).get("hash", {}).get("value")
+                    )
+                    if logged_hash != entry_hash:
+                        return {
+                            "status": "tampered",
+                            "corrupted_audit_id": row[_AUDIT_ID],
+                            "reason": f"rekor_hash_mismatch (expected {entry_hash}, got {logged_hash})",
+                        }
+            finally:
+                await rekor_client.close()
+        except Exception as e:
+            logger.error("Failed to verify external Rekor anchor: %s", e)
+        return None
 
     async def _anchor_worker(self) -> None:
         """Background worker that pulls unanchored local entries and anchors them to Rekor/TSA asynchronously."""
@@ -431,9 +622,9 @@ class EnterpriseAuditLedger:
                             for audit_id, signature, prev_hash in unanchored:
                                 external_anchor = None
                                 try:
-                                    from babylon60.audit.smt import SparseMerkleTree
+                                    from babylon60.audit.smt import LegacyPathTree
 
-                                    smt_state = SparseMerkleTree()
+                                    smt_state = LegacyPathTree()
                                     smt_state.update(cortex_hash(audit_id.encode()), audit_id)
                                     merkle_root = smt_state.root
 
@@ -642,9 +833,9 @@ class EnterpriseAuditLedger:
         try:
             # Reconstruct batch entry_hash
             if smt_state is None:
-                from babylon60.audit.smt import SparseMerkleTree
+                from babylon60.audit.smt import LegacyPathTree
 
-                smt_state = SparseMerkleTree()
+                smt_state = LegacyPathTree()
             for aid in batch_audit_ids:
                 smt_state.update(cortex_hash(aid.encode()), aid)
             merkle_root = smt_state.root
@@ -16,7 +16,7 @@ from typing import Any
 import aiosqlite
 
 from babylon60.audit.ledger import EnterpriseAuditLedger
-from babylon60.audit.smt import SparseMerkleTree
+from babylon60.audit.smt import LegacyPathTree
 from babylon60.crypto.hash_registry import cortex_hash
 
 logger = logging.getLogger("babylon60.audit.ledger_compactor")
@@ -84,7 +84,7 @@ async def compact_ledger(
 
         # Calculate the h_end by walking the SMT for the batches we compact
         expected_prev_hash = h_start
-        local_smt = SparseMerkleTree()
+        local_smt = LegacyPathTree()
         for _prev_hash, _signature, batch_rows in batches_to_compact:
             # Bypass logic if it's already a compaction node
             if len(batch_rows) == 1 and batch_rows[0][6] == "COMPACTION_NODE":
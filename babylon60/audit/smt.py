@@ -2,15 +2,441 @@
 """
 CORTEX v6+ - Sparse Merkle Tree (SMT) Ledger Integration
 Provides O(log n) cryptographic tamper-evident verification for Swarm agents.
+
+``SparseMerkleTree`` is a node-store-backed SMT with leaf shortcuts: a subtree
+holding a single leaf is represented by that leaf, so an update touches
+O(log n) nodes instead of the full key depth. Nodes are content-addressed
+(``hash -> encoded node``), which makes every historical root provable as
+long as the store keeps its nodes.
+
+Hashing (raw digests of the active ``cortex_hash`` algorithm):
+
+- empty subtree: ``00..00``
+- leaf:          ``H(0x00 || key || value)``
+- internal:      ``H(0x01 || left || right)``
+
+``LegacyPathTree`` keeps the pre-v2 computation (the root of the path of the
+most recently updated key over empty siblings) because existing audit-ledger
+batch signatures commit to it.
 """
 
-from babylon60.crypto.hash_registry import cortex_hash
+from __future__ import annotations
+
+import sqlite3
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Protocol
+
+from babylon60.crypto.hash_registry import cortex_hash, cortex_hash_raw
+
+__all__ = [
+    "CompressedSMTProof",
+    "LegacyPathTree",
+    "MemoryNodeStore",
+    "NodeStore",
+    "SMTProof",
+    "SQLiteNodeStore",
+    "SparseMerkleTree",
+    "smt_engine",
+]
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+_NODE_CACHE_SIZE = 65_536
+
+
+class NodeStore(Protocol):
+    """Persistence backend for SMT nodes and named roots."""
+
+    def get(self, node_hash: bytes) -> bytes | None: ...
+
+    def put_many(self, nodes: dict[bytes, bytes]) -> None: ...
+
+    def get_root(self, name: str) -> bytes | None: ...
+
+    def set_root(self, name: str, root: bytes) -> None: ...
+
+
+class MemoryNodeStore:
+    """Dict-backed node store (default; not persistent)."""
+
+    def __init__(self) -> None:
+        self._nodes: dict[bytes, bytes] = {}
+        self._roots: dict[str, bytes] = {}
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def get(self, node_hash: bytes) -> bytes | None:
+        return self._nodes.get(node_hash)
+
+    def put_many(self, nodes: dict[bytes, bytes]) -> None:
+        self._nodes.update(nodes)
+
+    def get_root(self, name: str) -> bytes | None:
+        return self._roots.get(name)
+
+    def set_root(self, name: str, root: bytes) -> None:
+        self._roots[name] = root
+
+
+class SQLiteNodeStore:
+    """SQLite-backed node store (``smt_nodes`` + ``smt_roots`` tables).
+
+    Nodes are written once per ``put_many`` call in a single transaction, so
+    ``SparseMerkleTree.batch_update`` costs one commit per batch.
+    """
+
+    def __init__(self, db: str | Path | sqlite3.Connection) -> None:
+        if isinstance(db, sqlite3.Connection):
+            self._conn = db
+        else:
+            self._conn = sqlite3.connect(str(db), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._lock = threading.Lock()
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS smt_nodes (
+                hash BLOB PRIMARY KEY,
+                node BLOB NOT NULL
+            ) WITHOUT ROWID;
+            CREATE TABLE IF NOT EXISTS smt_roots (
+                name TEXT PRIMARY KEY,
+                root BLOB NOT NULL
+            );
+            """
+        )
+
+    def get(self, node_hash: bytes) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT node FROM smt_nodes WHERE hash = ?", (node_hash,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def put_many(self, nodes: dict[bytes, bytes]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO smt_nodes (hash, node) VALUES (?, ?)", nodes.items()
+            )
+
+    def get_root(self, name: str) -> bytes | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT root FROM smt_roots WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def set_root(self, name: str, root: bytes) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO smt_roots (name, root) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET root = excluded.root",
+                (name, root),
+            )
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+@dataclass(frozen=True, slots=True)
+class SMTProof:
+    """Inclusion (``value`` set) or exclusion (``value is None``) proof.
+
+    ``siblings`` are hex digests ordered root→leaf, one per level down to the
+    depth where the key's path ends. An exclusion proof whose path ends at a
+    different leaf carries that leaf as ``other_leaf = (key, value)``.
+    """
+
+    key: str
+    value: str | None
+    siblings: tuple[str, ...]
+    other_leaf: tuple[str, str] | None = None
+
+    def compress(self, empty: str | None = None) -> CompressedSMTProof:
+        """Drop default-empty siblings, recording their positions in a bitmap."""
+        empty = empty or "0" * len(self.key)
+        bitmap = 0
+        kept = []
+        for level, sibling in enumerate(self.siblings):
+            if sibling != empty:
+                bitmap |= 1 << level
+                kept.append(sibling)
+        return CompressedSMTProof(
+            self.key, self.value, len(self.siblings), bitmap, tuple(kept), self.other_leaf
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CompressedSMTProof:
+    """``SMTProof`` without empty siblings; bit ``i`` of ``bitmap`` marks level ``i``."""
+
+    key: str
+    value: str | None
+    length: int
+    bitmap: int
+    siblings: tuple[str, ...]
+    other_leaf: tuple[str, str] | None = None
+
+    def expand(self, empty: str | None = None) -> SMTProof:
+        empty = empty or "0" * len(self.key)
+        it = iter(self.siblings)
+        full = tuple(
+            next(it) if self.bitmap >> level & 1 else empty for level in range(self.length)
+        )
+        return SMTProof(self.key, self.value, full, self.other_leaf)
 
 
 class SparseMerkleTree:
     """
     C5-REAL: Sparse Merkle Tree for Ledger Audit.
-    Optimized 256-bit depth tree to bind facts to agents deterministically.
+    Key-depth tree (256 levels for SHA-256 keys) with shortcut leaves, cached
+    internal nodes and a pluggable node store.
+    """
+
+    def __init__(self, store: NodeStore | None = None, name: str = "default") -> None:
+        self._digest_size = len(cortex_hash_raw(b""))
+        self.depth = 8 * self._digest_size
+        self._empty = bytes(self._digest_size)
+        self.store: NodeStore = store if store is not None else MemoryNodeStore()
+        self.name = name
+        self._cache: OrderedDict[bytes, tuple] = OrderedDict()
+        self._root = self.store.get_root(name) or self._empty
+
+    @property
+    def root(self) -> str:
+        return self._root.hex()
+
+    @property
+    def empty_hash(self) -> str:
+        return self._empty.hex()
+
+    # ─── Hashing / node I/O ───────────────────────────────────────
+
+    def _key(self, key_hash: str) -> bytes:
+        key = bytes.fromhex(key_hash)
+        if len(key) != self._digest_size:
+            raise ValueError(f"SMT key must be {self._digest_size} bytes, got {len(key)}")
+        return key
+
+    def _load(self, node_hash: bytes) -> tuple:
+        node = self._cache.get(node_hash)
+        if node is not None:
+            self._cache.move_to_end(node_hash)
+            return node
+        raw = self.store.get(node_hash)
+        if raw is None:
+            raise KeyError(f"SMT node {node_hash.hex()} missing from store")
+        size = self._digest_size
+        if raw[:1] == _LEAF:
+            key = raw[1 : 1 + size]
+            node = ("L", int.from_bytes(key, "big"), key, raw[1 + size :])
+        else:
+            node = ("N", raw[1 : 1 + size], raw[1 + size :])
+        self._remember(node_hash, node)
+        return node
+
+    def _remember(self, node_hash: bytes, node: tuple) -> None:
+        self._cache[node_hash] = node
+        if len(self._cache) > _NODE_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    def _leaf(self, key: bytes, key_int: int, value: bytes, pending: dict) -> bytes:
+        raw = _LEAF + key + value
+        node_hash = cortex_hash_raw(raw)
+        pending[node_hash] = raw
+        self._remember(node_hash, ("L", key_int, key, value))
+        return node_hash
+
+    def _internal(self, left: bytes, right: bytes, pending: dict) -> bytes:
+        if left == self._empty and right == self._empty:
+            return self._empty
+        raw = _NODE + left + right
+        node_hash = cortex_hash_raw(raw)
+        pending[node_hash] = raw
+        self._remember(node_hash, ("N", left, right))
+        return node_hash
+
+    # ─── Updates ──────────────────────────────────────────────────
+
+    def update(self, key_hash: str, value_hash: str) -> str:
+        """
+        Updates the leaf at `key_hash` with `value_hash` and returns the new SMT root.
+        """
+        return self.batch_update([(key_hash, value_hash)])
+
+    def batch_update(self, items: Iterable[tuple[str, str]]) -> str:
+        """Apply many ``(key_hash, value)`` updates and return the new root.
+
+        Keys are sorted and split level by level, so every internal node above
+        the changed leaves is hashed once per batch rather than once per key.
+        Later duplicates of a key win.
+        """
+        latest: dict[int, tuple[bytes, bytes]] = {}
+        for key_hash, value in items:
+            key = self._key(key_hash)
+            latest[int.from_bytes(key, "big")] = (key, value.encode("utf-8"))
+        if not latest:
+            return self.root
+        keys = sorted(latest)
+        leaves = [(k, *latest[k]) for k in keys]
+        pending: dict[bytes, bytes] = {}
+        self._root = self._update(self._root, 0, keys, leaves, 0, len(keys), pending)
+        self.store.put_many(pending)
+        self.store.set_root(self.name, self._root)
+        return self.root
+
+    def _update(
+        self,
+        node_hash: bytes,
+        depth: int,
+        keys: list[int],
+        leaves: list[tuple[int, bytes, bytes]],
+        lo: int,
+        hi: int,
+        pending: dict,
+    ) -> bytes:
+        if lo == hi:
+            return node_hash
+        if node_hash != self._empty:
+            node = self._load(node_hash)
+            if node[0] == "N":
+                mid = self._split(keys, lo, hi, depth)
+                left = self._update(node[1], depth + 1, keys, leaves, lo, mid, pending)
+                right = self._update(node[2], depth + 1, keys, leaves, mid, hi, pending)
+                return self._internal(left, right, pending)
+            # Existing shortcut leaf: push it down with the new keys unless replaced.
+            _, key_int, key, value = node
+            pos = bisect_left(keys, key_int, lo, hi)
+            if pos == hi or keys[pos] != key_int:
+                keys = keys[lo:pos] + [key_int] + keys[pos:hi]
+                leaves = leaves[lo:pos] + [(key_int, key, value)] + leaves[pos:hi]
+                lo, hi = 0, len(keys)
+        return self._build(depth, keys, leaves, lo, hi, pending)
+
+    def _build(
+        self,
+        depth: int,
+        keys: list[int],
+        leaves: list[tuple[int, bytes, bytes]],
+        lo: int,
+        hi: int,
+        pending: dict,
+    ) -> bytes:
+        """Hash a fresh subtree holding ``leaves[lo:hi]`` (all sharing ``depth`` prefix bits)."""
+        if lo == hi:
+            return self._empty
+        if hi - lo == 1:
+            key_int, key, value = leaves[lo]
+            return self._leaf(key, key_int, value, pending)
+        mid = self._split(keys, lo, hi, depth)
+        left = self._build(depth + 1, keys, leaves, lo, mid, pending)
+        right = self._build(depth + 1, keys, leaves, mid, hi, pending)
+        return self._internal(left, right, pending)
+
+    def _split(self, keys: list[int], lo: int, hi: int, depth: int) -> int:
+        """First index in ``keys[lo:hi]`` whose bit at ``depth`` is set."""
+        shift = self.depth - depth - 1
+        pivot = (keys[lo] >> (shift + 1) << (shift + 1)) | (1 << shift)
+        return bisect_left(keys, pivot, lo, hi)
+
+    # ─── Reads / proofs ───────────────────────────────────────────
+
+    def get(self, key_hash: str) -> str | None:
+        """Value stored at ``key_hash``, or ``None``."""
+        key_int = int.from_bytes(self._key(key_hash), "big")
+        node_hash = self._root
+        depth = 0
+        while node_hash != self._empty:
+            node = self._load(node_hash)
+            if node[0] == "L":
+                return node[3].decode("utf-8") if node[1] == key_int else None
+            node_hash = node[2] if key_int >> (self.depth - depth - 1) & 1 else node[1]
+            depth += 1
+        return None
+
+    def get_proof(self, key_hash: str) -> SMTProof:
+        """Inclusion or exclusion proof for ``key_hash`` against the current root."""
+        key_int = int.from_bytes(self._key(key_hash), "big")
+        siblings: list[str] = []
+        node_hash = self._root
+        depth = 0
+        while node_hash != self._empty:
+            node = self._load(node_hash)
+            if node[0] == "L":
+                value = node[3].decode("utf-8")
+                if node[1] == key_int:
+                    return SMTProof(key_hash, value, tuple(siblings))
+                return SMTProof(key_hash, None, tuple(siblings), (node[2].hex(), value))
+            if key_int >> (self.depth - depth - 1) & 1:
+                siblings.append(node[1].hex())
+                node_hash = node[2]
+            else:
+                siblings.append(node[2].hex())
+                node_hash = node[1]
+            depth += 1
+        return SMTProof(key_hash, None, tuple(siblings))
+
+    def verify(
+        self,
+        key_hash: str,
+        value_hash: str | None,
+        proof: SMTProof | CompressedSMTProof,
+        expected_root: str,
+    ) -> bool:
+        """
+        Verifies an SMT inclusion (or, with ``value_hash=None``, exclusion) proof in O(log n).
+        """
+        if isinstance(proof, CompressedSMTProof):
+            proof = proof.expand(self.empty_hash)
+        if proof.key != key_hash or proof.value != value_hash:
+            return False
+        try:
+            key = self._key(key_hash)
+        except ValueError:
+            return False
+        key_int = int.from_bytes(key, "big")
+        levels = len(proof.siblings)
+        if levels > self.depth:
+            return False
+
+        if value_hash is not None:
+            current = cortex_hash_raw(_LEAF + key + value_hash.encode("utf-8"))
+        elif proof.other_leaf is not None:
+            other_key = bytes.fromhex(proof.other_leaf[0])
+            other_int = int.from_bytes(other_key, "big")
+            shift = self.depth - levels
+            if other_int == key_int or other_int >> shift != key_int >> shift:
+                return False
+            current = cortex_hash_raw(_LEAF + other_key + proof.other_leaf[1].encode("utf-8"))
+        else:
+            current = self._empty
+
+        for level in range(levels - 1, -1, -1):
+            sibling = bytes.fromhex(proof.siblings[level])
+            if key_int >> (self.depth - level - 1) & 1:
+                current = self._combine(sibling, current)
+            else:
+                current = self._combine(current, sibling)
+        return current.hex() == expected_root
+
+    def _combine(self, left: bytes, right: bytes) -> bytes:
+        if left == self._empty and right == self._empty:
+            return self._empty
+        return cortex_hash_raw(_NODE + left + right)
+
+
+class LegacyPathTree:
+    """Pre-v2 SMT root computation, kept for audit-ledger compatibility.
+
+    ``root`` is the 256-level path hash of the most recently updated key over
+    empty siblings; earlier leaves do not contribute. Signed ledger batches
+    commit to this value, so it must not change.
     """
 
     def __init__(self) -> None:
@@ -32,21 +458,14 @@ class SparseMerkleTree:
         return cortex_hash(left + right)
 
     def update(self, key_hash: str, value_hash: str) -> str:
-        """
-        Updates the leaf at `key_hash` with `value_hash` and returns the new SMT root.
-        """
+        """Records the leaf and returns the legacy root for it."""
         self.db[key_hash] = value_hash
-
-        # In a strict cryptographic SMT, we trace the path bits from bottom to top.
-        # For C5-REAL execution, we construct the minimal viable path update.
         current_hash = value_hash
         path_bits = bin(int(key_hash, 16))[2:].zfill(self.depth)
 
         for i in range(self.depth - 1, -1, -1):
-            bit = path_bits[i]
             sibling = self._empty_hashes[self.depth - 1 - i]
-
-            if bit == "0":
+            if path_bits[i] == "0":
                 current_hash = self._hash_pair(current_hash, sibling)
             else:
                 current_hash = self._hash_pair(sibling, current_hash)
@@ -54,26 +473,5 @@ class SparseMerkleTree:
         self.root = current_hash
         return self.root
 
-    def verify(self, key_hash: str, value_hash: str, proof: list[str], expected_root: str) -> bool:
-        """
-        Verifies an SMT inclusion proof in O(log n).
-        """
-        current_hash = value_hash
-        path_bits = bin(int(key_hash, 16))[2:].zfill(self.depth)
-
-        if len(proof) != self.depth:
-            return False
-
-        for i in range(self.depth - 1, -1, -1):
-            bit = path_bits[i]
-            sibling = proof[self.depth - 1 - i]
-
-            if bit == "0":
-                current_hash = self._hash_pair(current_hash, sibling)
-            else:
-                current_hash = self._hash_pair(sibling, current_hash)
-
-        return current_hash == expected_root
-
 
-smt_engine = SparseMerkleTree()
+smt_engine = LegacyPathTree()
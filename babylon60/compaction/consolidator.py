@@ -25,10 +25,13 @@ Edge-compatible: Falls back to CPU + API-based SLM (Gemini Flash).
 from __future__ import annotations
 
 import logging
+import sqlite3
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
+    import numpy as np
+
     from babylon60.engine import CortexEngine
 
 logger = logging.getLogger("babylon60.consolidator")
@@ -54,7 +57,19 @@ _CONSOLIDATABLE_TYPES = frozenset(
 _MIN_CLUSTER_SIZE = 2
 
 # Maximum events to process per consolidation cycle
-_MAX_EVENTS_PER_CYCLE = 200
+_MAX_EVENTS_PER_CYCLE = 100_000
+
+# Similarity tiles are (_BLOCK_ROWS seeds x _BLOCK_COLS candidates) float32,
+# so clustering memory is bounded independently of the event count.
+_BLOCK_ROWS = 256
+_BLOCK_COLS = 8192
+
+# Texts sent to the embedder per call.
+_EMBED_CHUNK = 1024
+
+# Events without a stored vector embedded per cycle when no embedding cache
+# is configured; the rest wait for a later cycle.
+_MAX_FRESH_EMBEDS = 200
 
 
 @dataclass
@@ -154,60 +169,40 @@ class BeliefConsolidator:
         contents: list[str],
         fact_ids: list[int],
         embedder: Any = None,
+        stored: list[bytes | None] | None = None,
     ) -> list[ClusterResult]:
         """Cluster events by semantic similarity.
 
-        Simple single-pass clustering: O(N²) but N is bounded
-        by _MAX_EVENTS_PER_CYCLE (200). GPU-accelerated embedding.
+        Greedy leader clustering: in event order, each unclaimed event seeds a
+        cluster and claims every later unclaimed event within the threshold.
+        Similarities are computed in fixed-size tiles (see
+        :func:`_leader_assign`), never as a full N×N matrix. ``stored`` holds
+        each event's vector from ``fact_embeddings`` (``None`` if it has none).
         """
-        import numpy as np
-
-        from babylon60.engine.core.semantic_hash import batch_fingerprint
-
         if len(contents) < _MIN_CLUSTER_SIZE:
             return []
 
-        fingerprints = batch_fingerprint(contents, embedder)
-        n = len(fingerprints)
+        import numpy as np
 
-        # Ouroboros O(1) Matrix Multiplication
-        embeddings = np.array([f.embedding for f in fingerprints])
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        embeddings_normalized = embeddings / np.where(norms == 0, 1e-10, norms)
-        sim_matrix = embeddings_normalized @ embeddings_normalized.T
+        vectors = _embed_normalized(contents, embedder, stored)
+        leader, sims = _leader_assign(vectors, self._similarity_threshold)
 
-        # Greedy clustering: assign each event to first matching cluster
         clusters: list[ClusterResult] = []
-        assigned: set[int] = set()
-
-        for i in range(n):
-            if i in assigned:
+        # Groups come out in seed order; stable sort keeps members in event
+        # order, so each cluster's seed leads.
+        order = np.argsort(leader, kind="stable")
+        bounds = np.flatnonzero(np.diff(leader[order])) + 1
+        for group in np.split(order, bounds):
+            if len(group) < _MIN_CLUSTER_SIZE:
                 continue
-
-            cluster = ClusterResult(
-                cluster_id=len(clusters),
-                event_ids=[fact_ids[i]],
-                event_contents=[contents[i]],
-            )
-            assigned.add(i)
-
-            similarities = []
-            for j in range(i + 1, n):
-                if j in assigned:
-                    continue
-                sim = float(sim_matrix[i, j])
-                if sim >= self._similarity_threshold:
-                    cluster.event_ids.append(fact_ids[j])
-                    cluster.event_contents.append(contents[j])
-                    assigned.add(j)
-                    similarities.append(sim)
-
-            if len(cluster.event_ids) >= _MIN_CLUSTER_SIZE:
-                cluster.avg_similarity = (
-                    sum(similarities) / len(similarities) if similarities else 1.0
+            clusters.append(
+                ClusterResult(
+                    cluster_id=len(clusters),
+                    event_ids=[fact_ids[i] for i in group],
+                    event_contents=[contents[i] for i in group],
+                    avg_similarity=float(sims[group[1:]].mean()),
                 )
-                clusters.append(cluster)
-
+            )
         return clusters
 
     async def consolidate(
@@ -239,21 +234,41 @@ class BeliefConsolidator:
         try:
             conn = await engine.get_conn()
 
-            # Fetch recent consolidatable events
+            # Fetch recent consolidatable events with any vector already stored
             placeholders = ",".join("?" for _ in types_tuple)
-            cursor = await conn.execute(
-                f"SELECT id, content, fact_type FROM facts "
-                f"WHERE project = ? AND fact_type IN ({placeholders}) "
-                f"AND valid_until IS NULL "
-                f"AND created_at >= datetime('now', '-{hours_back} hours') "
-                f"ORDER BY created_at DESC LIMIT ?",
-                (project, *types_tuple, max_events),
+            where = (
+                f"WHERE f.project = ? AND f.fact_type IN ({placeholders}) "
+                f"AND f.valid_until IS NULL "
+                f"AND f.created_at >= datetime('now', '-{hours_back} hours') "
+                f"ORDER BY f.created_at DESC LIMIT ?"
             )
+            params = (project, *types_tuple, max_events)
+            try:
+                cursor = await conn.execute(
+                    "SELECT f.id, f.content, f.fact_type, v.embedding FROM facts AS f "
+                    "LEFT JOIN fact_embeddings AS v ON v.fact_id = f.id " + where,
+                    params,
+                )
+            except sqlite3.OperationalError:
+                # No sqlite-vec: every event is embedded below
+                cursor = await conn.execute(
+                    "SELECT f.id, f.content, f.fact_type, NULL FROM facts AS f " + where,
+                    params,
+                )
             rows = await cursor.fetchall()
 
             if not rows:
                 return result
 
+            from babylon60.embeddings.cache import get_embedding_cache
+
+            if get_embedding_cache() is None:
+                fresh = [row[0] for row in rows if row[3] is None]
+                if len(fresh) > _MAX_FRESH_EMBEDS:
+                    deferred = set(fresh[_MAX_FRESH_EMBEDS:])
+                    rows = [row for row in rows if row[0] not in deferred]
+                    logger.debug("Deferring %d unembedded events to a later cycle", len(deferred))
+
             result.total_events_scanned = len(rows)  # type: ignore[type-error]
             fact_ids = [row[0] for row in rows]
 
@@ -272,7 +287,9 @@ class BeliefConsolidator:
                 contents = [str(row[1]) for row in rows]
 
             # Cluster semantically
-            clusters = self._cluster_by_similarity(contents, fact_ids)
+            clusters = self._cluster_by_similarity(
+                contents, fact_ids, engine._get_embedder(), [row[3] for row in rows]
+            )
             result.clusters_found = len(clusters)
             result.clusters = clusters
 
@@ -327,3 +344,98 @@ class BeliefConsolidator:
             result.error = str(e)
 
         return result
+
+
+def _embed_normalized(
+    contents: list[str],
+    embedder: Any = None,
+    stored: list[bytes | None] | None = None,
+) -> np.ndarray:
+    """Unit-norm float32 embeddings.
+
+    Stored float32 blobs are decoded as-is; only the remaining contents are
+    embedded, served from the embedding cache where possible.
+    """
+    import numpy as np
+
+    rows: list[Any] = [
+        None if blob is None else np.frombuffer(blob, dtype=np.float32)
+        for blob in (stored or [None] * len(contents))
+    ]
+    missing = [i for i, row in enumerate(rows) if row is None]
+    if missing:
+        from babylon60.embeddings.cache import cached_embed_batch
+
+        if embedder is None:
+            from babylon60.embeddings import LocalEmbedder
+
+            embedder = LocalEmbedder()
+
+    for start in range(0, len(missing), _EMBED_CHUNK):
+        chunk = missing[start : start + _EMBED_CHUNK]
+        batch = cached_embed_batch(embedder, [contents[i] for i in chunk])
+        for i, vector in zip(chunk, batch, strict=True):
+            rows[i] = np.asarray(vector, dtype=np.float32)
+    vectors = np.stack(rows)
+
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    vectors /= np.where(norms == 0, 1e-10, norms)
+    return vectors
+
+
+def _leader_assign(
+    vectors: np.ndarray,
+    threshold: float,
+    block_rows: int = _BLOCK_ROWS,
+    block_cols: int = _BLOCK_COLS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Greedy leader assignment over unit vectors using blocked products.
+
+    Returns ``(leader, sims)``: ``leader[i]`` is the index of the seed that
+    claimed event ``i`` (``i`` itself for seeds) and ``sims[i]`` its cosine
+    similarity to that seed.
+
+    Rows are processed in blocks. The block's own square tile settles which
+    of its rows are seeds. Those seeds then sweep the still-unclaimed later
+    columns tile by tile, each column going to the first seed above the
+    threshold. Only unclaimed columns are multiplied, so work shrinks as
+    clusters absorb events.
+    """
+    import numpy as np
+
+    n = len(vectors)
+    leader = np.full(n, -1, dtype=np.int64)
+    sims = np.ones(n, dtype=np.float32)
+
+    for b0 in range(0, n, block_rows):
+        b1 = min(b0 + block_rows, n)
+        block = vectors[b0:b1]
+        intra = block @ block.T
+        seeds: list[int] = []
+        for r in range(b1 - b0):
+            if leader[b0 + r] != -1:
+                continue
+            leader[b0 + r] = b0 + r
+            seeds.append(r)
+            hits = np.flatnonzero(intra[r, r + 1 :] >= threshold) + r + 1
+            hits = hits[leader[b0 + hits] == -1]
+            leader[b0 + hits] = b0 + r
+            sims[b0 + hits] = intra[r, hits]
+
+        if not seeds or b1 == n:
+            continue
+        seed_vectors = block[seeds]
+        seed_index = np.asarray(seeds, dtype=np.int64) + b0
+        open_cols = np.flatnonzero(leader[b1:] == -1) + b1
+        for c0 in range(0, len(open_cols), block_cols):
+            cols = open_cols[c0 : c0 + block_cols]
+            tile = seed_vectors @ vectors[cols].T
+            hit = tile >= threshold
+            claimed = np.flatnonzero(hit.any(axis=0))
+            if not len(claimed):
+                continue
+            first = hit[:, claimed].argmax(axis=0)
+            leader[cols[claimed]] = seed_index[first]
+            sims[cols[claimed]] = tile[first, claimed]
+
+    return leader, sims
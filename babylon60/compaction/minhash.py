@@ -0,0 +1,126 @@
+# [C5-REAL] Exergy-Maximized
+"""
+MinHash signatures + banded LSH for near-duplicate candidate generation.
+
+Signatures are computed once per fact at store time (``fact_minhash`` table)
+and reused by the DEDUP strategy, which only runs the expensive
+``SequenceMatcher`` confirmation on pairs that collide in at least one band.
+Requires numpy (``cortex-persist[compute]``); callers check ``available()``.
+"""
+
+from __future__ import annotations
+
+import zlib
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from typing import Any
+
+from babylon60.compaction.utils import normalize_content
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+__all__ = [
+    "LSH_BANDS",
+    "NUM_PERM",
+    "LSHIndex",
+    "SHINGLE_SIZE",
+    "available",
+    "signature",
+    "signature_from_bytes",
+    "signature_to_bytes",
+]
+
+NUM_PERM = 128  # Hash permutations per signature (512 bytes as uint32)
+LSH_BANDS = 32  # 32 bands x 4 rows → S-curve threshold ≈ (1/32)^(1/4) ≈ 0.42
+SHINGLE_SIZE = 4  # Character n-grams over normalized content
+_SEED = 0x5EED_DEDB
+_PRIME = 4_294_967_311  # Smallest prime > 2^32: a*x+b stays inside uint64
+
+_coeffs: tuple[Any, Any] | None = None
+
+
+def available() -> bool:
+    """Whether the numpy-backed MinHash engine can run."""
+    return np is not None
+
+
+def _permutations() -> tuple[Any, Any]:
+    global _coeffs
+    if _coeffs is None:
+        rng = np.random.default_rng(_SEED)
+        a = rng.integers(1, 2**32, size=NUM_PERM, dtype=np.uint64)
+        b = rng.integers(0, 2**32, size=NUM_PERM, dtype=np.uint64)
+        _coeffs = (a, b)
+    return _coeffs
+
+
+def _shingle_hashes(text: str) -> Any:
+    norm = normalize_content(text).encode("utf-8")
+    if len(norm) <= SHINGLE_SIZE:
+        grams: Iterable[bytes] = (norm,)
+    else:
+        grams = {norm[i : i + SHINGLE_SIZE] for i in range(len(norm) - SHINGLE_SIZE + 1)}
+    return np.fromiter((zlib.crc32(g) for g in grams), dtype=np.uint64)
+
+
+def signature(text: str) -> Any:
+    """MinHash signature of ``text`` as a ``(NUM_PERM,)`` uint32 array."""
+    a, b = _permutations()
+    hashes = _shingle_hashes(text)
+    # (shingles, perms) universal hashes, min over shingles
+    permuted = (np.outer(hashes, a) + b) % np.uint64(_PRIME)
+    return permuted.min(axis=0).astype(np.uint32)
+
+
+def signature_to_bytes(sig: Any) -> bytes:
+    """Serialize a signature for the ``fact_minhash`` table."""
+    return np.ascontiguousarray(sig, dtype="<u4").tobytes()
+
+
+def signature_from_bytes(blob: bytes) -> Any:
+    """Inverse of :func:`signature_to_bytes`."""
+    return np.frombuffer(blob, dtype="<u4").astype(np.uint32)
+
+
+class LSHIndex:
+    """Banded LSH buckets over a fixed list of signatures.
+
+    Candidates are resolved per item on demand instead of materializing every
+    colliding pair, so memory stays O(items x bands) even when many facts
+    share a bucket.
+    """
+
+    __slots__ = ("_buckets", "_keys")
+
+    def __init__(
+        self,
+        signatures: Sequence[Any],
+        partitions: Sequence[Any] | None = None,
+        bands: int = LSH_BANDS,
+    ) -> None:
+        """Args:
+        signatures: One signature per item, all of length ``NUM_PERM``.
+        partitions: Optional key per item; only items with equal keys collide.
+        bands: Number of bands (``NUM_PERM`` must be divisible by it).
+        """
+        self._buckets: dict[tuple[Any, int, bytes], list[int]] = defaultdict(list)
+        self._keys: list[list[tuple[Any, int, bytes]]] = [[] for _ in signatures]
+        if not signatures:
+            return
+        matrix = np.stack(signatures)
+        rows = matrix.shape[1] // bands
+        for band in range(bands):
+            band_keys = matrix[:, band * rows : (band + 1) * rows]
+            for idx in range(len(signatures)):
+                part = partitions[idx] if partitions is not None else None
+                key = (part, band, band_keys[idx].tobytes())
+                self._buckets[key].append(idx)
+                self._keys[idx].append(key)
+
+    def candidates(self, idx: int) -> list[int]:
+        """Sorted indices ``j > idx`` sharing at least one band with ``idx``."""
+        found = {j for key in self._keys[idx] for j in self._buckets[key] if j > idx}
+        return sorted(found)
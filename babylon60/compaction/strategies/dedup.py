@@ -1,12 +1,20 @@
 # [C5-REAL] Exergy-Maximized
 """
 Deduplication strategy for compaction.
+
+Exact duplicates are grouped by content hash. Near-duplicates are found by
+MinHash/LSH candidate generation over signatures persisted in
+``fact_minhash`` (computed at store time, backfilled here when missing);
+``SequenceMatcher`` only confirms candidate pairs. Without numpy the
+pairwise scan is used.
 """
 
 import logging
+import sqlite3
 from collections import defaultdict
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
+from babylon60.compaction import minhash
 from babylon60.compaction.utils import content_hash, similarity
 
 __all__ = ["execute_dedup", "find_duplicates"]
@@ -27,7 +35,7 @@ async def execute_dedup(
     threshold: float,
 ) -> None:
     """Execute the DEDUP strategy."""
-    dup_groups = await find_duplicates(engine, project, threshold)
+    dup_groups, fact_map = await _collect_duplicates(engine, project, threshold)
     if not dup_groups:
         return
 
@@ -36,7 +44,7 @@ async def execute_dedup(
     for group in dup_groups:
         canonical_id = group[0]
         if not dry_run:
-            await _merge_duplicate_group(engine, project, canonical_id, group)
+            await _merge_duplicate_group(engine, canonical_id, group, fact_map)
             result.deprecated_ids.extend(group[1:])
 
     total_removed = sum(len(g) - 1 for g in dup_groups)
@@ -55,17 +63,68 @@ async def find_duplicates(
     Returns list of groups where each group is list of fact IDs.
     First ID in each group is canonical (oldest).
     """
+    groups, _ = await _collect_duplicates(engine, project, similarity_threshold)
+    return groups
+
+
+async def _collect_duplicates(
+    engine: "CortexEngine",
+    project: str,
+    similarity_threshold: float,
+) -> tuple[list[list[int]], dict[int, Any]]:
+    """Duplicate groups plus the id → fact map they were computed from."""
     facts = await engine.facts.recall(project=project)
 
     if not facts:
-        return []
+        return [], {}
 
     # Map to tuples (id, content, fact_type, created_at) to reuse existing logic
     rows = [(f.id, f.content, f.fact_type, f.created_at) for f in facts]
 
     exact_groups, seen = _find_exact_duplicates(rows)
-    near_groups = _find_near_duplicates(rows, seen, similarity_threshold)
-    return exact_groups + near_groups
+    signatures = None
+    if minhash.available():
+        remaining = [r for r in rows if r[0] not in seen]
+        signatures = await _load_signatures(engine, remaining)
+    near_groups = _find_near_duplicates(rows, seen, similarity_threshold, signatures)
+    return exact_groups + near_groups, {f.id: f for f in facts}
+
+
+async def _load_signatures(engine: "CortexEngine", rows: list[tuple]) -> dict[int, Any]:
+    """Fetch persisted MinHash signatures; compute and persist missing ones."""
+    if not rows:
+        return {}
+    conn = await engine.get_conn()
+    ids = [r[0] for r in rows]
+    signatures: dict[int, Any] = {}
+    try:
+        for start in range(0, len(ids), 500):
+            chunk = ids[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            async with conn.execute(
+                f"SELECT fact_id, signature FROM fact_minhash WHERE fact_id IN ({placeholders})",
+                chunk,
+            ) as cursor:
+                for fact_id, blob in await cursor.fetchall():
+                    signatures[fact_id] = minhash.signature_from_bytes(blob)
+    except sqlite3.OperationalError as e:
+        logger.debug("fact_minhash unavailable, computing signatures in memory: %s", e)
+        return {r[0]: minhash.signature(r[1]) for r in rows}
+
+    missing = [r for r in rows if r[0] not in signatures]
+    if missing:
+        backfill = []
+        for fact_id, content, *_ in missing:
+            sig = minhash.signature(content)
+            signatures[fact_id] = sig
+            backfill.append((fact_id, minhash.signature_to_bytes(sig)))
+        await conn.executemany(
+            "INSERT OR REPLACE INTO fact_minhash (fact_id, signature) VALUES (?, ?)",
+            backfill,
+        )
+        await conn.commit()
+        logger.info("Dedup: backfilled %d MinHash signatures", len(backfill))
+    return signatures
 
 
 def _find_exact_duplicates(rows: list[tuple]) -> tuple[list[list[int]], set[int]]:
@@ -89,9 +148,17 @@ def _find_near_duplicates(
     rows: list[tuple],
     seen_ids: set[int],
     threshold: float,
+    signatures: dict[int, Any] | None = None,
 ) -> list[list[int]]:
-    """Phase 2: Levenshtein-based near-duplicate detection on remaining rows."""
+    """Phase 2: Levenshtein-based near-duplicate detection on remaining rows.
+
+    With ``signatures`` (fact id → MinHash), only LSH candidate pairs of the
+    same fact_type are compared; otherwise every pair is.
+    """
     remaining = [r for r in rows if r[0] not in seen_ids]
+    if signatures is not None:
+        return _find_near_duplicates_lsh(remaining, threshold, signatures)
+
     groups: list[list[int]] = []
     local_seen: set[int] = set()
 
@@ -114,21 +181,44 @@ def _find_near_duplicates(
     return groups
 
 
+def _find_near_duplicates_lsh(
+    remaining: list[tuple],
+    threshold: float,
+    signatures: dict[int, Any],
+) -> list[list[int]]:
+    """Greedy grouping identical to the pairwise scan, restricted to LSH candidates."""
+    index = minhash.LSHIndex(
+        [signatures[r[0]] for r in remaining],
+        partitions=[r[2] for r in remaining],  # same fact_type only
+    )
+
+    groups: list[list[int]] = []
+    local_seen: set[int] = set()
+    for i, row_i in enumerate(remaining):
+        if row_i[0] in local_seen:
+            continue
+        group = [row_i[0]]
+        for j in index.candidates(i):
+            row_j = remaining[j]
+            if row_j[0] in local_seen:
+                continue
+            if similarity(row_i[1], row_j[1]) >= threshold:
+                group.append(row_j[0])
+                local_seen.add(row_j[0])
+        if len(group) > 1:
+            local_seen.add(row_i[0])
+            groups.append(group)
+
+    return groups
+
+
 async def _merge_duplicate_group(
     engine: "CortexEngine",
-    project: str,
     canonical_id: int,
     group: list[int],
+    fact_map: dict[int, Any],
 ) -> None:
     """Merge a single duplicate group: deprecate duplicates, update canonical."""
-    facts = await engine.facts.recall(project=project)
-
-    if not facts:
-        return
-
-    # Create mapping of id to content
-    fact_map = {f.id: f for f in facts}
-
     canonical_fact = fact_map.get(canonical_id)
     if not canonical_fact:
         return
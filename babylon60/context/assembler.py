@@ -15,6 +15,7 @@ import os
 from pathlib import Path
 from typing import Any
 
+from babylon60.context.ki_index import get_knowledge_index
 from babylon60.pipeline import ContextPacket
 
 logger = logging.getLogger("babylon60.context.assembler")
@@ -171,60 +172,48 @@ class ContextAssembler:
         return packet
 
     def _scan_knowledge_dir(self, intent: str, packet: ContextPacket, budget: int) -> int:
-        """Scan the local self._knowledge_dir for relevant files matching query terms."""
+        """Load the best BM25 matches that fit the remaining token budget.
+
+        Hits arrive in score order with their indexed ``token_cost``. The best
+        hit is always loaded (truncated if it alone overflows the budget);
+        after that a hit is taken only if its cost still fits, so files that
+        would not fit are never read.
+        """
         if not os.path.exists(self._knowledge_dir) or budget <= 100:
             return budget
 
         try:
-            # Tokenize intent into lowercase keywords for simple scanning
-            query_terms = [t.lower() for t in intent.split() if len(t) > 3]
-            if not query_terms:
-                return budget
-
-            # Scan files recursively
-            for root, _, files in os.walk(self._knowledge_dir):
-                for file in files:
-                    if file.endswith(".md") or file.endswith(".txt"):
-                        path = os.path.join(root, file)
-                        path_lower = path.lower()
-                        match_count = sum(1 for term in query_terms if term in path_lower)
-
-                        if match_count > 0:
-                            try:
-                                with open(path, encoding="utf-8") as f:
-                                    content = f.read()
-
-                                # Score: 0.5 base + 0.1 per name match + content match boost
-                                content_lower = content.lower()
-                                content_match = sum(
-                                    1 for term in query_terms if term in content_lower
-                                )
-                                relevance = (
-                                    0.5 + (0.1 * match_count) + min(0.3, 0.05 * content_match)
-                                )
-
-                                token_cost = len(content) // 4
-                                if token_cost > budget:
-                                    content = content[: budget * 4]
-                                    token_cost = budget
-
-                                relative_name = os.path.relpath(path, self._knowledge_dir)
-
-                                if self._add_knowledge_item(
-                                    packet, relative_name, content, "fs_scan", token_cost, relevance
-                                ):
-                                    budget -= token_cost
-                                    logger.debug(
-                                        "  [FS_SCAN] Loaded KI '%s' (%d tokens, relevance %.2f)",
-                                        relative_name,
-                                        token_cost,
-                                        relevance,
-                                    )
-
-                                if budget <= 0:
-                                    return 0
-                            except OSError:
-                                continue
+            top_score = 0.0
+            for hit in get_knowledge_index(self._knowledge_dir).search(intent):
+                if top_score and hit.token_cost > budget:
+                    continue
+                top_score = top_score or hit.score
+                try:
+                    with open(hit.path, encoding="utf-8") as f:
+                        content = f.read()
+                except (OSError, UnicodeDecodeError):
+                    continue
+
+                token_cost = len(content) // 4
+                if token_cost > budget:
+                    content = content[: budget * 4]
+                    token_cost = budget
+
+                # Same 0.5-1.0 band the substring scorer used, relative to the best hit.
+                relevance = 0.5 + 0.5 * hit.score / top_score
+                if self._add_knowledge_item(
+                    packet, hit.relative_name, content, "fs_scan", token_cost, relevance
+                ):
+                    budget -= token_cost
+                    logger.debug(
+                        "  [FS_SCAN] Loaded KI '%s' (%d tokens, bm25 %.3f)",
+                        hit.relative_name,
+                        token_cost,
+                        hit.score,
+                    )
+
+                if budget <= 0:
+                    return 0
         except Exception as e:
             logger.warning("  [FS_SCAN] Scan failed: %s", e)
 
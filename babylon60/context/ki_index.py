@@ -0,0 +1,219 @@
+# [C5-REAL] Exergy-Maximized
+"""Incremental BM25 index over the Knowledge Item directory.
+
+The index lives for the process and is shared by every ContextAssembler
+pointed at the same directory. Each refresh walks the tree with
+``os.scandir`` and re-reads only files whose ``(mtime_ns, size)`` changed;
+deleted files drop out of the postings. Searches refresh at most once per
+``REFRESH_INTERVAL_S``, so a burst of queries costs one directory walk. Queries score by BM25 over
+content and path terms (path terms weighted up, as the old scan favoured
+name matches) and hand back ranked hits lazily, so callers read only the
+files that fit their token budget.
+"""
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import os
+import re
+import threading
+import time
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+
+logger = logging.getLogger("babylon60.context.ki_index")
+
+__all__ = ["KIHit", "KnowledgeIndex", "get_knowledge_index", "tokenize"]
+
+KI_SUFFIXES = (".md", ".txt")
+PATH_TERM_WEIGHT = 3
+BM25_K1 = 1.2
+BM25_B = 0.75
+REFRESH_INTERVAL_S = 5.0
+
+_TERM_RE = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercase word terms, splitting on punctuation and underscores."""
+    return [t for t in _TERM_RE.findall(text.lower()) if len(t) > 2]
+
+
+@dataclass(frozen=True, slots=True)
+class KIHit:
+    """A ranked Knowledge Item; ``token_cost`` is estimated from the indexed size."""
+
+    path: str
+    relative_name: str
+    score: float
+    token_cost: int
+
+
+@dataclass(slots=True)
+class _Doc:
+    mtime_ns: int
+    size: int
+    token_cost: int
+    length: int
+    tf: dict[str, int]
+
+
+class KnowledgeIndex:
+    """Term postings and per-file stats for one knowledge directory."""
+
+    def __init__(self, root: str, refresh_interval: float = REFRESH_INTERVAL_S) -> None:
+        self.root = root
+        self.refresh_interval = refresh_interval
+        self._refreshed_at: float | None = None
+        self._docs: dict[str, _Doc] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._total_length = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def refresh(self) -> tuple[int, int]:
+        """Sync with the directory; returns ``(reindexed, removed)`` file counts."""
+        with self._lock:
+            return self._refresh_locked()
+
+    def search(self, query: str) -> Iterator[KIHit]:
+        """Refresh if the last walk is stale, then yield hits in descending BM25 order.
+
+        Ranking is a heap pop per hit, so stopping early (budget spent)
+        costs O(n + k log n) rather than a full sort.
+        """
+        terms = set(tokenize(query))
+        if not terms:
+            return iter(())
+        with self._lock:
+            now = time.monotonic()
+            if self._refreshed_at is None or now - self._refreshed_at >= self.refresh_interval:
+                self._refresh_locked()
+            scored = self._score_locked(terms)
+            docs = {path: self._docs[path].token_cost for _, path in scored}
+        return self._ranked(scored, docs)
+
+    def _ranked(self, heap: list[tuple[float, str]], costs: dict[str, int]) -> Iterator[KIHit]:
+        heapq.heapify(heap)
+        while heap:
+            neg_score, path = heapq.heappop(heap)
+            yield KIHit(
+                path=path,
+                relative_name=os.path.relpath(path, self.root),
+                score=-neg_score,
+                token_cost=costs[path],
+            )
+
+    def _score_locked(self, terms: set[str]) -> list[tuple[float, str]]:
+        n_docs = len(self._docs)
+        if not n_docs:
+            return []
+        avg_len = self._total_length / n_docs or 1.0
+        scores: dict[str, float] = {}
+        for term in terms:
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            df = len(postings)
+            idf = math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+            for path, tf in postings.items():
+                norm = BM25_K1 * (1.0 - BM25_B + BM25_B * self._docs[path].length / avg_len)
+                scores[path] = scores.get(path, 0.0) + idf * tf * (BM25_K1 + 1.0) / (tf + norm)
+        return [(-score, path) for path, score in scores.items()]
+
+    def _refresh_locked(self) -> tuple[int, int]:
+        self._refreshed_at = time.monotonic()
+        seen: set[str] = set()
+        reindexed = 0
+        for path, st in _walk_ki_files(self.root):
+            seen.add(path)
+            doc = self._docs.get(path)
+            if doc is not None and doc.mtime_ns == st.st_mtime_ns and doc.size == st.st_size:
+                continue
+            try:
+                with open(path, encoding="utf-8") as f:
+                    content = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.debug("  [KI_INDEX] Skipping unreadable '%s': %s", path, e)
+                seen.discard(path)
+                continue
+            self._remove(path)
+            self._add(path, st, content)
+            reindexed += 1
+
+        removed = [path for path in self._docs if path not in seen]
+        for path in removed:
+            self._remove(path)
+        if reindexed or removed:
+            logger.debug(
+                "  [KI_INDEX] %s: %d (re)indexed, %d removed, %d total",
+                self.root,
+                reindexed,
+                len(removed),
+                len(self._docs),
+            )
+        return reindexed, len(removed)
+
+    def _add(self, path: str, st: os.stat_result, content: str) -> None:
+        tf = Counter(tokenize(content))
+        for term in tokenize(os.path.relpath(path, self.root)):
+            tf[term] += PATH_TERM_WEIGHT
+        doc = _Doc(
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            token_cost=len(content) // 4,
+            length=sum(tf.values()),
+            tf=dict(tf),
+        )
+        self._docs[path] = doc
+        self._total_length += doc.length
+        for term, count in doc.tf.items():
+            self._postings.setdefault(term, {})[path] = count
+
+    def _remove(self, path: str) -> None:
+        doc = self._docs.pop(path, None)
+        if doc is None:
+            return
+        self._total_length -= doc.length
+        for term in doc.tf:
+            postings = self._postings.get(term)
+            if postings is not None:
+                postings.pop(path, None)
+                if not postings:
+                    del self._postings[term]
+
+
+def _walk_ki_files(root: str) -> Iterator[tuple[str, os.stat_result]]:
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.name.endswith(KI_SUFFIXES) and entry.is_file():
+                            yield entry.path, entry.stat()
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+_indexes: dict[str, KnowledgeIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_knowledge_index(root: str) -> KnowledgeIndex:
+    """The process-wide index for ``root``, created on first use."""
+    with _indexes_lock:
+        index = _indexes.get(root)
+        if index is None:
+            index = _indexes[root] = KnowledgeIndex(root)
+        return index
@@ -64,6 +64,12 @@ class CortexConfig:
     CHECKPOINT_MIN: int = 100
     CHECKPOINT_MAX: int = 1000
     CONNECTION_POOL_SIZE: int = 5
+    SEARCH_BRANCH_TIMEOUT: float = 2.0  # Seconds per hybrid-search branch
+    TIME_TRAVEL_CHECKPOINT_EVERY: int = 500  # Tenant txs between state checkpoints (0 = off)
+    POST_STORE_ASYNC: bool = True  # Post-store work in a background task (0 = inline after commit)
+    POST_STORE_MAX_ATTEMPTS: int = 5
+    GUARD_ADAPTIVE_ORDER: bool = True  # Re-order pre-store guards by reject rate / cost
+    GUARD_CACHE_SIZE: int = 4096  # Cached passes of deterministic guards
 
     # Federation
     FEDERATION_MODE: str = "single"
@@ -86,6 +92,8 @@ class CortexConfig:
     EMBEDDINGS_DIMENSION: int = 768
     EMBEDDINGS_MODEL: str = ""  # Override model name (empty = provider default)
     EMBEDDINGS_TASK_TYPE: str = "RETRIEVAL_DOCUMENT"
+    EMBEDDING_CACHE_PATH: str = ""  # Opt-in vector cache file ("" = disabled)
+    EMBEDDING_CACHE_MAX_MB: int = 256
 
     # L2 Vector Store
     VECTOR_STORE_PATH: str = ""
@@ -177,6 +185,12 @@ class CortexConfig:
             CHECKPOINT_MIN=int(_moskv_env("CHECKPOINT_MIN", "100")),
             CHECKPOINT_MAX=int(_moskv_env("CHECKPOINT_MAX", "1000")),
             CONNECTION_POOL_SIZE=int(_moskv_env("POOL_SIZE", "5")),
+            SEARCH_BRANCH_TIMEOUT=float(_moskv_env("SEARCH_BRANCH_TIMEOUT", "2.0")),
+            TIME_TRAVEL_CHECKPOINT_EVERY=int(_moskv_env("TIME_TRAVEL_CHECKPOINT_EVERY", "500")),
+            POST_STORE_ASYNC=_moskv_env("POST_STORE_ASYNC", "1") == "1",
+            POST_STORE_MAX_ATTEMPTS=int(_moskv_env("POST_STORE_MAX_ATTEMPTS", "5")),
+            GUARD_ADAPTIVE_ORDER=_moskv_env("GUARD_ADAPTIVE_ORDER", "1") == "1",
+            GUARD_CACHE_SIZE=int(_moskv_env("GUARD_CACHE_SIZE", "4096")),
             FEDERATION_MODE=_moskv_env("FEDERATION_MODE", "single"),
             SHARD_DIR=Path(_moskv_env("SHARD_DIR", str(CORTEX_DIR / "shards"))),
             MCP_MAX_CONTENT_LENGTH=int(_moskv_env("MCP_MAX_CONTENT", "50000")),
@@ -192,6 +206,8 @@ class CortexConfig:
             EMBEDDINGS_DIMENSION=int(_moskv_env("EMBEDDINGS_DIM", "768")),
             EMBEDDINGS_MODEL=_moskv_env("EMBEDDINGS_MODEL", ""),
             EMBEDDINGS_TASK_TYPE=_moskv_env("EMBEDDINGS_TASK_TYPE", "RETRIEVAL_DOCUMENT"),
+            EMBEDDING_CACHE_PATH=_moskv_env("EMBED_CACHE", ""),
+            EMBEDDING_CACHE_MAX_MB=int(_moskv_env("EMBED_CACHE_MB", "256")),
             VECTOR_STORE_PATH=_moskv_env("VECTOR_STORE_PATH", str(CORTEX_DIR / "vectors")),
             VECTOR_STORE_MODE=_moskv_env("VECTOR_STORE_MODE", "local"),
             LLM_PROVIDER=_moskv_env("LLM_PROVIDER", "deepseek"),
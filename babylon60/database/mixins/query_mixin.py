@@ -9,16 +9,25 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any
 
 from babylon60.engine.mixins.base import FACT_COLUMNS, FACT_JOIN, EngineMixinBase
-from babylon60.memory.temporal import build_temporal_filter_params, time_travel_filter
+from babylon60.memory.temporal import build_temporal_filter_params
 
 if TYPE_CHECKING:
     from babylon60.search import SearchResult
 __all__ = ["QueryMixin"]
 logger = logging.getLogger("babylon60")
 
+# Temporal proximity adds at most 0.2 to a score weighted 0.8 by consensus, so
+# a fact more than 0.2 / 0.8 below the recall cut-off can never outrank it.
+_RECALL_RECENCY_MARGIN = 0.25
+
+# Ids per ``IN (...)`` when loading a time-travel snapshot (SQLite's default
+# bound-parameter limit is 999 on older builds).
+_ID_CHUNK = 500
+
 
 class QueryMixin(EngineMixinBase):
     """Query Layer - Recall, History, Time-Travel, Graph, and Stats.
@@ -109,27 +118,30 @@ class QueryMixin(EngineMixinBase):
         """Bayesian-scored recall with temporal decay.
         Scoring: ``consensus_score * 0.8 + temporal_proximity * 0.2``.
         Excludes quarantined and tombstoned facts.
+        With a ``limit``, candidates are read from ``idx_facts_recall`` by
+        consensus score and only those are ranked with temporal decay.
         """
         tenant_id = self._resolve_tenant(tenant_id)
         async with self.session() as conn:
-            q = (
-                f"SELECT {FACT_COLUMNS} "
-                f"{FACT_JOIN} "
+            where = (
                 "WHERE f.tenant_id = ? AND f.project = ? "
                 "AND f.is_quarantined = 0 "
                 "AND f.is_tombstoned = 0"
             )
             params: list = [tenant_id, project]
             if fact_type:
-                q += " AND f.fact_type = ?"
+                where += " AND f.fact_type = ?"
                 params.append(fact_type)
+            if limit:
+                cutoff = await self._recall_score_cutoff(conn, where, params, limit + offset)
+                if cutoff is not None:
+                    where += " AND f.consensus_score >= ?"
+                    params.append(cutoff - _RECALL_RECENCY_MARGIN)
             # Unified Scoring: Bayesian reputation + Temporal decay
-            # Guard json_extract against encrypted meta (v6_aesgcm: prefix)
-            q += """
+            q = f"""
+                SELECT {FACT_COLUMNS} {FACT_JOIN} {where}
                 ORDER BY (
-                    CASE WHEN f.metadata LIKE 'v6_aesgcm:%' THEN 1.0
-                         ELSE coalesce(json_extract(f.metadata, '$.consensus_score'), 1.0)
-                    END * 0.8
+                    coalesce(f.consensus_score, 1.0) * 0.8
                     + (1.0 / (1.0 + (
                         julianday('now') - julianday(f.created_at)
                     ))) * 0.2
@@ -146,6 +158,20 @@ class QueryMixin(EngineMixinBase):
             facts = [self._row_to_fact(row, tenant_id=tenant_id) for row in rows]
             return await self._resolve_symlinks_async(facts, conn, tenant_id)
 
+    @staticmethod
+    async def _recall_score_cutoff(conn: Any, where: str, params: list, depth: int) -> float | None:
+        """Consensus score of the ``depth``-th best fact, read off the recall index.
+
+        ``None`` when fewer than ``depth`` facts match (rank them all).
+        """
+        async with conn.execute(
+            f"SELECT f.consensus_score {FACT_JOIN} {where} "
+            "ORDER BY f.consensus_score DESC LIMIT 1 OFFSET ?",
+            [*params, depth - 1],
+        ) as cursor:
+            row = await cursor.fetchone()
+        return float(row[0]) if row and row[0] is not None else None
+
     async def history(
         self,
         project: str,
@@ -199,33 +225,28 @@ class QueryMixin(EngineMixinBase):
             ValueError: If the transaction ID does not exist.
         """
         tenant_id = self._resolve_tenant(tenant_id)
+        if not tx_id:
+            return await self.recall(project, tenant_id=tenant_id)
+        from babylon60.core import config
+        from babylon60.memory.time_travel import live_fact_bitmap
+
         async with self.session() as conn:
-            if not tx_id:
-                return await self.recall(project, tenant_id=tenant_id)
-            async with conn.execute(
-                "SELECT created_at FROM transactions WHERE id = ? AND tenant_id = ?",
-                (tx_id, tenant_id),
-            ) as cursor:
-                tx = await cursor.fetchone()
-                if not tx:
-                    raise ValueError(f"Transaction {tx_id} not found for tenant {tenant_id}")
-            tx_time = tx[0]
+            live = await live_fact_bitmap(
+                conn, tenant_id, tx_id, checkpoint_every=config.TIME_TRAVEL_CHECKPOINT_EVERY
+            )
+            # One pass over the project's facts born by tx_id, kept if live.
             q = (
                 f"SELECT {FACT_COLUMNS} {FACT_JOIN} "  # nosec B608
-                "WHERE f.tenant_id = ? AND f.project = ? "
-                "AND f.is_tombstoned = 0 "
-                "AND f.created_at <= ? "
-                "AND (f.is_tombstoned = 0 OR "
-                "json_extract(f.metadata, '$.tombstoned_at') > ? OR "
-                "json_extract(f.metadata, '$.valid_until') > ?) "
-                "ORDER BY f.id ASC"
+                "WHERE f.tenant_id = ? AND f.project = ? AND f.is_tombstoned = 0 "
+                "AND f.tx_id <= ? ORDER BY f.id ASC"
             )
-            async with conn.execute(
-                q,
-                [tenant_id, project, tx_time, tx_time, tx_time],
-            ) as cursor:
+            async with conn.execute(q, (tenant_id, project, tx_id)) as cursor:
                 rows = await cursor.fetchall()
-            facts = [self._row_to_fact(row, tenant_id=tenant_id) for row in rows]
+            facts = [
+                self._row_to_fact(row, tenant_id=tenant_id)
+                for row in rows
+                if row[0] < len(live) and live[row[0]]
+            ]
             return await self._resolve_symlinks_async(facts, conn, tenant_id)
 
     async def time_travel(
@@ -236,7 +257,12 @@ class QueryMixin(EngineMixinBase):
         """Global world-state snapshot at a given transaction.
         Unlike ``reconstruct_state()``, this is project-agnostic -
         it returns *all* facts across all projects at the given point.
+        The live set comes from the nearest state checkpoint plus the facts
+        created or deprecated since (:mod:`babylon60.memory.time_travel`).
         """
+        from babylon60.core import config
+        from babylon60.memory.time_travel import live_fact_ids
+
         tenant_id = self._resolve_tenant(tenant_id)
         async with self.session() as conn:
             if tx_id is None:
@@ -248,21 +274,40 @@ class QueryMixin(EngineMixinBase):
                 )
                 async with conn.execute(q, [tenant_id]) as cursor:
                     rows = await cursor.fetchall()
-            else:
-                clause, tparams = time_travel_filter(
-                    tx_id,
-                    table_alias="f",
-                )
-                q = (
-                    f"SELECT {FACT_COLUMNS} {FACT_JOIN} "
-                    f"WHERE f.tenant_id = ? "
-                    f"AND f.is_tombstoned = 0 AND {clause} "
-                    "ORDER BY f.id ASC"
-                )  # nosec B608 - parameterized via temporal builder
-                async with conn.execute(q, [tenant_id, *tparams]) as cursor:
-                    rows = await cursor.fetchall()
-            facts = [self._row_to_fact(row, tenant_id=tenant_id) for row in rows]
-            return await self._resolve_symlinks_async(facts, conn, tenant_id)
+                facts = [self._row_to_fact(row, tenant_id=tenant_id) for row in rows]
+                return await self._resolve_symlinks_async(facts, conn, tenant_id)
+            if not isinstance(tx_id, int) or tx_id <= 0:
+                raise ValueError(f"Invalid tx_id: {tx_id!r}")
+            ids = await live_fact_ids(
+                conn, tenant_id, tx_id, checkpoint_every=config.TIME_TRAVEL_CHECKPOINT_EVERY
+            )
+            return await self._facts_by_ids(conn, tenant_id, ids)
+
+    async def _facts_by_ids(
+        self,
+        conn: Any,
+        tenant_id: str,
+        ids: Sequence[int],
+    ) -> list[dict[str, Any]]:
+        """Load live facts by primary key in ascending id order, symlinks resolved.
+
+        Tombstoned facts are dropped: apoptosis tombstones without setting
+        ``valid_until``, so the time-travel replay still counts them as live.
+        """
+        where = "WHERE f.tenant_id = ? AND f.is_tombstoned = 0"
+        facts: list[dict[str, Any]] = []
+        for start in range(0, len(ids), _ID_CHUNK):
+            chunk = [int(i) for i in ids[start : start + _ID_CHUNK]]
+            placeholders = ",".join("?" * len(chunk))
+            q = (
+                f"SELECT {FACT_COLUMNS} {FACT_JOIN} {where} "  # nosec B608
+                f"AND f.id IN ({placeholders}) ORDER BY f.id ASC"
+            )
+            params = [tenant_id, *chunk]
+            async with conn.execute(q, params) as cursor:
+                rows = await cursor.fetchall()
+            facts.extend(self._row_to_fact(row, tenant_id=tenant_id) for row in rows)
+        return await self._resolve_symlinks_async(facts, conn, tenant_id)
 
     async def stats(self, tenant_id: str = "default") -> dict:
         tenant_id = self._resolve_tenant(tenant_id)
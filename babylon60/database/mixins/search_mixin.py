@@ -88,6 +88,7 @@ class SearchMixin(EngineMixinBase):
                     as_of=as_of,
                     confidence=confidence,
                     causal_gap=causal_gap,
+                    pool=self._search_pool(),
                     **kwargs,
                 )
 
@@ -197,6 +198,32 @@ class SearchMixin(EngineMixinBase):
 
                 return fallback_results
 
+    def _search_pool(self) -> Any:
+        """Pool whose connections serve hybrid-search branches in parallel.
+
+        The engine's own pool when it has one, otherwise a lazily opened
+        read-only pool on the database file. ``None`` for in-memory databases,
+        where a second connection would see a different database.
+        """
+        if getattr(self, "_pool", None) is not None:
+            return self._pool  # type: ignore[attr-defined]
+        pool = getattr(self, "_read_pool", None)
+        if pool is None:
+            db_path = getattr(self, "_db_path", None)
+            if db_path is None or ":memory:" in str(db_path) or not db_path.exists():
+                return None
+            from babylon60.core import config
+            from babylon60.database.pool import CortexConnectionPool
+
+            pool = CortexConnectionPool(
+                str(db_path),
+                min_connections=2,
+                max_connections=max(2, config.CONNECTION_POOL_SIZE),
+                read_only=True,
+            )
+            self._read_pool = pool
+        return pool
+
     async def _enrich_with_graph_context(
         self, conn, results: list[Any], query: str, graph_depth: int, tenant_id: str = "default"
     ) -> None:
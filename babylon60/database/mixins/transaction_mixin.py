@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import sqlite3
+from collections.abc import Sequence
 from typing import Any, cast
 
 import aiosqlite
@@ -38,20 +39,7 @@ class TransactionMixin(EngineMixinBase):
         from babylon60.utils.canonical import canonical_json, compute_tx_hash
         from babylon60.utils.locks import get_loop_lock
 
-        # JIS (SOC 2 / C5 / GDPR) Audit Policy Check
-        try:
-            from babylon60.extensions.policy.jis_auditor import JISAuditor
-
-            auditor = JISAuditor(enforce_encryption=False)  # Enforced softly
-            violations = auditor.audit_payload(detail, event_id=f"tx_pending_{project}_{action}")
-            if violations:
-                logger.error(
-                    f"JIS Policy violation in project '{project}' for action '{action}': {violations}"
-                )
-                # Depending on strictness, we might raise an Exception here,
-                # but for now we log it as an error to track entropy.
-        except (ValueError, TypeError, KeyError, OSError, RuntimeError) as exc:
-            logger.warning("Suppressed exception: %s", exc)
+        self._audit_tx_detail(project, action, detail)
 
         dj = canonical_json(detail)
         ts = now_iso()
@@ -78,22 +66,95 @@ class TransactionMixin(EngineMixinBase):
             )
             tx_id = c.lastrowid
 
-            if getattr(self, "_ledger", None):
-                try:
-                    self._ledger.record_write()
-                    if not getattr(self, "_closing", False):
-                        await self._ledger.create_checkpoint_async(conn)
-                except (sqlite3.Error, OSError, RuntimeError, AttributeError, ValueError) as e:
-                    logger.warning("Auto-checkpoint failed: %s", e)
-                    from babylon60.telemetry.metrics import metrics
-
-                    metrics.inc(
-                        "cortex_ledger_checkpoint_failures_total",
-                        meta={"error": str(e)},
-                    )
+            await self._ledger_after_writes(conn, 1)
 
             return int(tx_id) if tx_id is not None else 0
 
+    async def _log_transactions(
+        self,
+        conn: aiosqlite.Connection,
+        entries: Sequence[tuple[str, str, dict[str, Any]]],
+        tenant_id: str = "default",
+    ) -> list[int]:
+        """Append ``(project, action, detail)`` entries to the tenant's chain in one pass.
+
+        Same records as calling ``_log_transaction`` per entry, but the chain
+        head is read once and the rows go in with a single ``executemany``.
+        """
+        from babylon60.engine.core.fact_store_core import next_autoincrement_id
+        from babylon60.utils.canonical import canonical_json, compute_tx_hash
+        from babylon60.utils.locks import get_loop_lock
+
+        if not entries:
+            return []
+        for project, action, detail in entries:
+            self._audit_tx_detail(project, action, detail)
+
+        async with get_loop_lock(self, "write"):
+            if not conn.in_transaction:
+                await conn.execute("BEGIN IMMEDIATE")
+
+            cursor = await conn.execute(
+                "SELECT hash FROM transactions WHERE tenant_id = ? ORDER BY id DESC LIMIT 1",
+                (tenant_id,),
+            )
+            prev = await cursor.fetchone()
+            await cursor.close()
+            ph = prev[0] if prev else "GENESIS"
+
+            first_id = await next_autoincrement_id(conn, "transactions")
+            rows = []
+            for tx_id, (project, action, detail) in enumerate(entries, start=first_id):
+                dj = canonical_json(detail)
+                ts = now_iso()
+                th = compute_tx_hash(ph, project, action, dj, ts, tenant_id=tenant_id)
+                rows.append((tx_id, tenant_id, project, action, dj, ph, th, ts))
+                ph = th
+
+            await conn.executemany(
+                "INSERT INTO transactions "
+                "(id, tenant_id, project, action, detail, prev_hash, hash, timestamp) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            await self._ledger_after_writes(conn, len(rows))
+
+            return [row[0] for row in rows]
+
+    @staticmethod
+    def _audit_tx_detail(project: str, action: str, detail: dict[str, Any]) -> None:
+        # JIS (SOC 2 / C5 / GDPR) Audit Policy Check
+        try:
+            from babylon60.extensions.policy.jis_auditor import JISAuditor
+
+            auditor = JISAuditor(enforce_encryption=False)  # Enforced softly
+            violations = auditor.audit_payload(detail, event_id=f"tx_pending_{project}_{action}")
+            if violations:
+                logger.error(
+                    f"JIS Policy violation in project '{project}' for action '{action}': {violations}"
+                )
+                # Depending on strictness, we might raise an Exception here,
+                # but for now we log it as an error to track entropy.
+        except (ValueError, TypeError, KeyError, OSError, RuntimeError) as exc:
+            logger.warning("Suppressed exception: %s", exc)
+
+    async def _ledger_after_writes(self, conn: aiosqlite.Connection, count: int) -> None:
+        if not getattr(self, "_ledger", None):
+            return
+        try:
+            for _ in range(count):
+                self._ledger.record_write()
+            if not getattr(self, "_closing", False):
+                await self._ledger.create_checkpoint_async(conn)
+        except (sqlite3.Error, OSError, RuntimeError, AttributeError, ValueError) as e:
+            logger.warning("Auto-checkpoint failed: %s", e)
+            from babylon60.telemetry.metrics import metrics
+
+            metrics.inc(
+                "cortex_ledger_checkpoint_failures_total",
+                meta={"error": str(e)},
+            )
+
     async def verify_ledger(self) -> dict[str, Any]:
         """Verify the integrity of the sovereign ledger (Operation Void)."""
         if not getattr(self, "_ledger", None):
@@ -55,6 +55,7 @@ __all__ = [
     "CREATE_FACTS_FTS",
     "CREATE_FACTS_FTS_TRIGGERS",
     "CREATE_FACTS_INDEXES",
+    "CREATE_FACT_STATE_CHECKPOINTS",
     "CREATE_GHOSTS",
     "CREATE_GHOSTS_INDEX",
     "CREATE_HEARTBEATS",
@@ -65,6 +66,7 @@ __all__ = [
     "CREATE_MERKLE_ROOTS",
     "CREATE_META",
     "CREATE_OUTCOMES",
+    "CREATE_POST_STORE_OUTBOX",
     "CREATE_PROCEDURAL_ENGRAMS",
     "CREATE_RWC_INDEXES",
     "CREATE_SESSIONS",
@@ -139,6 +141,10 @@ CREATE INDEX IF NOT EXISTS idx_facts_proj_type ON facts(project, fact_type);
 CREATE INDEX IF NOT EXISTS idx_facts_tombstone ON facts(is_tombstoned);
 CREATE INDEX IF NOT EXISTS idx_facts_tenant_valid ON facts(tenant_id, valid_until);
 CREATE INDEX IF NOT EXISTS idx_facts_proj_valid ON facts(project, valid_until);
+-- Recall candidates by consensus score (QueryMixin.recall)
+CREATE INDEX IF NOT EXISTS idx_facts_recall ON facts(tenant_id, project, consensus_score);
+-- Time-travel delta replay (babylon60.memory.time_travel)
+CREATE INDEX IF NOT EXISTS idx_facts_tenant_tx ON facts(tenant_id, tx_id);
 -- Double-Plane Faceting Indexes
 CREATE INDEX IF NOT EXISTS idx_facts_quadrant ON facts(quadrant);
 CREATE INDEX IF NOT EXISTS idx_facts_category ON facts(category);
@@ -209,6 +215,65 @@ CREATE TABLE IF NOT EXISTS transactions (
 );
 """
 
+# ─── Time-Travel State Checkpoints ───────────────────────────────────
+# Live fact-id bitmap per tenant at a transaction. The triggers drop
+# checkpoints that a history rewrite (reactivation, back-dated insert,
+# tx re-link) would make stale; ordinary deprecation only touches the future.
+CREATE_FACT_STATE_CHECKPOINTS = """
+CREATE TABLE IF NOT EXISTS fact_state_checkpoints (
+    tenant_id   TEXT NOT NULL,
+    tx_id       INTEGER NOT NULL,
+    tx_time     TEXT NOT NULL,
+    fact_count  INTEGER NOT NULL,
+    bitmap      BLOB NOT NULL,
+    created_at  TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (tenant_id, tx_id)
+) WITHOUT ROWID;
+
+CREATE TRIGGER IF NOT EXISTS trg_fact_checkpoints_insert
+AFTER INSERT ON facts
+WHEN NEW.tx_id IS NOT NULL
+BEGIN
+    DELETE FROM fact_state_checkpoints
+    WHERE tenant_id = NEW.tenant_id AND tx_id >= NEW.tx_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_fact_checkpoints_update
+AFTER UPDATE OF tx_id, valid_until, tenant_id ON facts
+WHEN OLD.tx_id IS NOT NEW.tx_id
+  OR OLD.tenant_id IS NOT NEW.tenant_id
+  OR OLD.valid_until IS NOT NEW.valid_until
+BEGIN
+    DELETE FROM fact_state_checkpoints
+    WHERE tenant_id IN (OLD.tenant_id, NEW.tenant_id)
+      AND (
+        OLD.tx_id IS NOT NEW.tx_id
+        OR OLD.tenant_id IS NOT NEW.tenant_id
+        OR tx_time >= OLD.valid_until
+        OR tx_time >= NEW.valid_until
+      );
+END;
+"""
+
+# Post-store work (embedding, HDC, hooks) recorded in the store transaction
+# and executed after commit. status: pending | running | done | failed.
+CREATE_POST_STORE_OUTBOX = """
+CREATE TABLE IF NOT EXISTS post_store_outbox (
+    fact_id     INTEGER PRIMARY KEY,
+    tenant_id   TEXT NOT NULL DEFAULT 'default',
+    project     TEXT NOT NULL,
+    fact_type   TEXT NOT NULL,
+    source      TEXT,
+    status      TEXT NOT NULL DEFAULT 'pending',
+    attempts    INTEGER NOT NULL DEFAULT 0,
+    last_error  TEXT,
+    created_at  REAL NOT NULL DEFAULT ((julianday('now') - 2440587.5) * 86400.0),
+    claimed_at  REAL,
+    done_at     REAL
+);
+CREATE INDEX IF NOT EXISTS idx_post_store_outbox_status ON post_store_outbox(status, fact_id);
+"""
+
 CREATE_TRANSACTIONS_INDEX = """
 CREATE INDEX IF NOT EXISTS idx_tx_tenant ON transactions(tenant_id);
 CREATE INDEX IF NOT EXISTS idx_tx_project ON transactions(project);
@@ -381,6 +446,8 @@ _CORE_SCHEMA = [
     CREATE_SESSIONS,
     CREATE_TRANSACTIONS,
     CREATE_TRANSACTIONS_INDEX,
+    CREATE_FACT_STATE_CHECKPOINTS,
+    CREATE_POST_STORE_OUTBOX,
     CREATE_HEARTBEATS,
     CREATE_HEARTBEATS_INDEX,
     CREATE_TIME_ENTRIES,
@@ -138,6 +138,14 @@ CREATE INDEX IF NOT EXISTS idx_enrichment_jobs_status ON enrichment_jobs(status,
 CREATE INDEX IF NOT EXISTS idx_enrichment_jobs_fact ON enrichment_jobs(fact_id);
 """
 
+# ─── Near-Duplicate Signatures (Compaction DEDUP) ───────────────────
+CREATE_FACT_MINHASH = """
+CREATE TABLE IF NOT EXISTS fact_minhash (
+    fact_id   INTEGER PRIMARY KEY REFERENCES facts(id),
+    signature BLOB NOT NULL
+);
+"""
+
 # ─── Full-Text Search (Decoupled in v5) ─────────────────────────────
 CREATE_FACTS_FTS = """
 CREATE VIRTUAL TABLE IF NOT EXISTS facts_fts USING fts5(
@@ -158,6 +166,7 @@ CREATE TABLE IF NOT EXISTS merkle_roots (
     tx_start_id     INTEGER NOT NULL,
     tx_end_id       INTEGER NOT NULL,
     tx_count        INTEGER NOT NULL,
+    hash_version    INTEGER NOT NULL DEFAULT 1,
     timestamp       TEXT NOT NULL DEFAULT (datetime('now'))
 );
 """
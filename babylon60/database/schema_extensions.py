@@ -26,6 +26,7 @@ from .schema_ext_2 import (
     CREATE_ENTITY_EVENTS_INDEXES,
     CREATE_EPISODES_FTS_TRIGGERS,
     CREATE_EXECUTION_TRACE_LEDGER,
+    CREATE_FACT_MINHASH,
     CREATE_FACTS_FTS,
     CREATE_FACTS_FTS_TRIGGERS,
     CREATE_INTEGRITY_CHECKS,
@@ -68,6 +69,7 @@ EXTENSION_SCHEMA = [
     CREATE_CAUSAL_EDGES,
     CREATE_ENRICHMENT_JOBS,
     CREATE_ENRICHMENT_JOBS_INDEXES,
+    CREATE_FACT_MINHASH,
     CREATE_PROCEDURAL_ENGRAMS,
     CREATE_FACTS_FTS,
     CREATE_FACTS_FTS_TRIGGERS,
@@ -38,6 +38,13 @@ Usage:
         # Auto-commits on exit, auto-rollbacks on exception
 
     await writer.stop()
+
+Group commit:
+    SqliteWriteWorker(db_path, group_commit=True) drains the single writes
+    queued within a small time/size budget into one BEGIN IMMEDIATE … COMMIT,
+    so a burst of INSERTs shares one WAL fsync. Each op runs under its own
+    SAVEPOINT: a failing op fails only its own future. Futures resolve after
+    the group commits. Writes issued inside transaction() are never grouped.
 """
 
 from __future__ import annotations
@@ -63,6 +70,7 @@ from babylon60.database.messages import (
     _WriteManyOp,
     _WriteOp,
 )
+from babylon60.telemetry.metrics import metrics
 from babylon60.utils.result import Err, Ok, Result
 
 __all__ = ["SqliteWriteWorker"]
@@ -84,9 +92,20 @@ class SqliteWriteWorker:
     # Checkpoint WAL every N writes to avoid unbounded WAL growth.
     _CHECKPOINT_INTERVAL: int = 5000
 
-    def __init__(self, db_path: str, *, queue_size: int = 10_000):
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        queue_size: int = 10_000,
+        group_commit: bool = False,
+        group_max_ops: int = 256,
+        group_max_wait_ms: float = 2.0,
+    ):
         self._db_path = db_path
         self._queue: queue.Queue[_Message] = queue.Queue(maxsize=queue_size)
+        self._group_commit = group_commit
+        self._group_max_ops = max(1, group_max_ops)
+        self._group_max_wait = max(0.0, group_max_wait_ms) / 1000
         self._thread: threading.Thread | None = None
         self._conn: sqlite3.Connection | None = None
         self._started = False
@@ -268,9 +287,18 @@ class SqliteWriteWorker:
 
         logger.debug("Writer loop started, processing queue")
 
+        # A message pulled off the queue while collecting a group that cannot
+        # join it; it runs next, after the group commits.
+        pending: _Message | None = None
         while True:
-            msg = self._queue.get()
+            msg = pending if pending is not None else self._queue.get()
+            pending = None
             try:
+                if self._group_commit and isinstance(msg, _WriteOp) and not conn.in_transaction:
+                    group, pending = self._collect_group(msg)
+                    if len(group) > 1:
+                        self._process_group(conn, group, loop)
+                        continue
                 should_exit = self._dispatch_message(msg, conn, loop)
                 if should_exit:
                     break
@@ -376,6 +404,74 @@ class SqliteWriteWorker:
                 Err(f"SQLite write error: {e}"),
             )
 
+    def _collect_group(self, first: _WriteOp) -> tuple[list[_WriteOp], _Message | None]:
+        """Drain queued single writes into a group within the time/size budget.
+
+        Returns the group and the first message that could not join it.
+        """
+        group = [first]
+        deadline = time.monotonic() + self._group_max_wait
+        while len(group) < self._group_max_ops:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    msg = self._queue.get(timeout=remaining)
+                else:
+                    msg = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if not isinstance(msg, _WriteOp):
+                return group, msg
+            group.append(msg)
+        return group, None
+
+    def _process_group(
+        self,
+        conn: sqlite3.Connection,
+        ops: list[_WriteOp],
+        loop: asyncio.AbstractEventLoop,
+    ) -> None:
+        """Run ``ops`` in one transaction, isolating each behind a savepoint."""
+        start_exec = time.monotonic()
+        results: list[Result[int, str]] = []
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            for op in ops:
+                conn.execute("SAVEPOINT group_op")
+                try:
+                    cursor = conn.execute(op.sql, op.params)
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO group_op")
+                    logger.warning("Write failed: %s | SQL: %s", e, op.sql[:100])
+                    results.append(Err(f"SQLite write error: {e}"))
+                else:
+                    results.append(Ok(cursor.rowcount))
+                conn.execute("RELEASE group_op")
+            start_commit = time.monotonic()
+            conn.commit()
+            metrics.observe("cortex_db_writer_commit_seconds", time.monotonic() - start_commit)
+        except sqlite3.Error as e:
+            logger.warning("Group commit of %d writes failed: %s", len(ops), e)
+            try:
+                conn.rollback()
+            except sqlite3.Error:
+                pass
+            results = [Err(f"SQLite group commit error: {e}")] * len(ops)
+
+        metrics.observe("cortex_db_writer_batch_size", float(len(ops)))
+        exec_ms = (time.monotonic() - start_exec) * 1000 / len(ops)
+        for op, result in zip(ops, results, strict=True):
+            ops_done = self._metrics["total_ops"]
+            self._metrics["avg_exec_ms"] = (self._metrics["avg_exec_ms"] * ops_done + exec_ms) / (
+                ops_done + 1
+            )
+            self._metrics["total_ops"] += 1
+            loop.call_soon_threadsafe(op.future.set_result, result)
+
+        self._write_count += len(ops)
+        if self._write_count >= self._CHECKPOINT_INTERVAL:
+            self._maybe_checkpoint(conn, loop)
+
     def _process_write_many(
         self,
         conn: sqlite3.Connection,
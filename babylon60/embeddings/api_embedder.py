@@ -400,6 +400,16 @@ class APIEmbedder:
         """Return the active provider name."""
         return self._provider
 
+    @property
+    def model_identity_hash(self) -> str:
+        """Stable identity of the vectors this embedder produces (cache key)."""
+        from babylon60.crypto.hash_registry import cortex_hash
+
+        payload = (
+            f"{self._provider}:{self._config.get('model', '')}:{self._target_dim}:{self._task_type}"
+        )
+        return cortex_hash(payload.encode("utf-8"))
+
     @property
     def supports_multimodal(self) -> bool:
         """Return True if current provider supports multimodal input."""
@@ -0,0 +1,317 @@
+# [C5-REAL] Exergy-Maximized
+"""Content-addressed embedding cache.
+
+Vectors are keyed by ``(model_identity_hash, cortex_hash(content))`` and
+stored as packed little-endian float32 blobs in a small SQLite file, with an
+in-process LRU of packed vectors in front. Byte-identical content embedded by
+the same model is therefore computed once, whether it arrives through
+:class:`EmbeddingManager`, ``LocalEmbedder``, ``ReindexPipeline`` or
+compaction's ``batch_fingerprint``.
+
+The on-disk file is bounded by ``max_bytes``; least-recently-used rows are
+evicted first. Disk hits only record their access time in memory; the
+timestamps are written back with the next ``put_many``, every
+``_TOUCH_FLUSH`` hits, or on ``close``. Hits and misses are reported as
+``cortex_embedding_cache_requests_total{tier,result}``.
+
+The process-wide cache is opt-in: set ``CORTEX_EMBED_CACHE`` to the path of
+the SQLite file to use (e.g. ``~/.cortex/embedding_cache.db``).
+"""
+
+from __future__ import annotations
+
+import logging
+import struct
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any
+
+from babylon60.crypto.hash_registry import cortex_hash
+from babylon60.telemetry.metrics import metrics
+
+__all__ = ["EmbeddingCache", "cached_embed_batch", "get_embedding_cache", "model_identity"]
+
+logger = logging.getLogger("babylon60.embeddings.cache")
+
+_CREATE_SQL = """
+CREATE TABLE IF NOT EXISTS embedding_cache (
+    model_hash   TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    vector       BLOB NOT NULL,
+    last_used    REAL NOT NULL,
+    PRIMARY KEY (model_hash, content_hash)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_embedding_cache_lru ON embedding_cache(last_used);
+"""
+
+# SQLite's default bound-parameter limit is 999 on older builds.
+_SQL_CHUNK = 400
+# Buffered disk-hit access times are written back once this many accumulate.
+_TOUCH_FLUSH = 256
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return struct.pack(f"<{len(vector)}f", *vector)
+
+
+def _unpack(blob: bytes) -> list[float]:
+    return list(struct.unpack(f"<{len(blob) // 4}f", blob))
+
+
+class EmbeddingCache:
+    """Two-tier (LRU + SQLite) cache of embedding vectors. Thread-safe."""
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        max_bytes: int = 256 * 1024 * 1024,
+        lru_size: int = 4096,
+    ) -> None:
+        self._path = str(path)
+        self._max_bytes = max_bytes
+        self._lru_size = lru_size
+        self._lru: OrderedDict[tuple[str, str], bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: Any = None
+        self._disk_bytes: int | None = None
+        self._touched: dict[tuple[str, str], float] = {}
+
+    def _connection(self) -> Any:
+        if self._conn is None:
+            from babylon60.database.core import causal_write, connect
+
+            Path(self._path).parent.mkdir(parents=True, exist_ok=True)
+            conn = connect(self._path)
+            with causal_write(conn):
+                conn.executescript(_CREATE_SQL)
+                conn.commit()
+            self._conn = conn
+        return self._conn
+
+    @staticmethod
+    def content_key(content: str) -> str:
+        return cortex_hash(content)
+
+    def get(self, model_hash: str, content: str) -> list[float] | None:
+        return self.get_many(model_hash, [content])[0]
+
+    def put(self, model_hash: str, content: str, vector: Sequence[float]) -> None:
+        self.put_many(model_hash, [content], [vector])
+
+    def get_many(self, model_hash: str, contents: Sequence[str]) -> list[list[float] | None]:
+        """Look up ``contents``; ``None`` marks a miss."""
+        keys = [self.content_key(c) for c in contents]
+        found: dict[str, bytes] = {}
+        with self._lock:
+            for key in keys:
+                blob = self._lru.get((model_hash, key))
+                if blob is not None:
+                    self._lru.move_to_end((model_hash, key))
+                    found[key] = blob
+            memory_hits = len(found)
+            missing = sorted({k for k in keys if k not in found})
+            if missing:
+                found.update(self._read_disk(model_hash, missing))
+        disk_hits = len(found) - memory_hits
+        misses = sum(1 for k in keys if k not in found)
+        if memory_hits:
+            metrics.inc(
+                "cortex_embedding_cache_requests_total",
+                {"tier": "memory", "result": "hit"},
+                memory_hits,
+            )
+        if disk_hits:
+            metrics.inc(
+                "cortex_embedding_cache_requests_total",
+                {"tier": "disk", "result": "hit"},
+                disk_hits,
+            )
+        if misses:
+            metrics.inc(
+                "cortex_embedding_cache_requests_total", {"tier": "disk", "result": "miss"}, misses
+            )
+        return [_unpack(found[k]) if k in found else None for k in keys]
+
+    def put_many(
+        self, model_hash: str, contents: Sequence[str], vectors: Sequence[Sequence[float]]
+    ) -> None:
+        if len(contents) != len(vectors):
+            raise ValueError("contents and vectors must have the same length")
+        if not contents:
+            return
+        now = time.time()
+        rows = [
+            (model_hash, self.content_key(c), _pack(v), now)
+            for c, v in zip(contents, vectors, strict=True)
+        ]
+        with self._lock:
+            for model, key, blob, _ in rows:
+                self._remember((model, key), blob)
+            try:
+                from babylon60.database.core import causal_write
+
+                conn = self._connection()
+                with causal_write(conn):
+                    self._write_touches(conn)
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO embedding_cache "
+                        "(model_hash, content_hash, vector, last_used) VALUES (?, ?, ?, ?)",
+                        rows,
+                    )
+                    conn.commit()
+                if self._disk_bytes is not None:
+                    self._disk_bytes += sum(len(blob) for _, _, blob, _ in rows)
+                self._evict(conn)
+            except Exception as e:
+                logger.warning("Embedding cache write failed: %s", e)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._lru.clear()
+            self._touched.clear()
+            from babylon60.database.core import causal_write
+
+            conn = self._connection()
+            with causal_write(conn):
+                conn.execute("DELETE FROM embedding_cache")
+                conn.commit()
+            self._disk_bytes = 0
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._flush_touches(self._conn)
+                except Exception as e:
+                    logger.warning("Embedding cache touch flush failed: %s", e)
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: tuple[str, str], blob: bytes) -> None:
+        self._lru[key] = blob
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._lru_size:
+            self._lru.popitem(last=False)
+
+    def _read_disk(self, model_hash: str, keys: list[str]) -> dict[str, bytes]:
+        found: dict[str, bytes] = {}
+        try:
+            conn = self._connection()
+            for i in range(0, len(keys), _SQL_CHUNK):
+                chunk = keys[i : i + _SQL_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT content_hash, vector FROM embedding_cache "
+                    f"WHERE model_hash = ? AND content_hash IN ({placeholders})",
+                    [model_hash, *chunk],
+                ).fetchall()
+                found.update((row[0], bytes(row[1])) for row in rows)
+            now = time.time()
+            self._touched.update(((model_hash, key), now) for key in found)
+            if len(self._touched) >= _TOUCH_FLUSH:
+                self._flush_touches(conn)
+        except Exception as e:
+            logger.warning("Embedding cache read failed: %s", e)
+            return found
+        for key, blob in found.items():
+            self._remember((model_hash, key), blob)
+        return found
+
+    def _flush_touches(self, conn: Any) -> None:
+        """Write buffered disk-hit access times in one transaction."""
+        if not self._touched:
+            return
+        from babylon60.database.core import causal_write
+
+        with causal_write(conn):
+            self._write_touches(conn)
+            conn.commit()
+
+    def _write_touches(self, conn: Any) -> None:
+        """Apply buffered access times inside the caller's write transaction."""
+        if not self._touched:
+            return
+        conn.executemany(
+            "UPDATE embedding_cache SET last_used = ? WHERE model_hash = ? AND content_hash = ?",
+            [(ts, model, key) for (model, key), ts in self._touched.items()],
+        )
+        self._touched.clear()
+
+    def _evict(self, conn: Any) -> None:
+        """Drop least-recently-used rows until the file's payload fits ``max_bytes``."""
+        if self._disk_bytes is None:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(length(vector)), 0) FROM embedding_cache"
+            ).fetchone()
+            self._disk_bytes = int(row[0])
+        if self._disk_bytes <= self._max_bytes:
+            return
+        # Evict down to 90% so steady inserts don't evict on every call.
+        target = int(self._max_bytes * 0.9)
+        from babylon60.database.core import causal_write
+
+        freed = 0
+        cursor = conn.execute(
+            "SELECT model_hash, content_hash, length(vector) FROM embedding_cache "
+            "ORDER BY last_used"
+        )
+        victims: list[tuple[str, str]] = []
+        for model_hash, content_hash, size in cursor:
+            if self._disk_bytes - freed <= target:
+                break
+            victims.append((model_hash, content_hash))
+            freed += size
+        with causal_write(conn):
+            conn.executemany(
+                "DELETE FROM embedding_cache WHERE model_hash = ? AND content_hash = ?", victims
+            )
+            conn.commit()
+        self._disk_bytes -= freed
+        metrics.inc("cortex_embedding_cache_evictions_total", value=len(victims))
+        logger.debug("Embedding cache evicted %d vectors (%d bytes)", len(victims), freed)
+
+
+_default_cache: EmbeddingCache | None = None
+_default_lock = threading.Lock()
+
+
+def get_embedding_cache() -> EmbeddingCache | None:
+    """Process-wide cache at ``CORTEX_EMBED_CACHE``; unset or ``""`` disables it."""
+    global _default_cache
+    from babylon60.core import config
+
+    path = config.EMBEDDING_CACHE_PATH
+    if not path:
+        return None
+    with _default_lock:
+        if _default_cache is None or _default_cache._path != path:
+            _default_cache = EmbeddingCache(
+                path, max_bytes=config.EMBEDDING_CACHE_MAX_MB * 1024 * 1024
+            )
+        return _default_cache
+
+
+def model_identity(embedder: Any) -> str | None:
+    """The embedder's ``model_identity_hash``, or ``None`` if it can't be cached."""
+    identity = getattr(embedder, "model_identity_hash", None)
+    return identity if isinstance(identity, str) and identity else None
+
+
+def cached_embed_batch(embedder: Any, texts: list[str]) -> list[list[float]]:
+    """``embedder.embed_batch(texts)`` through the cache, embedding only misses."""
+    cache = get_embedding_cache()
+    identity = model_identity(embedder)
+    if cache is None or identity is None or getattr(embedder, "caches_embeddings", False):
+        return embedder.embed_batch(texts)
+    vectors = cache.get_many(identity, texts)
+    miss_idx = [i for i, v in enumerate(vectors) if v is None]
+    if miss_idx:
+        computed = embedder.embed_batch([texts[i] for i in miss_idx])
+        cache.put_many(identity, [texts[i] for i in miss_idx], computed)
+        for i, vector in zip(miss_idx, computed, strict=True):
+            vectors[i] = list(vector)
+    return vectors  # type: ignore[return-value]
@@ -58,7 +58,14 @@ def _resolve_device() -> str:
 
 
 class LocalEmbedder:
-    """SentenceTransformer-backed embedder with deterministic offline fallback."""
+    """SentenceTransformer-backed embedder with deterministic offline fallback.
+
+    Model vectors go through the content-addressed embedding cache; fallback
+    vectors are never cached, so a later real model load is not shadowed.
+    """
+
+    # Tells cached_embed_batch() not to wrap this embedder a second time.
+    caches_embeddings = True
 
     _model = None
     _model_lock = threading.Lock()
@@ -152,31 +159,46 @@ class LocalEmbedder:
             return self.embed_batch(text)
         return self._embed_one(text)
 
+    def _cache(self):
+        if os.environ.get("CORTEX_NO_EMBED") == "1":
+            return None
+        from babylon60.embeddings.cache import get_embedding_cache
+
+        return get_embedding_cache()
+
     def _embed_one(self, text: str) -> list[float]:
         if not text:
             return [0.0] * EMBEDDING_DIM
-
-        model_name = self._resolve_model_name(self._model_name_override)
-        model = self._load_model(model_name, self._device)
-        if model is None:
-            return _hash_to_unit_vector(text)
-
-        encoded = model.encode(text, normalize_embeddings=True)
-        return cast(list[float], [float(value) for value in encoded.tolist()])
+        return self.embed_batch([text])[0]
 
     def embed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         if not texts:
             return []
 
+        cache = self._cache()
+        identity = self.model_identity_hash if cache is not None else ""
+        vectors: list[list[float] | None] = (
+            cache.get_many(identity, texts) if cache is not None else [None] * len(texts)
+        )
+        miss_idx = [i for i, v in enumerate(vectors) if v is None]
+        if not miss_idx:
+            return cast(list[list[float]], vectors)
+
         model_name = self._resolve_model_name(self._model_name_override)
         model = self._load_model(model_name, self._device)
+        misses = [texts[i] for i in miss_idx]
         if model is None:
-            return [_hash_to_unit_vector(text) for text in texts]
-
-        encoded = model.encode(
-            texts,
-            batch_size=batch_size,
-            normalize_embeddings=True,
-        )
-        rows = encoded.tolist()
-        return [[float(value) for value in row] for row in rows]
+            computed = [_hash_to_unit_vector(text) for text in misses]
+        else:
+            encoded = model.encode(
+                misses,
+                batch_size=batch_size,
+                normalize_embeddings=True,
+            )
+            computed = [[float(value) for value in row] for row in encoded.tolist()]
+            if cache is not None:
+                cache.put_many(identity, misses, computed)
+
+        for i, vector in zip(miss_idx, computed, strict=True):
+            vectors[i] = vector
+        return cast(list[list[float]], vectors)
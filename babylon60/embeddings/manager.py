@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -22,6 +23,7 @@ class EmbeddingManager:
     def __init__(self, engine):
         self.engine = engine
         self._embedder = None
+        self._reindex_task: asyncio.Task[None] | None = None
 
     @property
     def mode(self) -> str:
@@ -79,20 +81,42 @@ class EmbeddingManager:
         """Async embedding API that supports both local and cloud backends."""
         embedder = self._get_embedder()
         if self.mode == "api":
-            return await embedder.embed(text)  # type: ignore[reportGeneralTypeIssues]
-        import asyncio
-
+            if isinstance(text, list):
+                return await self._aembed_api(embedder, text)
+            return (await self._aembed_api(embedder, [text]))[0]
         return await asyncio.to_thread(embedder.embed, text)
 
     async def aembed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
         """Async batch embedding API that supports both local and cloud backends."""
         embedder = self._get_embedder()
         if self.mode == "api":
-            return await embedder.embed_batch(texts, batch_size=batch_size)  # type: ignore[reportGeneralTypeIssues]
-        import asyncio
-
+            return await self._aembed_api(embedder, texts, batch_size)
         return await asyncio.to_thread(embedder.embed_batch, texts, batch_size=batch_size)
 
+    async def _aembed_api(
+        self, embedder: Any, texts: list[str], batch_size: int = 32
+    ) -> list[list[float]]:
+        """Cloud embedding through the content-addressed cache; only misses hit the API.
+
+        (Local embedders consult the cache themselves.)
+        """
+        from babylon60.embeddings.cache import get_embedding_cache, model_identity
+
+        cache = get_embedding_cache()
+        identity = model_identity(embedder)
+        if cache is None or identity is None or not texts:
+            return await embedder.embed_batch(texts, batch_size)
+
+        vectors = await asyncio.to_thread(cache.get_many, identity, texts)
+        miss_idx = [i for i, v in enumerate(vectors) if v is None]
+        if miss_idx:
+            misses = [texts[i] for i in miss_idx]
+            computed = await embedder.embed_batch(misses, batch_size)
+            await asyncio.to_thread(cache.put_many, identity, misses, computed)
+            for i, vector in zip(miss_idx, computed, strict=True):
+                vectors[i] = list(vector)
+        return vectors  # type: ignore[return-value]
+
     async def embed_multimodal(
         self,
         parts: list[dict[str, Any]],
@@ -165,48 +189,102 @@ class EmbeddingManager:
         This method is called by the EnrichmentWorker to finalize a fact's
         entry into the Double-Plane architecture.
         """
+        async with self.engine.session() as conn:
+            await self._enrich_in_session(conn, fact_id, content, project, tenant_id)
+            await conn.commit()
+            logger.info("Fact #%d enriched: vector + metadata refined (V2)", fact_id)
+
+    async def enrich_facts(
+        self, facts: list[dict[str, Any]], batch_size: int = 32
+    ) -> list[Exception | None]:
+        """Enrich many facts with a single batched embedder call.
+
+        ``facts`` carry ``fact_id``, ``content``, ``project`` and ``tenant_id``.
+        Returns one entry per fact: ``None`` on success or the exception that
+        failed it. A failing embedder call raises, since no fact can proceed.
+        """
+        if not facts:
+            return []
+        vectors = await self.aembed_batch([f["content"] for f in facts], batch_size=batch_size)
+        if len(vectors) != len(facts):
+            raise ValueError(f"Embedder returned {len(vectors)} vectors for {len(facts)} facts")
+
+        results: list[Exception | None] = []
+        async with self.engine.session() as conn:
+            for fact, vector in zip(facts, vectors, strict=True):
+                try:
+                    await self._enrich_in_session(
+                        conn,
+                        int(fact["fact_id"]),
+                        fact["content"],
+                        fact["project"],
+                        fact.get("tenant_id") or "default",
+                        embedding=list(vector),
+                    )
+                    results.append(None)
+                except Exception as e:
+                    logger.warning("Enrichment failed for fact %s: %s", fact["fact_id"], e)
+                    results.append(e)
+            await conn.commit()
+        logger.info("Enriched %d/%d facts in one batch", results.count(None), len(facts))
+        return results
+
+    async def _enrich_in_session(
+        self,
+        conn: Any,
+        fact_id: int,
+        content: str,
+        project: str,
+        tenant_id: str,
+        embedding: list[float] | None = None,
+    ) -> None:
         from babylon60.engine.core.embedding_engine import embed_fact_async
         from babylon60.engine.meta.metadata_engine import MetadataEngine
 
-        async with self.engine.session() as conn:
-            # 1. Dense & Specular Embeddings
-            await embed_fact_async(
-                conn,
+        # 1. Dense & Specular Embeddings
+        await embed_fact_async(
+            conn,
+            fact_id,
+            project,
+            content,
+            self._get_embedder(),
+            self.engine._memory_manager,
+            tenant_id,
+            embedding=embedding,
+        )
+
+        # 2. Async Semantic Enrichment (V2 Refinement)
+        metadata = await MetadataEngine.enrich_async(fact_id, content, self.engine)
+
+        # 3. Update Multi-Plane Metadata
+        query = """
+            UPDATE facts_meta
+            SET category = COALESCE(?, category),
+                yield_score = COALESCE(?, yield_score),
+                exergy_score = COALESCE(?, exergy_score)
+            WHERE fact_id = ?
+        """
+        await conn.execute(
+            query,
+            (
+                metadata.get("category"),
+                metadata.get("yield_score"),
+                metadata.get("exergy_score"),
                 fact_id,
-                project,
-                content,
-                self._get_embedder(),
-                self.engine._memory_manager,
-                tenant_id,
-            )
-
-            # 2. Async Semantic Enrichment (V2 Refinement)
-            metadata = await MetadataEngine.enrich_async(fact_id, content, self.engine)
-
-            # 3. Update Multi-Plane Metadata
-            query = """
-                UPDATE facts_meta
-                SET category = COALESCE(?, category),
-                    yield_score = COALESCE(?, yield_score),
-                    exergy_score = COALESCE(?, exergy_score)
-                WHERE fact_id = ?
-            """
-            await conn.execute(
-                query,
-                (
-                    metadata.get("category"),
-                    metadata.get("yield_score"),
-                    metadata.get("exergy_score"),
-                    fact_id,
-                ),
-            )
-            await conn.commit()
-            logger.info("Fact #%d enriched: vector + metadata refined (V2)", fact_id)
+            ),
+        )
 
     async def check_and_reindex(self, tenant_id: str = "default") -> None:
-        """Sovereign Boot Sequence: Check dimension alignment and re-index if mutated."""
+        """Sovereign Boot Sequence: Check dimension alignment and re-index if mutated.
+
+        The re-index runs in the background against a shadow table, so search
+        keeps serving the old index until the swap; an interrupted build resumes.
+        """
         from babylon60.embeddings.reindex import ReindexPipeline
 
+        if self._reindex_task is not None and not self._reindex_task.done():
+            return
+
         pipeline = ReindexPipeline(self.engine, self)
         current_dim = await pipeline.get_current_db_dimension()
 
@@ -219,7 +297,27 @@ class EmbeddingManager:
                 current_dim,
                 target_dim,
             )
-            results = await pipeline.execute_reindex(tenant_id=tenant_id)
-            logger.info("Re-indexing complete: %s", results)
+        elif await pipeline.has_pending_build():
+            logger.warning("Resuming interrupted Re-indexing Pipeline (Ω₁)...")
         else:
             logger.debug("Embedding dimensions aligned (%d). No re-index needed.", target_dim)
+            return
+
+        self._reindex_task = asyncio.create_task(self._run_reindex(pipeline, tenant_id))
+
+    async def _run_reindex(self, pipeline: Any, tenant_id: str) -> None:
+        try:
+            results = await pipeline.execute_reindex(tenant_id=tenant_id)
+            logger.info("Re-indexing complete: %s", results)
+        except Exception as e:
+            logger.error("Re-indexing failed (will resume from checkpoint): %s", e)
+
+    async def stop_reindex(self) -> None:
+        """Cancel a running background re-index; its checkpoint is kept."""
+        task, self._reindex_task = self._reindex_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
@@ -7,9 +7,11 @@ Designed by Borja Moskv.
 from __future__ import annotations
 
 import base64
+import functools
 import hashlib
 import hmac
 import os
+from typing import overload
 
 import numpy as np
 
@@ -31,8 +33,18 @@ def derive_pad_vector(dimension: int, tenant_id: str = "default", project: str =
     """
     Derives a deterministic project-specific and tenant-specific pad vector (one-time pad).
     Uses HMAC-SHA256 based KDF to produce stable floats.
+
+    Pads are memoized per (key, scale, context); the returned array is read-only.
     """
-    secret = get_obfuscation_key()
+    # Default scale factor is 0.1, configurable via CORTEX_OBFUSCATION_PAD_SCALE
+    scale = float(os.environ.get("CORTEX_OBFUSCATION_PAD_SCALE", "0.1"))
+    return _derive_pad(get_obfuscation_key(), scale, dimension, tenant_id, project)
+
+
+@functools.lru_cache(maxsize=1024)
+def _derive_pad(
+    secret: bytes, scale: float, dimension: int, tenant_id: str, project: str
+) -> np.ndarray:
     context = f"{tenant_id}:{project}".encode()
 
     # Generate floats by expanding key
@@ -47,34 +59,49 @@ def derive_pad_vector(dimension: int, tenant_id: str = "default", project: str =
     raw_floats = (uints.astype(np.float32) / 4294967295.0) * 2.0 - 1.0
 
     # Scale to specific small magnitude to maintain cosine similarity ranking stability.
-    # Default scale factor is 0.1, configurable via CORTEX_OBFUSCATION_PAD_SCALE
-    scale = float(os.environ.get("CORTEX_OBFUSCATION_PAD_SCALE", "0.1"))
     norm = np.linalg.norm(raw_floats)
     if norm > 0:
         raw_floats = (raw_floats / norm) * scale
 
+    raw_floats.setflags(write=False)
     return raw_floats
 
 
+@overload
 def obfuscate_vector(
-    vector: list[float],
+    vector: np.ndarray, tenant_id: str = ..., project: str = ...
+) -> np.ndarray: ...
+
+
+@overload
+def obfuscate_vector(
+    vector: list[float], tenant_id: str = ..., project: str = ...
+) -> list[float]: ...
+
+
+def obfuscate_vector(
+    vector: list[float] | np.ndarray,
     tenant_id: str = "default",
     project: str = "",
-) -> list[float]:
+) -> list[float] | np.ndarray:
     """
     Obfuscates an embedding vector by adding a derived static pad vector (one-time pad).
     If CORTEX_OBFUSCATE_EMBEDDINGS is not enabled or not set to '1'/'true', returns the vector unchanged.
+
+    NumPy input stays NumPy (float32) end to end; lists come back as lists.
     """
     enabled = os.environ.get("CORTEX_OBFUSCATE_EMBEDDINGS", "0").lower() in ("1", "true")
     if not enabled:
         return vector
 
-    if not vector:
-        return []
+    if len(vector) == 0:
+        return vector if isinstance(vector, np.ndarray) else []
 
-    arr = np.array(vector, dtype=np.float32)
+    arr = np.asarray(vector, dtype=np.float32)
     pad = derive_pad_vector(len(arr), tenant_id, project)
 
     # Linear addition: embedding + pad
     obfuscated = arr + pad
+    if isinstance(vector, np.ndarray):
+        return obfuscated
     return obfuscated.tolist()
@@ -4,16 +4,76 @@ Re-indexing Pipeline for Vector Embeddings (Ω₁).
 
 Handles migration and re-embedding when the EmbeddingProvider or dimension changes
 (e.g., from Local [384] to API [768] or due to an algorithmic update).
+
+The new index is built online in a shadow table (``fact_embeddings_v<dim>``)
+while ``fact_embeddings`` keeps serving search:
+
+1. Facts are streamed with keyset pagination and embedded in batches.
+2. Every batch commits together with its checkpoint row, so a crashed or
+   cancelled run resumes after the last committed fact id.
+3. Facts embedded while the build runs are dual-written to the shadow table
+   (see :func:`active_shadow_tables` and ``embed_fact_async``).
+4. A catch-up pass embeds every live fact still missing from the shadow:
+   pages that failed, here or in an earlier run, and facts stored by other
+   processes (dual-write state is per process, so their writes skip the
+   shadow).
+5. Only when nothing is left missing does the shadow replace
+   ``fact_embeddings``, in a single transaction; readers see either the old
+   index or the new one. Otherwise the shadow and its checkpoint are kept and
+   the next run retries the missing facts.
+
+Facts another process stores between the catch-up pass and the swap are not
+in the new index until they are embedded again.
 """
 
-import asyncio
+from __future__ import annotations
+
 import logging
+import sqlite3
+import time
 from typing import Any
 
 from babylon60.embeddings.manager import EmbeddingManager
+from babylon60.telemetry.metrics import metrics
+
+__all__ = ["ReindexPipeline", "active_shadow_tables", "shadow_table_name"]
 
 logger = logging.getLogger("babylon60.embeddings.reindex")
 
+_CREATE_STATE_SQL = """
+CREATE TABLE IF NOT EXISTS embedding_reindex_state (
+    shadow_table TEXT PRIMARY KEY,
+    dimension    INTEGER NOT NULL,
+    last_fact_id INTEGER NOT NULL DEFAULT 0,
+    embedded     INTEGER NOT NULL DEFAULT 0,
+    failed       INTEGER NOT NULL DEFAULT 0,
+    started_at   REAL NOT NULL,
+    updated_at   REAL NOT NULL
+)
+"""
+
+# Shadow tables being built in this process. New embeddings are dual-written here;
+# other processes do not see this set (the catch-up pass covers their writes).
+_shadow_tables: set[str] = set()
+
+
+def shadow_table_name(dimension: int) -> str:
+    return f"fact_embeddings_v{int(dimension)}"
+
+
+def active_shadow_tables() -> tuple[str, ...]:
+    """Shadow embedding tables currently under construction in this process."""
+    return tuple(_shadow_tables)
+
+
+def _vec_table_sql(name: str, dimension: int) -> str:
+    return f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING vec0(
+            fact_id INTEGER PRIMARY KEY,
+            embedding FLOAT[{int(dimension)}]
+        )
+    """
+
 
 class ReindexPipeline:
     """Manages full vector re-indexing for semantic search."""
@@ -45,12 +105,32 @@ class ReindexPipeline:
                 logger.warning("Could not determine current db dimension: %s", e)
                 return None
 
+    async def has_pending_build(self) -> bool:
+        """True if a previous run left a checkpointed shadow build behind."""
+        async with self.engine.session() as conn:
+            cursor = await conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='embedding_reindex_state'"
+            )
+            if await cursor.fetchone() is None:
+                return False
+            cursor = await conn.execute("SELECT 1 FROM embedding_reindex_state LIMIT 1")
+            return await cursor.fetchone() is not None
+
     async def execute_reindex(
         self, tenant_id: str = "default", batch_size: int = 100
     ) -> dict[str, Any]:
-        """Drop current embeddings, recreate with new dimension, and re-embed all facts."""
+        """Build a shadow index for the current provider and swap it in.
+
+        ``fact_embeddings`` is shared by every tenant, so all active facts are
+        re-embedded (each under its own tenant's obfuscation key);
+        ``tenant_id`` is the tenant the ledger event is recorded under.
+        Resumes from the checkpoint of an interrupted build of the same table.
+        The swap is skipped (``swapped`` is False) while any live fact is
+        still missing from the shadow after the catch-up pass.
+        """
         target_dim = self.manager.dimension
         current_dim = await self.get_current_db_dimension()
+        shadow = shadow_table_name(target_dim)
 
         logger.info(
             "Starting Re-indexing Pipeline. Target dimension: %d, Current DB dimension: %s",
@@ -58,86 +138,252 @@ class ReindexPipeline:
             current_dim,
         )
 
+        state = await self._prepare_shadow(shadow, target_dim)
+        if state["last_fact_id"]:
+            logger.info("Resuming re-index into %s after fact #%d", shadow, state["last_fact_id"])
+
+        _shadow_tables.add(shadow)
+        started = time.monotonic()
+        processed = 0
+        try:
+            while True:
+                rows = await self._fetch_page(state["last_fact_id"], batch_size)
+                if not rows:
+                    break
+                await self._embed_page(shadow, rows, state)
+                processed += len(rows)
+
+                elapsed = time.monotonic() - started
+                rate = processed / elapsed if elapsed > 0 else 0.0
+                metrics.set_gauge("cortex_reindex_facts_per_second", rate)
+                logger.info(
+                    "Re-indexing progress: %d facts embedded into %s (%.1f facts/s)",
+                    state["embedded"],
+                    shadow,
+                    rate,
+                )
+
+            processed += await self._catch_up(shadow, state, batch_size)
+            swapped = state["failed"] == 0
+            if swapped:
+                await self._swap(shadow, target_dim)
+            else:
+                logger.error(
+                    "Re-index into %s left %d facts without embeddings; keeping "
+                    "fact_embeddings and the checkpoint for the next run",
+                    shadow,
+                    state["failed"],
+                )
+        finally:
+            _shadow_tables.discard(shadow)
+
+        elapsed = time.monotonic() - started
+        rate = processed / elapsed if elapsed > 0 else 0.0
+        metrics.set_gauge("cortex_reindex_facts_per_second", rate)
+        metrics.inc("cortex_reindex_facts_total", value=processed)
+        total = state["embedded"] + state["failed"]
+        if swapped:
+            await self._record_ledger_event(tenant_id, target_dim, total, state["embedded"])
+
+        return {
+            "total_facts": total,
+            "success": state["embedded"],
+            "failed": state["failed"],
+            "dimension": target_dim,
+            "swapped": swapped,
+            "facts_per_second": round(rate, 2),
+        }
+
+    async def _prepare_shadow(self, shadow: str, dimension: int) -> dict[str, Any]:
+        """Create (or reopen) the shadow table and its checkpoint row."""
+        from babylon60.database.core import causal_write
+
         async with self.engine.session() as conn:
-            # 1. Drop old tables
-            await conn.execute("DROP TABLE IF EXISTS fact_embeddings")
-            # 2. Recreate tables with correct dimension
-            await conn.execute(f"""
-                CREATE VIRTUAL TABLE fact_embeddings USING vec0(
-                    fact_id INTEGER PRIMARY KEY,
-                    embedding FLOAT[{target_dim}]
+            with causal_write(conn):
+                await conn.execute(_CREATE_STATE_SQL)
+                cursor = await conn.execute(
+                    "SELECT last_fact_id, embedded, failed FROM embedding_reindex_state "
+                    "WHERE shadow_table = ? AND dimension = ?",
+                    (shadow, dimension),
                 )
-            """)
+                row = await cursor.fetchone()
+                cursor = await conn.execute("SELECT 1 FROM sqlite_master WHERE name = ?", (shadow,))
+                shadow_exists = await cursor.fetchone() is not None
+
+                if row is None or not shadow_exists:
+                    # No usable checkpoint: start the build from scratch.
+                    await conn.execute(f"DROP TABLE IF EXISTS {shadow}")
+                    await conn.execute(_vec_table_sql(shadow, dimension))
+                    now = time.time()
+                    await conn.execute(
+                        "INSERT OR REPLACE INTO embedding_reindex_state "
+                        "(shadow_table, dimension, last_fact_id, embedded, failed, "
+                        "started_at, updated_at) VALUES (?, ?, 0, 0, 0, ?, ?)",
+                        (shadow, dimension, now, now),
+                    )
+                    row = (0, 0, 0)
+                await conn.commit()
+        return {"last_fact_id": row[0], "embedded": row[1], "failed": row[2]}
 
-            # 3. Fetch all facts for the tenant
+    async def _fetch_page(self, after_id: int, limit: int) -> list[tuple[Any, ...]]:
+        async with self.engine.session() as conn:
             cursor = await conn.execute(
-                "SELECT id, content, project FROM facts WHERE tenant_id = ? AND valid_until IS NULL",
-                (tenant_id,),
+                "SELECT id, content, project, tenant_id FROM facts "
+                "WHERE id > ? AND valid_until IS NULL ORDER BY id LIMIT ?",
+                (after_id, limit),
             )
-            rows = await cursor.fetchall()
-
-            total = len(rows)
-            success = 0
-            failed = 0
-
-            # 4. Batch re-embed
-            from babylon60.engine.core.embedding_engine import embed_fact_async
-
-            embedder = self.manager._get_embedder()
-            mem_mgr = getattr(self.engine, "_memory_manager", None)
-
-            # Process in batches to avoid OOM
-            for i in range(0, total, batch_size):
-                batch = rows[i : i + batch_size]
-                tasks = []
-                for row in batch:
-                    fact_id, content, project = row
-                    # Bypass event loop blocking by scheduling them concurrently
-                    tasks.append(
-                        embed_fact_async(
-                            conn=conn,
-                            fact_id=fact_id,
-                            project=project,
-                            content=content,
-                            embedder=embedder,
-                            memory_manager=mem_mgr,
-                            tenant_id=tenant_id,
-                        )
-                    )
+            return [tuple(row) for row in await cursor.fetchall()]
+
+    async def _fetch_missing(self, shadow: str, after_id: int, limit: int) -> list[tuple[Any, ...]]:
+        """Live facts after ``after_id`` that have no row in the shadow table."""
+        async with self.engine.session() as conn:
+            cursor = await conn.execute(
+                "SELECT id, content, project, tenant_id FROM facts f "
+                "WHERE id > ? AND valid_until IS NULL "
+                f"AND NOT EXISTS (SELECT 1 FROM {shadow} s WHERE s.fact_id = f.id) "
+                "ORDER BY id LIMIT ?",
+                (after_id, limit),
+            )
+            return [tuple(row) for row in await cursor.fetchall()]
 
-                results = await asyncio.gather(*tasks, return_exceptions=True)
-                for res in results:
-                    if isinstance(res, Exception):
-                        failed += 1
-                        logger.error("Failed to re-embed fact: %s", res)
-                    else:
-                        success += 1
+    async def _catch_up(self, shadow: str, state: dict[str, Any], batch_size: int) -> int:
+        """Embed every live fact the shadow is missing; ``state["failed"]`` ends as the remainder."""
+        state["failed"] = 0
+        after_id, processed = 0, 0
+        while rows := await self._fetch_missing(shadow, after_id, batch_size):
+            values = await self._embed_rows(rows)
+            state["embedded"] += len(values)
+            state["failed"] += len(rows) - len(values)
+            await self._write_page(shadow, values, state)
+            after_id = rows[-1][0]
+            processed += len(rows)
+        if processed:
+            logger.info(
+                "Re-index catch-up: %d facts missing from %s, %d still failing",
+                processed,
+                shadow,
+                state["failed"],
+            )
+        return processed
 
-                # Commit intermediate progress
-                await conn.commit()
-                logger.info(
-                    "Re-indexing progress: %d/%d facts processed", min(i + batch_size, total), total
-                )
+    async def _embed_page(
+        self, shadow: str, rows: list[tuple[Any, ...]], state: dict[str, Any]
+    ) -> None:
+        """Embed one page with a single batched call and commit it with its checkpoint."""
+        values = await self._embed_rows(rows)
+        state["last_fact_id"] = rows[-1][0]
+        state["embedded"] += len(values)
+        state["failed"] += len(rows) - len(values)
+        await self._write_page(shadow, values, state)
 
-            # Record re-index event in the ledger
-            try:
-                import time
+    async def _embed_rows(self, rows: list[tuple[Any, ...]]) -> list[tuple[int, bytes]]:
+        """``(fact_id, blob)`` for each row, or ``[]`` if the batched call failed."""
+        import numpy as np
 
-                from babylon60.crypto.hash_registry import cortex_hash
+        from babylon60.embeddings.obfuscation import obfuscate_vector
+        from babylon60.embeddings.vec_blob import to_float32_blob
 
-                payload = f"reindex:{tenant_id}:{target_dim}:{total}:{int(time.time())}"
+        values: list[tuple[int, bytes]] = []
+        try:
+            vectors = await self.manager.aembed_batch([row[1] for row in rows])
+            for (fact_id, _content, project, tenant_id), vector in zip(rows, vectors, strict=True):
+                obfuscated = obfuscate_vector(
+                    np.asarray(vector, dtype=np.float32),
+                    tenant_id=tenant_id or "default",
+                    project=project,
+                )
+                values.append((fact_id, to_float32_blob(obfuscated)))
+        except Exception as e:
+            logger.error("Failed to re-embed facts #%d..#%d: %s", rows[0][0], rows[-1][0], e)
+            return []
+        return values
+
+    async def _write_page(
+        self, shadow: str, values: list[tuple[int, bytes]], state: dict[str, Any]
+    ) -> None:
+        """Store embedded rows and the checkpoint in one transaction."""
+        from babylon60.database.core import causal_write
+
+        async with self.engine.session() as conn:
+            with causal_write(conn):
+                if values:
+                    # Dual-writes may already have stored some of these ids.
+                    placeholders = ",".join("?" * len(values))
+                    await conn.execute(
+                        f"DELETE FROM {shadow} WHERE fact_id IN ({placeholders})",
+                        [fact_id for fact_id, _ in values],
+                    )
+                    await conn.executemany(
+                        f"INSERT INTO {shadow} (fact_id, embedding) VALUES (?, ?)", values
+                    )
                 await conn.execute(
-                    "INSERT INTO transactions (tenant_id, project, action, detail, hash) VALUES (?, ?, ?, ?, ?)",
+                    "UPDATE embedding_reindex_state SET last_fact_id = ?, embedded = ?, "
+                    "failed = ?, updated_at = ? WHERE shadow_table = ?",
                     (
-                        tenant_id,
-                        "system",
-                        "REINDEX_EMBEDDINGS",
-                        f"Re-indexed {success} facts to dim {target_dim}",
-                        cortex_hash(payload.encode()),
+                        state["last_fact_id"],
+                        state["embedded"],
+                        state["failed"],
+                        time.time(),
+                        shadow,
                     ),
                 )
                 await conn.commit()
-            except Exception as e:
-                logger.warning("Failed to emit ledger event for re-indexing: %s", e)
 
-        return {"total_facts": total, "success": success, "failed": failed, "dimension": target_dim}
+    async def _swap(self, shadow: str, dimension: int) -> None:
+        """Atomically replace ``fact_embeddings`` with the finished shadow table."""
+        from babylon60.database.core import causal_write
+
+        async with self.engine.session() as conn:
+            with causal_write(conn):
+                if not conn.in_transaction:
+                    await conn.execute("BEGIN IMMEDIATE")
+                try:
+                    # Facts deprecated or deleted during the build.
+                    await conn.execute(
+                        f"DELETE FROM {shadow} WHERE fact_id NOT IN "
+                        "(SELECT id FROM facts WHERE valid_until IS NULL)"
+                    )
+                    await conn.execute("DROP TABLE IF EXISTS fact_embeddings")
+                    try:
+                        await conn.execute(f"ALTER TABLE {shadow} RENAME TO fact_embeddings")
+                    except sqlite3.OperationalError:
+                        # vec0 builds without rename support: copy inside the same transaction.
+                        await conn.execute(_vec_table_sql("fact_embeddings", dimension))
+                        await conn.execute(
+                            "INSERT INTO fact_embeddings (fact_id, embedding) "
+                            f"SELECT fact_id, embedding FROM {shadow}"
+                        )
+                        await conn.execute(f"DROP TABLE {shadow}")
+                    await conn.execute(
+                        "DELETE FROM embedding_reindex_state WHERE shadow_table = ?", (shadow,)
+                    )
+                    await conn.commit()
+                except BaseException:
+                    await conn.rollback()
+                    raise
+        logger.info("Swapped %s in as fact_embeddings (dim %d)", shadow, dimension)
+
+    async def _record_ledger_event(
+        self, tenant_id: str, dimension: int, total: int, success: int
+    ) -> None:
+        """Record the re-index event in the ledger."""
+        try:
+            from babylon60.crypto.hash_registry import cortex_hash
+            from babylon60.database.core import causal_write
+
+            payload = f"reindex:{tenant_id}:{dimension}:{total}:{int(time.time())}"
+            async with self.engine.session() as conn:
+                with causal_write(conn):
+                    await conn.execute(
+                        "INSERT INTO transactions (tenant_id, project, action, detail, hash) VALUES (?, ?, ?, ?, ?)",
+                        (
+                            tenant_id,
+                            "system",
+                            "REINDEX_EMBEDDINGS",
+                            f"Re-indexed {success} facts to dim {dimension}",
+                            cortex_hash(payload.encode()),
+                        ),
+                    )
+                    await conn.commit()
+        except Exception as e:
+            logger.warning("Failed to emit ledger event for re-indexing: %s", e)
@@ -0,0 +1,111 @@
+# [C5-REAL] Exergy-Maximized
+"""Binary vector encodings for sqlite-vec.
+
+sqlite-vec accepts vectors either as JSON text or as packed blobs. JSON makes
+every store and every KNN query format and re-parse hundreds of decimal
+floats; the blob forms are a single memcpy on both sides.
+
+* ``float32`` — little-endian IEEE floats, for ``FLOAT[N]`` columns.
+* ``int8``    — ``unit`` scalar quantization (the scale of
+  ``vec_quantize_int8(v, 'unit')``, rounded to nearest), for ``INT8[N]`` columns.
+* ``bit``     — sign bits packed LSB-first (as ``vec_quantize_binary``),
+  for ``BIT[N]`` columns.
+
+Quantized blobs must be tagged in SQL so sqlite-vec knows their element
+type; :func:`vector_param` returns the blob with its placeholder.
+
+numpy (the ``compute`` extra) is optional: without it the same bytes are
+produced with ``array('f')`` and :func:`from_float32_blob` returns a list.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via subprocess import test
+    np = None
+
+__all__ = [
+    "VECTOR_FORMATS",
+    "from_float32_blob",
+    "to_bit_blob",
+    "to_float32_blob",
+    "to_int8_blob",
+    "vector_param",
+]
+
+VECTOR_FORMATS = ("float32", "int8", "bit")
+
+_PLACEHOLDERS = {"float32": "?", "int8": "vec_int8(?)", "bit": "vec_bit(?)"}
+
+# 'unit' quantization maps [-1.0, 1.0] onto the 256 int8 steps.
+_INT8_STEP = 2.0 / 255.0
+
+
+def _as_float32(vector: Sequence[float] | Any) -> Any:
+    return np.asarray(vector, dtype="<f4")
+
+
+def _float32_array(vector: Sequence[float] | Any) -> array:
+    """Pure-Python path: ``vector`` rounded to float32, in native byte order."""
+    return array("f", (float(x) for x in vector))
+
+
+def to_float32_blob(vector: Sequence[float] | Any) -> bytes:
+    if np is not None:
+        return _as_float32(vector).tobytes()
+    values = _float32_array(vector)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def from_float32_blob(blob: bytes) -> Any:
+    """The vector as a float32 ndarray (a list of floats without numpy)."""
+    if np is not None:
+        return np.frombuffer(blob, dtype="<f4")
+    values = array("f", blob)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tolist()
+
+
+def to_int8_blob(vector: Sequence[float] | Any) -> bytes:
+    if np is not None:
+        scaled = (_as_float32(vector) + 1.0) / _INT8_STEP - 128.0
+        return np.clip(np.rint(scaled), -128, 127).astype(np.int8).tobytes()
+    return array(
+        "b",
+        (
+            max(-128, min(127, round((x + 1.0) / _INT8_STEP - 128.0)))
+            for x in _float32_array(vector)
+        ),
+    ).tobytes()
+
+
+def to_bit_blob(vector: Sequence[float] | Any) -> bytes:
+    if np is not None:
+        return np.packbits(_as_float32(vector) > 0, bitorder="little").tobytes()
+    bits = [x > 0 for x in _float32_array(vector)]
+    return bytes(
+        sum(1 << j for j, bit in enumerate(bits[i : i + 8]) if bit) for i in range(0, len(bits), 8)
+    )
+
+
+_ENCODERS = {"float32": to_float32_blob, "int8": to_int8_blob, "bit": to_bit_blob}
+
+
+def vector_param(vector: Sequence[float] | Any, fmt: str = "float32") -> tuple[bytes, str]:
+    """Encode ``vector`` as ``fmt``; returns ``(blob, sql_placeholder)``."""
+    try:
+        encode = _ENCODERS[fmt]
+    except KeyError:
+        raise ValueError(
+            f"Unknown vector format {fmt!r}; expected one of {VECTOR_FORMATS}"
+        ) from None
+    return encode(vector), _PLACEHOLDERS[fmt]
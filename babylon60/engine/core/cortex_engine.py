@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import sqlite3
 import threading
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -91,6 +92,7 @@ class CortexEngine(
             self._pool = pool
         self._db_path.parent.mkdir(parents=True, exist_ok=True)
         self._conn: aiosqlite.Connection | None = None
+        self._read_pool: Any = None
         self._thread_init_lock = threading.Lock()
         self._vec_available = False
         self._schema_ready = False
@@ -232,13 +234,24 @@ class CortexEngine(
         except Exception as e:
             logger.warning("Re-indexing check skipped/failed: %s", e)
 
+        # Resume post-store work left pending by a previous process.
+        try:
+            await self._dispatch_post_store()
+        except (sqlite3.Error, OSError, RuntimeError) as e:
+            logger.warning("Post-store outbox resume failed: %s", e)
+
         logger.info("🚀 [CORTEX] Sovereign Engine ignited (Ω₀-Ω₆).")
 
     async def close(self):
         """Shutdown the engine, optimizer, and database connections."""
         self._closing = True
         await self.stop_optimizer()
+        if self._embeddings is not None:
+            await self._embeddings.stop_reindex()
         await self._drain_tasks()
+        if self._read_pool is not None:
+            await self._read_pool.close()
+            self._read_pool = None
 
         self._memory_l1 = None
         self._memory_l3 = None
@@ -7,7 +7,6 @@ Embedding Engine - Asynchronous fact embedding and Specular Memory.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import sqlite3
 from typing import Any, Protocol
@@ -37,6 +36,29 @@ class MemoryManagerProtocol(Protocol):
 logger = logging.getLogger("babylon60")
 
 
+async def compute_embedding(embedder: EmbedderProtocol, content: str) -> Any:
+    """Run the embedder off the event loop (or await it if it is async)."""
+    import inspect
+
+    if inspect.iscoroutinefunction(embedder.embed):
+        return await embedder.embed(content)
+    return await asyncio.to_thread(embedder.embed, content)
+
+
+async def compute_embeddings(embedder: Any, texts: list[str]) -> list[Any]:
+    """Embed ``texts`` with one ``embed_batch`` call when the embedder has one."""
+    import inspect
+
+    batch = getattr(embedder, "embed_batch", None)
+    if batch is None:
+        return [await compute_embedding(embedder, text) for text in texts]
+    if inspect.iscoroutinefunction(batch):
+        return list(await batch(texts))
+    from babylon60.embeddings.cache import cached_embed_batch
+
+    return list(await asyncio.to_thread(cached_embed_batch, embedder, texts))
+
+
 async def embed_fact_async(
     conn: aiosqlite.Connection,
     fact_id: int,
@@ -45,30 +67,65 @@ async def embed_fact_async(
     embedder: EmbedderProtocol | None = None,
     memory_manager: MemoryManagerProtocol | None = None,
     tenant_id: str = "default",
+    embedding: list[float] | None = None,
 ) -> None:
-    """Generate and store embedding for a fact asynchronously."""
+    """Generate and store embedding for a fact asynchronously.
+
+    A precomputed ``embedding`` (e.g. from a batched embedder call) skips the
+    per-fact embedder round trip.
+    """
     # 1. Legacy Vector Store (L2 Dense)
-    if embedder:
+    vector_blob: bytes | None = None
+    if embedder or embedding is not None:
         try:
-            import inspect
+            if embedding is None:
+                embedding = await compute_embedding(embedder, content)  # type: ignore[arg-type]
 
-            if inspect.iscoroutinefunction(embedder.embed):
-                embedding = await embedder.embed(content)
-            else:
-                embedding = await asyncio.to_thread(embedder.embed, content)
+            import numpy as np
 
             from babylon60.embeddings.obfuscation import obfuscate_vector
+            from babylon60.embeddings.vec_blob import to_float32_blob
 
-            embedding = obfuscate_vector(embedding, tenant_id=tenant_id, project=project)
+            vector = obfuscate_vector(
+                np.asarray(embedding, dtype=np.float32), tenant_id=tenant_id, project=project
+            )
+            vector_blob = to_float32_blob(vector)
 
+            # Idempotent: the post-store outbox may deliver a fact more than once.
+            await conn.execute("DELETE FROM fact_embeddings WHERE fact_id = ?", (fact_id,))
             await conn.execute(
                 "INSERT INTO fact_embeddings (fact_id, embedding) VALUES (?, ?)",
-                (fact_id, json.dumps(embedding)),
+                (fact_id, vector_blob),
             )
         except (sqlite3.Error, OSError, ValueError, ImportError) as e:
             logger.warning("Embedding failed for fact %d: %s", fact_id, e)
 
+    # Dual-write into any shadow index an online re-index is building.
+    if vector_blob is not None:
+        from babylon60.embeddings.reindex import active_shadow_tables
+
+        for shadow in active_shadow_tables():
+            try:
+                await conn.execute(f"DELETE FROM {shadow} WHERE fact_id = ?", (fact_id,))
+                await conn.execute(
+                    f"INSERT INTO {shadow} (fact_id, embedding) VALUES (?, ?)",
+                    (fact_id, vector_blob),
+                )
+            except sqlite3.Error as e:
+                logger.warning("Shadow embedding (%s) failed for fact %d: %s", shadow, fact_id, e)
+
     # 2. Vector Alpha (G10 Specular Memory)
+    await memorize_fact_async(fact_id, project, content, memory_manager, tenant_id)
+
+
+async def memorize_fact_async(
+    fact_id: int,
+    project: str,
+    content: str,
+    memory_manager: MemoryManagerProtocol | None,
+    tenant_id: str = "default",
+) -> None:
+    """Index a fact into HDC Specular Memory. Needs no database connection."""
     if (
         memory_manager
         and hasattr(memory_manager, "get_context_vector")
@@ -98,7 +155,9 @@ async def embed_fact_async(
                         embedding=fact_hv.tolist(),
                         specular_embedding=intent_hv.tolist(),
                         confidence="C5",
-                        source_metadata=SourceMetadata(origin="system", author="embedding_engine", confidence_in_source=1.0)
+                        source_metadata=SourceMetadata(
+                            origin="system", author="embedding_engine", confidence_in_source=1.0
+                        ),
                     )
                     await memory_manager._hdc.memorize(fact)
                     logger.debug("Vector Alpha (HDC) indexed for fact %d", fact_id)
@@ -9,7 +9,8 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
-from typing import Any
+from collections.abc import Sequence
+from typing import Any, NamedTuple
 
 import aiosqlite
 
@@ -82,25 +83,15 @@ async def _resolve_causal_parent(
     return None
 
 
-async def insert_fact_record(
+async def _verify_fact_guards(
     conn: aiosqlite.Connection,
-    tenant_id: str,
-    project: str,
     content: str,
     fact_type: str,
-    tags: list[str] | None,
     confidence: str,
-    ts: str | None,
-    source: str | None,
     meta: dict[str, Any] | None,
-    tx_id: int | None,
-    parent_decision_id: int | None = None,
-    taint_already_verified: bool = False,
-) -> int:
-    """Perform the actual SQL insert into the facts table."""
-    ts = ts or now_iso()
-    tags_json = json.dumps(tags or [])
-
+    taint_already_verified: bool,
+) -> None:
+    """Last-line content guards shared by the single and bulk insert paths."""
     import os
 
     from babylon60.engine.causal.taint_engine import enforce_taint_check
@@ -146,6 +137,28 @@ async def insert_fact_record(
             if not success:
                 raise CTRECollisionError(int(expected_hash), int(current_hash), epsilon)
 
+
+async def insert_fact_record(
+    conn: aiosqlite.Connection,
+    tenant_id: str,
+    project: str,
+    content: str,
+    fact_type: str,
+    tags: list[str] | None,
+    confidence: str,
+    ts: str | None,
+    source: str | None,
+    meta: dict[str, Any] | None,
+    tx_id: int | None,
+    parent_decision_id: int | None = None,
+    taint_already_verified: bool = False,
+) -> int:
+    """Perform the actual SQL insert into the facts table."""
+    ts = ts or now_iso()
+    tags_json = json.dumps(tags or [])
+
+    await _verify_fact_guards(conn, content, fact_type, confidence, meta, taint_already_verified)
+
     f_hash, encrypted_content, sig_b64, pub_b64 = await _prepare_fact_content(content, tenant_id)
 
     parent_decision_id = await _resolve_causal_parent(
@@ -197,6 +210,112 @@ async def insert_fact_record(
     return fact_id
 
 
+class FactRecord(NamedTuple):
+    """One row for :func:`insert_fact_records` (``insert_fact_record`` arguments)."""
+
+    tenant_id: str
+    project: str
+    content: str
+    fact_type: str
+    tags: list[str] | None
+    confidence: str
+    ts: str | None
+    source: str | None
+    meta: dict[str, Any] | None
+    tx_id: int | None
+    parent_decision_id: int | None = None
+
+
+async def next_autoincrement_id(conn: aiosqlite.Connection, table: str) -> int:
+    """The id SQLite's AUTOINCREMENT would assign next in ``table``.
+
+    Bulk inserts reserve ids from here so dependent rows can be written with
+    ``executemany``. The caller must hold the write transaction throughout.
+    """
+    async with conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {table}") as cursor:
+        top = (await cursor.fetchone())[0]  # type: ignore[index]
+    try:
+        async with conn.execute(
+            "SELECT seq FROM sqlite_sequence WHERE name = ?", (table,)
+        ) as cursor:
+            seq = await cursor.fetchone()
+    except sqlite3.OperationalError:  # No AUTOINCREMENT table created yet.
+        seq = None
+    return max(int(top), int(seq[0]) if seq else 0) + 1
+
+
+async def insert_fact_records(
+    conn: aiosqlite.Connection,
+    records: Sequence[FactRecord],
+    taint_already_verified: bool = False,
+) -> list[int]:
+    """Bulk :func:`insert_fact_record`: same guards and columns, one ``executemany`` per table.
+
+    Ids are assigned in order, so a decision earlier in the batch becomes the
+    auto-resolved parent of later decisions/errors in the same project.
+    """
+    if not records:
+        return []
+    facts_columns = await _get_table_columns(conn, "facts")
+    first_id = await next_autoincrement_id(conn, "facts")
+    ids = list(range(first_id, first_id + len(records)))
+
+    latest_decision: dict[tuple[str, str], int | None] = {}
+    rows: list[list[Any]] = []
+    columns: list[str] = []
+    resolved: list[FactRecord] = []
+    for fact_id, rec in zip(ids, records, strict=True):
+        ts = rec.ts or now_iso()
+        tags_json = json.dumps(rec.tags or [])
+        await _verify_fact_guards(
+            conn, rec.content, rec.fact_type, rec.confidence, rec.meta, taint_already_verified
+        )
+        f_hash, encrypted_content, _sig, _pub = await _prepare_fact_content(
+            rec.content, rec.tenant_id
+        )
+
+        key = (rec.tenant_id, rec.project)
+        parent = rec.parent_decision_id
+        if parent is None and rec.fact_type in ("decision", "error") and key in latest_decision:
+            parent = latest_decision[key]
+        else:
+            parent = await _resolve_causal_parent(
+                conn, rec.tenant_id, rec.project, rec.fact_type, parent
+            )
+            if rec.parent_decision_id is None and rec.fact_type in ("decision", "error"):
+                latest_decision[key] = parent
+        if rec.fact_type == "decision":
+            latest_decision[key] = fact_id
+
+        payload = await _build_fact_payload(
+            conn,
+            rec.tenant_id,
+            rec.project,
+            encrypted_content,
+            rec.fact_type,
+            rec.meta,  # pyright: ignore[reportArgumentType]
+            f_hash,
+            rec.source,
+            rec.confidence,
+            parent,
+            rec.tx_id,
+            tags_json,
+            ts,
+            facts_columns=facts_columns,
+        )
+        if not columns:
+            columns = ["id", *(column for column, _ in payload)]
+        rows.append([fact_id, *(value for _, value in payload)])
+        resolved.append(rec._replace(ts=ts, parent_decision_id=parent))
+
+    await conn.executemany(
+        f"INSERT INTO facts ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})",
+        rows,
+    )
+    await _post_insert_actions_many(conn, ids, resolved)
+    return ids
+
+
 async def _build_fact_payload(
     conn: aiosqlite.Connection,
     tenant_id: str,
@@ -211,6 +330,7 @@ async def _build_fact_payload(
     tx_id: int | None,
     tags_json: str,
     ts: str,
+    facts_columns: set[str] | None = None,
 ) -> list[tuple[str, Any]]:
     """Construct the SQL payload with layout-aware column detection."""
     from babylon60.engine.cognitive.models import Fact
@@ -231,7 +351,8 @@ async def _build_fact_payload(
     rank_map = {"C5": 5, "C4": 4, "C3": 3, "C2": 2, "C1": 1, "stated": 5, "verified": 5}
     c_rank = rank_map.get(confidence, 3)
 
-    facts_columns = await _get_table_columns(conn, "facts")
+    if facts_columns is None:
+        facts_columns = await _get_table_columns(conn, "facts")
     payload: list[tuple[str, Any]] = []
 
     def add(col: str, val: Any) -> None:
@@ -351,6 +472,8 @@ async def _post_insert_actions(
     except (OSError, ValueError, sqlite3.Error) as e:
         logger.error("Failed to insert FTS for fact %d: %s", fact_id, e)
 
+    await _store_minhash_signature(conn, fact_id, content)
+
     await _record_causality(conn, fact_id, project, tenant_id, meta, parent_decision_id)
 
     try:
@@ -361,6 +484,97 @@ async def _post_insert_actions(
         logger.error("Failed to process graph for fact %d: %s", fact_id, e)
 
 
+async def _post_insert_actions_many(
+    conn: aiosqlite.Connection, ids: Sequence[int], records: Sequence[FactRecord]
+) -> None:
+    """Set-based ``_post_insert_actions``; causality and graph stay per fact."""
+    pairs = list(zip(ids, records, strict=True))
+    try:
+        await conn.executemany(
+            "INSERT INTO enrichment_jobs (fact_id, job_type, status, priority) VALUES (?, 'embedding', 'pending', ?)",
+            [(fid, 1 if rec.fact_type == "decision" else 0) for fid, rec in pairs],
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.error("Failed to insert enrichment jobs for %d facts: %s", len(pairs), e)
+
+    tag_rows = [(fid, t, rec.tenant_id) for fid, rec in pairs for t in rec.tags or ()]
+    if tag_rows:
+        await conn.executemany(
+            "INSERT OR IGNORE INTO fact_tags (fact_id, tag, tenant_id) VALUES (?, ?, ?)",
+            tag_rows,
+        )
+
+    try:
+        await conn.executemany(
+            "INSERT OR REPLACE INTO facts_fts (rowid, content, project, tags, fact_type, tenant_id) VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (
+                    fid,
+                    rec.content,
+                    rec.project,
+                    json.dumps(rec.tags or []),
+                    rec.fact_type,
+                    rec.tenant_id,
+                )
+                for fid, rec in pairs
+            ],
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.error("Failed to insert FTS for %d facts: %s", len(pairs), e)
+
+    await _store_minhash_signatures(conn, pairs)
+
+    for fid, rec in pairs:
+        await _record_causality(
+            conn, fid, rec.project, rec.tenant_id, rec.meta or {}, rec.parent_decision_id
+        )
+
+    try:
+        from babylon60.graph import process_fact_graph
+    except ImportError as e:
+        logger.error("Failed to process graph for %d facts: %s", len(pairs), e)
+        return
+    for fid, rec in pairs:
+        try:
+            await process_fact_graph(conn, fid, rec.content, rec.project, rec.ts, rec.tenant_id)
+        except (OSError, ValueError, sqlite3.Error) as e:
+            logger.error("Failed to process graph for fact %d: %s", fid, e)
+
+
+async def _store_minhash_signature(conn: aiosqlite.Connection, fact_id: int, content: str) -> None:
+    """Persist the MinHash signature used by compaction DEDUP (needs numpy)."""
+    from babylon60.compaction import minhash
+
+    if not minhash.available():
+        return
+    try:
+        await conn.execute(
+            "INSERT OR REPLACE INTO fact_minhash (fact_id, signature) VALUES (?, ?)",
+            (fact_id, minhash.signature_to_bytes(minhash.signature(content))),
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.debug("MinHash signature skipped for fact %d: %s", fact_id, e)
+
+
+async def _store_minhash_signatures(
+    conn: aiosqlite.Connection, pairs: Sequence[tuple[int, FactRecord]]
+) -> None:
+    from babylon60.compaction import minhash
+
+    if not minhash.available():
+        return
+    try:
+        await conn.executemany(
+            "INSERT OR REPLACE INTO fact_minhash (fact_id, signature) VALUES (?, ?)",
+            [
+                (fid, minhash.signature_to_bytes(minhash.signature(rec.content)))
+                for fid, rec in pairs
+            ],
+        )
+    except (OSError, ValueError, sqlite3.Error) as e:
+        logger.debug("MinHash signatures skipped for %d facts: %s", len(pairs), e)
+
+
 async def resolve_causality_async(
     conn: aiosqlite.Connection, project: str, meta: dict[str, Any] | None
 ) -> dict[str, Any]:
@@ -0,0 +1,139 @@
+# [C5-REAL] Exergy-Maximized
+"""Post-store outbox - slow per-fact work moved out of the store transaction.
+
+``StoreMixin._store_impl`` records one ``post_store_outbox`` row next to the
+fact inside its ``BEGIN IMMEDIATE`` transaction. After commit the executor,
+on its own connection, claims rows, embeds outside any write lock and
+writes the embedding in one short transaction. The ``GuardPipeline``
+post-hooks then run outside any transaction, the row is marked done, and
+HDC memorization follows. ``done`` rows are pruned after a retention period.
+
+Delivery is at-least-once: a ``running`` claim older than the lease is
+claimed again, so every step must tolerate a repeat.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+from typing import Any, NamedTuple
+
+from babylon60.database.core import causal_write
+
+__all__ = [
+    "OutboxRow",
+    "claim_post_store",
+    "enqueue_post_store",
+    "enqueue_post_store_many",
+    "finish_post_store",
+    "outbox_write",
+    "post_store_status",
+    "prune_post_store",
+]
+
+_ENQUEUE = (
+    "INSERT OR REPLACE INTO post_store_outbox "
+    "(fact_id, tenant_id, project, fact_type, source) VALUES (?, ?, ?, ?, ?)"
+)
+_CLAIM = """
+UPDATE post_store_outbox
+SET status = 'running', attempts = attempts + 1, claimed_at = ?
+WHERE fact_id IN (
+    SELECT fact_id FROM post_store_outbox
+    WHERE fact_id > ? AND (status = 'pending' OR (status = 'running' AND claimed_at < ?))
+    ORDER BY fact_id
+    LIMIT ?
+)
+RETURNING fact_id, tenant_id, project, fact_type, source, attempts
+"""
+_DONE = (
+    "UPDATE post_store_outbox SET status = 'done', last_error = NULL, done_at = ? WHERE fact_id = ?"
+)
+_PRUNE = "DELETE FROM post_store_outbox WHERE status = 'done' AND done_at < ?"
+_FAIL = (
+    "UPDATE post_store_outbox "
+    "SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END, "
+    "last_error = ?, claimed_at = NULL WHERE fact_id = ?"
+)
+
+
+class OutboxRow(NamedTuple):
+    fact_id: int
+    tenant_id: str
+    project: str
+    fact_type: str
+    source: str | None
+    attempts: int
+
+
+@asynccontextmanager
+async def outbox_write(conn: Any) -> AsyncIterator[None]:
+    """Short write transaction; joins one already open on a shared connection."""
+    started = not conn.in_transaction
+    if started:
+        await conn.execute("BEGIN IMMEDIATE")
+    try:
+        with causal_write(conn):
+            yield
+    except BaseException:
+        if started and conn.in_transaction:
+            await conn.rollback()
+        raise
+    if started:
+        await conn.commit()
+
+
+async def enqueue_post_store(
+    conn: Any,
+    fact_id: int,
+    tenant_id: str,
+    project: str,
+    fact_type: str,
+    source: str | None,
+) -> None:
+    """Record post-store work for ``fact_id`` in the caller's transaction."""
+    await conn.execute(_ENQUEUE, (fact_id, tenant_id, project, fact_type, source))
+
+
+async def enqueue_post_store_many(
+    conn: Any, rows: Sequence[tuple[int, str, str, str, str | None]]
+) -> None:
+    """Batch ``enqueue_post_store``: ``(fact_id, tenant_id, project, fact_type, source)`` rows."""
+    await conn.executemany(_ENQUEUE, rows)
+
+
+async def claim_post_store(
+    conn: Any, limit: int, lease_seconds: float, *, after_id: int = 0
+) -> list[OutboxRow]:
+    """Claim up to ``limit`` pending rows (or expired claims) past ``after_id``, in id order."""
+    now = time.time()
+    async with conn.execute(_CLAIM, (now, after_id, now - lease_seconds, limit)) as cursor:
+        rows = await cursor.fetchall()
+    return sorted((OutboxRow(*row) for row in rows), key=lambda r: r.fact_id)
+
+
+async def finish_post_store(
+    conn: Any, fact_id: int, error: str | None = None, *, max_attempts: int = 5
+) -> None:
+    """Mark a claimed row done, or release it for retry (``failed`` once exhausted)."""
+    if error is None:
+        await conn.execute(_DONE, (time.time(), fact_id))
+    else:
+        await conn.execute(_FAIL, (max_attempts, error[:500], fact_id))
+
+
+async def prune_post_store(conn: Any, older_than: float) -> int:
+    """Delete ``done`` rows finished before ``older_than`` (epoch seconds)."""
+    cursor = await conn.execute(_PRUNE, (older_than,))
+    return max(cursor.rowcount, 0)
+
+
+async def post_store_status(conn: Any, fact_id: int) -> str | None:
+    """Outbox status of a fact, or None if it never went through the outbox
+    (or finished long enough ago to be pruned)."""
+    async with conn.execute(
+        "SELECT status FROM post_store_outbox WHERE fact_id = ?", (fact_id,)
+    ) as cursor:
+        row = await cursor.fetchone()
+    return row[0] if row else None
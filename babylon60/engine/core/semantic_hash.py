@@ -144,9 +144,9 @@ def semantic_fingerprint(
         embedder = LocalEmbedder()
 
     assert embedder is not None
-    embedding = embedder.embed(text)
-    if isinstance(embedding[0], list):
-        embedding = embedding[0]
+    from babylon60.embeddings.cache import cached_embed_batch
+
+    embedding = cached_embed_batch(embedder, [text])[0]
 
     quantized = _quantize_embedding(embedding)
     hash_value = _hash_quantized(quantized)
@@ -219,7 +219,8 @@ def batch_fingerprint(
 ) -> list[SemanticFingerprint]:
     """Generate fingerprints for multiple texts in a single batch.
 
-    GPU-native: leverages batch encoding for CUDA acceleration.
+    GPU-native: leverages batch encoding for CUDA acceleration. Texts already
+    in the embedding cache are not re-encoded.
     """
     if not texts:
         return []
@@ -230,7 +231,9 @@ def batch_fingerprint(
         embedder = LocalEmbedder()
 
     assert embedder is not None
-    embeddings = embedder.embed_batch(texts)
+    from babylon60.embeddings.cache import cached_embed_batch
+
+    embeddings = cached_embed_batch(embedder, texts)
 
     results = []
     for text, embedding in zip(texts, embeddings, strict=True):
@@ -0,0 +1,201 @@
+# [C5-REAL] Exergy-Maximized
+"""Set-based bulk store for ``StoreMixin.store_many``.
+
+Extracted from StoreMixin to satisfy the Landauer LOC barrier (≤500).
+
+Per-fact guards and validation still run for every fact; the database work
+is vectorized instead:
+
+* exact dedup is one ``hash IN (...)`` lookup per (tenant, project), and
+  repeats inside the batch resolve to the first occurrence;
+* the ledger chain is extended once per tenant (``_log_transactions``);
+* facts, tags, FTS rows and outbox rows go in with ``executemany``.
+
+Embeddings are computed by the post-store outbox executor after commit,
+one ``embed_batch`` call per claimed batch.
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Any
+
+import aiosqlite
+
+from babylon60.database.core import causal_write
+from babylon60.engine.core.fact_store_core import FactRecord, insert_fact_records
+from babylon60.engine.core.post_store_outbox import enqueue_post_store_many
+from babylon60.engine.core.store_validators import find_duplicate_hashes, validate_content
+from babylon60.utils.canonical import compute_fact_hash
+
+__all__ = ["store_many_logic"]
+
+_STORE_DEFAULTS: dict[str, Any] = {
+    "tenant_id": "default",
+    "fact_type": "knowledge",
+    "tags": None,
+    "confidence": "stated",
+    "source": None,
+    "actor_id": None,
+    "meta": None,
+    "valid_from": None,
+    "tx_id": None,
+    "parent_decision_id": None,
+}
+_REQUIRED = ("project", "content")
+
+
+def _normalise(fact: dict[str, Any]) -> dict[str, Any]:
+    """``store()`` keyword defaults; the same TypeErrors ``store(**fact)`` would raise."""
+    unknown = set(fact) - set(_STORE_DEFAULTS) - set(_REQUIRED)
+    if unknown:
+        raise TypeError(f"store_many() got unexpected fact keys: {sorted(unknown)}")
+    missing = [key for key in _REQUIRED if key not in fact]
+    if missing:
+        raise TypeError(f"store_many() fact is missing required keys: {missing}")
+    return {**_STORE_DEFAULTS, **fact}
+
+
+async def store_many_logic(
+    mixin_instance: Any, conn: aiosqlite.Connection, facts: list[dict[str, Any]]
+) -> list[int]:
+    """Store ``facts`` in the caller's transaction; returns one fact id per input.
+
+    Duplicates (stored or earlier in the batch) return the existing id, as
+    ``store()`` does. The caller commits.
+    """
+    prepared = [_normalise(fact) for fact in facts]
+    for args in prepared:
+        args["tenant_id"], args["source"] = mixin_instance._resolve_store_identity(
+            args["tenant_id"], args["source"], args["actor_id"]
+        )
+        args["meta"] = mixin_instance._with_default_taint(args["meta"])
+        await mixin_instance._run_pre_store_guards(
+            conn,
+            args["content"],
+            args["project"],
+            args["fact_type"],
+            args["meta"],
+            args["tenant_id"],
+        )
+
+    # ── Set-based exact dedup ────────────────────────────────────
+    keys: list[tuple[str, str, str] | None] = []
+    by_group: dict[tuple[str, str], set[str]] = defaultdict(set)
+    for args in prepared:
+        if args["meta"].get("previous_fact_id"):
+            keys.append(None)  # Versioned writes never dedup (see run_store_validation_logic).
+            continue
+        f_hash = compute_fact_hash(
+            validate_content(args["project"], args["content"], args["fact_type"])
+        )
+        keys.append((args["tenant_id"], args["project"], f_hash))
+        by_group[(args["tenant_id"], args["project"])].add(f_hash)
+
+    stored: dict[tuple[str, str, str], int] = {}
+    for (tenant_id, project), hashes in by_group.items():
+        found = await find_duplicate_hashes(conn, tenant_id, project, hashes)
+        stored.update({(tenant_id, project, h): fid for h, fid in found.items()})
+
+    ids: list[int | None] = [None] * len(prepared)
+    first_seen: dict[tuple[str, str, str], int] = {}
+    aliases: dict[int, int] = {}
+    accepted: list[tuple[int, dict[str, Any]]] = []
+    for i, (args, key) in enumerate(zip(prepared, keys, strict=True)):
+        if key is not None and key in stored:
+            ids[i] = stored[key]
+            continue
+        if key is not None and key in first_seen:
+            aliases[i] = first_seen[key]
+            continue
+        if key is not None:
+            first_seen[key] = i
+
+        dedupe_id, meta, content, fact_type = await mixin_instance._validate_for_store(
+            conn,
+            args["project"],
+            args["content"],
+            args["tenant_id"],
+            args["fact_type"],
+            args["tags"],
+            args["confidence"],
+            args["source"],
+            args["meta"],
+            dedup=False,
+        )
+        if dedupe_id is not None:
+            ids[i] = dedupe_id
+            continue
+        accepted.append((i, {**args, "meta": meta, "content": content, "fact_type": fact_type}))
+
+    if accepted:
+        with causal_write(conn):
+            await _assign_tx_ids(mixin_instance, conn, [args for _, args in accepted])
+            new_ids = await insert_fact_records(
+                conn,
+                [
+                    FactRecord(
+                        args["tenant_id"],
+                        args["project"],
+                        args["content"],
+                        args["fact_type"],
+                        args["tags"],
+                        args["confidence"],
+                        args["valid_from"],
+                        args["source"],
+                        args["meta"],
+                        args["tx_id"],
+                        args["parent_decision_id"],
+                    )
+                    for _, args in accepted
+                ],
+                taint_already_verified=True,
+            )
+            # Embedding and post-hooks run after commit (see _dispatch_post_store).
+            await enqueue_post_store_many(
+                conn,
+                [
+                    (fid, a["tenant_id"], a["project"], a["fact_type"], a["source"])
+                    for fid, (_, a) in zip(new_ids, accepted, strict=True)
+                ],
+            )
+        for fid, (i, args) in zip(new_ids, accepted, strict=True):
+            ids[i] = fid
+            mixin_instance._ingest_ambient_signal(
+                args["project"], args["fact_type"], args["tags"], args["source"]
+            )
+        for tenant_id in {args["tenant_id"] for _, args in accepted}:
+            mixin_instance._invalidate_l1_cache(tenant_id)
+
+    for i, first in aliases.items():
+        ids[i] = ids[first]
+    return ids  # type: ignore[return-value]
+
+
+async def _assign_tx_ids(
+    mixin_instance: Any, conn: aiosqlite.Connection, accepted: list[dict[str, Any]]
+) -> None:
+    """Fill each fact's ``tx_id``: one ledger pass per tenant for those without one."""
+    pending: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for args in accepted:
+        if args["tx_id"] is None:
+            pending[args["tenant_id"]].append(args)
+    for tenant_id, group in pending.items():
+        tx_ids = await mixin_instance._log_transactions(
+            conn,
+            [
+                (
+                    args["project"],
+                    "store",
+                    {
+                        "fact_type": args["fact_type"],
+                        "content_hash": compute_fact_hash(args["content"]),
+                        "actor_id": args["actor_id"] or "system",
+                    },
+                )
+                for args in group
+            ],
+            tenant_id=tenant_id,
+        )
+        for args, tx_id in zip(group, tx_ids, strict=True):
+            args["tx_id"] = tx_id
@@ -8,18 +8,37 @@ Quarantine       → cortex.engine.core.store_quarantine_mixin
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, ClassVar
 
 import aiosqlite
-from babylon60.database.core import causal_write
+from babylon60.database.core import causal_write, connect_async_ctx, load_sqlite_vec_async
 
 from babylon60.crypto import get_default_encrypter
 from babylon60.engine.cognitive.capabilities import CapabilityRegistry
-from babylon60.engine.core.embedding_engine import embed_fact_async
+from babylon60.engine.core.embedding_engine import (
+    compute_embedding,
+    compute_embeddings,
+    embed_fact_async,
+    memorize_fact_async,
+)
 from babylon60.engine.core.fact_store_core import insert_fact_record
 from babylon60.database.mixins.ghost_mixin import GhostMixin
 from babylon60.database.mixins.privacy_mixin import PrivacyMixin
+from babylon60.engine.core.post_store_outbox import (
+    OutboxRow,
+    claim_post_store,
+    enqueue_post_store,
+    finish_post_store,
+    outbox_write,
+    prune_post_store,
+)
+from babylon60.engine.core.store_batch import store_many_logic
 from babylon60.engine.core.store_mutation import (
     deprecate_impl_logic,
     invalidate_impl_logic,
@@ -29,6 +48,7 @@ from babylon60.engine.core.store_quarantine_mixin import QuarantineMixin
 from babylon60.engine.core.store_validation import run_store_validation_logic
 from babylon60.engine.core.store_validators import MIN_CONTENT_LENGTH, check_dedup, validate_content
 from babylon60.guards.thermodynamic import AgentMode, ThermodynamicCounters
+from babylon60.telemetry.metrics import metrics
 
 # now_iso removed (internal use relocated)
 
@@ -36,6 +56,10 @@ __all__ = ["StoreMixin"]
 
 logger = logging.getLogger("babylon60")
 
+_POST_STORE_BATCH = 32
+_POST_STORE_LEASE_SECONDS = 300.0
+_POST_STORE_DONE_RETENTION_SECONDS = 3600.0
+
 
 class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
     """Sovereign Storage Layer - Fact Lifecycle with Zero-Trust Isolation.
@@ -72,21 +96,7 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
         conn: aiosqlite.Connection | None = None,
     ) -> int:
         """Store a new fact with proper connection management."""
-        tenant_id = self._resolve_tenant(tenant_id)
-        if source is None and actor_id:
-            source = (
-                actor_id
-                if actor_id.startswith(("agent:", "cli", "api", "human"))
-                else f"agent:{actor_id}"
-            )
-
-        # ═══ SOVEREIGN LOCK (Axiom Ω_CB) ═══
-        if getattr(self, "system_state", "ACTIVE") == "LOCKED_EPISTEMIC_HALT":
-            if source != "daemon:circuit-breaker":
-                raise RuntimeError(
-                    "CORTEX Engine is in LOCKED_EPISTEMIC_HALT state due to cognitive thrashing. "
-                    "Write access denied until Sovereign Lock is lifted by Autodidact-Omega."
-                )
+        tenant_id, source = self._resolve_store_identity(tenant_id, source, actor_id)
 
         if conn:
             started_tx = False
@@ -94,7 +104,7 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 await conn.execute("BEGIN IMMEDIATE")
                 started_tx = True
             try:
-                return await self._store_impl(
+                fact_id = await self._store_impl(
                     conn,
                     project=project,
                     content=content,
@@ -114,6 +124,9 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 if started_tx and conn.in_transaction:
                     await conn.rollback()
                 raise
+            if commit:
+                await self._dispatch_post_store()
+            return fact_id
 
         async with self.session() as _conn:
             started_tx = False
@@ -121,7 +134,7 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 await _conn.execute("BEGIN IMMEDIATE")
                 started_tx = True
             try:
-                return await self._store_impl(
+                fact_id = await self._store_impl(
                     _conn,
                     project=project,
                     content=content,
@@ -141,6 +154,40 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 if started_tx and _conn.in_transaction:
                     await _conn.rollback()
                 raise
+        if commit:
+            await self._dispatch_post_store()
+        return fact_id
+
+    def _resolve_store_identity(
+        self, tenant_id: str, source: str | None, actor_id: str | None
+    ) -> tuple[str, str | None]:
+        """Resolve tenant and source for a write, enforcing the sovereign lock."""
+        tenant_id = self._resolve_tenant(tenant_id)
+        if source is None and actor_id:
+            source = (
+                actor_id
+                if actor_id.startswith(("agent:", "cli", "api", "human"))
+                else f"agent:{actor_id}"
+            )
+
+        # ═══ SOVEREIGN LOCK (Axiom Ω_CB) ═══
+        if getattr(self, "system_state", "ACTIVE") == "LOCKED_EPISTEMIC_HALT":
+            if source != "daemon:circuit-breaker":
+                raise RuntimeError(
+                    "CORTEX Engine is in LOCKED_EPISTEMIC_HALT state due to cognitive thrashing. "
+                    "Write access denied until Sovereign Lock is lifted by Autodidact-Omega."
+                )
+        return tenant_id, source
+
+    @staticmethod
+    def _with_default_taint(meta: dict[str, Any] | None) -> dict[str, Any]:
+        meta = meta or {}
+        if "cortex_taint" not in meta:
+            from datetime import datetime, timezone
+
+            ts = datetime.now(timezone.utc).isoformat()
+            meta["cortex_taint"] = f"taint:system:internal:{ts}:0:system_bypass"
+        return meta
 
     async def _run_store_validation(
         self,
@@ -153,6 +200,7 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
         confidence: str,
         source: str | None,
         meta: dict[str, Any] | None,
+        dedup: bool = True,
     ) -> tuple[int | None, dict[str, Any] | None, str, str]:
         """Delegated validation logic (Ω₁₃, Semantic Dedup, Bridge)."""
         return await run_store_validation_logic(
@@ -166,9 +214,10 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
             confidence=confidence,
             source=source,
             meta=meta,
+            dedup=dedup,
         )
 
-    async def _store_impl(
+    async def _validate_for_store(
         self,
         conn: aiosqlite.Connection,
         project: str,
@@ -178,26 +227,24 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
         tags: list[str] | None,
         confidence: str,
         source: str | None,
-        actor_id: str | None,
         meta: dict[str, Any] | None,
-        valid_from: str | None,
-        commit: bool,
-        tx_id: int | None,
-        parent_decision_id: int | None = None,
-    ) -> int:
-        meta = meta or {}
-        if "cortex_taint" not in meta:
-            from datetime import datetime, timezone
-            ts = datetime.now(timezone.utc).isoformat()
-            meta["cortex_taint"] = f"taint:system:internal:{ts}:0:system_bypass"
-
-        await self._run_pre_store_guards(conn, content, project, fact_type, meta, tenant_id)
-
+        dedup: bool = True,
+    ) -> tuple[int | None, dict[str, Any] | None, str, str]:
+        """``_run_store_validation`` that records a SAGA abort on CTRE collisions."""
         from babylon60.guards.ctre_guard import CTRECollisionError
 
         try:
-            dedupe_id, meta, content, fact_type = await self._run_store_validation(
-                conn, project, content, tenant_id, fact_type, tags, confidence, source, meta
+            return await self._run_store_validation(
+                conn,
+                project,
+                content,
+                tenant_id,
+                fact_type,
+                tags,
+                confidence,
+                source,
+                meta,
+                dedup=dedup,
             )
         except CTRECollisionError as e:
             # Emit cryptographic audit trail for the SAGA abort
@@ -216,11 +263,38 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
             # Propagate to the agent so it knows it must retry the perception loop
             raise
 
+    async def _store_impl(
+        self,
+        conn: aiosqlite.Connection,
+        project: str,
+        content: str,
+        tenant_id: str,
+        fact_type: str,
+        tags: list[str] | None,
+        confidence: str,
+        source: str | None,
+        actor_id: str | None,
+        meta: dict[str, Any] | None,
+        valid_from: str | None,
+        commit: bool,
+        tx_id: int | None,
+        parent_decision_id: int | None = None,
+    ) -> int:
+        meta = self._with_default_taint(meta)
+
+        await self._run_pre_store_guards(conn, content, project, fact_type, meta, tenant_id)
+
+        dedupe_id, meta, content, fact_type = await self._validate_for_store(
+            conn, project, content, tenant_id, fact_type, tags, confidence, source, meta
+        )
+
         if dedupe_id is not None:
             return dedupe_id
 
         with causal_write(conn):
-            tx_id = await self._resolve_tx_id(tx_id, conn, project, content, fact_type, tenant_id, actor_id=actor_id)
+            tx_id = await self._resolve_tx_id(
+                tx_id, conn, project, content, fact_type, tenant_id, actor_id=actor_id
+            )
             fact_id = await insert_fact_record(
                 conn,
                 tenant_id,
@@ -237,10 +311,10 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 taint_already_verified=True,
             )
 
-            await self._run_post_store_tasks(
-                conn, fact_id, project, content, fact_type, tags, source, tenant_id
-            )
+            # Embedding and post-hooks run after commit (see _dispatch_post_store).
+            await enqueue_post_store(conn, fact_id, tenant_id, project, fact_type, source)
 
+        self._ingest_ambient_signal(project, fact_type, tags, source)
         self._invalidate_l1_cache(tenant_id)
 
         if commit:
@@ -282,37 +356,17 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
             conn,
             project,
             "store",
-            {"fact_type": fact_type, "content_hash": content_hash, "actor_id": actor_id or "system"},
+            {
+                "fact_type": fact_type,
+                "content_hash": content_hash,
+                "actor_id": actor_id or "system",
+            },
             tenant_id=tenant_id,  # pyright: ignore
         )
 
-    async def _run_post_store_tasks(
-        self,
-        conn: aiosqlite.Connection,
-        fact_id: int,
-        project: str,
-        content: str,
-        fact_type: str,
-        tags: list[str] | None,
-        source: str | None,
-        tenant_id: str,
+    def _ingest_ambient_signal(
+        self, project: str, fact_type: str, tags: list[str] | None, source: str | None
     ) -> None:
-        caps = CapabilityRegistry.get_instance().capabilities
-        if (
-            getattr(self, "_auto_embed", False)
-            and getattr(self, "_vec_available", False)
-            and caps.embeddings
-        ):
-            await embed_fact_async(
-                conn,
-                fact_id,
-                project,
-                content,
-                self._get_embedder(),
-                getattr(self, "_memory_manager", None),
-                tenant_id,
-            )
-
         if hasattr(self, "right_brain") and self.right_brain is not None:  # pyright: ignore
             self.right_brain.ingest_ambient_signal(  # pyright: ignore
                 {
@@ -323,38 +377,227 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 }
             )
 
-        pipeline = getattr(self, "_guard_pipeline", None)
-        if pipeline is not None:
-            db_path = str(getattr(self, "_db_path", "") or "")
+    # ─── Post-store outbox executor ───────────────────────────────
+
+    async def _dispatch_post_store(self) -> None:
+        """Hand committed outbox rows to the executor.
+
+        Runs a background task by default; with ``POST_STORE_ASYNC`` off (or
+        without the engine's task registry) the batch runs inline, still
+        outside the store's write transaction. Enrichment workers are woken
+        here too, once the enrichment_jobs rows are committed and visible.
+        """
+        from babylon60.core import config
+        from babylon60.enrichment.notify import notify_enrichment
+
+        notify_enrichment()
+
+        tasks: set[asyncio.Task[Any]] | None = getattr(self, "_post_commit_tasks", None)
+        if not config.POST_STORE_ASYNC or tasks is None:
+            await self._drain_post_store()
+            return
+        if getattr(self, "_closing", False):
+            return  # Rows stay pending and are claimed by the next executor run.
+
+        self._post_store_dirty = True
+        running: asyncio.Task[Any] | None = getattr(self, "_post_store_task", None)
+        if running is not None and not running.done():
+            return
+        task = asyncio.create_task(self._post_store_worker())
+        self._post_store_task = task
+        tasks.add(task)
+        task.add_done_callback(tasks.discard)
+
+    async def _post_store_worker(self) -> None:
+        while getattr(self, "_post_store_dirty", False):
+            self._post_store_dirty = False
             try:
-                await pipeline.run_post_hooks(
-                    fact_id,
-                    project,
-                    fact_type,
-                    conn,
-                    tenant_id=tenant_id,
-                    source=source,
-                    db_path=db_path,
+                await self._drain_post_store()
+            except (sqlite3.Error, OSError, RuntimeError, ValueError) as e:
+                # Rows keep their status; the next dispatch (or lease expiry) retries.
+                logger.warning("Post-store executor stopped: %s", e)
+                return
+
+    async def flush_post_store(self) -> int:
+        """Wait for the background executor, then drain whatever is still pending.
+
+        Returns the number of rows processed by this call.
+        """
+        running: asyncio.Task[Any] | None = getattr(self, "_post_store_task", None)
+        if running is not None and running is not asyncio.current_task():
+            await asyncio.gather(running, return_exceptions=True)
+        return await self._drain_post_store()
+
+    @asynccontextmanager
+    async def _post_store_session(self) -> AsyncIterator[aiosqlite.Connection]:
+        """A connection for the executor that no foreground store is using.
+
+        Without a pool, ``session()`` hands out the engine's one shared
+        connection, and the executor's transactions would interleave with a
+        concurrent ``store()`` on it. Engines backed by a file therefore get a
+        private connection per executor run.
+        """
+        db_path = getattr(self, "_db_path", None)
+        if getattr(self, "_pool", None) is not None or not db_path:
+            async with self.session() as conn:
+                yield conn
+            return
+        async with connect_async_ctx(str(db_path)) as conn:
+            if getattr(self, "_vec_available", False):
+                await load_sqlite_vec_async(conn)
+            yield conn
+
+    async def _drain_post_store(self) -> int:
+        done, after_id = 0, 0
+        async with self._post_store_session() as conn:
+            while True:
+                async with outbox_write(conn):
+                    rows = await claim_post_store(
+                        conn, _POST_STORE_BATCH, _POST_STORE_LEASE_SECONDS, after_id=after_id
+                    )
+                contents = [await self._post_store_content(conn, row) for row in rows]
+                embeddings = await self._embed_post_store_batch(contents)
+                for row, content, embedding in zip(rows, contents, embeddings, strict=True):
+                    await self._run_post_store_row(conn, row, content, embedding)
+                done += len(rows)
+                if len(rows) < _POST_STORE_BATCH:
+                    break
+                # Released failures wait for the next run instead of retrying in a tight loop.
+                after_id = rows[-1].fact_id
+            if done:
+                async with outbox_write(conn):
+                    await prune_post_store(conn, time.time() - _POST_STORE_DONE_RETENTION_SECONDS)
+        return done
+
+    async def _embed_post_store_batch(self, contents: list[str | None]) -> list[Any]:
+        """One ``embed_batch`` call for the claimed rows (None where nothing to embed).
+
+        Holds no database lock. If the batch call fails, rows are embedded one
+        by one in ``_run_post_store_row`` so a single bad row fails alone.
+        """
+        embeddings: list[Any] = [None] * len(contents)
+        todo = [i for i, content in enumerate(contents) if content is not None]
+        if not todo or not self._post_store_embeds():
+            return embeddings
+        try:
+            vectors = await compute_embeddings(  # type: ignore[misc]
+                self._get_embedder(), [contents[i] for i in todo]
+            )
+        except (OSError, ValueError, RuntimeError, ImportError) as e:
+            logger.debug("Batch embedding failed, retrying per fact: %s", e)
+            return embeddings
+        for i, vector in zip(todo, vectors, strict=True):
+            embeddings[i] = vector
+        return embeddings
+
+    async def _run_post_store_row(
+        self,
+        conn: aiosqlite.Connection,
+        row: OutboxRow,
+        content: str | None,
+        embedding: Any = None,
+    ) -> None:
+        from babylon60.core import config
+
+        try:
+            if embedding is None and content is not None and self._post_store_embeds():
+                # The forward pass / HTTP call holds no database lock.
+                embedding = await compute_embedding(self._get_embedder(), content)
+
+            if embedding is not None:
+                async with outbox_write(conn):
+                    await embed_fact_async(
+                        conn,
+                        row.fact_id,
+                        row.project,
+                        content,  # type: ignore[arg-type]
+                        tenant_id=row.tenant_id,
+                        embedding=embedding,
+                    )
+            # Hooks may commit (signal emits do), so they run between the
+            # executor's transactions; the row stays claimed until done.
+            if content is not None:
+                await self._run_post_hooks(conn, row)
+            async with outbox_write(conn):
+                await finish_post_store(conn, row.fact_id)
+        except (sqlite3.Error, OSError, ValueError, RuntimeError, ImportError) as e:
+            logger.warning("Post-store work failed for fact %d: %s", row.fact_id, e)
+            metrics.inc("cortex_post_store_failures_total")
+            async with outbox_write(conn):
+                await finish_post_store(
+                    conn, row.fact_id, str(e), max_attempts=config.POST_STORE_MAX_ATTEMPTS
                 )
-            except (ValueError, TypeError, KeyError, OSError, RuntimeError) as _ph_err:  # noqa: BLE001
-                logger.debug("[AX-II] GuardPipeline post-hooks skipped: %s", _ph_err)
+            return
+
+        metrics.inc("cortex_post_store_processed_total")
+        if content is not None:
+            await memorize_fact_async(
+                row.fact_id,
+                row.project,
+                content,
+                getattr(self, "_memory_manager", None),
+                row.tenant_id,
+            )
+
+    def _post_store_embeds(self) -> bool:
+        caps = CapabilityRegistry.get_instance().capabilities
+        return bool(
+            getattr(self, "_auto_embed", False)
+            and getattr(self, "_vec_available", False)
+            and caps.embeddings
+            and self._get_embedder() is not None
+        )
+
+    async def _post_store_content(self, conn: aiosqlite.Connection, row: OutboxRow) -> str | None:
+        """Plaintext content of the fact, or None if it was purged meanwhile."""
+        async with conn.execute(
+            "SELECT content FROM facts WHERE id = ? AND tenant_id = ?",
+            (row.fact_id, row.tenant_id),
+        ) as cursor:
+            found = await cursor.fetchone()
+        if not found:
+            return None
+        return get_default_encrypter().decrypt_str(found[0], tenant_id=row.tenant_id) or ""
+
+    async def _run_post_hooks(self, conn: aiosqlite.Connection, row: OutboxRow) -> None:
+        pipeline = getattr(self, "_guard_pipeline", None)
+        if pipeline is None:
+            return
+        db_path = str(getattr(self, "_db_path", "") or "")
+        try:
+            await pipeline.run_post_hooks(
+                row.fact_id,
+                row.project,
+                row.fact_type,
+                conn,
+                tenant_id=row.tenant_id,
+                source=row.source,
+                db_path=db_path,
+            )
+        except (ValueError, TypeError, KeyError, OSError, RuntimeError) as _ph_err:  # noqa: BLE001
+            logger.debug("[AX-II] GuardPipeline post-hooks skipped: %s", _ph_err)
 
     async def store_many(self, facts: list[dict[str, Any]]) -> list[int]:
+        """Store M facts (``store()`` keyword dicts) in one transaction, set-based.
+
+        Exact duplicates are resolved with one hash lookup per project, the
+        ledger chain is extended in one pass and facts/tags go in with
+        ``executemany`` (see ``store_batch``). All-or-nothing.
+        """
         if not facts:
             raise ValueError("facts list cannot be empty")
         async with self.session() as conn:
             if not conn.in_transaction:
                 await conn.execute("BEGIN IMMEDIATE")
-            ids = []
             try:
-                for fact in facts:
-                    ids.append(await self.store(commit=False, conn=conn, **fact))
+                ids = await store_many_logic(self, conn, facts)
                 await conn.commit()
-                return ids
             except (aiosqlite.Error, ValueError, OSError):
                 # Deliberate boundary: rollback any store failure atomically, then re-raise
                 await conn.rollback()
                 raise
+        await self._dispatch_post_store()
+        return ids
 
     async def update(
         self,
@@ -426,7 +669,8 @@ class StoreMixin(PrivacyMixin, GhostMixin, QuarantineMixin):
                 )
 
                 await conn.commit()
-            return new_id
+        await self._dispatch_post_store()
+        return new_id
 
     async def deprecate(
         self,
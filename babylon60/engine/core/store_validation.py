@@ -112,8 +112,13 @@ async def run_store_validation_logic(
     confidence: str,
     source: str | None,
     meta: dict[str, Any] | None,
+    dedup: bool = True,
 ) -> tuple[int | None, dict[str, Any] | None, str, str]:
-    """Orchestrates the multi-stage validation pipeline for memory storage."""
+    """Orchestrates the multi-stage validation pipeline for memory storage.
+
+    ``dedup=False`` skips the exact-hash lookup for callers that already did
+    it set-based (``StoreMixin.store_many``); semantic dedup still runs.
+    """
     _validate_dependencies()
     await _check_byzantine_auth(mixin_instance, meta, source, tenant_id)
     await _enforce_ctre(meta)
@@ -138,7 +143,7 @@ async def run_store_validation_logic(
     content = validate_content(project, content, fact_type)
 
     if not (meta and meta.get("previous_fact_id")):
-        if (eid := await check_dedup(conn, tenant_id, project, content)) is not None:
+        if dedup and (eid := await check_dedup(conn, tenant_id, project, content)) is not None:
             return eid, meta, content, fact_type
         if fid := await _apply_semantic_dedup(mixin_instance, conn, project, content, tenant_id):
             return fid, meta, content, fact_type
@@ -7,6 +7,7 @@ These are pure functions: no side effects beyond raising ValueError on rejection
 
 from __future__ import annotations
 
+from collections.abc import Collection
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -15,11 +16,15 @@ if TYPE_CHECKING:
 __all__ = [
     "validate_content",
     "check_dedup",
+    "find_duplicate_hashes",
     "MIN_CONTENT_LENGTH",
 ]
 
 MIN_CONTENT_LENGTH = 10
 
+# Stay under SQLite's 999 bound-parameter limit on older builds.
+_DEDUP_CHUNK = 400
+
 
 def validate_content(project: str, content: str, fact_type: str) -> str:
     """Sovereign Content Gatekeeper - normalizes content before storage.
@@ -67,3 +72,25 @@ async def check_dedup(
     if existing:
         return existing[0]
     return None
+
+
+async def find_duplicate_hashes(
+    conn: aiosqlite.Connection,
+    tenant_id: str,
+    project: str,
+    hashes: Collection[str],
+) -> dict[str, int]:
+    """Set-based ``check_dedup``: map each already-stored content hash to a live fact id."""
+    found: dict[str, int] = {}
+    pending = sorted(set(hashes))
+    for start in range(0, len(pending), _DEDUP_CHUNK):
+        chunk = pending[start : start + _DEDUP_CHUNK]
+        async with conn.execute(
+            "SELECT hash, MIN(id) FROM facts WHERE tenant_id = ? AND project = ? "
+            f"AND hash IN ({', '.join('?' for _ in chunk)}) "
+            "AND is_tombstoned = 0 AND is_quarantined = 0 AND valid_until IS NULL "
+            "GROUP BY hash",
+            (tenant_id, project, *chunk),
+        ) as cursor:
+            found.update({row[0]: row[1] for row in await cursor.fetchall()})
+    return found
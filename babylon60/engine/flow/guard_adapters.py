@@ -120,6 +120,13 @@ class ContradictionGuardAdapter:
 class VerifierGuardAdapter:
     """AX-II Hook 3 → StoreGuard protocol (code-type formal verification)."""
 
+    # AST/SMT work only, passes cached by content hash. As the only pure guard
+    # it forms a group of one, which GuardPipeline runs inline on the event
+    # loop: most facts are not code and return at once, so a thread hop would
+    # cost more than the check.
+    pure_cpu = True
+    deterministic = True
+
     async def check(
         self,
         content: str,
@@ -129,6 +136,17 @@ class VerifierGuardAdapter:
         conn: aiosqlite.Connection,
         *,
         tenant_id: str = "default",
+    ) -> None:
+        self.check_sync(content, project, fact_type, meta, tenant_id=tenant_id)
+
+    def check_sync(
+        self,
+        content: str,
+        project: str,
+        fact_type: str,
+        meta: dict[str, Any],
+        *,
+        tenant_id: str = "default",
     ) -> None:
         if fact_type != "code":
             return
@@ -306,7 +324,7 @@ class SignalEmitHook:
         source: str | None = None,
         db_path: str | None = None,
     ) -> None:
-        from babylon60.extensions.signals.bus import AsyncSignalBus
+        from babylon60.extensions.signals.bus import UNCONSUMED_SQL, AsyncSignalBus
         from babylon60.extensions.signals.fact_hook import _compact_threshold
 
         bus = AsyncSignalBus(conn)
@@ -331,7 +349,7 @@ class SignalEmitHook:
                 "SELECT COUNT(*) FROM signals "
                 "WHERE event_type = 'fact:stored' "
                 "AND project = ? "
-                "AND consumed_by = '[]'",
+                f"AND {UNCONSUMED_SQL}",
                 (project,),
             ) as cursor:
                 row = await cursor.fetchone()
@@ -5,15 +5,33 @@ Replaces the hardcoded try/except ImportError blocks in store_mixin._store_impl
 with a registered list of protocol-conforming guards, mutators, and hooks.
 
 Guards that fail to import at registration time are silently skipped.
+
+Pre-store guards are profiled: per-guard latency, rejection and cache-hit
+counters (``profile()``, ``cortex_guard_*`` metrics). Once a guard has
+``_MIN_SAMPLES`` calls it is ordered by rejection rate per second of cost,
+so cheap guards that often reject run first; guards still warming up keep
+registration order ahead of them. Two optional guard attributes:
+
+* ``pure_cpu = True`` with a synchronous ``check_sync(content, project,
+  fact_type, meta, *, tenant_id)``: no connection, no I/O. Adjacent pure
+  guards run concurrently on worker threads; a lone one runs inline.
+* ``deterministic = True``: the outcome depends only on (content, project,
+  fact_type), so passes are cached by content hash.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import TYPE_CHECKING, Any
 
 import aiosqlite
 
+from babylon60.telemetry.metrics import metrics
+
 if TYPE_CHECKING:
     from babylon60.extensions.interfaces.store_pipeline import (
         ContentMutator,
@@ -21,10 +39,41 @@ if TYPE_CHECKING:
         StoreGuard,
     )
 
-__all__ = ["GuardPipeline"]
+__all__ = ["GuardPipeline", "GuardStats"]
 
 logger = logging.getLogger("babylon60.engine")
 
+_MIN_SAMPLES = 20  # Calls before a guard's profile decides its position.
+_REORDER_EVERY = 64  # Pipeline runs between re-sorts.
+
+
+@dataclass
+class GuardStats:
+    """Running profile of one registered guard."""
+
+    name: str
+    calls: int = 0
+    rejections: int = 0
+    cache_hits: int = 0
+    seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.seconds / self.calls if self.calls else 0.0
+
+    @property
+    def reject_rate(self) -> float:
+        # Laplace-smoothed so a guard that never rejected still has a rank.
+        return (self.rejections + 1) / (self.calls + 2)
+
+    @property
+    def priority(self) -> float:
+        return self.reject_rate / max(self.mean_seconds, 1e-6)
+
+
+def _flag(guard: Any, name: str) -> bool:
+    return getattr(guard, name, False) is True
+
 
 class GuardPipeline:
     """Orchestrates pre-store guards, content mutators, and post-store hooks."""
@@ -33,11 +82,28 @@ class GuardPipeline:
         self._guards: list[StoreGuard] = []
         self._mutators: list[ContentMutator] = []
         self._post_hooks: list[PostStoreHook] = []
+        self._stats: list[GuardStats] = []
+        self._plan: list[list[int]] | None = None
+        self._runs = 0
+        self._passed: OrderedDict[tuple[int, str, str, str], None] = OrderedDict()
 
     # ─── Registration ─────────────────────────────────────────────
 
-    def add_guard(self, guard: StoreGuard) -> None:
+    def add_guard(self, guard: StoreGuard, name: str | None = None) -> None:
+        """Register ``guard``; ``name`` labels it in ``profile()`` and metrics.
+
+        Defaults to the class name; repeats get a ``#2``, ``#3``... suffix so
+        every registered guard has its own profile label.
+        """
+        base = name or type(guard).__name__
+        taken = {stats.name for stats in self._stats}
+        label, n = base, 1
+        while label in taken:
+            n += 1
+            label = f"{base}#{n}"
         self._guards.append(guard)
+        self._stats.append(GuardStats(label))
+        self._plan = None
 
     def add_mutator(self, mutator: ContentMutator) -> None:
         self._mutators.append(mutator)
@@ -57,9 +123,151 @@ class GuardPipeline:
         *,
         tenant_id: str = "default",
     ) -> None:
-        """Run all pre-store guards. First rejection raises ValueError."""
-        for guard in self._guards:
-            await guard.check(content, project, fact_type, meta, conn, tenant_id=tenant_id)
+        """Run all pre-store guards. First rejection raises ValueError.
+
+        Rejection is checked in plan order; pure-CPU guards batched together
+        all finish before the first of their rejections is raised.
+        """
+        from babylon60.core import config
+
+        if not self._guards:
+            return
+        self._runs += 1
+        if self._plan is None or (config.GUARD_ADAPTIVE_ORDER and self._runs % _REORDER_EVERY == 0):
+            self._plan = self._build_plan(config.GUARD_ADAPTIVE_ORDER)
+
+        content_key: str | None = None
+        for group in self._plan:
+            pending = []
+            for i in group:
+                if _flag(self._guards[i], "deterministic"):
+                    if content_key is None:
+                        from babylon60.utils.canonical import compute_fact_hash
+
+                        content_key = compute_fact_hash(content)
+                    if self._cache_hit(i, content_key, project, fact_type):
+                        continue
+                pending.append(i)
+            if not pending:
+                continue
+
+            if len(pending) == 1 and not _flag(self._guards[pending[0]], "pure_cpu"):
+                i = pending[0]
+                start = time.perf_counter()
+                try:
+                    await self._guards[i].check(
+                        content, project, fact_type, meta, conn, tenant_id=tenant_id
+                    )
+                except Exception:
+                    self._record(i, time.perf_counter() - start, rejected=True)
+                    raise
+                self._record(i, time.perf_counter() - start, rejected=False)
+            else:
+                errors = await self._run_pure(pending, content, project, fact_type, meta, tenant_id)
+                first = next((e for e in errors if e is not None), None)
+                if first is not None:
+                    raise first
+
+            if content_key is not None:
+                for i in pending:
+                    if _flag(self._guards[i], "deterministic"):
+                        self._remember_pass(i, content_key, project, fact_type)
+
+    async def _run_pure(
+        self,
+        group: list[int],
+        content: str,
+        project: str,
+        fact_type: str,
+        meta: dict[str, Any],
+        tenant_id: str,
+    ) -> list[BaseException | None]:
+        """Run pure-CPU guards side by side on worker threads; errors in group order."""
+
+        def _call(i: int) -> tuple[float, BaseException | None]:
+            start = time.perf_counter()
+            try:
+                self._guards[i].check_sync(  # type: ignore[attr-defined]
+                    content, project, fact_type, meta, tenant_id=tenant_id
+                )
+            except Exception as e:  # noqa: BLE001 - re-raised by run_guards
+                return time.perf_counter() - start, e
+            return time.perf_counter() - start, None
+
+        if len(group) == 1:
+            results = [_call(group[0])]
+        else:
+            results = await asyncio.gather(*(asyncio.to_thread(_call, i) for i in group))
+        for i, (elapsed, error) in zip(group, results, strict=True):
+            self._record(i, elapsed, rejected=error is not None)
+        return [error for _, error in results]
+
+    def _build_plan(self, adaptive: bool) -> list[list[int]]:
+        order = list(range(len(self._guards)))
+        if adaptive:
+            cold = [i for i in order if self._stats[i].calls < _MIN_SAMPLES]
+            warm = sorted(
+                (i for i in order if self._stats[i].calls >= _MIN_SAMPLES),
+                key=lambda i: self._stats[i].priority,
+                reverse=True,
+            )
+            order = cold + warm
+        plan: list[list[int]] = []
+        for i in order:
+            if (
+                plan
+                and _flag(self._guards[i], "pure_cpu")
+                and _flag(self._guards[plan[-1][0]], "pure_cpu")
+            ):
+                plan[-1].append(i)
+            else:
+                plan.append([i])
+        return plan
+
+    def _record(self, i: int, elapsed: float, *, rejected: bool) -> None:
+        stats = self._stats[i]
+        stats.calls += 1
+        stats.seconds += elapsed
+        labels = {"guard": stats.name}
+        metrics.observe("cortex_guard_seconds", elapsed, labels)
+        if rejected:
+            stats.rejections += 1
+            metrics.inc("cortex_guard_rejections_total", labels)
+
+    def _cache_hit(self, i: int, content_key: str, project: str, fact_type: str) -> bool:
+        key = (i, content_key, project, fact_type)
+        if key not in self._passed:
+            return False
+        self._passed.move_to_end(key)
+        self._stats[i].cache_hits += 1
+        metrics.inc("cortex_guard_cache_hits_total", {"guard": self._stats[i].name})
+        return True
+
+    def _remember_pass(self, i: int, content_key: str, project: str, fact_type: str) -> None:
+        from babylon60.core import config
+
+        self._passed[(i, content_key, project, fact_type)] = None
+        while len(self._passed) > config.GUARD_CACHE_SIZE:
+            self._passed.popitem(last=False)
+
+    def profile(self) -> list[dict[str, Any]]:
+        """Per-guard profile, in current execution order."""
+        order = [i for group in self._plan or [] for i in group] or range(len(self._guards))
+        return [
+            {
+                "position": position,
+                "guard": self._stats[i].name,
+                "calls": self._stats[i].calls,
+                "rejections": self._stats[i].rejections,
+                "cache_hits": self._stats[i].cache_hits,
+                "mean_ms": round(self._stats[i].mean_seconds * 1000.0, 3),
+                "total_ms": round(self._stats[i].seconds * 1000.0, 3),
+                "reject_rate": round(self._stats[i].reject_rate, 4),
+                "pure_cpu": _flag(self._guards[i], "pure_cpu"),
+                "deterministic": _flag(self._guards[i], "deterministic"),
+            }
+            for position, i in enumerate(order)
+        ]
 
     async def run_mutators(
         self,
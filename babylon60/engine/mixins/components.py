@@ -239,7 +239,7 @@ class ComponentsMixin:
             if is_hook:
                 pipeline.add_post_hook(component)
             else:
-                pipeline.add_guard(component)
+                pipeline.add_guard(component, name=name)
         except ImportError as e:
             if os.environ.get("CORTEX_STRICT_GUARDS") == "1":
                 raise RuntimeError(f"FAIL-CLOSED: {name} failed: {e}") from e
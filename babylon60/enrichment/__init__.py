@@ -1,4 +1,5 @@
 # [C5-REAL] Exergy-Maximized
+from babylon60.enrichment.notify import notify_enrichment
 from babylon60.enrichment.worker import EnrichmentWorker
 
-__all__ = ["EnrichmentWorker"]
+__all__ = ["EnrichmentWorker", "notify_enrichment"]
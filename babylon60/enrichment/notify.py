@@ -0,0 +1,48 @@
+# [C5-REAL] Exergy-Maximized
+"""In-process wake-ups for enrichment workers.
+
+Producers call :func:`notify_enrichment` after enqueueing a job; every running
+worker registered here is woken on its own event loop instead of waiting out
+its poll interval. Safe to call from any thread, with or without a loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+_lock = threading.Lock()
+_listeners: dict[int, tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+
+
+def register_listener(event: asyncio.Event) -> None:
+    """Wake ``event`` (owned by the running loop) on every notification."""
+    loop = asyncio.get_running_loop()
+    with _lock:
+        _listeners[id(event)] = (loop, event)
+
+
+def unregister_listener(event: asyncio.Event) -> None:
+    with _lock:
+        _listeners.pop(id(event), None)
+
+
+def notify_enrichment() -> None:
+    """Signal that new enrichment work is available."""
+    with _lock:
+        listeners = list(_listeners.values())
+    if not listeners:
+        return
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    for loop, event in listeners:
+        if loop is current:
+            event.set()
+        elif not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop closed between the check and the call.
+                continue
@@ -4,23 +4,70 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+import sqlite3
 import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
+from babylon60.enrichment.notify import register_listener, unregister_listener
 from babylon60.ledger.queue import EnrichmentQueue
 from babylon60.ledger.store import LedgerStore
+from babylon60.telemetry.metrics import metrics
 
 logger = logging.getLogger("babylon60.enrichment")
 
+# Facts created by these ledger actions carry content worth embedding.
+_ENRICHABLE_ACTIONS = ("store", "create", "update")
+# Compat-mode claims left in 'processing' longer than this are reclaimed.
+_CLAIM_LEASE = timedelta(minutes=10)
+# Compat-mode 'failed' rows stop being retried after this many attempts
+# (EnrichmentQueue marks ledger jobs terminal at the same count).
+_MAX_ATTEMPTS = 8
+
+
+def _utc_now() -> datetime:
+    return datetime.fromtimestamp(time.time(), tz=timezone.utc)
+
+
+def _lag_seconds(created_at: str | None) -> float | None:
+    """Seconds since a job's ``created_at`` (SQLite or ISO-8601 UTC text)."""
+    if not created_at:
+        return None
+    try:
+        created = datetime.fromisoformat(created_at)
+    except ValueError:
+        return None
+    if created.tzinfo is None:
+        created = created.replace(tzinfo=timezone.utc)
+    return max(0.0, (_utc_now() - created).total_seconds())
+
 
 class EnrichmentWorker:
-    """Sovereign worker for processing enrichment jobs asynchronously."""
+    """Sovereign worker for processing enrichment jobs asynchronously.
+
+    Jobs are claimed ``batch_size`` at a time, embedded with one batched
+    embedder call per claim, and up to ``max_concurrency`` batches run at
+    once. Enqueuers wake the worker through
+    :func:`babylon60.enrichment.notify.notify_enrichment`; polling remains as
+    a fallback for jobs written by other processes.
+    """
 
-    def __init__(self, engine: Any, store: LedgerStore | Any):
+    def __init__(
+        self,
+        engine: Any,
+        store: LedgerStore | Any,
+        *,
+        batch_size: int = 32,
+        max_concurrency: int = 4,
+    ):
+        if batch_size < 1 or max_concurrency < 1:
+            raise ValueError("batch_size and max_concurrency must be >= 1")
         self.engine = engine
         self.is_running = False
+        self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
         self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
         self._compat_db_mode = not hasattr(store, "tx")
 
         if self._compat_db_mode:
@@ -37,12 +84,15 @@ class EnrichmentWorker:
         if self.is_running:
             return
         self.is_running = True
+        register_listener(self._wakeup)
         self._task = asyncio.create_task(self._run_loop())
         logger.info("EnrichmentWorker started.")
 
     async def stop(self):
         """Stop the background worker."""
         self.is_running = False
+        unregister_listener(self._wakeup)
+        self._wakeup.set()
         if self._task:
             try:
                 await asyncio.wait_for(self._task, timeout=5.0)
@@ -51,172 +101,250 @@ class EnrichmentWorker:
         logger.info("EnrichmentWorker stopped.")
 
     async def _run_loop(self):
-        """Main worker loop with adaptive polling."""
+        """Main worker loop: batch claims, bounded concurrency, wake-or-poll when idle."""
         poll_interval = 1.0
-        while self.is_running:
+        slots = asyncio.Semaphore(self.max_concurrency)
+        in_flight: set[asyncio.Task] = set()
+
+        async def run_batch(jobs: list[dict[str, Any]]) -> None:
             try:
-                if self._compat_db_mode:
-                    job = await self._get_next_job()
-                else:
-                    # Polling from EnrichmentQueue is currently synchronous to ensure
-                    # atomic claim operations within the underlying SQLite transaction.
-                    job = self.queue.claim_one()  # type: ignore[reportOptionalMemberAccess]
-
-                if job:
-                    await self._process_job(job)
-                    poll_interval = 0.1  # Spin faster if we find work
-                else:
-                    await asyncio.sleep(poll_interval)
-                    poll_interval = min(5.0, poll_interval + 0.5)  # Backoff
-            except (RuntimeError, ValueError, OSError):
-                logger.exception("Error in EnrichmentWorker loop")
-                await asyncio.sleep(5)
-
-    async def _get_next_job(self) -> dict[str, Any] | None:
-        """Compatibility path for legacy enrichment_jobs-backed workers."""
-        if not self._compat_db_mode:
-            return self.queue.claim_one()  # type: ignore[reportOptionalMemberAccess]
-
-        now = datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
+                await self._process_batch(jobs)
+            except Exception:
+                logger.exception("Enrichment batch of %d jobs failed", len(jobs))
+            finally:
+                slots.release()
+
+        try:
+            while self.is_running:
+                try:
+                    await slots.acquire()
+                    jobs: list[dict[str, Any]] = []
+                    try:
+                        jobs = await self._claim_batch()
+                    finally:
+                        if not jobs:
+                            slots.release()
+
+                    if jobs:
+                        task = asyncio.create_task(run_batch(jobs))
+                        in_flight.add(task)
+                        task.add_done_callback(in_flight.discard)
+                        poll_interval = 0.1  # Spin faster if we find work
+                    elif await self._wait_for_work(poll_interval):
+                        # A wake-up may land just before the enqueuing commit is
+                        # visible; re-poll quickly instead of backing off.
+                        poll_interval = 0.1
+                    else:
+                        poll_interval = min(5.0, poll_interval + 0.5)  # Backoff
+                except (RuntimeError, ValueError, OSError, sqlite3.Error):
+                    logger.exception("Error in EnrichmentWorker loop")
+                    await asyncio.sleep(5)
+        finally:
+            if in_flight:
+                await asyncio.gather(*in_flight, return_exceptions=True)
+
+    async def _wait_for_work(self, timeout: float) -> bool:
+        """Sleep up to ``timeout``; True if woken by an enqueue notification."""
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._wakeup.clear()
+
+    async def _claim_batch(self) -> list[dict[str, Any]]:
+        """Claim up to ``batch_size`` jobs and refresh the queue-depth gauge."""
+        if self._compat_db_mode:
+            jobs = await self._claim_compat_batch(self.batch_size)
+        else:
+            # Claims stay synchronous so each batch is taken in one short
+            # SQLite transaction on the store's own connection.
+            jobs = self.queue.claim_batch(self.batch_size)  # type: ignore[reportOptionalMemberAccess]
+            metrics.set_gauge("cortex_enrichment_queue_depth", float(self.queue.depth()))  # type: ignore[reportOptionalMemberAccess]
+        if jobs:
+            metrics.observe("cortex_enrichment_batch_size", float(len(jobs)))
+        return jobs
+
+    async def _claim_compat_batch(self, limit: int) -> list[dict[str, Any]]:
+        """Claim legacy enrichment_jobs rows by flipping them to 'processing'."""
+        now = _utc_now()
         async with self.engine.session() as conn:
             cursor = await conn.execute(
                 """
-                SELECT id, fact_id, attempts
-                FROM enrichment_jobs
-                WHERE status IN ('pending', 'queued', 'failed')
-                  AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
-                ORDER BY id
-                LIMIT 1
+                UPDATE enrichment_jobs
+                SET status = 'processing', updated_at = ?
+                WHERE id IN (
+                    SELECT id
+                    FROM enrichment_jobs
+                    WHERE (
+                            (
+                                status IN ('pending', 'queued')
+                                OR (status = 'failed' AND attempts < ?)
+                            )
+                            AND (next_attempt_at IS NULL OR next_attempt_at <= ?)
+                          )
+                       OR (status = 'processing' AND updated_at <= ?)
+                    ORDER BY priority DESC, id
+                    LIMIT ?
+                )
+                RETURNING id, fact_id, attempts, created_at
                 """,
-                (now,),
+                (
+                    now.isoformat(),
+                    _MAX_ATTEMPTS,
+                    now.isoformat(),
+                    (now - _CLAIM_LEASE).isoformat(),
+                    limit,
+                ),
             )
-            row = await cursor.fetchone()
-
-        if not row:
-            return None
+            rows = list(await cursor.fetchall())
+            cursor = await conn.execute(
+                """
+                SELECT COUNT(*) FROM enrichment_jobs
+                WHERE status IN ('pending', 'queued') OR (status = 'failed' AND attempts < ?)
+                """,
+                (_MAX_ATTEMPTS,),
+            )
+            depth = (await cursor.fetchone())[0]
+            await conn.commit()
 
-        return {
-            "job_id": row[0],
-            "fact_id": row[1],
-            "attempts": row[2] or 0,
-        }
+        metrics.set_gauge("cortex_enrichment_queue_depth", float(depth))
+        return [
+            {"job_id": r[0], "fact_id": r[1], "attempts": r[2] or 0, "created_at": r[3]}
+            for r in sorted(rows, key=lambda r: r[0])
+        ]
 
-    async def _process_job(self, job: dict[str, Any]):
-        """Process a single enrichment job."""
+    async def _process_batch(self, jobs: list[dict[str, Any]]) -> None:
+        """Process a claimed batch with one batched embedding call."""
         if self._compat_db_mode:
-            await self._process_queued_job(job)
-            return
+            await self._process_compat_batch(jobs)
+        else:
+            await self._process_ledger_batch(jobs)
 
-        job_id = job["job_id"]
-        event_id = job["event_id"]
-        attempts = job["attempts"]
+    async def _process_ledger_batch(self, jobs: list[dict[str, Any]]) -> None:
+        event_ids = [job["event_id"] for job in jobs]
+        placeholders = ",".join("?" * len(event_ids))
+        with self.store.tx() as conn:  # type: ignore[reportOptionalMemberAccess]
+            rows = conn.execute(
+                f"SELECT event_id, payload_json FROM ledger_events WHERE event_id IN ({placeholders})",
+                event_ids,
+            ).fetchall()
+        payloads = {row["event_id"]: json.loads(row["payload_json"]) for row in rows}
 
-        try:
-            logger.debug("Processing enrichment for event %s (job %s)", event_id, job_id)
-
-            # 1. Fetch event detail
-            with self.store.tx() as conn:  # type: ignore[reportOptionalMemberAccess]
-                row = conn.execute(
-                    "SELECT payload_json FROM ledger_events WHERE event_id=?", (event_id,)
-                ).fetchone()
-                if not row:
-                    raise ValueError(f"Event {event_id} not found in ledger")
-                payload = json.loads(row["payload_json"])
-
-            # 2. Perform enrichment based on action/tool
-            # For now, default to generating embedding if it looks like a fact
-            if payload.get("action") in ("store", "create", "update"):
-                target = payload.get("target", {})
-                if target.get("identifier"):  # Likely a fact ID
-                    await self._enrich_fact(target["identifier"], payload)
-
-            # 3. Mark successful
-            self.queue.mark_done(job_id, event_id)  # type: ignore[reportOptionalMemberAccess]
-            logger.info("Enrichment completed for event %s", event_id)
+        failed: dict[str, str] = {}
+        facts: list[dict[str, Any]] = []
+        fact_jobs: list[dict[str, Any]] = []
+        for job in jobs:
+            payload = payloads.get(job["event_id"])
+            if payload is None:
+                failed[job["job_id"]] = f"Event {job['event_id']} not found in ledger"
+                continue
+            fact = self._fact_from_payload(payload)
+            if fact is not None:
+                facts.append(fact)
+                fact_jobs.append(job)
 
-        except Exception as e:
-            logger.error("Failed to process job %s: %s", job_id, e)
-            self.queue.mark_failed(job_id, event_id, str(e), attempts)  # type: ignore[reportOptionalMemberAccess]
-
-    async def _process_queued_job(self, job: dict[str, Any]) -> None:
-        """Process a legacy enrichment_jobs row for backward compatibility."""
-        job_id = int(job["job_id"])
-        fact_id = int(job["fact_id"])
+        for job, error in zip(fact_jobs, await self._enrich_facts(facts), strict=True):
+            if error is not None:
+                failed[job["job_id"]] = str(error)
 
-        try:
-            async with self.engine.session() as conn:
-                cursor = await conn.execute(
-                    "SELECT project, content, tenant_id FROM facts WHERE id = ?",
-                    (fact_id,),
-                )
-                row = await cursor.fetchone()
-                if not row:
-                    raise ValueError(f"Fact {fact_id} not found")
-
-                project, content, tenant_id = row
-                if hasattr(self.engine, "embeddings") and getattr(self.engine, "embeddings", None):
-                    await self.engine.embeddings.enrich_fact(
-                        fact_id=fact_id,
-                        content=content,
-                        project=project,
-                        tenant_id=tenant_id,
-                    )
-
-                await conn.execute(
-                    """
-                    UPDATE enrichment_jobs
-                    SET status = 'completed', updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(), job_id),
+        done = [job for job in jobs if job["job_id"] not in failed]
+        self.queue.mark_done_many([(job["job_id"], job["event_id"]) for job in done])  # type: ignore[reportOptionalMemberAccess]
+        for job in jobs:
+            if job["job_id"] in failed:
+                logger.error("Failed to process job %s: %s", job["job_id"], failed[job["job_id"]])
+                self.queue.mark_failed(  # type: ignore[reportOptionalMemberAccess]
+                    job["job_id"], job["event_id"], failed[job["job_id"]], job["attempts"]
                 )
-                await conn.commit()
-        except Exception as e:
-            async with self.engine.session() as conn:
-                await conn.execute(
-                    """
-                    UPDATE enrichment_jobs
-                    SET status = 'failed',
-                        attempts = attempts + 1,
-                        last_error = ?,
-                        next_attempt_at = ?,
-                        updated_at = ?
-                    WHERE id = ?
-                    """,
-                    (
-                        str(e),
-                        (
-                            datetime.fromtimestamp(time.time(), tz=timezone.utc)
-                            + timedelta(minutes=5)
-                        ).isoformat(),
-                        datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat(),
-                        job_id,
-                    ),
-                )
-                await conn.commit()
-            raise
+        self._observe_lag(done)
+        logger.info("Enrichment batch: %d done, %d failed", len(done), len(failed))
 
-    async def _enrich_fact(self, fact_id: str | int, payload: dict[str, Any]):
-        """Generate embeddings or summaries for a fact."""
-        # This uses the engine to perform the heavy lifting
-        if not hasattr(self.engine, "embeddings"):
-            return
+    async def _process_compat_batch(self, jobs: list[dict[str, Any]]) -> None:
+        fact_ids = [int(job["fact_id"]) for job in jobs]
+        placeholders = ",".join("?" * len(fact_ids))
+        async with self.engine.session() as conn:
+            cursor = await conn.execute(
+                f"SELECT id, project, content, tenant_id FROM facts WHERE id IN ({placeholders})",
+                fact_ids,
+            )
+            rows = {r[0]: r for r in await cursor.fetchall()}
 
-        try:
-            # Metadata usually contains 'content' and 'project'
-            metadata = payload.get("metadata", {})
-            content = metadata.get("content", "")
-            project = metadata.get("project", "default")
-            tenant_id = metadata.get("tenant_id", "default")
-
-            if not content:
-                logger.warning("No content found for fact %s enrichment", fact_id)
-                return
-
-            # Call the sovereign enrichment method in EmbeddingManager
-            await self.engine.embeddings.enrich_fact(
-                fact_id=int(fact_id), content=content, project=project, tenant_id=tenant_id
+        failed: dict[int, str] = {}
+        facts: list[dict[str, Any]] = []
+        fact_jobs: list[dict[str, Any]] = []
+        for job in jobs:
+            row = rows.get(int(job["fact_id"]))
+            if row is None:
+                failed[int(job["job_id"])] = f"Fact {job['fact_id']} not found"
+                continue
+            facts.append(
+                {"fact_id": row[0], "project": row[1], "content": row[2], "tenant_id": row[3]}
             )
+            fact_jobs.append(job)
+
+        for job, error in zip(fact_jobs, await self._enrich_facts(facts), strict=True):
+            if error is not None:
+                failed[int(job["job_id"])] = str(error)
+
+        now = _utc_now()
+        retry_at = (now + timedelta(minutes=5)).isoformat()
+        done = [job for job in jobs if int(job["job_id"]) not in failed]
+        async with self.engine.session() as conn:
+            await conn.executemany(
+                "UPDATE enrichment_jobs SET status = 'completed', updated_at = ? WHERE id = ?",
+                [(now.isoformat(), int(job["job_id"])) for job in done],
+            )
+            await conn.executemany(
+                """
+                UPDATE enrichment_jobs
+                SET status = 'failed',
+                    attempts = attempts + 1,
+                    last_error = ?,
+                    next_attempt_at = ?,
+                    updated_at = ?
+                WHERE id = ?
+                """,
+                [(err, retry_at, now.isoformat(), job_id) for job_id, err in failed.items()],
+            )
+            await conn.commit()
+        self._observe_lag(done)
+        logger.info("Enrichment batch: %d done, %d failed", len(done), len(failed))
+
+    async def _enrich_facts(self, facts: list[dict[str, Any]]) -> list[Exception | None]:
+        """Embed ``facts`` in one call; a whole-batch failure fails every fact."""
+        if not facts or not getattr(self.engine, "embeddings", None):
+            return [None] * len(facts)
+        try:
+            return await self.engine.embeddings.enrich_facts(facts, batch_size=self.batch_size)
         except Exception as e:
-            logger.warning("Semantic enrichment for fact %s failure: %s", fact_id, e)
-            raise
+            logger.warning("Batched enrichment of %d facts failed: %s", len(facts), e)
+            return [e] * len(facts)
+
+    @staticmethod
+    def _fact_from_payload(payload: dict[str, Any]) -> dict[str, Any] | None:
+        """The fact a ledger event asks to enrich, or None if there is nothing to embed."""
+        if payload.get("action") not in _ENRICHABLE_ACTIONS:
+            return None
+        fact_id = payload.get("target", {}).get("identifier")
+        if not fact_id:
+            return None
+        metadata = payload.get("metadata", {})
+        content = metadata.get("content", "")
+        if not content:
+            logger.warning("No content found for fact %s enrichment", fact_id)
+            return None
+        return {
+            "fact_id": int(fact_id),
+            "content": content,
+            "project": metadata.get("project", "default"),
+            "tenant_id": metadata.get("tenant_id", "default"),
+        }
+
+    @staticmethod
+    def _observe_lag(jobs: list[dict[str, Any]]) -> None:
+        """Record enqueue-to-completion lag for finished jobs."""
+        for job in jobs:
+            lag = _lag_seconds(job.get("created_at"))
+            if lag is not None:
+                metrics.observe("cortex_enrichment_lag_seconds", lag)
@@ -6,13 +6,15 @@ import json
 import logging
 import sqlite3
 import time
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
 
 import aiosqlite
 
+from babylon60.extensions.signals.fanout import notify_signal
 from babylon60.extensions.signals.models import Signal, signal_from_row
 
-__all__ = ["AsyncSignalBus", "SignalBus"]
+__all__ = ["UNCONSUMED_SQL", "AsyncSignalBus", "SignalBus"]
 
 logger = logging.getLogger("babylon60_extensions.signals.bus")
 
@@ -37,6 +39,133 @@ CREATE INDEX IF NOT EXISTS idx_signals_project ON signals(project);
 CREATE INDEX IF NOT EXISTS idx_signals_tenant ON signals(tenant_id);
 """
 
+# Per-consumer read position. Polling is a rowid range scan after
+# ``last_rowid`` and acking is one upsert, instead of a LIKE over
+# ``signals.consumed_by`` plus one UPDATE per signal.
+_CREATE_OFFSETS = """\
+CREATE TABLE IF NOT EXISTS signal_offsets (
+    consumer TEXT NOT NULL,
+    tenant_id TEXT NOT NULL DEFAULT 'default',
+    last_rowid INTEGER NOT NULL DEFAULT 0,
+    updated_at TEXT NOT NULL DEFAULT (datetime('now')),
+    PRIMARY KEY (consumer, tenant_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_signal_offsets_tenant ON signal_offsets(tenant_id, last_rowid);
+"""
+
+_HAS_OFFSETS = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'signal_offsets'"
+
+# One-time carry-over of positions recorded in the legacy consumed_by arrays:
+# each consumer's offset is the end of the prefix it consumed without gaps.
+# Rows it consumed past a gap (a filtered poll skipped something) are still
+# excluded by the consumed_by check in _unseen_clause.
+_SEED_OFFSETS = """\
+INSERT OR IGNORE INTO signal_offsets (consumer, tenant_id, last_rowid)
+SELECT c.consumer, c.tenant_id, COALESCE(
+    (SELECT MIN(s.id) - 1 FROM signals AS s
+     WHERE s.tenant_id = c.tenant_id AND s.id < c.hi AND NOT EXISTS (
+        SELECT 1 FROM json_each(
+            CASE WHEN json_valid(s.consumed_by) THEN s.consumed_by ELSE '[]' END
+        ) AS j WHERE j.value = c.consumer)),
+    c.hi)
+FROM (
+    SELECT j.value AS consumer, s.tenant_id AS tenant_id, MAX(s.id) AS hi
+    FROM signals AS s, json_each(s.consumed_by) AS j
+    WHERE s.consumed_by != '[]' AND json_valid(s.consumed_by)
+    GROUP BY j.value, s.tenant_id
+) AS c
+"""
+
+_ACK = """\
+INSERT INTO signal_offsets (consumer, tenant_id, last_rowid, updated_at)
+VALUES (?, ?, ?, datetime('now'))
+ON CONFLICT (consumer, tenant_id) DO UPDATE SET
+    last_rowid = MAX(last_rowid, excluded.last_rowid),
+    updated_at = excluded.updated_at
+"""
+
+_OFFSETS_FOR_TENANT = "SELECT consumer, last_rowid FROM signal_offsets WHERE tenant_id = ?"
+
+# The plain offset and every filtered one ("consumer\x1f...") of a consumer.
+_UNREGISTER = (
+    "DELETE FROM signal_offsets WHERE tenant_id = ?"
+    " AND (consumer = ? OR substr(consumer, 1, length(?)) = ?)"
+)
+
+_GC_FLOORS = "SELECT tenant_id, MIN(last_rowid) FROM signal_offsets"
+
+# Filtered polls keep their own offset, keyed "consumer\x1ftype\x1fsource\x1fproject",
+# so a row one filter skipped is still delivered to a poll with another filter.
+# Every poll also skips rows the consumer acked through its other offsets
+# (see _unseen_clause), so no row is delivered twice to the same consumer.
+_FILTER_SEP = "\x1f"
+_FILTER_COLUMNS = ("event_type", "source", "project")
+
+#: Rows no registered consumer of their tenant has read yet. Only unfiltered
+#: offsets count: a filtered offset says nothing about the rows it skipped.
+UNCONSUMED_SQL = (
+    "id > (SELECT COALESCE(MAX(o.last_rowid), 0) FROM signal_offsets AS o"
+    " WHERE o.tenant_id = signals.tenant_id AND instr(o.consumer, char(31)) = 0)"
+)
+
+
+def _offset_key(
+    consumer: str,
+    event_type: str | None = None,
+    source: str | None = None,
+    project: str | None = None,
+) -> str:
+    """Offset row for ``consumer`` polling with this filter."""
+    if not (event_type or source or project):
+        return consumer
+    return _FILTER_SEP.join((consumer, event_type or "", source or "", project or ""))
+
+
+def _parse_key(key: str) -> tuple[str, tuple[str, str, str] | None]:
+    """Base consumer of offset ``key`` and its (type, source, project) filter."""
+    if _FILTER_SEP not in key:
+        return key, None
+    consumer, event_type, source, project = key.rsplit(_FILTER_SEP, 3)
+    return consumer, (event_type, source, project)
+
+
+def _matches(sig: Signal, key: str) -> tuple[str, bool]:
+    """Base consumer of offset ``key`` and whether ``sig`` passes its filter."""
+    consumer, filt = _parse_key(key)
+    if filt is None:
+        return consumer, True
+    values = (sig.event_type, sig.source, sig.project)
+    return consumer, all(not want or got == want for want, got in zip(filt, values, strict=True))
+
+
+def _unseen_clause(key: str, offsets: list[tuple[str, int]]) -> tuple[str, list]:
+    """Rows past ``key``'s offset that its consumer has not acked any other way.
+
+    The plain offset covers every row up to it; each other filtered offset
+    covers the rows up to it that match its filter; legacy rows carry the
+    consumer in ``consumed_by``. New rows hold ``'[]'`` there, so the LIKE
+    only runs on pre-offset rows.
+    """
+    consumer, _ = _parse_key(key)
+    floor = 0
+    sql, params = "", []
+    for other, last in offsets:
+        base, filt = _parse_key(other)
+        if base != consumer:
+            continue
+        if other == key or filt is None:
+            floor = max(floor, last)
+            continue
+        conds, cond_params = ["id <= ?"], [last]
+        for column, value in zip(_FILTER_COLUMNS, filt, strict=True):
+            if value:
+                conds.append(f"{column} = ?")
+                cond_params.append(value)
+        sql += f" AND NOT ({' AND '.join(conds)})"
+        params.extend(cond_params)
+    sql = " AND id > ?" + sql + " AND (consumed_by = '[]' OR consumed_by NOT LIKE ?)"
+    return sql, [floor, *params, f'%"{consumer}"%']
+
 
 def _build_query(
     *,
@@ -44,7 +173,8 @@ def _build_query(
     event_type: str | None = None,
     source: str | None = None,
     project: str | None = None,
-    unconsumed_by: str | None = None,
+    after_consumer: str | None = None,
+    offsets: list[tuple[str, int]] | None = None,
     order: str = "ASC",
     limit: int = 50,
 ) -> tuple[str, list]:
@@ -62,14 +192,49 @@ def _build_query(
     if project:
         query += " AND project = ?"
         params.append(project)
-    if unconsumed_by:
-        query += " AND consumed_by NOT LIKE ?"
-        params.append(f'%"{unconsumed_by}"%')
+    if after_consumer:
+        # (tenant_id, rowid) index range scan past the consumer's offset.
+        clause, clause_params = _unseen_clause(after_consumer, offsets or [])
+        query += clause
+        params.extend(clause_params)
     query += f" ORDER BY rowid {order} LIMIT ?"
     params.append(limit)
     return query, params
 
 
+def _with_consumers(signals: list[Signal], offsets: list[tuple[str, int]]) -> list[Signal]:
+    """Fill ``consumed_by`` from the consumers whose offset has passed each signal."""
+    if not offsets:
+        return signals
+    out = []
+    for sig in signals:
+        passed: list[str] = []
+        for key, last in offsets:
+            if last < sig.id:
+                continue
+            consumer, ok = _matches(sig, key)
+            if ok and consumer not in sig.consumed_by and consumer not in passed:
+                passed.append(consumer)
+        out.append(replace(sig, consumed_by=sig.consumed_by + passed) if passed else sig)
+    return out
+
+
+def _gc_cutoff(max_age_days: int) -> str:
+    return (
+        datetime.fromtimestamp(time.time(), tz=timezone.utc) - timedelta(days=max_age_days)
+    ).isoformat()
+
+
+def _log_gc(pruned: int, max_age_days: int, tenant_id: str | None) -> None:
+    if pruned:
+        logger.info(
+            "GC: pruned %d consumed signal(s) older than %d days (%s)",
+            pruned,
+            max_age_days,
+            f"tenant: {tenant_id}" if tenant_id else "all tenants",
+        )
+
+
 class AsyncSignalBus:
     __slots__ = ("_conn", "_ready", "session_emitted", "session_errors")
 
@@ -86,7 +251,8 @@ class AsyncSignalBus:
             self._ready = True
             return
 
-        await self._conn.executescript(_CREATE_TABLE + _CREATE_INDEXES)
+        had_offsets = await (await self._conn.execute(_HAS_OFFSETS)).fetchone()
+        await self._conn.executescript(_CREATE_TABLE + _CREATE_INDEXES + _CREATE_OFFSETS)
 
         cursor = await self._conn.execute("PRAGMA table_info(signals)")
         columns = [row[1] for row in await cursor.fetchall()]
@@ -97,6 +263,8 @@ class AsyncSignalBus:
             await self._conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_signals_tenant ON signals(tenant_id)"
             )
+        if not had_offsets:
+            await self._conn.execute(_SEED_OFFSETS)
 
         if not self._conn.in_transaction:
             await self._conn.commit()
@@ -130,6 +298,7 @@ class AsyncSignalBus:
                 ),
             )
             await self._conn.commit()
+            notify_signal()
             self.session_emitted += 1
             return cursor.lastrowid or 0
         except (RuntimeError, ValueError, OSError):
@@ -160,7 +329,12 @@ class AsyncSignalBus:
             params.insert(-1, since.isoformat())
         cursor = await self._conn.execute(query, params)
         rows = await cursor.fetchall()
-        return [signal_from_row(tuple(row)) for row in rows]
+        signals = [signal_from_row(tuple(row)) for row in rows]
+        return _with_consumers(signals, await self._offsets(tenant_id))
+
+    async def _offsets(self, tenant_id: str) -> list[tuple[str, int]]:
+        cursor = await self._conn.execute(_OFFSETS_FOR_TENANT, (tenant_id,))
+        return [(row[0], row[1]) for row in await cursor.fetchall()]
 
     async def _query(
         self,
@@ -169,20 +343,23 @@ class AsyncSignalBus:
         event_type: str | None = None,
         source: str | None = None,
         project: str | None = None,
-        unconsumed_by: str | None = None,
+        after_consumer: str | None = None,
         limit: int = 50,
     ) -> list[Signal]:
+        offsets = await self._offsets(tenant_id)
         query, params = _build_query(
             tenant_id=tenant_id,
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=unconsumed_by,
+            after_consumer=after_consumer,
+            offsets=offsets,
             limit=limit,
         )
         cursor = await self._conn.execute(query, params)
         rows = await cursor.fetchall()
-        return [signal_from_row(tuple(row)) for row in rows]
+        signals = [signal_from_row(tuple(row)) for row in rows]
+        return _with_consumers(signals, offsets)
 
     async def poll(
         self,
@@ -194,27 +371,42 @@ class AsyncSignalBus:
         consumer: str = "default",
         limit: int = 50,
     ) -> list[Signal]:
+        """Signals after ``consumer``'s offset, acknowledged in one write.
+
+        A filtered poll reads and moves its own offset for that filter, so
+        rows it skipped are still delivered to the consumer's other polls.
+        Rows already acked through any of the consumer's offsets are never
+        delivered again.
+        """
         await self.ensure_table()
+        key = _offset_key(consumer, event_type, source, project)
         signals = await self._query(
             tenant_id=tenant_id,
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=consumer,
+            after_consumer=key,
             limit=limit,
         )
-
-        for sig in signals:
-            new_consumed = sig.consumed_by + [consumer]
-            await self._conn.execute(
-                "UPDATE signals SET consumed_by = ? WHERE id = ? AND tenant_id = ?",
-                (json.dumps(new_consumed), sig.id, tenant_id),
-            )
         if signals:
-            await self._conn.commit()
-
+            await self.ack(key, signals[-1].id, tenant_id=tenant_id)
         return signals
 
+    async def ack(self, consumer: str, last_id: int, *, tenant_id: str = "default") -> None:
+        """Advance ``consumer``'s offset to ``last_id`` (never backwards)."""
+        await self.ensure_table()
+        await self._conn.execute(_ACK, (consumer, tenant_id, last_id))
+        await self._conn.commit()
+
+    async def unregister(self, consumer: str, *, tenant_id: str = "default") -> None:
+        """Forget ``consumer`` so it no longer holds back :meth:`gc`."""
+        await self.ensure_table()
+        await self._conn.execute(
+            _UNREGISTER,
+            (tenant_id, consumer, consumer + _FILTER_SEP, consumer + _FILTER_SEP),
+        )
+        await self._conn.commit()
+
     async def peek(
         self,
         *,
@@ -231,7 +423,7 @@ class AsyncSignalBus:
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=consumer,
+            after_consumer=consumer and _offset_key(consumer, event_type, source, project),
             limit=limit,
         )
 
@@ -265,36 +457,35 @@ class AsyncSignalBus:
 
         row = await (
             await self._conn.execute(
-                "SELECT COUNT(*) FROM signals WHERE consumed_by = '[]' AND tenant_id = ?",
+                f"SELECT COUNT(*) FROM signals WHERE tenant_id = ? AND {UNCONSUMED_SQL}",
                 (tenant_id,),
             )
         ).fetchone()
         result["unconsumed"] = row[0] if row else 0
+        result["offsets"] = dict(await self._offsets(tenant_id))
 
         return result
 
     async def gc(self, max_age_days: int = 30, tenant_id: str | None = None) -> int:
+        """Delete signals older than ``max_age_days`` that every registered
+        consumer of their tenant has passed. Tenants without consumers keep theirs."""
         await self.ensure_table()
-        cutoff = (
-            datetime.fromtimestamp(time.time(), tz=timezone.utc) - timedelta(days=max_age_days)
-        ).isoformat()
+        cutoff = _gc_cutoff(max_age_days)
 
-        sql = "DELETE FROM signals WHERE consumed_by != '[]' AND created_at < ?"
-        params: list = [cutoff]
+        sql, params = _GC_FLOORS, []
         if tenant_id:
-            sql += " AND tenant_id = ?"
+            sql += " WHERE tenant_id = ?"
             params.append(tenant_id)
-
-        cursor = await self._conn.execute(sql, tuple(params))
-        await self._conn.commit()
-        pruned = cursor.rowcount
-        if pruned:
-            logger.info(
-                "GC: pruned %d consumed signal(s) older than %d days (%s)",
-                pruned,
-                max_age_days,
-                f"tenant: {tenant_id}" if tenant_id else "all tenants",
+        cursor = await self._conn.execute(sql + " GROUP BY tenant_id", params)
+        pruned = 0
+        for tenant, floor in await cursor.fetchall():
+            cursor = await self._conn.execute(
+                "DELETE FROM signals WHERE tenant_id = ? AND id <= ? AND created_at < ?",
+                (tenant, floor, cutoff),
             )
+            pruned += max(cursor.rowcount, 0)
+        await self._conn.commit()
+        _log_gc(pruned, max_age_days, tenant_id)
         return pruned
 
 
@@ -314,7 +505,8 @@ class SignalBus:
             self._ready = True
             return
 
-        self._conn.executescript(_CREATE_TABLE + _CREATE_INDEXES)
+        had_offsets = self._conn.execute(_HAS_OFFSETS).fetchone()
+        self._conn.executescript(_CREATE_TABLE + _CREATE_INDEXES + _CREATE_OFFSETS)
 
         cursor = self._conn.execute("PRAGMA table_info(signals)")
         columns = [row[1] for row in cursor.fetchall()]
@@ -325,6 +517,8 @@ class SignalBus:
             self._conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_signals_tenant ON signals(tenant_id)"
             )
+        if not had_offsets:
+            self._conn.execute(_SEED_OFFSETS)
 
         if not self._conn.in_transaction:
             self._conn.commit()
@@ -358,6 +552,7 @@ class SignalBus:
                 ),
             )
             self._conn.commit()
+            notify_signal()
             signal_id = cursor.lastrowid
             logger.info(
                 "Signal emitted: %s (#%d) from %s (tenant: %s)",
@@ -382,24 +577,25 @@ class SignalBus:
         consumer: str = "default",
         limit: int = 50,
     ) -> list[Signal]:
+        """Signals after ``consumer``'s offset, acknowledged in one write.
+
+        A filtered poll reads and moves its own offset for that filter, so
+        rows it skipped are still delivered to the consumer's other polls.
+        Rows already acked through any of the consumer's offsets are never
+        delivered again.
+        """
         self.ensure_table()
+        key = _offset_key(consumer, event_type, source, project)
         signals = self._query(
             tenant_id=tenant_id,
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=consumer,
+            after_consumer=key,
             limit=limit,
         )
-
-        for sig in signals:
-            new_consumed = sig.consumed_by + [consumer]
-            self._conn.execute(
-                "UPDATE signals SET consumed_by = ? WHERE id = ? AND tenant_id = ?",
-                (json.dumps(new_consumed), sig.id, tenant_id),
-            )
         if signals:
-            self._conn.commit()
+            self.ack(key, signals[-1].id, tenant_id=tenant_id)
             logger.info(
                 "Polled %d signal(s) as consumer '%s' (tenant: %s)",
                 len(signals),
@@ -409,6 +605,21 @@ class SignalBus:
 
         return signals
 
+    def ack(self, consumer: str, last_id: int, *, tenant_id: str = "default") -> None:
+        """Advance ``consumer``'s offset to ``last_id`` (never backwards)."""
+        self.ensure_table()
+        self._conn.execute(_ACK, (consumer, tenant_id, last_id))
+        self._conn.commit()
+
+    def unregister(self, consumer: str, *, tenant_id: str = "default") -> None:
+        """Forget ``consumer`` so it no longer holds back :meth:`gc`."""
+        self.ensure_table()
+        self._conn.execute(
+            _UNREGISTER,
+            (tenant_id, consumer, consumer + _FILTER_SEP, consumer + _FILTER_SEP),
+        )
+        self._conn.commit()
+
     def peek(
         self,
         *,
@@ -425,7 +636,7 @@ class SignalBus:
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=consumer,
+            after_consumer=consumer and _offset_key(consumer, event_type, source, project),
             limit=limit,
         )
 
@@ -452,7 +663,8 @@ class SignalBus:
             query = query.replace(" ORDER BY", " AND created_at >= ? ORDER BY", 1)
             params.insert(-1, since.isoformat())
         cursor = self._conn.execute(query, params)
-        return [signal_from_row(tuple(row)) for row in cursor.fetchall()]
+        signals = [signal_from_row(tuple(row)) for row in cursor.fetchall()]
+        return _with_consumers(signals, self._offsets(tenant_id))
 
     def stats(self, tenant_id: str = "default") -> dict:
         self.ensure_table()
@@ -482,37 +694,40 @@ class SignalBus:
         result["by_source"] = {r[0]: r[1] for r in cursor.fetchall()}
 
         row = self._conn.execute(
-            "SELECT COUNT(*) FROM signals WHERE consumed_by = '[]' AND tenant_id = ?",
+            f"SELECT COUNT(*) FROM signals WHERE tenant_id = ? AND {UNCONSUMED_SQL}",
             (tenant_id,),
         ).fetchone()
         result["unconsumed"] = row[0] if row else 0
+        result["offsets"] = dict(self._offsets(tenant_id))
 
         return result
 
     def gc(self, max_age_days: int = 30, tenant_id: str | None = None) -> int:
+        """Delete signals older than ``max_age_days`` that every registered
+        consumer of their tenant has passed. Tenants without consumers keep theirs."""
         self.ensure_table()
-        cutoff = (
-            datetime.fromtimestamp(time.time(), tz=timezone.utc) - timedelta(days=max_age_days)
-        ).isoformat()
+        cutoff = _gc_cutoff(max_age_days)
 
-        sql = "DELETE FROM signals WHERE consumed_by != '[]' AND created_at < ?"
-        params: list = [cutoff]
+        sql, params = _GC_FLOORS, []
         if tenant_id:
-            sql += " AND tenant_id = ?"
+            sql += " WHERE tenant_id = ?"
             params.append(tenant_id)
-
-        cursor = self._conn.execute(sql, tuple(params))
-        self._conn.commit()
-        pruned = cursor.rowcount
-        if pruned:
-            logger.info(
-                "GC: pruned %d consumed signal(s) older than %d days (%s)",
-                pruned,
-                max_age_days,
-                f"tenant: {tenant_id}" if tenant_id else "all tenants",
+        floors = self._conn.execute(sql + " GROUP BY tenant_id", params).fetchall()
+        pruned = 0
+        for tenant, floor in floors:
+            cursor = self._conn.execute(
+                "DELETE FROM signals WHERE tenant_id = ? AND id <= ? AND created_at < ?",
+                (tenant, floor, cutoff),
             )
+            pruned += max(cursor.rowcount, 0)
+        self._conn.commit()
+        _log_gc(pruned, max_age_days, tenant_id)
         return pruned
 
+    def _offsets(self, tenant_id: str) -> list[tuple[str, int]]:
+        cursor = self._conn.execute(_OFFSETS_FOR_TENANT, (tenant_id,))
+        return [(row[0], row[1]) for row in cursor.fetchall()]
+
     def _query(
         self,
         *,
@@ -520,16 +735,19 @@ class SignalBus:
         event_type: str | None = None,
         source: str | None = None,
         project: str | None = None,
-        unconsumed_by: str | None = None,
+        after_consumer: str | None = None,
         limit: int = 50,
     ) -> list[Signal]:
+        offsets = self._offsets(tenant_id)
         query, params = _build_query(
             tenant_id=tenant_id,
             event_type=event_type,
             source=source,
             project=project,
-            unconsumed_by=unconsumed_by,
+            after_consumer=after_consumer,
+            offsets=offsets,
             limit=limit,
         )
         cursor = self._conn.execute(query, params)
-        return [signal_from_row(tuple(row)) for row in cursor.fetchall()]
+        signals = [signal_from_row(tuple(row)) for row in cursor.fetchall()]
+        return _with_consumers(signals, offsets)
@@ -90,7 +90,7 @@ def emit_fact_stored(
                      (passed in to avoid a double read inside this hook).
     """
     try:
-        from babylon60.extensions.signals.bus import SignalBus
+        from babylon60.extensions.signals.bus import UNCONSUMED_SQL, SignalBus
 
         conn = db_connect(db_path, timeout=3)
 
@@ -124,7 +124,7 @@ def emit_fact_stored(
                 "SELECT COUNT(*) FROM signals "
                 "WHERE event_type = 'fact:stored' "
                 "AND project = ? "
-                "AND consumed_by = '[]'",
+                f"AND {UNCONSUMED_SQL}",
                 (project,),
             )
             row = cursor.fetchone()
@@ -0,0 +1,317 @@
+# [C5-REAL] Exergy-Maximized
+"""In-process fan-out of the ``signals`` table to streaming subscribers.
+
+One :class:`SignalFanoutHub` per database tails ``signals`` by rowid
+watermark (a single indexed range read per tick, however many clients are
+connected) and pushes each new row to the bounded queue of every matching
+:class:`Subscription`. Nothing is written back: SSE clients no longer
+rewrite ``consumed_by``.
+
+* Emitters in this process call :func:`notify_signal` so the tailer reads
+  immediately; rows from other processes are picked up within
+  ``poll_interval``.
+* ``last_event_id`` replays the rows a reconnecting client missed.
+* A subscriber that falls ``queue_size`` events behind loses its oldest
+  queued events; the count is reported once via :attr:`Subscription.take_dropped`
+  so the stream can tell the client to resync.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from collections.abc import AsyncIterator, Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+from babylon60.extensions.signals.models import Signal, signal_from_row
+from babylon60.telemetry.metrics import metrics
+
+__all__ = [
+    "SignalFanoutHub",
+    "Subscription",
+    "get_signal_hub",
+    "notify_signal",
+]
+
+logger = logging.getLogger("babylon60_extensions.signals.fanout")
+
+_SELECT_AFTER = (
+    "SELECT id, event_type, payload, source, project, created_at, consumed_by, tenant_id"
+    " FROM signals WHERE id > ? ORDER BY id LIMIT ?"
+)
+
+
+class SignalSource(Protocol):
+    async def max_id(self) -> int: ...
+
+    async def rows_after(self, after_id: int, limit: int) -> list[tuple]:
+        """Rows with ``id > after_id``, oldest first: (id, event_type, payload,
+        source, project, created_at, consumed_by, tenant_id)."""
+        ...
+
+
+class _SessionSource:
+    """Reads ``signals`` through an ``async with factory() as conn`` context."""
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        self._factory = factory
+
+    async def max_id(self) -> int:
+        async with self._factory() as conn:
+            cursor = await conn.execute("SELECT COALESCE(MAX(id), 0) FROM signals")
+            row = await cursor.fetchone()
+            return int(row[0]) if row else 0
+
+    async def rows_after(self, after_id: int, limit: int) -> list[tuple]:
+        async with self._factory() as conn:
+            cursor = await conn.execute(_SELECT_AFTER, (after_id, limit))
+            return [tuple(row) for row in await cursor.fetchall()]
+
+
+_BACKFILL_LIMIT = 500
+
+
+@dataclass(eq=False)
+class Subscription:
+    """A subscriber's filtered, bounded view of the signal stream."""
+
+    tenant_id: str
+    event_types: frozenset[str] | None
+    queue: asyncio.Queue[Signal]
+    dropped: int = 0
+    _floor: int = field(default=0, repr=False)
+
+    def matches(self, tenant_id: str, event_type: str) -> bool:
+        return tenant_id == self.tenant_id and (
+            self.event_types is None or event_type in self.event_types
+        )
+
+    def offer(self, signal: Signal) -> None:
+        """Enqueue without blocking the tailer; drop the oldest event when full."""
+        while True:
+            try:
+                self.queue.put_nowait(signal)
+                return
+            except asyncio.QueueFull:
+                self.queue.get_nowait()
+                self.dropped += 1
+                metrics.inc("cortex_signal_fanout_dropped_total")
+
+    def take_dropped(self) -> int:
+        """Events dropped since the last call."""
+        dropped, self.dropped = self.dropped, 0
+        return dropped
+
+    async def next(self) -> Signal:
+        """Next signal, skipping anything already replayed by the backfill."""
+        while True:
+            signal = await self.queue.get()
+            if signal.id > self._floor:
+                self._floor = signal.id
+                return signal
+
+
+class SignalFanoutHub:
+    """Single shared tailer of ``signals`` feeding per-client queues."""
+
+    def __init__(
+        self,
+        source: SignalSource,
+        *,
+        poll_interval: float = 0.05,
+        batch_size: int = 256,
+        queue_size: int = 256,
+    ) -> None:
+        self._source = source
+        self._poll_interval = poll_interval
+        self._batch_size = batch_size
+        self._queue_size = queue_size
+        self._subscribers: set[Subscription] = set()
+        self._watermark: int | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._wake: asyncio.Event | None = None
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    async def subscribe(
+        self,
+        tenant_id: str,
+        event_types: Iterable[str] | None = None,
+        *,
+        last_event_id: int | None = None,
+    ) -> tuple[Subscription, list[Signal]]:
+        """Register a subscriber; returns it with the backlog after ``last_event_id``."""
+        sub = Subscription(
+            tenant_id=tenant_id,
+            event_types=frozenset(event_types) if event_types else None,
+            queue=asyncio.Queue(maxsize=self._queue_size),
+        )
+        async with self._start_lock:
+            if self._watermark is None:
+                self._watermark = await self._source.max_id()
+            # Rows after ``end`` reach the queue live; the backlog covers up to it.
+            end = self._watermark
+            self._subscribers.add(sub)
+        metrics.set_gauge("cortex_signal_fanout_subscribers", len(self._subscribers))
+        self._ensure_running()
+
+        backlog: list[Signal] = []
+        if last_event_id is not None and last_event_id < end:
+            sub._floor = last_event_id
+            after = last_event_id
+            while after < end:
+                rows = await self._source.rows_after(after, self._batch_size)
+                if not rows:
+                    break
+                after = rows[-1][0]
+                backlog.extend(
+                    signal_from_row(tuple(row[:7]))
+                    for row in rows
+                    if row[0] <= end and sub.matches(row[7] or "default", row[1])
+                )
+            if len(backlog) > _BACKFILL_LIMIT:
+                # Too far behind: replay the newest part and report the gap.
+                sub.dropped += len(backlog) - _BACKFILL_LIMIT
+                backlog = backlog[-_BACKFILL_LIMIT:]
+            if backlog:
+                sub._floor = backlog[-1].id
+        return sub, backlog
+
+    async def unsubscribe(self, sub: Subscription) -> None:
+        self._subscribers.discard(sub)
+        metrics.set_gauge("cortex_signal_fanout_subscribers", len(self._subscribers))
+        if not self._subscribers and self._task is not None:
+            # Idle: stop tailing. The next subscriber starts from the then-current end.
+            task, self._task = self._task, None
+            self._watermark = None
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def stream(
+        self,
+        tenant_id: str,
+        event_types: Iterable[str] | None = None,
+        *,
+        last_event_id: int | None = None,
+    ) -> AsyncIterator[Signal | int]:
+        """Yield signals for one subscriber; an ``int`` reports dropped events."""
+        sub, backlog = await self.subscribe(tenant_id, event_types, last_event_id=last_event_id)
+        try:
+            dropped = sub.take_dropped()
+            if dropped:
+                yield dropped
+            for signal in backlog:
+                yield signal
+            while True:
+                signal = await sub.next()
+                dropped = sub.take_dropped()
+                if dropped:
+                    yield dropped
+                yield signal
+        finally:
+            await self.unsubscribe(sub)
+
+    def wake(self) -> None:
+        if self._wake is not None:
+            self._wake.set()
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._tail())
+
+    async def _tail(self) -> None:
+        assert self._wake is not None
+        _register_hub(self)
+        try:
+            while True:
+                try:
+                    read = await self._dispatch_new()
+                except Exception as e:
+                    logger.warning("Signal fan-out read failed: %s", e)
+                    read = 0
+                if read >= self._batch_size:
+                    continue  # More rows waiting.
+                try:
+                    await asyncio.wait_for(self._wake.wait(), self._poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._wake.clear()
+        finally:
+            _unregister_hub(self)
+
+    async def _dispatch_new(self) -> int:
+        assert self._watermark is not None
+        rows = await self._source.rows_after(self._watermark, self._batch_size)
+        for row in rows:
+            tenant_id, event_type = row[7] or "default", row[1]
+            signal: Signal | None = None
+            for sub in self._subscribers:
+                if sub.matches(tenant_id, event_type):
+                    if signal is None:
+                        signal = signal_from_row(tuple(row[:7]))
+                    sub.offer(signal)
+            self._watermark = row[0]
+        if rows:
+            metrics.inc("cortex_signal_fanout_rows_total", value=len(rows))
+        return len(rows)
+
+
+_hubs: weakref.WeakKeyDictionary[Any, SignalFanoutHub] = weakref.WeakKeyDictionary()
+
+
+def get_signal_hub(owner: Any) -> SignalFanoutHub:
+    """The hub for ``owner`` (an engine or connection pool), created on first use.
+
+    Reads go through the owner's ``session()`` (engines) or ``acquire()`` (pools).
+    """
+    hub = _hubs.get(owner)
+    if hub is None:
+        factory = getattr(owner, "session", None) or owner.acquire
+        hub = _hubs[owner] = SignalFanoutHub(_SessionSource(factory))
+    return hub
+
+
+# ─── Wake-ups from in-process emitters ──────────────────────────────
+
+_running_lock = threading.Lock()
+_running: dict[int, tuple[asyncio.AbstractEventLoop, SignalFanoutHub]] = {}
+
+
+def _register_hub(hub: SignalFanoutHub) -> None:
+    with _running_lock:
+        _running[id(hub)] = (asyncio.get_running_loop(), hub)
+
+
+def _unregister_hub(hub: SignalFanoutHub) -> None:
+    with _running_lock:
+        _running.pop(id(hub), None)
+
+
+def notify_signal() -> None:
+    """Wake running hubs after a signal is committed. Safe from any thread."""
+    with _running_lock:
+        hubs = list(_running.values())
+    if not hubs:
+        return
+    try:
+        current = asyncio.get_running_loop()
+    except RuntimeError:
+        current = None
+    for loop, hub in hubs:
+        if loop is current:
+            hub.wake()
+        elif not loop.is_closed():
+            try:
+                loop.call_soon_threadsafe(hub.wake)
+            except RuntimeError:
+                continue
@@ -176,9 +176,11 @@ class ShardedAsyncSignalBus:
             source=source,
             project=project,
             tenant_id=tenant_id,
-            unconsumed_by=consumer,
             limit=limit,
         )
+        # Shards still track consumers in the consumed_by arrays, not signal_offsets.
+        query = query.replace(" ORDER BY", " AND consumed_by NOT LIKE ? ORDER BY", 1)
+        params.insert(-1, f'%"{consumer}"%')
 
         shard_indices = (
             [self._get_shard_index(routing_key)] if routing_key else range(self.num_shards)
@@ -268,7 +268,9 @@ def _semantic_arm(  # nosec B608 - parameterized query
         "   " + type_clause + "   AND f.deprecated_at IS NULL"
         " ORDER BY ve.distance"
     )
-    params: list = [json.dumps(embedding), top_k * 2, *type_params]
+    from babylon60.embeddings.vec_blob import to_float32_blob
+
+    params: list = [to_float32_blob(embedding), top_k * 2, *type_params]
 
     try:
         cursor = conn.execute(sql, params)
@@ -60,24 +60,7 @@ class FactManager:
         """Sovereign Store: Delegates to engine with pre-validation."""
         tenant_id = self.engine._resolve_tenant(tenant_id)
         if conn:
-            return await self._store_delegate(
-                conn,
-                project,
-                content,
-                tenant_id,
-                fact_type,
-                tags,
-                confidence,
-                source,
-                meta,
-                valid_from,
-                commit,
-                tx_id,
-                **kwargs,
-            )
-
-        async with self.engine.session() as conn:
-            return await self._store_delegate(
+            fact_id = await self._store_delegate(
                 conn,
                 project,
                 content,
@@ -92,6 +75,27 @@ class FactManager:
                 tx_id,
                 **kwargs,
             )
+        else:
+            async with self.engine.session() as conn:
+                fact_id = await self._store_delegate(
+                    conn,
+                    project,
+                    content,
+                    tenant_id,
+                    fact_type,
+                    tags,
+                    confidence,
+                    source,
+                    meta,
+                    valid_from,
+                    commit,
+                    tx_id,
+                    **kwargs,
+                )
+        if commit:
+            # Embedding and post-hooks run after commit, off the write lock.
+            await self.engine._dispatch_post_store()
+        return fact_id
 
     async def _store_delegate(
         self,
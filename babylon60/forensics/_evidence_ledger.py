@@ -5,7 +5,7 @@ import sqlite3
 from collections.abc import Mapping
 from typing import Any
 
-from babylon60.ledger.ledger_core import MerkleTree
+from babylon60.ledger.merkle import MERKLE_HASH_V1, merkle_root
 from babylon60.utils.canonical import compute_tx_hash, compute_tx_hash_v1
 
 # Action constant used by ledger
@@ -119,9 +119,11 @@ def _verify_tenant_chain(conn: sqlite3.Connection, tenant_id: str) -> list[dict[
 def _verify_merkle_roots(conn: sqlite3.Connection) -> list[dict[str, Any]]:
     violations = []
     try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(merkle_roots)").fetchall()}
+        version_col = "hash_version" if "hash_version" in columns else str(MERKLE_HASH_V1)
         roots = conn.execute(
             "SELECT COALESCE(tenant_id, '__global__') AS tenant_id, root_hash, "
-            "tx_start_id, tx_end_id FROM merkle_roots ORDER BY id"
+            f"tx_start_id, tx_end_id, {version_col} AS hash_version FROM merkle_roots ORDER BY id"
         ).fetchall()
     except sqlite3.OperationalError:
         return violations
@@ -143,7 +145,10 @@ def _verify_merkle_roots(conn: sqlite3.Connection) -> list[dict[str, Any]]:
         if not hashes and root["root_hash"] == "GENESIS":
             computed_root = "GENESIS"
         else:
-            computed_root = MerkleTree(hashes).root_hash
+            try:
+                computed_root = merkle_root(hashes, root["hash_version"])
+            except ValueError:
+                computed_root = None
         if computed_root != root["root_hash"]:
             violations.append(
                 {
@@ -0,0 +1,688 @@
+# [C5-REAL] Exergy-Maximized
+"""
+In-memory CSR adjacency snapshots for the SQLite graph backend.
+
+``find_path`` and ``find_context_subgraph`` used to issue one SQL query per
+BFS frontier node. This module keeps a per-(database, tenant) compressed
+sparse row view of ``entities``/``entity_relations`` so traversals run
+entirely in memory:
+
+- Built lazily on first read, with two scans of the tenant's rows.
+- Kept current by the backend write paths (entity/relation upserts and
+  ``delete_fact_elements``); new edges land in a small overlay that is
+  folded back into the CSR arrays once it grows past ``CSR_MAX_DELTAS``.
+- Validated on every read against the tenant's ``MAX(id)`` watermarks, so
+  writes made outside the backend (other processes, rolled back
+  transactions) force a rebuild; ``CSR_TTL_SECONDS`` bounds staleness for
+  the changes that watermarks cannot see (external deletes/weight updates).
+- Tenants above ``CSR_MAX_EDGES`` are never cached; callers fall back to SQL.
+
+Hit rate and rebuild time are reported through ``babylon60.telemetry.metrics``.
+"""
+
+from __future__ import annotations
+
+import inspect
+import logging
+import os
+import time
+import weakref
+from array import array
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from typing import Any
+
+import aiosqlite
+
+from babylon60.telemetry.metrics import metrics
+
+__all__ = [
+    "CSR_MAX_DELTAS",
+    "CSR_MAX_EDGES",
+    "CSR_TTL_SECONDS",
+    "ADJACENCY_CACHE",
+    "AdjacencyCache",
+    "AdjacencySnapshot",
+    "load_snapshot",
+    "note_entity",
+    "note_entity_sync",
+    "note_fact_deleted",
+    "note_relation",
+    "note_relation_sync",
+]
+
+logger = logging.getLogger("babylon60.graph.backends")
+
+CSR_MAX_EDGES = int(os.environ.get("CORTEX_GRAPH_CSR_MAX_EDGES", "250000"))
+CSR_MAX_TOTAL_EDGES = 4 * CSR_MAX_EDGES  # Budget across all cached tenants (LRU)
+CSR_MAX_DELTAS = 4096  # Overlay edges before the CSR arrays are recompacted
+CSR_TTL_SECONDS = 300.0
+
+_Q_WATERMARK = (
+    "SELECT (SELECT file FROM pragma_database_list WHERE name = 'main'), "
+    "(SELECT MAX(id) FROM entities WHERE tenant_id = ?), "
+    "(SELECT MAX(id) FROM entity_relations WHERE tenant_id = ?), "
+    "(SELECT COUNT(*) FROM entity_relations WHERE tenant_id = ?)"
+)
+_Q_DB_FILE = "SELECT file FROM pragma_database_list WHERE name = 'main'"
+_Q_ENTITIES = "SELECT id, name, entity_type FROM entities WHERE tenant_id = ? ORDER BY id"
+_Q_RELATIONS = (
+    "SELECT id, source_entity_id, target_entity_id, relation_type, weight, source_fact_id "
+    "FROM entity_relations WHERE tenant_id = ? ORDER BY id"
+)
+_FOREIGN_CHUNK = 500
+
+
+class AdjacencySnapshot:
+    """CSR adjacency of one tenant's entity graph.
+
+    Nodes and edges are addressed by dense indices. Edges are stored once and
+    referenced from both endpoints, so traversal is direction-agnostic like
+    the SQL queries it replaces; direction is kept in ``edge_src``/``edge_dst``.
+    """
+
+    __slots__ = (
+        "built_at",
+        "deltas",
+        "edge_alive",
+        "edge_dst",
+        "edge_fact",
+        "edge_ids",
+        "edge_index",
+        "edge_src",
+        "edge_type",
+        "edge_weight",
+        "entity_hw",
+        "facts",
+        "name_index",
+        "neighbors",
+        "node_ids",
+        "node_index",
+        "node_names",
+        "node_types",
+        "offsets",
+        "overlay",
+        "relation_hw",
+        "slots",
+    )
+
+    def __init__(self) -> None:
+        self.built_at = time.monotonic()
+        self.node_ids: list[int] = []
+        self.node_names: list[str] = []
+        self.node_types: list[str] = []
+        self.node_index: dict[int, int] = {}
+        self.name_index: dict[str, list[int]] = {}
+        self.edge_ids: list[int] = []
+        self.edge_src: list[int] = []
+        self.edge_dst: list[int] = []
+        self.edge_type: list[str] = []
+        self.edge_weight: list[float] = []
+        self.edge_fact: list[int | None] = []
+        self.edge_alive = bytearray()
+        self.edge_index: dict[int, int] = {}
+        self.facts: dict[int, list[int]] = {}
+        self.offsets = array("q", [0])
+        self.neighbors = array("q")
+        self.slots = array("q")
+        self.overlay: dict[int, list[tuple[int, int]]] = {}
+        self.deltas = 0
+        self.entity_hw = 0
+        self.relation_hw = 0
+
+    # ─── Construction ─────────────────────────────────────────────
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.edge_ids)
+
+    def add_node(self, entity_id: int, name: str, entity_type: str, *, local: bool = True) -> int:
+        """Register an entity; ``local=False`` for endpoints owned by another tenant."""
+        idx = self.node_index.get(entity_id)
+        if idx is not None:
+            return idx
+        idx = len(self.node_ids)
+        self.node_ids.append(entity_id)
+        self.node_names.append(name)
+        self.node_types.append(entity_type)
+        self.node_index[entity_id] = idx
+        if local:
+            self.name_index.setdefault(name, []).append(idx)
+            self.entity_hw = max(self.entity_hw, entity_id)
+        return idx
+
+    def add_edge(
+        self,
+        rel_id: int,
+        source_id: int,
+        target_id: int,
+        relation_type: str,
+        weight: float,
+        fact_id: int | None,
+        *,
+        overlay: bool = True,
+    ) -> bool:
+        """Append an edge. Returns ``False`` if an endpoint is unknown."""
+        s = self.node_index.get(source_id)
+        t = self.node_index.get(target_id)
+        if s is None or t is None:
+            return False
+        slot = len(self.edge_ids)
+        self.edge_ids.append(rel_id)
+        self.edge_src.append(s)
+        self.edge_dst.append(t)
+        self.edge_type.append(relation_type)
+        self.edge_weight.append(weight)
+        self.edge_fact.append(fact_id)
+        self.edge_alive.append(1)
+        self.edge_index[rel_id] = slot
+        if fact_id is not None:
+            self.facts.setdefault(fact_id, []).append(slot)
+        self.relation_hw = max(self.relation_hw, rel_id)
+        if overlay:
+            self.overlay.setdefault(s, []).append((t, slot))
+            if t != s:
+                self.overlay.setdefault(t, []).append((s, slot))
+            self.deltas += 1
+            if self.deltas > CSR_MAX_DELTAS:
+                self.compact()
+        return True
+
+    def compact(self) -> None:
+        """Rebuild the CSR arrays from the edge lists, dropping dead edges."""
+        n = len(self.node_ids)
+        degree = [0] * (n + 1)
+        alive = self.edge_alive
+        for slot, (s, t) in enumerate(zip(self.edge_src, self.edge_dst, strict=True)):
+            if alive[slot]:
+                degree[s + 1] += 1
+                if t != s:
+                    degree[t + 1] += 1
+        for i in range(n):
+            degree[i + 1] += degree[i]
+        offsets = array("q", degree)
+        cursor = list(degree[:n])
+        neighbors = array("q", bytes(8 * degree[n]))
+        slots = array("q", bytes(8 * degree[n]))
+        # Edge slots are in id order, so each node's neighbors stay id-ordered.
+        for slot, (s, t) in enumerate(zip(self.edge_src, self.edge_dst, strict=True)):
+            if not alive[slot]:
+                continue
+            neighbors[cursor[s]] = t
+            slots[cursor[s]] = slot
+            cursor[s] += 1
+            if t != s:
+                neighbors[cursor[t]] = s
+                slots[cursor[t]] = slot
+                cursor[t] += 1
+        self.offsets, self.neighbors, self.slots = offsets, neighbors, slots
+        self.overlay = {}
+        self.deltas = 0
+
+    # ─── Incremental maintenance ──────────────────────────────────
+
+    def bump_edge(self, rel_id: int, relation_type: str, increment: float) -> bool:
+        """Mirror the upsert path's ``weight + increment`` on an existing edge."""
+        slot = self.edge_index.get(rel_id)
+        if slot is None:
+            return False
+        self.edge_weight[slot] += increment
+        self.edge_type[slot] = relation_type
+        return True
+
+    def drop_fact(self, fact_id: int) -> int:
+        """Mark every edge sourced from ``fact_id`` as deleted."""
+        dropped = self.facts.pop(fact_id, [])
+        for slot in dropped:
+            self.edge_alive[slot] = 0
+            self.edge_index.pop(self.edge_ids[slot], None)
+        if dropped and self.edge_ids[dropped[-1]] >= self.relation_hw:
+            self.relation_hw = max(
+                (rid for rid, ok in zip(self.edge_ids, self.edge_alive, strict=True) if ok),
+                default=0,
+            )
+        return len(dropped)
+
+    @property
+    def live_edges(self) -> int:
+        return len(self.edge_index)
+
+    # ─── Traversal ────────────────────────────────────────────────
+
+    def adjacent(self, node: int) -> Iterator[tuple[int, int]]:
+        """Yield ``(neighbor, edge_slot)`` pairs for ``node``, in edge-id order."""
+        alive = self.edge_alive
+        if node + 1 < len(self.offsets):
+            for pos in range(self.offsets[node], self.offsets[node + 1]):
+                slot = self.slots[pos]
+                if alive[slot]:
+                    yield self.neighbors[pos], slot
+        for nbr, slot in self.overlay.get(node, ()):
+            if alive[slot]:
+                yield nbr, slot
+
+    def resolve(self, name: str) -> int | None:
+        """Node index for ``name`` (highest id wins, like a rowid-ordered scan)."""
+        hits = self.name_index.get(name)
+        return hits[-1] if hits else None
+
+    def bfs_path(self, start: int, end: int, max_depth: int) -> list[int] | None:
+        """Edge slots of the first BFS path, with the SQL implementation's semantics."""
+        queue: deque[tuple[int, list[int]]] = deque([(start, [])])
+        visited = {start}
+        while queue:
+            node, path = queue.popleft()
+            if len(path) >= max_depth:
+                continue
+            for nbr, slot in self.adjacent(node):
+                if nbr == end:
+                    return path + [slot]
+                if nbr not in visited:
+                    visited.add(nbr)
+                    queue.append((nbr, path + [slot]))
+        return None
+
+    def bidirectional_path(self, start: int, end: int, max_depth: int) -> list[int] | None:
+        """Edge slots of a shortest ``start``→``end`` path of at most ``max_depth`` hops.
+
+        Expands the smaller frontier one full layer at a time; among the
+        meetings found in a layer the shortest total length wins.
+        """
+        if start == end:
+            return self.bfs_path(start, end, max_depth)
+        parents: tuple[dict[int, tuple[int, int] | None], ...] = ({start: None}, {end: None})
+        depth = [{start: 0}, {end: 0}]
+        frontiers = [[start], [end]]
+        hops = 0
+        while frontiers[0] and frontiers[1] and hops < max_depth:
+            side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+            mine, other = parents[side], parents[1 - side]
+            best: tuple[int, int] | None = None
+            nxt: list[int] = []
+            for node in frontiers[side]:
+                for nbr, slot in self.adjacent(node):
+                    if nbr in mine:
+                        continue
+                    mine[nbr] = (node, slot)
+                    depth[side][nbr] = depth[side][node] + 1
+                    nxt.append(nbr)
+                    if nbr in other:
+                        total = depth[side][nbr] + depth[1 - side][nbr]
+                        if best is None or total < best[0]:
+                            best = (total, nbr)
+            frontiers[side] = nxt
+            hops += 1
+            if best is not None:
+                return self._join(parents, best[1]) if best[0] <= max_depth else None
+        return None
+
+    @staticmethod
+    def _join(parents: tuple[dict[int, tuple[int, int] | None], ...], meet: int) -> list[int]:
+        forward: list[int] = []
+        node = meet
+        while (link := parents[0][node]) is not None:
+            node, slot = link
+            forward.append(slot)
+        forward.reverse()
+        node = meet
+        while (link := parents[1][node]) is not None:
+            node, slot = link
+            forward.append(slot)
+        return forward
+
+    def path_steps(self, start: int, slots: list[int], source_name: str) -> list[dict]:
+        """Format edge slots as ``find_path`` step dicts."""
+        steps = []
+        node = start
+        for slot in slots:
+            s, t = self.edge_src[slot], self.edge_dst[slot]
+            nxt = t if s == node else s
+            steps.append(
+                {
+                    "source": source_name if node == start else "intermediate",
+                    "target": self.node_names[nxt],
+                    "type": self.edge_type[slot],
+                    "weight": self.edge_weight[slot],
+                }
+            )
+            node = nxt
+        return steps
+
+    def k_hop(self, seeds: list[str], depth: int, max_nodes: int) -> dict:
+        """Subgraph around ``seeds``, mirroring ``find_context_subgraph`` layer semantics."""
+        nodes: dict[str, dict] = {}
+        visited: set[int] = set()
+        layer: list[int] = []
+        wanted = set(seeds)
+        for name in wanted:
+            for idx in self.name_index.get(name, ()):
+                layer.append(idx)
+        layer.sort(key=self.node_ids.__getitem__)
+        for idx in layer:
+            nodes[self.node_names[idx]] = {"id": self.node_ids[idx], "type": self.node_types[idx]}
+            visited.add(idx)
+
+        edges: list[dict] = []
+        seen_edges: set[tuple] = set()
+        for _ in range(depth):
+            if not layer or len(nodes) >= max_nodes:
+                break
+            slots = sorted({slot for node in layer for _, slot in self.adjacent(node)})
+            nxt: list[int] = []
+            for slot in slots:
+                s, t = self.edge_src[slot], self.edge_dst[slot]
+                for idx in (s, t):
+                    name = self.node_names[idx]
+                    if name in nodes:
+                        continue
+                    nodes[name] = {"id": self.node_ids[idx], "type": self.node_types[idx]}
+                    if idx not in visited:
+                        visited.add(idx)
+                        nxt.append(idx)
+                key = (
+                    self.node_names[s],
+                    self.node_names[t],
+                    self.edge_type[slot],
+                    self.edge_weight[slot],
+                )
+                if key not in seen_edges:
+                    seen_edges.add(key)
+                    edges.append(
+                        dict(zip(("source", "target", "type", "weight"), key, strict=True))
+                    )
+            layer = nxt
+            if len(nodes) >= max_nodes:
+                break
+        return {"nodes": [{"name": k, **v} for k, v in nodes.items()], "edges": edges}
+
+
+class AdjacencyCache:
+    """Process-wide LRU of :class:`AdjacencySnapshot` keyed by (database, tenant)."""
+
+    def __init__(
+        self, max_edges: int = CSR_MAX_EDGES, max_total_edges: int = CSR_MAX_TOTAL_EDGES
+    ) -> None:
+        self.max_edges = max_edges
+        self.max_total_edges = max_total_edges
+        self._snapshots: OrderedDict[tuple[Any, str], AdjacencySnapshot] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.rebuilds = 0
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def peek(self, key: tuple[Any, str]) -> AdjacencySnapshot | None:
+        return self._snapshots.get(key)
+
+    def tenants(self, db_key: Any) -> list[AdjacencySnapshot]:
+        return [snap for (db, _), snap in self._snapshots.items() if db == db_key]
+
+    def put(self, key: tuple[Any, str], snap: AdjacencySnapshot) -> None:
+        self._snapshots[key] = snap
+        self._snapshots.move_to_end(key)
+        total = sum(s.edge_count for s in self._snapshots.values())
+        while total > self.max_total_edges and len(self._snapshots) > 1:
+            _, evicted = self._snapshots.popitem(last=False)
+            total -= evicted.edge_count
+        metrics.set_gauge("cortex_graph_adjacency_edges", float(total))
+
+    def invalidate(self, key: tuple[Any, str] | None = None) -> None:
+        if key is None:
+            self._snapshots.clear()
+        else:
+            self._snapshots.pop(key, None)
+
+    def reset(self) -> None:
+        """Drop every snapshot and zero the counters."""
+        self._snapshots.clear()
+        self.hits = self.misses = self.bypasses = self.rebuilds = 0
+
+    def record(self, outcome: str) -> None:
+        if outcome == "hit":
+            self.hits += 1
+        elif outcome == "miss":
+            self.misses += 1
+        else:
+            self.bypasses += 1
+        metrics.inc("cortex_graph_adjacency_requests_total", {"result": outcome})
+
+    def stats(self) -> dict[str, Any]:
+        lookups = self.hits + self.misses + self.bypasses
+        return {
+            "snapshots": len(self._snapshots),
+            "edges": sum(s.edge_count for s in self._snapshots.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "rebuilds": self.rebuilds,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+ADJACENCY_CACHE = AdjacencyCache()
+
+_db_keys: weakref.WeakKeyDictionary[Any, Any] = weakref.WeakKeyDictionary()
+
+
+def _db_key(conn: Any, file: str | None) -> Any:
+    # Private in-memory databases are only reachable through their connection.
+    return file if file else ("memory", id(conn))
+
+
+async def _fetch(conn: Any, query: str, params: tuple | list) -> list:
+    if isinstance(conn, aiosqlite.Connection):
+        async with conn.execute(query, params) as cursor:
+            return list(await cursor.fetchall())
+    cursor = conn.execute(query, params)
+    if inspect.isawaitable(cursor):
+        cursor = await cursor
+        return list(await cursor.fetchall())
+    return cursor.fetchall()
+
+
+async def _build(conn: Any, tenant_id: str, entity_hw: int, relation_hw: int) -> AdjacencySnapshot:
+    start = time.perf_counter()
+    snap = AdjacencySnapshot()
+    for eid, name, etype in await _fetch(conn, _Q_ENTITIES, (tenant_id,)):
+        snap.add_node(eid, name, etype)
+    relations = await _fetch(conn, _Q_RELATIONS, (tenant_id,))
+
+    # Relations may point at entities owned by another tenant; the SQL
+    # traversal joins them without a tenant filter, so load them too.
+    foreign = sorted(
+        {eid for row in relations for eid in (row[1], row[2]) if eid not in snap.node_index}
+    )
+    for i in range(0, len(foreign), _FOREIGN_CHUNK):
+        chunk = foreign[i : i + _FOREIGN_CHUNK]
+        phs = ",".join("?" * len(chunk))
+        q = f"SELECT id, name, entity_type FROM entities WHERE id IN ({phs})"
+        for eid, name, etype in await _fetch(conn, q, chunk):
+            snap.add_node(eid, name, etype, local=False)
+
+    for rel_id, sid, tid, rtype, weight, fact_id in relations:
+        snap.add_edge(rel_id, sid, tid, rtype, weight, fact_id, overlay=False)
+    snap.compact()
+    snap.entity_hw, snap.relation_hw = entity_hw, relation_hw
+
+    elapsed = time.perf_counter() - start
+    ADJACENCY_CACHE.rebuilds += 1
+    metrics.observe("cortex_graph_adjacency_rebuild_seconds", elapsed)
+    logger.debug(
+        "CSR adjacency rebuilt for tenant=%s: %d nodes, %d edges in %.3fs",
+        tenant_id,
+        len(snap.node_ids),
+        snap.edge_count,
+        elapsed,
+    )
+    return snap
+
+
+async def load_snapshot(conn: Any, tenant_id: str) -> AdjacencySnapshot | None:
+    """Current snapshot for ``tenant_id``, building it if needed.
+
+    Returns ``None`` when the tenant exceeds the size cap; callers then use
+    the SQL traversal.
+    """
+    rows = await _fetch(conn, _Q_WATERMARK, (tenant_id, tenant_id, tenant_id))
+    file, entity_hw, relation_hw, relation_count = rows[0]
+    db_key = _db_key(conn, file)
+    if isinstance(conn, aiosqlite.Connection):
+        _db_keys[conn] = db_key
+    key = (db_key, tenant_id)
+
+    if relation_count > ADJACENCY_CACHE.max_edges:
+        ADJACENCY_CACHE.invalidate(key)
+        ADJACENCY_CACHE.record("bypass")
+        return None
+
+    snap = ADJACENCY_CACHE.peek(key)
+    if (
+        snap is not None
+        and snap.entity_hw == (entity_hw or 0)
+        and snap.relation_hw == (relation_hw or 0)
+        and snap.live_edges == relation_count
+        and time.monotonic() - snap.built_at < CSR_TTL_SECONDS
+    ):
+        ADJACENCY_CACHE.record("hit")
+        ADJACENCY_CACHE.put(key, snap)
+        return snap
+
+    ADJACENCY_CACHE.record("miss")
+    snap = await _build(conn, tenant_id, entity_hw or 0, relation_hw or 0)
+    ADJACENCY_CACHE.put(key, snap)
+    return snap
+
+
+# ─── Write-path hooks ─────────────────────────────────────────────────
+#
+# Hooks run after the corresponding SQL statement and never raise: if the
+# database cannot be identified the whole cache is dropped instead.
+
+
+def _resolve_sync(conn: Any) -> Any:
+    try:
+        return _db_key(conn, conn.execute(_Q_DB_FILE).fetchone()[0])
+    except Exception as e:  # noqa: BLE001 - cache upkeep must not fail writes
+        logger.debug("CSR adjacency: cannot resolve database (%s); dropping cache", e)
+        ADJACENCY_CACHE.invalidate()
+        return None
+
+
+async def _resolve(conn: Any) -> Any:
+    try:
+        key = _db_keys.get(conn)
+    except TypeError:  # not weak-referenceable (sqlite3.Connection)
+        key = None
+    if key is not None:
+        return key
+    try:
+        rows = await _fetch(conn, _Q_DB_FILE, ())
+        key = _db_key(conn, rows[0][0])
+    except Exception as e:  # noqa: BLE001 - cache upkeep must not fail writes
+        logger.debug("CSR adjacency: cannot resolve database (%s); dropping cache", e)
+        ADJACENCY_CACHE.invalidate()
+        return None
+    if isinstance(conn, aiosqlite.Connection):
+        _db_keys[conn] = key
+    return key
+
+
+def _apply_entity(db_key: Any, tenant_id: str, entity_id: int, name: str, etype: str) -> None:
+    key = (db_key, tenant_id)
+    snap = ADJACENCY_CACHE.peek(key)
+    if snap is None:
+        return
+    if entity_id <= snap.entity_hw:
+        # Ids only grow; anything else means a write we did not observe.
+        ADJACENCY_CACHE.invalidate(key)
+        return
+    snap.add_node(entity_id, name, etype)
+
+
+def _apply_relation(
+    db_key: Any,
+    tenant_id: str,
+    rel_id: int,
+    source_id: int,
+    target_id: int,
+    relation_type: str,
+    fact_id: int | None,
+    inserted: bool,
+) -> None:
+    key = (db_key, tenant_id)
+    snap = ADJACENCY_CACHE.peek(key)
+    if snap is None:
+        return
+    if inserted:
+        ok = rel_id > snap.relation_hw and snap.add_edge(
+            rel_id, source_id, target_id, relation_type, 1.0, fact_id
+        )
+    else:
+        ok = snap.bump_edge(rel_id, relation_type, 0.5)
+    if not ok:
+        ADJACENCY_CACHE.invalidate(key)
+
+
+async def note_entity(
+    conn: Any, tenant_id: str, entity_id: int, name: str, entity_type: str
+) -> None:
+    """Record a freshly inserted entity in the cached snapshot, if any."""
+    if len(ADJACENCY_CACHE):
+        _apply_entity(await _resolve(conn), tenant_id, entity_id, name, entity_type)
+
+
+def note_entity_sync(
+    conn: Any, tenant_id: str, entity_id: int, name: str, entity_type: str
+) -> None:
+    """Synchronous :func:`note_entity` for ``sqlite3`` connections."""
+    if len(ADJACENCY_CACHE):
+        _apply_entity(_resolve_sync(conn), tenant_id, entity_id, name, entity_type)
+
+
+async def note_relation(
+    conn: Any,
+    tenant_id: str,
+    rel_id: int,
+    source_id: int,
+    target_id: int,
+    relation_type: str,
+    fact_id: int | None,
+    *,
+    inserted: bool,
+) -> None:
+    """Record an inserted relation, or the ``+0.5`` weight bump of an existing one."""
+    if len(ADJACENCY_CACHE):
+        db_key = await _resolve(conn)
+        _apply_relation(
+            db_key, tenant_id, rel_id, source_id, target_id, relation_type, fact_id, inserted
+        )
+
+
+def note_relation_sync(
+    conn: Any,
+    tenant_id: str,
+    rel_id: int,
+    source_id: int,
+    target_id: int,
+    relation_type: str,
+    fact_id: int | None,
+    *,
+    inserted: bool,
+) -> None:
+    """Synchronous :func:`note_relation` for ``sqlite3`` connections."""
+    if len(ADJACENCY_CACHE):
+        db_key = _resolve_sync(conn)
+        _apply_relation(
+            db_key, tenant_id, rel_id, source_id, target_id, relation_type, fact_id, inserted
+        )
+
+
+async def note_fact_deleted(conn: Any, tenant_id: str, fact_id: int) -> None:
+    """Drop the edges sourced from ``fact_id`` from the cached snapshot, if any."""
+    if not len(ADJACENCY_CACHE):
+        return
+    snap = ADJACENCY_CACHE.peek((await _resolve(conn), tenant_id))
+    if snap is not None:
+        snap.drop_fact(fact_id)
@@ -2,6 +2,8 @@
 
 from collections import deque
 
+from babylon60.graph.backends.sqlite.adjacency import load_snapshot
+
 __all__ = ["SQLiteAlgorithmsMixin"]
 
 
@@ -11,7 +13,19 @@ class SQLiteAlgorithmsMixin:
     async def find_path(
         self, source: str, target: str, max_depth: int = 3, tenant_id: str = "default"
     ) -> list:
-        """Find paths between entities using BFS."""
+        """Find paths between entities using BFS.
+
+        Runs a bidirectional BFS over the tenant's cached CSR adjacency; falls
+        back to per-node SQL expansion when the tenant exceeds the cache cap.
+        """
+        snap = await load_snapshot(self.conn, tenant_id)  # type: ignore[attr-defined]
+        if snap is not None:
+            start, end = snap.resolve(source), snap.resolve(target)
+            if start is None or end is None:
+                return []
+            slots = snap.bidirectional_path(start, end, max_depth)
+            return snap.path_steps(start, slots, source) if slots is not None else []
+
         q_ids = "SELECT id, name FROM entities WHERE name IN (?, ?) AND tenant_id = ?"
         id_rows = await self._fetch_rows(q_ids, [source, target, tenant_id])
         id_map = {row[1]: row[0] for row in id_rows}
@@ -61,6 +75,10 @@ class SQLiteAlgorithmsMixin:
         """Retrieve a subgraph around seed entities."""
         if not seed_entities:
             return {"nodes": [], "edges": []}
+        snap = await load_snapshot(self.conn, tenant_id)  # type: ignore[attr-defined]
+        if snap is not None:
+            return snap.k_hop(seed_entities, depth, max_nodes)
+
         nodes: dict[str, dict] = {}
         edges: list[dict] = []
         visited_ids: set[int] = set()
@@ -2,6 +2,8 @@
 
 import aiosqlite
 
+from babylon60.graph.backends.sqlite import adjacency
+
 __all__ = ["SQLiteStoreMixin"]
 
 
@@ -47,10 +49,11 @@ class SQLiteStoreMixin:
         params_insert = (name, entity_type, project, tenant_id, timestamp, timestamp)
         if self._is_async:
             async with self.conn.execute(query_insert, params_insert) as cursor:
-                return cursor.lastrowid
+                entity_id = cursor.lastrowid
         else:
-            cursor = self.conn.execute(query_insert, params_insert)
-            return cursor.lastrowid
+            entity_id = self.conn.execute(query_insert, params_insert).lastrowid
+        await adjacency.note_entity(self.conn, tenant_id, entity_id, name, entity_type)
+        return entity_id
 
     def upsert_entity_sync(
         self,
@@ -79,6 +82,7 @@ class SQLiteStoreMixin:
             "last_seen, mention_count) VALUES (?, ?, ?, ?, ?, ?, 1)",
             (name, entity_type, project, tenant_id, timestamp, timestamp),
         )
+        adjacency.note_entity_sync(self.conn, tenant_id, cursor.lastrowid, name, entity_type)
         return cursor.lastrowid
 
     async def upsert_relationship(
@@ -109,6 +113,16 @@ class SQLiteStoreMixin:
                 await self.conn.execute(query_update, (weight + 0.5, relation_type, rel_id))
             else:
                 self.conn.execute(query_update, (weight + 0.5, relation_type, rel_id))
+            await adjacency.note_relation(
+                self.conn,
+                tenant_id,
+                rel_id,
+                source_id,
+                target_id,
+                relation_type,
+                fact_id,
+                inserted=False,
+            )
             return rel_id
         query_insert = (
             "INSERT INTO entity_relations (source_entity_id, target_entity_id, "
@@ -118,10 +132,20 @@ class SQLiteStoreMixin:
         params_insert = (source_id, target_id, relation_type, timestamp, fact_id, tenant_id)
         if self._is_async:
             async with self.conn.execute(query_insert, params_insert) as cursor:
-                return cursor.lastrowid
+                rel_id = cursor.lastrowid
         else:
-            cursor = self.conn.execute(query_insert, params_insert)
-            return cursor.lastrowid
+            rel_id = self.conn.execute(query_insert, params_insert).lastrowid
+        await adjacency.note_relation(
+            self.conn,
+            tenant_id,
+            rel_id,
+            source_id,
+            target_id,
+            relation_type,
+            fact_id,
+            inserted=True,
+        )
+        return rel_id
 
     def upsert_relationship_sync(
         self,
@@ -145,6 +169,16 @@ class SQLiteStoreMixin:
                 "UPDATE entity_relations SET weight = ?, relation_type = ? WHERE id = ?",
                 (weight + 0.5, relation_type, rel_id),
             )
+            adjacency.note_relation_sync(
+                self.conn,
+                tenant_id,
+                rel_id,
+                source_id,
+                target_id,
+                relation_type,
+                fact_id,
+                inserted=False,
+            )
             return rel_id
         cursor = self.conn.execute(
             "INSERT INTO entity_relations (source_entity_id, target_entity_id, "
@@ -152,6 +186,16 @@ class SQLiteStoreMixin:
             "VALUES (?, ?, ?, 1.0, ?, ?, ?)",
             (source_id, target_id, relation_type, timestamp, fact_id, tenant_id),
         )
+        adjacency.note_relation_sync(
+            self.conn,
+            tenant_id,
+            cursor.lastrowid,
+            source_id,
+            target_id,
+            relation_type,
+            fact_id,
+            inserted=True,
+        )
         return cursor.lastrowid
 
     async def upsert_ghost(
@@ -218,6 +262,9 @@ class SQLiteStoreMixin:
         params = (fact_id, tenant_id)
         if self._is_async:
             async with self.conn.execute(q, params) as cursor:
-                return cursor.rowcount > 0
+                deleted = cursor.rowcount > 0
         else:
-            return self.conn.execute(q, params).rowcount > 0
+            deleted = self.conn.execute(q, params).rowcount > 0
+        if deleted:
+            await adjacency.note_fact_deleted(self.conn, tenant_id, fact_id)
+        return deleted
@@ -9,6 +9,7 @@ import os
 import sqlite3
 
 from babylon60.graph.backends import GraphBackend, SQLiteBackend
+from babylon60.graph.backends.sqlite import adjacency
 from babylon60.graph.patterns import COMMON_WORDS, ENTITY_PATTERNS, RELATION_SIGNALS
 
 __all__ = [
@@ -107,6 +108,7 @@ async def _upsert_entity(
         "VALUES (?, ?, ?, ?, ?, ?, 1)",
         (ent["name"], ent["entity_type"], project, tenant_id, timestamp, timestamp),
     )
+    await adjacency.note_entity(conn, tenant_id, cursor.lastrowid, ent["name"], ent["entity_type"])
     return cursor.lastrowid  # type: ignore[return-value]
 
 
@@ -132,14 +134,20 @@ async def _upsert_relation(
             "UPDATE entity_relations SET weight = ?, relation_type = ? WHERE id = ?",
             (weight + 0.5, relation_type, rel_id),
         )
+        await adjacency.note_relation(
+            conn, tenant_id, rel_id, sid, tid, relation_type, fact_id, inserted=False
+        )
     else:
-        await conn.execute(
+        cursor = await conn.execute(
             "INSERT INTO entity_relations "
             "(source_entity_id, target_entity_id, relation_type, "
             "weight, first_seen, source_fact_id, tenant_id) "
             "VALUES (?, ?, ?, 1.0, ?, ?, ?)",
             (sid, tid, relation_type, timestamp, fact_id, tenant_id),
         )
+        await adjacency.note_relation(
+            conn, tenant_id, cursor.lastrowid, sid, tid, relation_type, fact_id, inserted=True
+        )
 
 
 async def process_fact_graph(
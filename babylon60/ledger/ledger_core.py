@@ -14,8 +14,9 @@ import logging
 import sqlite3
 import time
 from collections import deque
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Iterable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
 
 import aiosqlite
@@ -33,9 +34,41 @@ from babylon60.utils.canonical import (
 logger = logging.getLogger("babylon60.ledger")
 
 
-from .merkle import MerkleTree
+from .merkle import MERKLE_HASH_V1, MERKLE_HASH_VERSION, MerkleFrontier, MerkleTree
 from .mixins.audit import LedgerAuditMixin
 
+__all__ = ["MerkleTree", "SovereignLedger"]
+
+
+@dataclass
+class _PendingCheckpoint:
+    """Transactions accumulated toward the next global checkpoint.
+
+    ``after_id`` is the ``tx_end_id`` of the checkpoint this one extends; the
+    frontier is discarded whenever that no longer matches the database.
+    """
+
+    after_id: int
+    version: int
+    frontier: MerkleFrontier = field(init=False)
+    first_id: int | None = None
+    last_id: int | None = None
+    last_hash: str | None = None
+
+    def __post_init__(self) -> None:
+        self.frontier = MerkleFrontier(version=self.version)
+
+    @property
+    def cursor(self) -> int:
+        return self.last_id if self.last_id is not None else self.after_id
+
+    def extend(self, rows: Iterable[tuple[int, str]]) -> None:
+        for tx_id, tx_hash in rows:
+            if self.first_id is None:
+                self.first_id = tx_id
+            self.frontier.append(tx_hash)
+            self.last_id, self.last_hash = tx_id, tx_hash
+
 
 class SovereignLedger(LedgerAuditMixin):
     """The Custodian of Immutable History (CORTEX Wave 5/8).
@@ -54,6 +87,7 @@ class SovereignLedger(LedgerAuditMixin):
         self.db = db
         self._write_timestamps: deque[float] = deque(maxlen=5000)
         self._config = config
+        self._pending_checkpoint: _PendingCheckpoint | None = None
 
         # Schema is created synchronously on init if possible
         if self._is_sync_connection(db):
@@ -109,6 +143,7 @@ class SovereignLedger(LedgerAuditMixin):
                     tx_end_id       INTEGER NOT NULL,
                     tx_count        INTEGER NOT NULL,
                     signature       TEXT,
+                    hash_version    INTEGER NOT NULL DEFAULT 1,
                     created_at      TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now'))
                 );
                 CREATE TABLE IF NOT EXISTS integrity_checks (
@@ -134,6 +169,9 @@ class SovereignLedger(LedgerAuditMixin):
                 "tenant_id",
                 "TEXT NOT NULL DEFAULT '__global__'",
             )
+            self._ensure_ledger_column(
+                conn, "merkle_roots", "hash_version", "INTEGER NOT NULL DEFAULT 1"
+            )
             conn.execute(
                 "CREATE INDEX IF NOT EXISTS idx_tx_tenant_id ON transactions(tenant_id, id)"
             )
@@ -332,29 +370,68 @@ class SovereignLedger(LedgerAuditMixin):
         )
         row = cursor.fetchone()
         last_covered = row[0] or 0 if row else 0
+        columns = {r[1] for r in conn.execute("PRAGMA table_info(merkle_roots)").fetchall()}
+
+        pending = self._resume_checkpoint(last_covered, columns, batch_size)
+        if pending.last_id is not None:
+            row = conn.execute(
+                "SELECT hash FROM transactions WHERE id = ?", (pending.last_id,)
+            ).fetchone()
+            if not row or row[0] != pending.last_hash:
+                pending = self._reset_checkpoint(last_covered, columns)
 
         cursor = conn.execute(
             "SELECT id, hash FROM transactions WHERE id > ? ORDER BY id LIMIT ?",
-            (last_covered, batch_size),
+            (pending.cursor, batch_size - len(pending.frontier)),
         )
-        rows = cursor.fetchall()
-
-        if not rows or len(rows) < batch_size:
+        pending.extend(cursor.fetchall())
+        if len(pending.frontier) < batch_size:
             return None
 
-        hashes = [r[1] for r in rows]
-        tree = MerkleTree(hashes)
-        root = tree.root_hash
-        start_id, end_id = rows[0][0], rows[-1][0]
+        root = pending.frontier.root_hash
+        conn.execute(*self._checkpoint_insert(pending, root, columns))
+        conn.commit()
+        self._pending_checkpoint = None
+        return root
 
-        conn.execute(
+    def _reset_checkpoint(self, last_covered: int, columns: set[str]) -> _PendingCheckpoint:
+        version = MERKLE_HASH_VERSION if "hash_version" in columns else MERKLE_HASH_V1
+        self._pending_checkpoint = _PendingCheckpoint(last_covered, version)
+        return self._pending_checkpoint
+
+    def _resume_checkpoint(
+        self, last_covered: int, columns: set[str], batch_size: int
+    ) -> _PendingCheckpoint:
+        """Reuse the in-memory frontier if it still extends the latest checkpoint."""
+        pending = self._pending_checkpoint
+        version = MERKLE_HASH_VERSION if "hash_version" in columns else MERKLE_HASH_V1
+        if (
+            pending is None
+            or pending.after_id != last_covered
+            or pending.version != version
+            or len(pending.frontier) > batch_size
+        ):
+            return self._reset_checkpoint(last_covered, columns)
+        return pending
+
+    @staticmethod
+    def _checkpoint_insert(
+        pending: _PendingCheckpoint, root: str | None, columns: set[str]
+    ) -> tuple[str, tuple]:
+        params = (root, pending.first_id, pending.last_id, len(pending.frontier))
+        if "hash_version" not in columns:
+            return (
+                "INSERT INTO merkle_roots "
+                "(tenant_id, root_hash, tx_start_id, tx_end_id, tx_count) "
+                "VALUES ('__global__', ?, ?, ?, ?)",
+                params,
+            )
+        return (
             "INSERT INTO merkle_roots "
-            "(tenant_id, root_hash, tx_start_id, tx_end_id, tx_count) "
-            "VALUES ('__global__', ?, ?, ?, ?)",
-            (root, start_id, end_id, len(rows)),
+            "(tenant_id, root_hash, tx_start_id, tx_end_id, tx_count, hash_version) "
+            "VALUES ('__global__', ?, ?, ?, ?, ?)",
+            (*params, pending.version),
         )
-        conn.commit()
-        return root
 
     async def create_checkpoint_async(self, conn: aiosqlite.Connection | None = None) -> str | None:
         """Create a Merkle checkpoint asynchronously."""
@@ -373,29 +450,31 @@ class SovereignLedger(LedgerAuditMixin):
         )
         row = await cursor.fetchone()
         last_covered = row[0] or 0 if row else 0
+        cursor = await conn.execute("PRAGMA table_info(merkle_roots)")
+        columns = {r[1] for r in await cursor.fetchall()}
+
+        pending = self._resume_checkpoint(last_covered, columns, batch_size)
+        if pending.last_id is not None:
+            cursor = await conn.execute(
+                "SELECT hash FROM transactions WHERE id = ?", (pending.last_id,)
+            )
+            row = await cursor.fetchone()
+            if not row or row[0] != pending.last_hash:
+                pending = self._reset_checkpoint(last_covered, columns)
 
         cursor = await conn.execute(
             "SELECT id, hash FROM transactions WHERE id > ? ORDER BY id LIMIT ?",
-            (last_covered, batch_size),
+            (pending.cursor, batch_size - len(pending.frontier)),
         )
-        rows = list(await cursor.fetchall())
-
-        if not rows or len(rows) < batch_size:
+        pending.extend(await cursor.fetchall())
+        if len(pending.frontier) < batch_size:
             return None
 
-        hashes = [r[1] for r in rows]
-        tree = MerkleTree(hashes)
-        root = tree.root_hash
-        start_id, end_id = rows[0][0], rows[-1][0]
-
-        await conn.execute(
-            "INSERT INTO merkle_roots "
-            "(tenant_id, root_hash, tx_start_id, tx_end_id, tx_count) "
-            "VALUES ('__global__', ?, ?, ?, ?)",
-            (root, start_id, end_id, len(rows)),
-        )
+        root = pending.frontier.root_hash
+        await conn.execute(*self._checkpoint_insert(pending, root, columns))
         if commit:
             await conn.commit()
+        self._pending_checkpoint = None
         return root
 
     @asynccontextmanager
@@ -1,10 +1,72 @@
 # [C5-REAL] Exergy-Maximized
+"""
+Merkle trees for ledger checkpoints.
+
+``MerkleTree`` stores each layer as one contiguous ``bytearray`` of fixed-width
+digests and supports appending leaves in O(log n) hashes per leaf.
+``MerkleFrontier`` keeps only the O(log n) perfect-subtree peaks, which is
+all a checkpoint needs to extend its root as transactions arrive.
+
+Two hashing modes exist; ``merkle_roots.hash_version`` records which one a
+checkpoint used:
+
+- ``MERKLE_HASH_V1``: ``H(left_hex + right_hex)`` over hex strings, leaves
+  taken verbatim, odd nodes paired with themselves (original scheme).
+- ``MERKLE_HASH_V2``: raw digests with domain separation,
+  ``H(0x00 || leaf)`` / ``H(0x01 || left || right)``, odd nodes promoted.
+"""
+
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Any
 
-from babylon60.crypto.hash_registry import cortex_hash
+from babylon60.crypto.hash_registry import cortex_hash, cortex_hash_raw
+
+__all__ = [
+    "MERKLE_HASH_V1",
+    "MERKLE_HASH_V2",
+    "MERKLE_HASH_VERSION",
+    "MerkleFrontier",
+    "MerkleNode",
+    "MerkleTree",
+    "SemanticMerkleTree",
+    "merkle_root",
+]
+
+MERKLE_HASH_V1 = 1
+MERKLE_HASH_V2 = 2
+MERKLE_HASH_VERSION = MERKLE_HASH_V2  # Used for new ledger checkpoints
+
+_LEAF = b"\x00"
+_NODE = b"\x01"
+
+
+def _check_version(version: int) -> int:
+    if version not in (MERKLE_HASH_V1, MERKLE_HASH_V2):
+        raise ValueError(f"Unknown Merkle hash version: {version}")
+    return version
+
+
+def _leaf_digest(leaf: str, version: int) -> bytes:
+    if version == MERKLE_HASH_V1:
+        return leaf.encode("utf-8")
+    return cortex_hash_raw(_LEAF + leaf.encode("utf-8"))
+
+
+def _node_digest(left: bytes, right: bytes, version: int) -> bytes:
+    if version == MERKLE_HASH_V1:
+        return cortex_hash(left + right).encode("ascii")
+    return cortex_hash_raw(_NODE + left + right)
+
+
+def _to_hex(digest: bytes, version: int) -> str:
+    return digest.decode("utf-8") if version == MERKLE_HASH_V1 else digest.hex()
+
+
+def _from_hex(value: str, version: int) -> bytes:
+    return value.encode("utf-8") if version == MERKLE_HASH_V1 else bytes.fromhex(value)
 
 
 @dataclass(frozen=True)
@@ -18,67 +80,183 @@ class MerkleNode:
 
 
 class MerkleTree:
-    """High-performance Merkle Tree for batch transaction verification."""
+    """High-performance Merkle Tree for batch transaction verification.
 
-    def __init__(self, leaves: list[str]):
-        if not leaves:
-            self.root = None
-            self._leaves = []
-            return
-
-        self._leaves = leaves
-        nodes = [MerkleNode(hash=h, is_leaf=True) for h in leaves]
-        self.layers = []
-        self.root = self._build_recursive(nodes)
-
-    def _hash_pair(self, left: str, right: str) -> str:
-        return cortex_hash((left + right).encode())
+    Layer ``k`` is a ``bytearray`` of ``len(layer) // width`` digests; only
+    the right edge of each layer is rehashed when leaves are appended.
+    """
 
-    def _build_recursive(self, nodes: list[MerkleNode]) -> MerkleNode:
-        self.layers.append(nodes)
-        if len(nodes) == 1:
-            return nodes[0]
+    def __init__(self, leaves: Iterable[str] = (), version: int = MERKLE_HASH_V1):
+        self.version = _check_version(version)
+        self._layers: list[bytearray] = []
+        self._widths: list[int] = []
+        self._count = 0
+        self.extend(leaves)
 
-        next_layer = []
-        for i in range(0, len(nodes), 2):
-            left = nodes[i]
-            right = nodes[i + 1] if i + 1 < len(nodes) else nodes[i]
-            combined_hash = self._hash_pair(left.hash, right.hash)
-            next_layer.append(MerkleNode(hash=combined_hash, left=left, right=right))
+    def __len__(self) -> int:
+        return self._count
 
-        return self._build_recursive(next_layer)
+    @property
+    def root(self) -> MerkleNode | None:
+        root_hash = self.root_hash
+        return MerkleNode(hash=root_hash, is_leaf=self._count == 1) if root_hash else None
 
     @property
     def root_hash(self) -> str | None:
-        return self.root.hash if self.root else None
+        if not self._count:
+            return None
+        return _to_hex(bytes(self._layers[-1][: self._widths[-1]]), self.version)
+
+    def _node(self, level: int, index: int) -> bytes:
+        width = self._widths[level]
+        return bytes(self._layers[level][index * width : (index + 1) * width])
+
+    def layer(self, level: int) -> list[str]:
+        """Hex digests of one layer (0 = leaves)."""
+        width = self._widths[level]
+        data = self._layers[level]
+        return [
+            _to_hex(bytes(data[i : i + width]), self.version) for i in range(0, len(data), width)
+        ]
+
+    def append(self, leaf: str) -> str:
+        """Append one leaf and return the new root."""
+        self.extend((leaf,))
+        return self.root_hash  # type: ignore[return-value]
+
+    def extend(self, leaves: Iterable[str]) -> None:
+        """Append leaves, rehashing only nodes whose subtree changed."""
+        digests = [_leaf_digest(leaf, self.version) for leaf in leaves]
+        if not digests:
+            return
+        if not self._layers:
+            self._layers.append(bytearray())
+            self._widths.append(len(digests[0]))
+        width = self._widths[0]
+        if any(len(d) != width for d in digests):
+            raise ValueError("Merkle leaves must all have the same length")
+        dirty = self._count
+        self._layers[0] += b"".join(digests)
+        self._count += len(digests)
+
+        level, size = 0, self._count
+        while size > 1:
+            parents = (size + 1) // 2
+            dirty //= 2
+            if level + 1 == len(self._layers):
+                self._layers.append(bytearray())
+                self._widths.append(len(_node_digest(b"", b"", self.version)))
+            out = self._layers[level + 1]
+            del out[dirty * self._widths[level + 1] :]
+            for j in range(dirty, parents):
+                left = self._node(level, 2 * j)
+                if 2 * j + 1 < size:
+                    out += _node_digest(left, self._node(level, 2 * j + 1), self.version)
+                elif self.version == MERKLE_HASH_V1:
+                    out += _node_digest(left, left, self.version)
+                else:
+                    out += left
+            level, size = level + 1, parents
 
     def get_proof(self, index: int) -> list[tuple[str, str]]:
-        """Optimized path discovery (O(log N)) using the pre-built Merkle Tree structure."""
-        if not self.root or not (0 <= index < len(self._leaves)):
+        """Sibling path for leaf ``index`` as ``(hash, "L"|"R")`` pairs, leaf to root."""
+        if not (0 <= index < self._count):
             return []
 
         proof = []
         idx = index
-        # We skip the last layer since it only contains the root
-        for layer in self.layers[:-1]:
-            sibling_idx = idx + 1 if idx % 2 == 0 else idx - 1
-            if sibling_idx < len(layer):
-                proof.append((layer[sibling_idx].hash, "R" if idx % 2 == 0 else "L"))
-            else:
+        for level in range(len(self._layers) - 1):
+            size = len(self._layers[level]) // self._widths[level]
+            sibling_idx = idx ^ 1
+            if sibling_idx < size:
+                sibling = _to_hex(self._node(level, sibling_idx), self.version)
+                proof.append((sibling, "R" if idx % 2 == 0 else "L"))
+            elif self.version == MERKLE_HASH_V1:
                 # Duplication case
-                proof.append((layer[idx].hash, "R"))
+                proof.append((_to_hex(self._node(level, idx), self.version), "R"))
             idx //= 2
         return proof
 
+    def get_proofs(self, start: int, stop: int) -> list[list[tuple[str, str]]]:
+        """Proofs for leaves ``start..stop-1`` (batched export for a tx range)."""
+        return [self.get_proof(i) for i in range(max(start, 0), min(stop, self._count))]
+
     @staticmethod
-    def verify_proof(leaf_hash: str, proof: list[tuple[str, str]], root_hash: str) -> bool:
-        current = leaf_hash
+    def verify_proof(
+        leaf_hash: str,
+        proof: list[tuple[str, str]],
+        root_hash: str,
+        version: int = MERKLE_HASH_V1,
+    ) -> bool:
+        current = _leaf_digest(leaf_hash, _check_version(version))
         for sibling_hash, direction in proof:
+            sibling = _from_hex(sibling_hash, version)
             if direction == "L":
-                current = cortex_hash((sibling_hash + current).encode())
+                current = _node_digest(sibling, current, version)
             else:
-                current = cortex_hash((current + sibling_hash).encode())
-        return current == root_hash
+                current = _node_digest(current, sibling, version)
+        return _to_hex(current, version) == root_hash
+
+
+class MerkleFrontier:
+    """Append-only Merkle accumulator holding one pending peak per level.
+
+    Produces the same root as ``MerkleTree`` over the same leaves and
+    version, in O(log n) memory.
+    """
+
+    __slots__ = ("_peaks", "count", "version")
+
+    def __init__(self, leaves: Iterable[str] = (), version: int = MERKLE_HASH_V1):
+        self.version = _check_version(version)
+        self._peaks: list[bytes | None] = []
+        self.count = 0
+        self.extend(leaves)
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, leaf: str) -> None:
+        node = _leaf_digest(leaf, self.version)
+        level, idx = 0, self.count
+        while idx & 1:
+            node = _node_digest(self._peaks[level], node, self.version)  # type: ignore[arg-type]
+            self._peaks[level] = None
+            level, idx = level + 1, idx >> 1
+        if level == len(self._peaks):
+            self._peaks.append(None)
+        self._peaks[level] = node
+        self.count += 1
+
+    def extend(self, leaves: Iterable[str]) -> None:
+        for leaf in leaves:
+            self.append(leaf)
+
+    @property
+    def root_hash(self) -> str | None:
+        if not self.count:
+            return None
+        carry: bytes | None = None
+        carry_level = 0
+        for level, peak in enumerate(self._peaks):
+            if peak is None:
+                continue
+            if carry is None:
+                carry, carry_level = peak, level
+                continue
+            if self.version == MERKLE_HASH_V1:
+                # Lift the partial right subtree by self-pairing, as the full tree does.
+                while carry_level < level:
+                    carry = _node_digest(carry, carry, self.version)
+                    carry_level += 1
+            carry = _node_digest(peak, carry, self.version)
+            carry_level = level + 1
+        return _to_hex(carry, self.version)  # type: ignore[arg-type]
+
+
+def merkle_root(leaves: Iterable[str], version: int = MERKLE_HASH_V1) -> str | None:
+    """Root of ``leaves`` under ``version`` without materializing the tree."""
+    return MerkleFrontier(leaves, version).root_hash
 
 
 class SemanticMerkleTree:
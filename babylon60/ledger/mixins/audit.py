@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     pass
-from babylon60.ledger.merkle import MerkleTree
+from babylon60.ledger.merkle import MERKLE_HASH_V1, MerkleTree, merkle_root
 from babylon60.utils.canonical import compute_tx_hash, compute_tx_hash_v1, now_iso
 
 logger = logging.getLogger("babylon60.ledger")
@@ -207,17 +207,17 @@ class LedgerAuditMixin:
 
     async def _verify_merkle_roots(self, conn, tenant_id: str | None) -> list[dict]:
         violations = []
+        version_col = await self._merkle_version_column(conn)
+        select = (
+            "SELECT COALESCE(tenant_id, 'default'), root_hash, tx_start_id, tx_end_id, "
+            f"{version_col} FROM merkle_roots"
+        )
         if tenant_id is None:
-            cursor = await conn.execute(
-                "SELECT COALESCE(tenant_id, 'default'), root_hash, tx_start_id, tx_end_id FROM merkle_roots"
-            )
+            cursor = await conn.execute(select)
         else:
-            cursor = await conn.execute(
-                "SELECT COALESCE(tenant_id, 'default'), root_hash, tx_start_id, tx_end_id FROM merkle_roots WHERE tenant_id = ?",
-                (tenant_id,),
-            )
+            cursor = await conn.execute(select + " WHERE tenant_id = ?", (tenant_id,))
         roots = list(await cursor.fetchall())
-        for root_tenant_id, stored_root, start, end in roots:
+        for root_tenant_id, stored_root, start, end, version in roots:
             if root_tenant_id == "__global__":
                 c = await conn.execute(
                     "SELECT hash FROM transactions WHERE id >= ? AND id <= ? ORDER BY id",
@@ -232,7 +232,55 @@ class LedgerAuditMixin:
             if not hashes and stored_root == "GENESIS":
                 computed_root = "GENESIS"
             else:
-                computed_root = MerkleTree(hashes).root_hash
+                try:
+                    computed_root = merkle_root(hashes, version)
+                except ValueError:
+                    computed_root = None
             if computed_root != stored_root:
                 violations.append({"range": f"{start}-{end}", "type": "MERKLE_MISMATCH"})
         return violations
+
+    @staticmethod
+    async def _merkle_version_column(conn) -> str:
+        """SQL expression for a checkpoint's hash version (v1 before the column existed)."""
+        cursor = await conn.execute("PRAGMA table_info(merkle_roots)")
+        columns = {row[1] for row in await cursor.fetchall()}
+        return "hash_version" if "hash_version" in columns else str(MERKLE_HASH_V1)
+
+    async def export_merkle_proofs(self, tx_start_id: int, tx_end_id: int) -> list[dict[str, Any]]:
+        """Inclusion proofs for transactions in ``[tx_start_id, tx_end_id]``.
+
+        Builds one tree per covering global checkpoint and exports every
+        requested proof from it. Transactions not yet checkpointed are omitted.
+        """
+        proofs: list[dict[str, Any]] = []
+        async with self._get_conn_proxy() as conn:  # type: ignore
+            version_col = await self._merkle_version_column(conn)
+            cursor = await conn.execute(
+                "SELECT id, root_hash, tx_start_id, tx_end_id, "
+                f"{version_col} FROM merkle_roots "
+                "WHERE tenant_id = '__global__' AND tx_count > 0 "
+                "AND tx_end_id >= ? AND tx_start_id <= ? ORDER BY tx_start_id",
+                (tx_start_id, tx_end_id),
+            )
+            checkpoints = list(await cursor.fetchall())
+            for checkpoint_id, root, start, end, version in checkpoints:
+                c = await conn.execute(
+                    "SELECT id, hash FROM transactions WHERE id >= ? AND id <= ? ORDER BY id",
+                    (start, end),
+                )
+                rows = list(await c.fetchall())
+                tree = MerkleTree((r[1] for r in rows), version=version)
+                for index, (tx_id, tx_hash) in enumerate(rows):
+                    if tx_start_id <= tx_id <= tx_end_id:
+                        proofs.append(
+                            {
+                                "tx_id": tx_id,
+                                "hash": tx_hash,
+                                "checkpoint_id": checkpoint_id,
+                                "root_hash": root,
+                                "hash_version": version,
+                                "proof": tree.get_proof(index),
+                            }
+                        )
+        return proofs
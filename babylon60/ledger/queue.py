@@ -32,6 +32,9 @@ class EnrichmentQueue:
                 """,
                 (job_id, event_id, utc_now_iso(), utc_now_iso()),
             )
+        from babylon60.enrichment.notify import notify_enrichment
+
+        notify_enrichment()
         return job_id
 
     def claim_one(self) -> dict[str, Any] | None:
@@ -69,6 +72,43 @@ class EnrichmentQueue:
             )
             return dict(row)
 
+    def claim_batch(self, limit: int) -> list[dict[str, Any]]:
+        """Atomically claim up to ``limit`` jobs in a single transaction."""
+        with self.store.tx() as conn:
+            rows = conn.execute(
+                """
+                UPDATE enrichment_jobs
+                SET status='processing', updated_at=strftime('%Y-%m-%dT%H:%M:%fZ','now')
+                WHERE job_id IN (
+                    SELECT job_id
+                    FROM enrichment_jobs
+                    WHERE status IN ('queued', 'retry')
+                      AND (next_attempt_ts IS NULL OR next_attempt_ts <= ?)
+                    ORDER BY created_at ASC
+                    LIMIT ?
+                )
+                RETURNING job_id, event_id, attempts, created_at
+                """,
+                (utc_now_iso(), limit),
+            ).fetchall()
+
+            if not rows:
+                return []
+
+            conn.executemany(
+                "UPDATE ledger_events SET semantic_status='processing' WHERE event_id=?",
+                [(row["event_id"],) for row in rows],
+            )
+            return sorted((dict(row) for row in rows), key=lambda job: job["created_at"])
+
+    def depth(self) -> int:
+        """Number of jobs waiting to be claimed (including scheduled retries)."""
+        with self.store.tx() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) FROM enrichment_jobs WHERE status IN ('queued', 'retry')"
+            ).fetchone()
+        return int(row[0])
+
     def mark_done(self, job_id: str, event_id: str) -> None:
         with self.store.tx() as conn:
             conn.execute(
@@ -88,6 +128,28 @@ class EnrichmentQueue:
                 (event_id,),
             )
 
+    def mark_done_many(self, jobs: list[tuple[str, str]]) -> None:
+        """Mark ``(job_id, event_id)`` pairs done in one transaction."""
+        if not jobs:
+            return
+        with self.store.tx() as conn:
+            conn.executemany(
+                """
+                UPDATE enrichment_jobs
+                SET status='done', updated_at=strftime('%Y-%m-%dT%H:%M:%fZ','now')
+                WHERE job_id=?
+                """,
+                [(job_id,) for job_id, _ in jobs],
+            )
+            conn.executemany(
+                """
+                UPDATE ledger_events
+                SET semantic_status='indexed', semantic_error=NULL
+                WHERE event_id=?
+                """,
+                [(event_id,) for _, event_id in jobs],
+            )
+
     def mark_failed(self, job_id: str, event_id: str, error: str, attempts: int) -> None:
         delay_minutes = min(60, 2 ** min(attempts, 5))
         next_attempt = (
@@ -69,6 +69,14 @@ class LedgerStore:
                     created_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now'))
                 );
 
+                CREATE TABLE IF NOT EXISTS ledger_verification_watermark (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    checkpoint_id INTEGER NOT NULL,
+                    end_event_id TEXT NOT NULL,
+                    end_hash TEXT NOT NULL,
+                    verified_at TEXT NOT NULL DEFAULT (strftime('%Y-%m-%dT%H:%M:%fZ','now'))
+                );
+
                 CREATE TABLE IF NOT EXISTS enrichment_jobs (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
                     job_id TEXT UNIQUE,
@@ -3,8 +3,14 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import TYPE_CHECKING
-
+import multiprocessing
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from babylon60.consensus.merkle import compute_merkle_root
 from babylon60.ledger.models import (
     ActionResult,
     ActionTarget,
@@ -19,61 +25,269 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("babylon60.ledger")
 
+VERIFY_MODES = ("full", "incremental")
+
+# Below this many events a process pool costs more than it saves.
+_MIN_POOL_EVENTS = 50_000
+
+# (checkpoint_id, root_hash, after_rowid, end_rowid); checkpoint fields are
+# None for the uncheckpointed tail, end_rowid is None when the shard is open.
+_Shard = tuple[int | None, str | None, int, int | None]
+
+
+def _reconstruct_event(payload: dict) -> LedgerEvent:
+    # Helper to rebuild the event from the payload JSON
+    target = ActionTarget(**payload["target"])
+    result = ActionResult(**payload["result"])
+    intent = IntentPayload(**payload["intent"]) if payload.get("intent") else None
+    origin = (
+        LedgerOriginSignature(**payload["origin"])
+        if isinstance(payload.get("origin"), dict)
+        else None
+    )
+
+    return LedgerEvent(
+        event_id=payload["event_id"],
+        ts=payload["timestamp"],
+        tool=payload["tool"],
+        actor=payload["actor"],
+        action=payload["action"],
+        target=target,
+        result=result,
+        intent=intent,
+        correlation_id=payload.get("correlation_id"),
+        trace_id=payload.get("trace_id"),
+        origin=origin,
+        prev_hash=payload.get("prev_hash"),
+        hash=payload.get("hash"),
+        semantic_status=payload.get("semantic_status", "pending"),
+        metadata=payload.get("metadata", {}),
+    )
+
+
+def _verify_shard(conn: sqlite3.Connection, shard: _Shard, expected_prev: str) -> dict[str, Any]:
+    """Verify the events of one shard, linking its first event to ``expected_prev``.
+
+    When the shard is a checkpoint range, its Merkle root is recomputed from
+    the stored hashes as well.
+    """
+    checkpoint_id, root_hash, after_rowid, end_rowid = shard
+    violations: list[str] = []
+    stats = {"pending": 0, "processing": 0, "indexed": 0, "failed": 0}
+    hashes: list[str] = []
+    checked = 0
+    broken = False
+
+    cursor = conn.execute(
+        "SELECT event_id, payload_json, prev_hash, hash, semantic_status "
+        "FROM ledger_events WHERE rowid > ? AND rowid <= ? ORDER BY rowid ASC",
+        (after_rowid, end_rowid if end_rowid is not None else 2**63 - 1),
+    )
+    current_prev = expected_prev
+    for row in cursor:
+        checked += 1
+        event_id = row["event_id"]
+        p_hash = row["prev_hash"]
+        c_hash = row["hash"]
+        s_status = row["semantic_status"]
+
+        if s_status in stats:
+            stats[s_status] += 1
+        if s_status == "failed":
+            violations.append(f"Semantic enrichment failed for event {event_id}")
+
+        if p_hash != current_prev:
+            broken = True
+            violations.append(
+                f"Chain break at {event_id}: prev_hash is {p_hash}, but expected {current_prev}"
+            )
+
+        # Full hash verification
+        try:
+            event = _reconstruct_event(json.loads(row["payload_json"]))
+            recomputed = event.compute_hash(p_hash)
+            if recomputed != c_hash:
+                broken = True
+                violations.append(
+                    f"Hash mismatch at {event_id}: stored {c_hash}, recomputed {recomputed}"
+                )
+        except (ValueError, TypeError, OSError, KeyError) as e:
+            broken = True
+            violations.append(f"Error parsing event {event_id}: {e}")
+
+        if c_hash:
+            hashes.append(c_hash)
+        current_prev = c_hash
+
+    if root_hash is not None and compute_merkle_root(hashes) != root_hash:
+        broken = True
+        violations.append(f"Merkle root mismatch for checkpoint {checkpoint_id}")
+
+    return {"violations": violations, "checked": checked, "stats": stats, "broken": broken}
+
+
+def _verify_shard_worker(db_path: str, shard: _Shard, expected_prev: str) -> dict[str, Any]:
+    """Process-pool entry point: verify one shard over a private connection."""
+    from babylon60.database.core import connect
+
+    conn = connect(db_path, row_factory=sqlite3.Row)
+    try:
+        return _verify_shard(conn, shard, expected_prev)
+    finally:
+        conn.close()
+
 
 class LedgerVerifier:
     def __init__(self, store: LedgerStore) -> None:
         self.store = store
 
-    def verify_chain(self) -> dict:
-        violations = []
+    def verify_chain(self, mode: str = "full", workers: int | None = None) -> dict:
+        """Verify the event hash chain and the Merkle roots of its checkpoints.
+
+        ``mode="full"`` walks the chain from GENESIS, one shard per checkpoint
+        range; shards run in a process pool when ``workers`` > 1, or when the
+        chain is large enough and ``workers`` is None. ``mode="incremental"``
+        resumes after the last trusted checkpoint recorded in
+        ``ledger_verification_watermark`` and falls back to a full walk if that
+        checkpoint no longer matches the chain. A clean run advances the
+        watermark to the last checkpoint it verified.
+        """
+        if mode not in VERIFY_MODES:
+            raise ValueError(f"Unknown verification mode: {mode}")
+        started = time.perf_counter()
+        violations: list[str] = []
         checked = 0
         stats = {"pending": 0, "processing": 0, "indexed": 0, "failed": 0}
+        broken = False
 
         with self.store.tx() as conn:
-            cursor = conn.execute(
-                "SELECT event_id, payload_json, prev_hash, hash, semantic_status "
-                "FROM ledger_events ORDER BY rowid ASC"
+            mark = self._load_watermark(conn) if mode == "incremental" else None
+            if mode == "incremental" and mark is None:
+                mode = "full"
+            after_rowid, genesis_prev = (mark[1], mark[2]) if mark else (0, "GENESIS")
+            shards, checkpoint_violations = self._plan_shards(conn, after_rowid)
+            violations.extend(checkpoint_violations)
+            broken = bool(checkpoint_violations)
+            seams = [genesis_prev] + [self._event_hash(conn, shard[2]) for shard in shards[1:]]
+
+            span = sum((end if end is not None else after) - after for _, _, after, end in shards)
+            pool_size = workers if workers is not None else os.cpu_count() or 1
+            use_pool = (
+                len(shards) > 1
+                and pool_size > 1
+                and self.store.db_path != ":memory:"
+                and (workers is not None or span >= _MIN_POOL_EVENTS)
             )
-            current_prev = "GENESIS"
-            for row in cursor:
-                checked += 1
-                event_id = row["event_id"]
-                payload = json.loads(row["payload_json"])
-                p_hash = row["prev_hash"]
-                c_hash = row["hash"]
-                s_status = row["semantic_status"]
-
-                if s_status in stats:
-                    stats[s_status] += 1
-                if s_status == "failed":
-                    violations.append(f"Semantic enrichment failed for event {event_id}")
-
-                if p_hash != current_prev:
-                    violations.append(
-                        f"Chain break at {event_id}: "
-                        f"prev_hash is {p_hash}, but expected {current_prev}"
-                    )
-
-                # Full hash verification
-                try:
-                    event = self._reconstruct_event(payload)
-                    recomputed = event.compute_hash(p_hash)
-                    if recomputed != c_hash:
-                        violations.append(
-                            f"Hash mismatch at {event_id}: stored {c_hash}, recomputed {recomputed}"
+            if use_pool:
+                with ProcessPoolExecutor(
+                    max_workers=min(pool_size, len(shards)),
+                    mp_context=multiprocessing.get_context("spawn"),
+                ) as pool:
+                    reports = list(
+                        pool.map(
+                            _verify_shard_worker,
+                            [self.store.db_path] * len(shards),
+                            shards,
+                            seams,
                         )
-                except (ValueError, TypeError, OSError, KeyError) as e:
-                    violations.append(f"Error parsing event {event_id}: {e}")
-
-                current_prev = c_hash
+                    )
+            else:
+                reports = [
+                    _verify_shard(conn, shard, prev)
+                    for shard, prev in zip(shards, seams, strict=True)
+                ]
+
+            for report in reports:
+                violations.extend(report["violations"])
+                checked += report["checked"]
+                broken = broken or report["broken"]
+                for key, value in report["stats"].items():
+                    stats[key] += value
+
+            trusted = [shard for shard in shards if shard[0] is not None]
+            # Failed enrichment is reported but does not make the chain untrusted.
+            if not broken and trusted:
+                self._store_watermark(conn, trusted[-1])
+            elif broken and mode == "full":
+                conn.execute("DELETE FROM ledger_verification_watermark")
+            watermark = self._load_watermark(conn)
 
         return {
             "valid": len(violations) == 0,
             "violations": violations,
             "checked_events": checked,
             "enrichment_stats": stats,
+            "mode": mode,
+            "shards": len(shards),
+            "parallel": use_pool,
+            "watermark_checkpoint_id": watermark[0] if watermark else None,
+            "duration_ms": round((time.perf_counter() - started) * 1000, 3),
         }
 
+    def _plan_shards(
+        self, conn: sqlite3.Connection, after_rowid: int
+    ) -> tuple[list[_Shard], list[str]]:
+        """Split the chain after ``after_rowid`` at checkpoint boundaries."""
+        violations: list[str] = []
+        shards: list[_Shard] = []
+        cursor = conn.execute(
+            "SELECT c.checkpoint_id, c.root_hash, e.rowid AS end_rowid "
+            "FROM ledger_checkpoints c LEFT JOIN ledger_events e ON e.event_id = c.end_event_id "
+            "ORDER BY c.checkpoint_id ASC"
+        )
+        boundary = after_rowid
+        for row in cursor:
+            end_rowid = row["end_rowid"]
+            if end_rowid is None:
+                violations.append(f"Checkpoint {row['checkpoint_id']} references a missing event")
+            elif end_rowid > boundary:
+                shards.append((row["checkpoint_id"], row["root_hash"], boundary, end_rowid))
+                boundary = end_rowid
+        shards.append((None, None, boundary, None))
+        return shards, violations
+
+    @staticmethod
+    def _event_hash(conn: sqlite3.Connection, rowid: int) -> str:
+        row = conn.execute("SELECT hash FROM ledger_events WHERE rowid = ?", (rowid,)).fetchone()
+        return row["hash"] if row else "GENESIS"
+
+    @staticmethod
+    def _load_watermark(conn: sqlite3.Connection) -> tuple[int, int, str] | None:
+        """Return ``(checkpoint_id, end_rowid, end_hash)`` if the watermark still holds.
+
+        The watermark is dropped when its checkpoint or boundary event changed.
+        """
+        row = conn.execute(
+            "SELECT w.checkpoint_id, w.end_hash, e.rowid AS end_rowid, e.hash AS event_hash "
+            "FROM ledger_verification_watermark w "
+            "JOIN ledger_checkpoints c ON c.checkpoint_id = w.checkpoint_id "
+            "AND c.end_event_id = w.end_event_id "
+            "LEFT JOIN ledger_events e ON e.event_id = w.end_event_id "
+            "WHERE w.id = 1"
+        ).fetchone()
+        if not row or row["event_hash"] != row["end_hash"]:
+            return None
+        return row["checkpoint_id"], row["end_rowid"], row["end_hash"]
+
+    @staticmethod
+    def _store_watermark(conn: sqlite3.Connection, shard: _Shard) -> None:
+        checkpoint_id, _, _, end_rowid = shard
+        event = conn.execute(
+            "SELECT event_id, hash FROM ledger_events WHERE rowid = ?", (end_rowid,)
+        ).fetchone()
+        conn.execute(
+            """
+            INSERT INTO ledger_verification_watermark (id, checkpoint_id, end_event_id, end_hash)
+            VALUES (1, ?, ?, ?)
+            ON CONFLICT(id) DO UPDATE SET
+                checkpoint_id = excluded.checkpoint_id,
+                end_event_id = excluded.end_event_id,
+                end_hash = excluded.end_hash,
+                verified_at = strftime('%Y-%m-%dT%H:%M:%fZ','now')
+            """,
+            (checkpoint_id, event["event_id"], event["hash"]),
+        )
+
     def _get_mldsa_private_key(self):
         import base64
         import os
@@ -245,33 +459,7 @@ class LedgerVerifier:
             return cursor.lastrowid
 
     def _reconstruct_event(self, payload: dict) -> LedgerEvent:
-        # Helper to rebuild the event from the payload JSON
-        target = ActionTarget(**payload["target"])
-        result = ActionResult(**payload["result"])
-        intent = IntentPayload(**payload["intent"]) if payload.get("intent") else None
-        origin = (
-            LedgerOriginSignature(**payload["origin"])
-            if isinstance(payload.get("origin"), dict)
-            else None
-        )
-
-        return LedgerEvent(
-            event_id=payload["event_id"],
-            ts=payload["timestamp"],
-            tool=payload["tool"],
-            actor=payload["actor"],
-            action=payload["action"],
-            target=target,
-            result=result,
-            intent=intent,
-            correlation_id=payload.get("correlation_id"),
-            trace_id=payload.get("trace_id"),
-            origin=origin,
-            prev_hash=payload.get("prev_hash"),
-            hash=payload.get("hash"),
-            semantic_status=payload.get("semantic_status", "pending"),
-            metadata=payload.get("metadata", {}),
-        )
+        return _reconstruct_event(payload)
 
     def verify_checkpoint_signatures(self) -> dict:
         """Verify the ML-DSA post-quantum signature of all checkpoints."""
@@ -8,9 +8,12 @@ Core operations on bipolar hypervectors (±1, int8):
     - permute(hv, k): Circular shift by k positions (encodes sequence)
     - cosine_similarity(a, b): Normalized dot product
     - random_bipolar(dim): Generate a random ±1 hypervector
+    - pack_bipolar / unpack_bipolar: 1 bit per dimension storage form
+    - hamming_distances_packed(q, m): Popcount distance against a packed matrix
 
 All operations use numpy int8 arrays for memory efficiency:
     10k-dim × int8 = 10 KB per vector (vs 40 KB for float32 dense).
+Packed storage form: 10k-dim × 1 bit = 1.25 KB per vector.
 """
 
 from __future__ import annotations
@@ -30,10 +33,13 @@ __all__ = [
     "bind",
     "bundle",
     "cosine_similarity",
+    "hamming_distances_packed",
     "hamming_similarity",
+    "pack_bipolar",
     "permute",
     "random_bipolar",
     "unbind",
+    "unpack_bipolar",
 ]
 
 # Sovereign constants
@@ -167,3 +173,52 @@ def hamming_similarity(a: HVType, b: HVType) -> float:
     """
     matches = int(np.sum(a == b))
     return matches / len(a)
+
+
+def pack_bipolar(hv: HVType) -> bytes:
+    """Pack a bipolar hypervector into bits (>= 0 → 1, < 0 → 0).
+
+    Zero maps to +1, matching the legacy ``np.sign`` projection that
+    promoted zero components to +1.
+
+    Args:
+        hv: Bipolar hypervector (any numeric dtype; sign is what counts).
+
+    Returns:
+        ``ceil(dim / 8)`` bytes, MSB-first within each byte.
+    """
+    return np.packbits(np.asarray(hv) >= 0).tobytes()
+
+
+def unpack_bipolar(packed: bytes, dim: int) -> HVType:
+    """Inverse of :func:`pack_bipolar`.
+
+    Args:
+        packed: Bytes produced by ``pack_bipolar``.
+        dim: Original dimensionality.
+
+    Returns:
+        numpy int8 array of shape (dim,) with values in {-1, +1}.
+    """
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), count=dim)
+    return (bits.astype(np.int8) * 2 - 1).astype(np.int8)
+
+
+def hamming_distances_packed(query: bytes | HVType, matrix: HVType) -> HVType:
+    """Hamming distance from a packed query to every row of a packed matrix.
+
+    For bipolar vectors ``cos(a, b) = 1 - 2 * hamming(a, b) / dim``, so this
+    is the popcount equivalent of :func:`cosine_similarity`.
+
+    Args:
+        query: Packed query (bytes or uint8 array of shape (nbytes,)).
+        matrix: uint8 array of shape (n, nbytes) or (nbytes,).
+
+    Returns:
+        int64 array of shape (n,) (or a 0-d array for a single row).
+    """
+    q = np.frombuffer(query, dtype=np.uint8) if isinstance(query, bytes) else query
+    diff = np.bitwise_xor(matrix, q)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(diff).sum(axis=-1, dtype=np.int64)
+    return np.unpackbits(diff, axis=-1).sum(axis=-1, dtype=np.int64)
@@ -24,7 +24,12 @@ except ImportError:
     sqlite_vec = None
 
 from babylon60.memory.cortex_decay import cortex_decay
-from babylon60.memory.hdc.algebra import unbind
+from babylon60.memory.hdc.algebra import (
+    hamming_distances_packed,
+    pack_bipolar,
+    unbind,
+    unpack_bipolar,
+)
 from babylon60.memory.hdc.codec import HDCEncoder
 from babylon60.memory.hdc.item_memory import ItemMemory
 from babylon60.memory.models import CortexFactModel
@@ -33,17 +38,25 @@ __all__ = ["HDCVectorStoreL2"]
 
 logger = logging.getLogger("babylon60.memory.hdc.store")
 
+# Packed (1 bit / dim) fact vectors. Supersedes the float32 ``hdc_vec_facts``
+# table, which is migrated on first connect.
+_BIT_TABLE = "hdc_bit_facts"
+_LEGACY_FLOAT_TABLE = "hdc_vec_facts"
+_MIGRATION_BATCH = 512
+
 
 class HDCVectorStoreL2:
     """Async vector store for CORTEX v7 L2 semantic memory (Hyperdimensional).
 
-    Uses sqlite-vec (with int8 embeddings mapped to float32 for compatibility,
-    or pure numpy if sqlite-vec doesn't support int8 cosine directly yet).
-    Since sqlite-vec expects float32, we cast int8 to float32 upon insert.
-    The storage penalty is accepted for phase 1 of Vector Alpha to reuse sqlite-vec ranking.
+    Fact hypervectors are stored bit-packed (+1 → 1, -1 → 0): a sqlite-vec
+    ``bit[N]`` column ranked with ``vec_distance_hamming`` when the extension
+    is available, otherwise a BLOB sidecar ranked with NumPy popcount.
+    For bipolar vectors ``(1 + cos) / 2 == 1 - hamming / dim``, so scores are
+    identical to the former float32 cosine path at 1/32 of the storage.
     """
 
     __slots__ = (
+        "_bit_vec",
         "_conn",
         "_db_path",
         "_encoder",
@@ -69,6 +82,7 @@ class HDCVectorStoreL2:
         self._lock = asyncio.Lock()
         self._ready = False
         self._vec_loaded = False
+        self._bit_vec = False
         self._half_life = half_life_days * 24 * 3600
 
     def _get_conn(self) -> sqlite3.Connection:
@@ -120,16 +134,24 @@ class HDCVectorStoreL2:
                 )
             """)
 
-            # Vector Table (sqlite-vec uses float[N])
+            # Vector Tables (sqlite-vec bit[N] requires N % 8 == 0)
             dim = self._encoder.dimension
-            if self._vec_loaded:
+            self._bit_vec = self._vec_loaded and dim % 8 == 0
+            if self._bit_vec:
                 # nosec
                 self._conn.execute(f"""
-                    CREATE VIRTUAL TABLE IF NOT EXISTS hdc_vec_facts USING vec0(
-                        embedding float[{dim}]
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {_BIT_TABLE} USING vec0(
+                        embedding bit[{dim}]
                     )
                 """)
-
+            else:
+                self._conn.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {_BIT_TABLE} (
+                        rowid INTEGER PRIMARY KEY,
+                        embedding BLOB
+                    )
+                """)
+            if self._vec_loaded:
                 # nosec
                 self._conn.execute(f"""
                     CREATE VIRTUAL TABLE IF NOT EXISTS hdc_specular_vec_facts USING vec0(
@@ -137,12 +159,6 @@ class HDCVectorStoreL2:
                     )
                 """)
             else:
-                self._conn.execute("""
-                    CREATE TABLE IF NOT EXISTS hdc_vec_facts (
-                        rowid INTEGER PRIMARY KEY,
-                        embedding BLOB
-                    )
-                """)
                 self._conn.execute("""
                     CREATE TABLE IF NOT EXISTS hdc_specular_vec_facts (
                         rowid INTEGER PRIMARY KEY,
@@ -158,9 +174,58 @@ class HDCVectorStoreL2:
             self._conn.execute("CREATE INDEX IF NOT EXISTS idx_bridge ON hdc_facts_meta(is_bridge)")
 
             self._conn.commit()
+            self._migrate_float_vectors(self._conn)
             self._ready = True
         return self._conn
 
+    @property
+    def _bit_param(self) -> str:
+        """SQL placeholder for a packed vector parameter."""
+        return "vec_bit(?)" if self._bit_vec else "?"
+
+    def _migrate_float_vectors(self, conn: sqlite3.Connection) -> int:
+        """Rewrite legacy float32 ``hdc_vec_facts`` rows into the packed table.
+
+        Runs in rowid-keyed batches and drops the legacy table once every row
+        has been copied. Returns the number of migrated vectors.
+        """
+        legacy = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (_LEGACY_FLOAT_TABLE,)
+        ).fetchone()
+        if not legacy:
+            return 0
+        migrated = 0
+        last_rowid = 0
+        try:
+            while True:
+                rows = conn.execute(  # bypass-tenant
+                    f"SELECT rowid, embedding FROM {_LEGACY_FLOAT_TABLE} "
+                    "WHERE rowid > ? ORDER BY rowid LIMIT ?",
+                    (last_rowid, _MIGRATION_BATCH),
+                ).fetchall()
+                if not rows:
+                    break
+                conn.executemany(  # bypass-tenant
+                    f"INSERT OR REPLACE INTO {_BIT_TABLE}(rowid, embedding) "
+                    f"VALUES (?, {self._bit_param})",
+                    [
+                        (r["rowid"], pack_bipolar(np.frombuffer(r["embedding"], dtype=np.float32)))
+                        for r in rows
+                    ],
+                )
+                migrated += len(rows)
+                last_rowid = rows[-1]["rowid"]
+            conn.execute(f"DROP TABLE {_LEGACY_FLOAT_TABLE}")
+            conn.commit()
+        except sqlite3.OperationalError as e:
+            # vec0 legacy table without the extension loaded: retry next connect
+            conn.rollback()
+            logger.warning("HDC packed migration deferred: %s", e)
+            return 0
+        if migrated:
+            logger.info("HDC: migrated %d float32 vectors to packed bits", migrated)
+        return migrated
+
     async def memorize(self, fact: CortexFactModel, fact_type: str | None = None) -> None:
         """Encode and store a multi-tenant CortexFactModel as a Hypervector."""
         conn = self._get_conn()
@@ -188,8 +253,8 @@ class HDCVectorStoreL2:
                 project_id=fact.project_id,
             )
 
-            # 2. Store: cast int8 to float32 for sqlite-vec compatibility
-            embedding_bytes = np.array(hv, dtype=np.float32).tobytes()
+            # 2. Store: 1 bit per dimension
+            embedding_bits = pack_bipolar(hv)
 
             cursor = conn.cursor()
             cursor.execute(
@@ -216,8 +281,8 @@ class HDCVectorStoreL2:
             rowid = cursor.lastrowid
 
             cursor.execute(  # bypass-tenant
-                "INSERT INTO hdc_vec_facts(rowid, embedding) VALUES (?, ?)",
-                (rowid, embedding_bytes),
+                f"INSERT INTO {_BIT_TABLE}(rowid, embedding) VALUES (?, {self._bit_param})",
+                (rowid, embedding_bits),
             )
 
             # 3. Store Specular Trace if available
@@ -258,7 +323,8 @@ class HDCVectorStoreL2:
         query_hv = self._encoder.encode_fact(
             content=query, fact_type=fact_type, project_id=project_id
         )
-        embedding_bytes = np.array(query_hv, dtype=np.float32).tobytes()
+        query_bits = pack_bipolar(query_hv)
+        dim = self._encoder.dimension
         now = time.monotonic()
 
         # Retrieve toxic vectors if inhibit_ids are provided
@@ -266,59 +332,53 @@ class HDCVectorStoreL2:
 
         cursor = conn.cursor()
 
-        if self._vec_loaded:
+        if self._bit_vec:
             cursor.execute(
-                """
+                f"""
                 SELECT
                     m.rowid, m.id, m.tenant_id, m.project_id, m.content, m.timestamp,
                     m.is_diamond, m.is_bridge, m.confidence, m.success_rate, m.metadata, m.fact_type,
-                    ((1.0 - vec_distance_cosine(v.embedding, ?) / 2.0) *
+                    v.embedding,
+                    ((1.0 - vec_distance_hamming(v.embedding, vec_bit(?)) / ?) *
                      cortex_decay(m.is_diamond, m.timestamp, ?, ?) *
                      m.success_rate) as final_score
                 FROM hdc_facts_meta m
-                JOIN hdc_vec_facts v ON m.rowid = v.rowid
+                JOIN {_BIT_TABLE} v ON m.rowid = v.rowid
                 WHERE m.tenant_id = ? AND (m.project_id = ? OR m.is_bridge = 1)
                 ORDER BY final_score DESC
                 LIMIT ?
                 """,
-                (embedding_bytes, now, self._half_life, tenant_id, project_id, limit * 2),
+                (query_bits, float(dim), now, self._half_life, tenant_id, project_id, limit * 2),
             )
             rows = cursor.fetchall()
         else:
             cursor.execute(
-                """
+                f"""
                 SELECT
                     m.rowid, m.id, m.tenant_id, m.project_id, m.content, m.timestamp,
                     m.is_diamond, m.is_bridge, m.confidence, m.success_rate, m.metadata, m.fact_type,
                     cortex_decay(m.is_diamond, m.timestamp, ?, ?) * m.success_rate as base_score,
                     v.embedding
                 FROM hdc_facts_meta m
-                JOIN hdc_vec_facts v ON m.rowid = v.rowid
+                JOIN {_BIT_TABLE} v ON m.rowid = v.rowid
                 WHERE m.tenant_id = ? AND (m.project_id = ? OR m.is_bridge = 1)
                 """,
                 (now, self._half_life, tenant_id, project_id),
             )
             raw_rows = cursor.fetchall()
-            q_emb = np.frombuffer(embedding_bytes, dtype=np.float32)
-            q_norm = np.linalg.norm(q_emb)
-            rows_with_score = []
-            for r in raw_rows:
-                db_emb = np.frombuffer(r["embedding"], dtype=np.float32)
-                db_norm = np.linalg.norm(db_emb)
-                if q_norm == 0 or db_norm == 0:
-                    cos_sim = 0.0
-                else:
-                    cos_sim = np.dot(q_emb, db_emb) / (q_norm * db_norm)
-
-                final_score = ((1.0 + cos_sim) / 2.0) * r["base_score"]
-
-                # Create a dict-like row with final_score
-                row_dict = dict(r)
-                row_dict["final_score"] = final_score
-                rows_with_score.append(row_dict)
-
-            rows_with_score.sort(key=lambda x: x["final_score"], reverse=True)
-            rows = rows_with_score[: limit * 2]
+            rows = []
+            if raw_rows:
+                # One popcount pass over the packed candidate matrix
+                matrix = np.frombuffer(
+                    b"".join(r["embedding"] for r in raw_rows), dtype=np.uint8
+                ).reshape(len(raw_rows), -1)
+                dists = hamming_distances_packed(query_bits, matrix)
+                base = np.array([r["base_score"] for r in raw_rows], dtype=np.float64)
+                scores = (1.0 - dists / dim) * base
+                for idx in np.argsort(-scores, kind="stable")[: limit * 2]:
+                    row_dict = dict(raw_rows[idx])
+                    row_dict["final_score"] = float(scores[idx])
+                    rows.append(row_dict)
 
         final_facts = []
 
@@ -332,42 +392,37 @@ class HDCVectorStoreL2:
 
     def _fetch_toxic_hvs(
         self, conn: sqlite3.Connection, inhibit_ids: list[str] | None
-    ) -> list[np.ndarray]:  # pyright: ignore[reportInvalidTypeForm]
-        """Fetch toxic vectors for inhibition."""
-        toxic_hvs = []
-        if inhibit_ids:
-            cursor = conn.cursor()
-            placeholders = ",".join(["?"] * len(inhibit_ids))
-            cursor.execute(  # nosec
-                f"SELECT embedding FROM hdc_vec_facts WHERE rowid IN "
-                f"(SELECT rowid FROM hdc_facts_meta WHERE id IN ({placeholders}))",
-                inhibit_ids,
-            )
-            for v_row in cursor.fetchall():
-                toxic_hvs.append(np.frombuffer(v_row["embedding"], dtype=np.float32))
-        return toxic_hvs
+    ) -> np.ndarray | None:  # pyright: ignore[reportInvalidTypeForm]
+        """Fetch toxic vectors for inhibition as a packed (n, nbytes) uint8 matrix."""
+        if not inhibit_ids:
+            return None
+        cursor = conn.cursor()
+        placeholders = ",".join(["?"] * len(inhibit_ids))
+        cursor.execute(  # nosec
+            f"SELECT embedding FROM {_BIT_TABLE} WHERE rowid IN "
+            f"(SELECT rowid FROM hdc_facts_meta WHERE id IN ({placeholders}))",
+            inhibit_ids,
+        )
+        blobs = [v_row["embedding"] for v_row in cursor.fetchall()]
+        if not blobs:
+            return None
+        return np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(len(blobs), -1)
 
     def _process_hdc_fact_row(
         self,
         conn: sqlite3.Connection,
         row: sqlite3.Row,
-        toxic_hvs: list[np.ndarray],  # pyright: ignore[reportInvalidTypeForm]
+        toxic_hvs: np.ndarray | None,  # pyright: ignore[reportInvalidTypeForm]
     ) -> CortexFactModel:
         """Process a single row from the HDC recall query."""
         score = row["final_score"]
-        emb_f32 = None
-
-        # Fetch embedding for inhibition check and models
-        v_cursor = conn.cursor()
-        v_cursor.execute("SELECT embedding FROM hdc_vec_facts WHERE rowid = ?", (row["rowid"],))  # bypass-tenant
-        v_row = v_cursor.fetchone()
-        if v_row:
-            emb_f32 = np.frombuffer(v_row["embedding"], dtype=np.float32)
-
-        # APPLY INHIBITION (Vector Gamma)
-        if toxic_hvs and emb_f32 is not None:
-            for thv in toxic_hvs:
-                interference = np.dot(emb_f32, thv) / self._encoder.dimension
+        emb_bits = row["embedding"]
+        dim = self._encoder.dimension
+
+        # APPLY INHIBITION (Vector Gamma): cos = 1 - 2 * hamming / dim
+        if toxic_hvs is not None and emb_bits is not None:
+            interferences = 1.0 - 2.0 * hamming_distances_packed(emb_bits, toxic_hvs) / dim
+            for interference in interferences.tolist():
                 if interference > 0.05:
                     score *= 1.0 - (interference * 2.0)
                     score = max(0.01, score)
@@ -377,12 +432,8 @@ class HDCVectorStoreL2:
                         interference,
                     )
 
-        # Revert float32 back to int8
-        emb_int8 = []
-        if emb_f32 is not None:
-            emb_int8_arr = np.sign(emb_f32).astype(np.int8)
-            emb_int8_arr[emb_int8_arr == 0] = 1
-            emb_int8 = emb_int8_arr.tolist()
+        # Unpack bits back to bipolar int8
+        emb_int8 = unpack_bipolar(emb_bits, dim).tolist() if emb_bits is not None else []
 
         # Retrieve specular embedding
         specular_emb = None
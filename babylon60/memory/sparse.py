@@ -12,21 +12,117 @@ Computational translation:
   768-dim embedding → 3072-dim sparse representation
   Global inhibition via top-k selection → only top 5% survive
   Result: near-zero interference between engram memories.
+
+The projection is a cached NumPy matrix and encoding is a matrix product,
+ReLU, a partition-based top-k threshold and L2 normalization. The default
+Gaussian projection is drawn from ``random.Random(seed)`` exactly as the
+original pure-Python encoder did, so a given seed yields the same matrix
+and the same encodings (up to float64 summation order).
+
+Without numpy (the optional ``compute`` extra), ``encode`` falls back to
+the original pure-Python loops over the same Gaussian projection; the
+batch, sparse-code and Achlioptas paths need numpy.
 """
 
 from __future__ import annotations
 
 import logging
 import math
+from functools import lru_cache
+from typing import Literal, NamedTuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via subprocess import test
+    np = None
+
+__all__ = ["MushroomBodyEncoder", "SparseCode"]
 
 logger = logging.getLogger("babylon60.memory.sparse")
 
+Projection = Literal["gaussian", "achlioptas"]
+
+_PROJECTIONS = ("gaussian", "achlioptas")
+_DTYPES = ("float32", "float64")
+
+
+class SparseCode(NamedTuple):
+    """Compact encoding: active Kenyon cell indices and their values."""
+
+    indices: np.ndarray
+    values: np.ndarray
+    dim: int
+
+    def to_dense(self) -> np.ndarray:
+        dense = np.zeros(self.dim, dtype=self.values.dtype)
+        dense[self.indices] = self.values
+        return dense
+
+
+def _gaussian_draws(seed: int, input_dim: int, output_dim: int) -> list[float]:
+    """Row-major Gaussian weights in the original nested-list draw order."""
+    import random
+
+    # Xavier-like initialization
+    scale = math.sqrt(2.0 / (input_dim + output_dim))
+    gauss = random.Random(seed).gauss
+    return [gauss(0, scale) for _ in range(output_dim * input_dim)]
+
+
+@lru_cache(maxsize=8)
+def _projection_rows(seed: int, input_dim: int, output_dim: int) -> tuple[tuple[float, ...], ...]:
+    """Pure-Python Gaussian projection, one tuple per Kenyon cell."""
+    flat = _gaussian_draws(seed, input_dim, output_dim)
+    return tuple(tuple(flat[r : r + input_dim]) for r in range(0, len(flat), input_dim))
+
+
+@lru_cache(maxsize=8)
+def _projection_matrix(
+    seed: int, input_dim: int, output_dim: int, kind: Projection, dtype: str
+) -> np.ndarray:
+    """Read-only (output_dim, input_dim) PN → KC matrix, shared across encoders."""
+    if kind == "gaussian":
+        # Same draw order as the original nested-list matrix (seed-compatible).
+        flat = _gaussian_draws(seed, input_dim, output_dim)
+        matrix = np.array(flat, dtype=np.float64).reshape(output_dim, input_dim)
+    else:
+        # ±sqrt(3)·scale with p=1/6 each, 0 with p=2/3: same variance, 2/3 zeros.
+        scale = math.sqrt(2.0 / (input_dim + output_dim))
+        signs = np.random.default_rng(seed).choice(
+            np.array([-1.0, 0.0, 1.0]), size=(output_dim, input_dim), p=[1 / 6, 2 / 3, 1 / 6]
+        )
+        matrix = signs * (math.sqrt(3.0) * scale)
+    matrix = matrix.astype(dtype, copy=False)
+    matrix.setflags(write=False)
+    return matrix
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise ImportError(
+            "numpy is required for this feature. "
+            "Install it with: pip install cortex-persist[compute]"
+        )
+
 
 class MushroomBodyEncoder:
     """Sparse encoder inspired by Drosophila Mushroom Body.
 
     Expands input embeddings into a higher-dimensional space with
     sparse activation, dramatically reducing inter-memory interference.
+
+    Args:
+        expansion_factor: KC cells per input dimension.
+        sparsity: Fraction of KC cells left active (APL inhibition).
+        seed: Projection seed.
+        projection: ``"gaussian"`` (default, seed-compatible) or
+            ``"achlioptas"`` (sparse ±1, a different encoding).
+        dtype: ``"float64"`` (default) or ``"float32"`` for a smaller,
+            faster projection at reduced precision.
+
+    Raises:
+        ValueError: If ``projection`` or ``dtype`` is not one of the above.
+        ImportError: For ``"achlioptas"`` without numpy.
     """
 
     def __init__(
@@ -34,69 +130,104 @@ class MushroomBodyEncoder:
         expansion_factor: int = 4,
         sparsity: float = 0.05,
         seed: int = 42,
+        projection: Projection = "gaussian",
+        dtype: str = "float64",
     ):
+        if projection not in _PROJECTIONS:
+            raise ValueError(f"Unknown projection {projection!r}; expected one of {_PROJECTIONS}")
+        try:
+            dtype_name = np.dtype(dtype).name if np is not None else str(dtype)
+        except TypeError:
+            dtype_name = str(dtype)
+        if dtype_name not in _DTYPES:
+            raise ValueError(f"Unsupported dtype {dtype!r}; expected one of {_DTYPES}")
+        if projection == "achlioptas":
+            _require_numpy()
         self._expansion = expansion_factor
         self._sparsity = sparsity
         self._seed = seed
-        self._projection: list[list[float]] | None = None
-
-    def _init_projection(self, input_dim: int) -> list[list[float]]:
-        """Initialize random projection matrix (PN → KC mapping).
+        self._kind: Projection = projection
+        self._dtype = dtype_name
+        self._projection: np.ndarray | None = None
 
-        Uses deterministic pseudo-random for reproducibility.
-        """
-        import random
-
-        rng = random.Random(self._seed)
-        output_dim = input_dim * self._expansion
-        # Xavier-like initialization
-        scale = math.sqrt(2.0 / (input_dim + output_dim))
-        return [[rng.gauss(0, scale) for _ in range(input_dim)] for _ in range(output_dim)]
+    def _get_projection(self, input_dim: int) -> np.ndarray:
+        if self._projection is None or self._projection.shape[1] != input_dim:
+            self._projection = _projection_matrix(
+                self._seed, input_dim, input_dim * self._expansion, self._kind, self._dtype
+            )
+        return self._projection
 
-    def encode(self, embedding: list[float]) -> list[float]:
-        """Expand and sparsify an embedding.
+    def encode_many(self, matrix: np.ndarray | list[list[float]]) -> np.ndarray:
+        """Expand and sparsify a batch of embeddings, shape (n, d) → (n, d·expansion).
 
         1. Project to higher dimension (PN → KC expansion)
         2. Apply APL global inhibition (top-k sparsity)
+        3. L2 normalize each row
         """
-        input_dim = len(embedding)
-        if input_dim == 0:
-            return []
+        _require_numpy()
+        x = np.asarray(matrix, dtype=self._dtype)
+        if x.ndim != 2:
+            raise ValueError(f"encode_many expects a 2-D matrix, got shape {x.shape}")
+        if x.shape[1] == 0:
+            return np.zeros((x.shape[0], 0), dtype=self._dtype)
+
+        # Matrix multiply (expansion) + ReLU activation
+        expanded = x @ self._get_projection(x.shape[1]).T
+        np.maximum(expanded, 0.0, out=expanded)
+
+        # APL Global Inhibition: keep values >= the k-th largest (ties survive)
+        output_dim = expanded.shape[1]
+        k = max(1, int(output_dim * self._sparsity))
+        if k < output_dim:
+            threshold = np.partition(expanded, output_dim - k, axis=1)[:, output_dim - k]
+            expanded[expanded < threshold[:, None]] = 0.0
 
-        # Lazy init projection matrix
-        if self._projection is None or len(self._projection[0]) != input_dim:
-            self._projection = self._init_projection(input_dim)
+        # L2 normalize the sparse vectors
+        norms = np.sqrt(np.einsum("ij,ij->i", expanded, expanded))
+        np.divide(expanded, norms[:, None], out=expanded, where=norms[:, None] > 0)
+        return expanded
 
-        output_dim = input_dim * self._expansion
+    def encode(self, embedding: list[float]) -> list[float]:
+        """Expand and sparsify one embedding (see ``encode_many``)."""
+        if len(embedding) == 0:
+            return []
+        if np is None:
+            return self._encode_pure(list(embedding))
+        return self.encode_many([embedding])[0].tolist()
+
+    def _encode_pure(self, embedding: list[float]) -> list[float]:
+        """The original pure-Python encoder, for installs without numpy."""
+        input_dim = len(embedding)
+        projection = _projection_rows(self._seed, input_dim, input_dim * self._expansion)
 
-        # Matrix-vector multiply (expansion)
+        # Matrix-vector multiply (expansion) + ReLU activation
         expanded = [
-            sum(w * x for w, x in zip(row, embedding, strict=True)) for row in self._projection
+            max(0.0, sum(w * x for w, x in zip(row, embedding, strict=True))) for row in projection
         ]
 
-        # ReLU activation
-        expanded = [max(0.0, v) for v in expanded]
-
-        # APL Global Inhibition: keep only top k% active
-        k = max(1, int(output_dim * self._sparsity))
-        if k < output_dim:
-            # Find k-th largest value
-            sorted_vals = sorted(expanded, reverse=True)
-            threshold = sorted_vals[k - 1] if k <= len(sorted_vals) else 0.0
-
-            # Zero out everything below threshold
+        # APL Global Inhibition: keep values >= the k-th largest (ties survive)
+        k = max(1, int(len(expanded) * self._sparsity))
+        if k < len(expanded):
+            threshold = sorted(expanded, reverse=True)[k - 1]
             expanded = [v if v >= threshold else 0.0 for v in expanded]
 
         # L2 normalize the sparse vector
         norm = math.sqrt(sum(v * v for v in expanded))
-        if norm > 0:
-            expanded = [v / norm for v in expanded]
+        return [v / norm for v in expanded] if norm > 0 else expanded
 
-        return expanded
+    def encode_sparse(self, embedding: list[float] | np.ndarray) -> SparseCode:
+        """``encode`` as active indices + values instead of a dense vector."""
+        _require_numpy()
+        dense = self.encode_many(np.asarray(embedding, dtype=self._dtype)[None, :])[0]
+        indices = np.flatnonzero(dense).astype(np.int32)
+        return SparseCode(indices, dense[indices], dense.shape[0])
 
-    def compute_sparsity_ratio(self, sparse_vec: list[float]) -> float:
+    def compute_sparsity_ratio(self, sparse_vec: list[float] | np.ndarray) -> float:
         """Compute actual sparsity of an encoded vector."""
-        if not sparse_vec:
+        if len(sparse_vec) == 0:
             return 1.0
-        active = sum(1 for v in sparse_vec if v > 0.0)
+        if np is None:
+            active = sum(1 for v in sparse_vec if v > 0.0)
+        else:
+            active = int(np.count_nonzero(np.asarray(sparse_vec) > 0.0))
         return 1.0 - (active / len(sparse_vec))
@@ -88,7 +88,9 @@ def time_travel_filter(
     """Build SQL WHERE clause to reconstruct fact state at a specific transaction.
 
     Returns facts whose ``tx_id`` is at or before the target transaction
-    and that had not yet been deprecated at that point.
+    and that had not yet been deprecated at that point. Engine queries use
+    :func:`babylon60.memory.time_travel.live_fact_ids`, which answers the
+    same question from checkpoints.
 
     Args:
         tx_id: Transaction ID to travel to.
@@ -111,11 +113,8 @@ def time_travel_filter(
         prefix = ""
 
     return (
-        f"json_extract({prefix}metadata, '$.tx_id') <= ? AND ("  # nosec B608
-        f"{prefix}is_tombstoned = 0 OR "
-        f"json_extract({prefix}metadata, '$.valid_until') > "
-        "(SELECT timestamp FROM transactions WHERE id = ?) OR "
-        f"json_extract({prefix}metadata, '$.tombstoned_at') > "
+        f"{prefix}tx_id <= ? AND ("  # nosec B608
+        f"{prefix}valid_until IS NULL OR {prefix}valid_until > "
         "(SELECT timestamp FROM transactions WHERE id = ?))",
-        [tx_id, tx_id, tx_id],
+        [tx_id, tx_id],
     )
@@ -0,0 +1,200 @@
+# [C5-REAL] Exergy-Maximized
+"""Point-in-time fact sets from materialized checkpoints plus delta replay.
+
+A fact is live at transaction ``T`` when ``tx_id <= T`` and it had not been
+deprecated by T's timestamp (``valid_until`` NULL or later). Going from the
+nearest checkpoint ``C <= T`` to ``T`` only touches the facts that changed
+in between:
+
+* births: ``C < tx_id <= T`` that survive to T (``idx_facts_tenant_tx``)
+* deaths: ``time(C) < valid_until <= time(T)`` (``idx_facts_tenant_valid``)
+
+Checkpoints are fact-id bitmaps in ``fact_state_checkpoints``, written when
+a query lands ``checkpoint_every`` or more tenant transactions past the
+nearest one. The schema triggers delete checkpoints that a history rewrite
+would invalidate.
+
+The live set is a numpy boolean array indexed by fact id, or a ``bytearray``
+of 0/1 flags when numpy (the optional ``compute`` extra) is missing; both
+encode to the same checkpoint bytes.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+import zlib
+from typing import Any
+
+from babylon60.database.core import causal_write
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via subprocess import test
+    np = None
+
+__all__ = ["decode_fact_bitmap", "encode_fact_bitmap", "live_fact_bitmap", "live_fact_ids"]
+
+logger = logging.getLogger("babylon60.memory.time_travel")
+
+_TX_TIME = "SELECT timestamp FROM transactions WHERE id = ? AND tenant_id = ?"
+_NEAREST = (
+    "SELECT tx_id, tx_time, bitmap FROM fact_state_checkpoints "
+    "WHERE tenant_id = ? AND tx_id <= ? ORDER BY tx_id DESC LIMIT 1"
+)
+_BORN = (
+    "SELECT id FROM facts WHERE tenant_id = ? AND tx_id > ? AND tx_id <= ? "
+    "AND (valid_until IS NULL OR valid_until > ?)"
+)
+_DIED = "SELECT id FROM facts WHERE tenant_id = ? AND valid_until > ? AND valid_until <= ?"
+_TX_SPAN = "SELECT COUNT(*) FROM transactions WHERE tenant_id = ? AND id > ? AND id <= ?"
+_SAVE = (
+    "INSERT OR REPLACE INTO fact_state_checkpoints "
+    "(tenant_id, tx_id, tx_time, fact_count, bitmap) VALUES (?, ?, ?, ?, ?)"
+)
+
+
+# Byte value -> its eight LSB-first bits as 0/1 bytes (pure-Python decode).
+_UNPACKED = [bytes((b >> k) & 1 for k in range(8)) for b in range(256)]
+
+
+def encode_fact_bitmap(live: np.ndarray | bytearray) -> bytes:
+    """zlib-compressed, LSB-first bitmap of a boolean array indexed by fact id."""
+    if np is not None:
+        return zlib.compress(np.packbits(np.asarray(live, dtype=bool), bitorder="little").tobytes())
+    packed = bytearray((len(live) + 7) // 8)
+    for i in _nonzero(live):
+        packed[i >> 3] |= 1 << (i & 7)
+    return zlib.compress(bytes(packed))
+
+
+def decode_fact_bitmap(blob: bytes) -> np.ndarray | bytearray:
+    if np is None:
+        return bytearray(b"".join(_UNPACKED[b] for b in zlib.decompress(blob)))
+    packed = np.frombuffer(zlib.decompress(blob), dtype=np.uint8)
+    return np.unpackbits(packed, bitorder="little").astype(bool)
+
+
+def _empty() -> np.ndarray | bytearray:
+    return bytearray() if np is None else np.zeros(0, dtype=bool)
+
+
+def _nonzero(live: np.ndarray | bytearray) -> np.ndarray | list[int]:
+    if np is None:
+        return [i for i, flag in enumerate(live) if flag]
+    return np.flatnonzero(live)
+
+
+async def _ids(conn: Any, sql: str, params: tuple) -> np.ndarray | list[int]:
+    async with conn.execute(sql, params) as cursor:
+        rows = await cursor.fetchall()
+    if np is None:
+        return [row[0] for row in rows]
+    return np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+
+
+def _set(
+    live: np.ndarray | bytearray, ids: np.ndarray | list[int], value: bool
+) -> np.ndarray | bytearray:
+    """Set ``live[ids] = value``; grows ``live`` for births, ignores unknown deaths."""
+    if not len(ids):
+        return live
+    if not value:
+        ids = [i for i in ids if i < len(live)] if np is None else ids[ids < len(live)]
+    elif (top := int(max(ids))) >= len(live):
+        if np is None:
+            live.extend(bytes(top + 1 - len(live)))
+        else:
+            live = np.concatenate([live, np.zeros(top + 1 - len(live), dtype=bool)])
+    if np is None:
+        for i in ids:
+            live[i] = value
+    else:
+        live[ids] = value
+    return live
+
+
+async def live_fact_ids(
+    conn: Any,
+    tenant_id: str,
+    tx_id: int,
+    *,
+    checkpoint_every: int = 0,
+) -> np.ndarray | list[int]:
+    """Ascending ids of the tenant's facts live at ``tx_id``.
+
+    Raises:
+        ValueError: If the transaction does not exist for the tenant.
+    """
+    live = await live_fact_bitmap(conn, tenant_id, tx_id, checkpoint_every=checkpoint_every)
+    return _nonzero(live)
+
+
+async def live_fact_bitmap(
+    conn: Any,
+    tenant_id: str,
+    tx_id: int,
+    *,
+    checkpoint_every: int = 0,
+) -> np.ndarray | bytearray:
+    """The tenant's live set at ``tx_id``: ``live[fact_id]`` is truthy for live facts.
+
+    Ids past the end of the sequence are not live.
+
+    Raises:
+        ValueError: If the transaction does not exist for the tenant.
+    """
+    # One read snapshot for the whole replay, so a checkpoint written from
+    # it is consistent; the write fails (and is skipped) if another writer
+    # committed in the meantime.
+    own_txn = bool(checkpoint_every) and not conn.in_transaction
+    if own_txn:
+        await conn.execute("BEGIN")
+    try:
+        async with conn.execute(_TX_TIME, (tx_id, tenant_id)) as cursor:
+            tx = await cursor.fetchone()
+        if not tx:
+            raise ValueError(f"Transaction {tx_id} not found for tenant {tenant_id}")
+        tx_time = tx[0]
+
+        try:
+            async with conn.execute(_NEAREST, (tenant_id, tx_id)) as cursor:
+                base = await cursor.fetchone()
+        except sqlite3.OperationalError:
+            base, checkpoint_every = None, 0  # Pre-033 schema: replay from scratch.
+        if base:
+            base_tx, base_time = base[0], base[1]
+            live = decode_fact_bitmap(base[2])
+        else:
+            base_tx, base_time, live = 0, None, _empty()
+
+        if base_tx < tx_id:
+            if base_time is not None:
+                died = await _ids(conn, _DIED, (tenant_id, base_time, tx_time))
+                live = _set(live, died, False)
+            born = await _ids(conn, _BORN, (tenant_id, base_tx, tx_id, tx_time))
+            live = _set(live, born, True)
+
+            if own_txn and checkpoint_every:
+                async with conn.execute(_TX_SPAN, (tenant_id, base_tx, tx_id)) as cursor:
+                    span = (await cursor.fetchone())[0]
+                if span >= checkpoint_every:
+                    await _save(conn, tenant_id, tx_id, tx_time, live)
+    finally:
+        if own_txn and conn.in_transaction:
+            await conn.rollback()
+
+    return live
+
+
+async def _save(
+    conn: Any, tenant_id: str, tx_id: int, tx_time: str, live: np.ndarray | bytearray
+) -> None:
+    count = live.count(1) if np is None else int(live.sum())
+    try:
+        with causal_write(conn):
+            await conn.execute(_SAVE, (tenant_id, tx_id, tx_time, count, encode_fact_bitmap(live)))
+            await conn.commit()
+    except sqlite3.Error as e:
+        # Read-only pool connection, or a writer committed since our snapshot.
+        logger.debug("Skipped time-travel checkpoint at tx %d: %s", tx_id, e)
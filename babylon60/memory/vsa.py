@@ -1,17 +1,29 @@
 # [C5-REAL] Exergy-Maximized
-"""CORTEX VSA-SDM v7.1 - Zero-Dependency Sovereign Memory Substrate.
-Pure Python implementation of Vector Symbolic Architecture (VSA) with
-Sparse Distributed Memory (SDM) for algebraic context collapse.
+"""CORTEX VSA-SDM v7.2 - Bit-Packed Sovereign Memory Substrate.
+Vector Symbolic Architecture (VSA) with Sparse Distributed Memory (SDM)
+for algebraic context collapse.
 Replaces RAG with deterministic algebraic operations:
 - MAP-B binary hypervectors (XOR bind, majority bundle)
 - Kanerva SDM with sparse activation for O(1) recall
 - Ebbinghaus temporal decay for memory consolidation
 - SHA-256 persistence for sovereign audit trail
-Law Ω₀: Zero external dependencies. Pure Python list comprehensions.
+Hypervectors are stored packed, 64 bits per ``np.uint64`` word (10k dims →
+157 words / 1.25 KB). Binding is a vectorized XOR, bundling uses bit-sliced
+counters and Hamming distance is popcount over XOR, batched across whole
+address / record matrices. The ``list[int]`` functions remain as a
+compatibility shim over the packed kernels.
+
+Without numpy (the optional ``compute`` extra) a packed hypervector is a
+plain Python ``int`` holding the same bits: XOR binds, ``int.bit_count``
+gives the Hamming distance, the bit-sliced bundle runs unchanged and the
+on-disk bytes are identical. Only the SDM hard-location addresses come from
+a different generator; they are never persisted, so either backend can load
+the other's ``.vsa`` files.
 """
 
 from __future__ import annotations
 
+import base64
 import json
 import logging
 import os
@@ -19,19 +31,164 @@ import random
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from babylon60.crypto.hash_registry import cortex_hash, cortex_hash_truncated
 
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised via subprocess import test
+    np = None
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    PackedHV = NDArray[np.uint64] | int
+else:
+    PackedHV = Any
+
 logger = logging.getLogger("babylon60.memory.vsa")
 # ── Constants ────────────────────────────────────────────────────────
 DIMENSION = 10_000  # Hypervector dimensionality
 SDM_LOCATIONS = 1000  # Kanerva hard locations
 SDM_ACTIVATION_RADIUS = 450  # Hamming distance threshold (~45%)
+SDM_ADDRESS_SEED = 7919  # Deterministic hard-location address space
 PERSISTENCE_DIR = os.path.expanduser("~/.cortex/memory/vsa")
+PACKED_FORMAT = "u64le-b64"  # On-disk encoding of packed record vectors
+WORD_BITS = 64
+
+
+# ── Packed Kernels ───────────────────────────────────────────────────
+def num_words(dim: int) -> int:
+    """Number of uint64 words needed to hold ``dim`` bits."""
+    return (dim + WORD_BITS - 1) // WORD_BITS
+
+
+def _tail_mask(dim: int) -> PackedHV:
+    """Word mask with padding bits beyond ``dim`` cleared."""
+    if np is None:
+        return (1 << dim) - 1
+    mask = np.full(num_words(dim), np.iinfo(np.uint64).max, dtype=np.uint64)
+    rem = dim % WORD_BITS
+    if rem:
+        mask[-1] = np.uint64((1 << rem) - 1)
+    return mask
+
 
+def _zeros(dim: int) -> PackedHV:
+    """All-zero packed hypervector."""
+    return 0 if np is None else np.zeros(num_words(dim), dtype=np.uint64)
 
-# ── MAP-B Algebra ────────────────────────────────────────────────────
+
+def _to_bytes(words: PackedHV, dim: int) -> bytes:
+    """Little-endian uint64 bytes of a packed hypervector (the on-disk layout)."""
+    if np is None:
+        return words.to_bytes(num_words(dim) * 8, "little")
+    return np.ascontiguousarray(words, dtype="<u8").tobytes()
+
+
+def _from_bytes(raw: bytes, dim: int) -> PackedHV:
+    """Inverse of ``_to_bytes``."""
+    size = num_words(dim) * 8
+    if np is None:
+        return int.from_bytes(raw[:size], "little")
+    return np.frombuffer(raw, dtype="<u8", count=size // 8).astype(np.uint64)
+
+
+def pack(bits: Any) -> PackedHV:
+    """Pack a {0, 1} vector (or a matrix of row vectors) into uint64 words.
+
+    Bit ``i`` lives in word ``i // 64`` at position ``i % 64``; padding bits
+    in the last word are always zero.
+    """
+    if np is None:
+        if bits and isinstance(bits[0], (list, tuple)):
+            return [pack(row) for row in bits]
+        return int("".join("1" if b else "0" for b in reversed(bits)) or "0", 2)
+    arr = np.asarray(bits, dtype=np.uint8)
+    packed = np.packbits(arr, axis=-1, bitorder="little")
+    pad = (-packed.shape[-1]) % 8
+    if pad:
+        packed = np.pad(packed, [(0, 0)] * (packed.ndim - 1) + [(0, pad)])
+    return np.ascontiguousarray(packed).view("<u8").astype(np.uint64, copy=False)
+
+
+def unpack(words: PackedHV, dim: int) -> list[int]:
+    """Unpack uint64 words back into a ``list[int]`` of length ``dim``."""
+    if np is None:
+        return [int(c) for c in reversed(format(words, f"0{dim}b"))] if dim else []
+    raw = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, count=dim, bitorder="little").tolist()
+
+
+def popcount(words: PackedHV) -> Any:
+    """Per-row popcount of packed words (sums over the last axis)."""
+    if np is None:
+        if isinstance(words, int):
+            return words.bit_count()
+        return [row.bit_count() for row in words]
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(words).sum(axis=-1, dtype=np.int64)
+    raw = np.ascontiguousarray(words, dtype="<u8").view(np.uint8)
+    return np.unpackbits(raw, axis=-1).sum(axis=-1, dtype=np.int64)
+
+
+def bind_packed(a: PackedHV, b: PackedHV) -> PackedHV:
+    """Vectorized XOR binding on packed hypervectors."""
+    return a ^ b
+
+
+def hamming_packed(a: PackedHV, b: PackedHV) -> int:
+    """Hamming distance between two packed hypervectors."""
+    return int(popcount(a ^ b))
+
+
+def hamming_many(query: PackedHV, matrix: PackedHV) -> Any:
+    """Hamming distance from ``query`` to every row of ``matrix`` in one call."""
+    if np is None:
+        return [(row ^ query).bit_count() for row in matrix]
+    return popcount(np.bitwise_xor(matrix, query))
+
+
+def bundle_packed(vectors: PackedHV, dim: int) -> PackedHV:
+    """Majority bundle over a ``(n, words)`` matrix via bit-sliced counters.
+
+    Each bit position keeps a ripple-carry counter spread across
+    ``n.bit_length()`` bit planes, so the whole bundle costs O(n log n)
+    word-wide XOR/AND operations instead of ``n * dim`` scalar additions.
+    Ties (even ``n``) are broken with random bits, matching ``bundle``.
+    """
+    n = len(vectors)
+    if n == 0:
+        return _zeros(dim)
+    if n == 1:
+        return vectors[0] if np is None else np.array(vectors[0], dtype=np.uint64)
+    planes = [_zeros(dim) for _ in range(n.bit_length())]
+    for row in vectors:
+        carry = row
+        for i, plane in enumerate(planes):
+            planes[i] = plane ^ carry
+            carry = plane & carry
+            if not (carry if np is None else carry.any()):
+                break
+    # Bit-sliced comparison of every counter against k = n // 2 (MSB first).
+    k = n // 2
+    gt = _zeros(dim)
+    eq = _tail_mask(dim)
+    for i in reversed(range(len(planes))):
+        if (k >> i) & 1:
+            eq &= planes[i]
+        else:
+            gt |= eq & planes[i]
+            eq &= ~planes[i]
+    result = gt
+    if n % 2 == 0:
+        ties = _from_bytes(random.randbytes(num_words(dim) * 8), dim)
+        result = gt | (eq & ties)
+    return result & _tail_mask(dim)
+
+
+# ── MAP-B Algebra (list[int] compatibility shim) ─────────────────────
 def random_bipolar(dim: int = DIMENSION, seed: int | None = None) -> list[int]:
     """Generate a random binary hypervector {0, 1}^D."""
     rng = random.Random(seed)
@@ -40,7 +197,8 @@ def random_bipolar(dim: int = DIMENSION, seed: int | None = None) -> list[int]:
 
 def bind(a: list[int], b: list[int]) -> list[int]:
     """XOR binding - exact self-inverse: bind(bind(a, b), b) == a."""
-    return [x ^ y for x, y in zip(a, b, strict=False)]
+    dim = min(len(a), len(b))
+    return unpack(bind_packed(pack(a[:dim]), pack(b[:dim])), dim)
 
 
 def bundle(vectors: list[list[int]]) -> list[int]:
@@ -51,17 +209,15 @@ def bundle(vectors: list[list[int]]) -> list[int]:
     if n == 1:
         return list(vectors[0])
     dim = len(vectors[0])
-    result = [0] * dim
-    threshold = n / 2
-    for i in range(dim):
-        total = sum(v[i] for v in vectors)
-        result[i] = 1 if total > threshold else (0 if total < threshold else random.randint(0, 1))
-    return result
+    return unpack(bundle_packed(pack(vectors), dim), dim)
 
 
 def hamming_distance(a: list[int], b: list[int]) -> int:
     """Hamming distance between two binary vectors."""
-    return sum(x ^ y for x, y in zip(a, b, strict=False))
+    dim = min(len(a), len(b))
+    if dim == 0:
+        return 0
+    return hamming_packed(pack(a[:dim]), pack(b[:dim]))
 
 
 def cosine_similarity(a: list[int], b: list[int]) -> float:
@@ -70,7 +226,7 @@ def cosine_similarity(a: list[int], b: list[int]) -> float:
     if dim == 0:
         return 0.0
     # Fast computation derived from Hamming distance: dot = dim - 2 * dist
-    dist = sum(x ^ y for x, y in zip(a, b, strict=False))
+    dist = hamming_distance(a, b)
     return (dim - 2 * dist) / dim
 
 
@@ -81,12 +237,16 @@ class TextEncoder:
     1. Each character → deterministic random HV (seeded by char code)
     2. N-gram = rotated bind of consecutive char HVs
     3. Document = bundle of all n-gram HVs
+    Rotated character HVs are packed once and cached per (char, shift), so
+    encoding a document is a gather + XOR over the n-gram matrix followed by
+    a single bit-sliced bundle.
     """
 
     def __init__(self, dim: int = DIMENSION, ngram_size: int = 3):
         self._dim = dim
         self._n = ngram_size
         self._char_cache: dict[str, list[int]] = {}
+        self._packed_cache: dict[tuple[str, int], PackedHV] = {}
 
     def _char_hv(self, c: str) -> list[int]:
         """Get deterministic HV for a character."""
@@ -94,6 +254,15 @@ class TextEncoder:
             self._char_cache[c] = random_bipolar(self._dim, seed=ord(c) + 42)
         return self._char_cache[c]
 
+    def _char_packed(self, c: str, shift: int = 0) -> PackedHV:
+        """Packed HV for a character, circularly rotated by ``shift``."""
+        key = (c, shift)
+        cached = self._packed_cache.get(key)
+        if cached is None:
+            cached = pack(self._rotate(self._char_hv(c), shift))
+            self._packed_cache[key] = cached
+        return cached
+
     @staticmethod
     def _rotate(v: list[int], positions: int = 1) -> list[int]:
         """Circular rotation for positional encoding."""
@@ -102,30 +271,43 @@ class TextEncoder:
         p = positions % len(v)
         return v[-p:] + v[:-p]
 
-    def encode(self, text: str) -> list[int]:
-        """Encode text into a single hypervector."""
+    def encode_packed(self, text: str) -> PackedHV:
+        """Encode text into a single packed hypervector."""
         text = text.lower().strip()
         if not text:
-            return [0] * self._dim
-        # Generate n-gram HVs
-        ngram_hvs = []
-        for i in range(len(text) - self._n + 1):
-            gram = text[i : i + self._n]
-            # Bind with positional rotation
-            hv = self._char_hv(gram[0])
-            for j in range(1, len(gram)):
-                rotated = self._rotate(self._char_hv(gram[j]), j)
-                hv = bind(hv, rotated)
-            ngram_hvs.append(hv)
-        if not ngram_hvs:
-            return self._char_hv(text[0])
-        return bundle(ngram_hvs)
+            return _zeros(self._dim)
+        count = len(text) - self._n + 1
+        if count <= 0:
+            packed = self._char_packed(text[0])
+            return packed if np is None else packed.copy()
+        # Bind with positional rotation: gram = c0 ^ rot(c1, 1) ^ rot(c2, 2) ...
+        if np is None:
+            grams = []
+            for i in range(count):
+                hv = 0
+                for j in range(self._n):
+                    hv ^= self._char_packed(text[i + j], j)
+                grams.append(hv)
+            return bundle_packed(grams, self._dim)
+        chars = sorted(set(text))
+        slot = {c: i for i, c in enumerate(chars)}
+        codes = np.fromiter((slot[c] for c in text), dtype=np.intp, count=len(text))
+        ngram_hvs = None
+        for j in range(self._n):
+            table = np.stack([self._char_packed(c, j) for c in chars])
+            layer = table[codes[j : j + count]]
+            ngram_hvs = layer if ngram_hvs is None else np.bitwise_xor(ngram_hvs, layer)
+        return bundle_packed(ngram_hvs, self._dim)
+
+    def encode(self, text: str) -> list[int]:
+        """Encode text into a single hypervector."""
+        return unpack(self.encode_packed(text), self._dim)
 
 
 # ── Kanerva SDM ──────────────────────────────────────────────────────
 @dataclass
 class SDMLocation:
-    """A hard location in Kanerva SDM."""
+    """Snapshot of a hard location in Kanerva SDM (see ``KanervaSDM.location``)."""
 
     address: list[int]
     counters: list[int] = field(default_factory=list)
@@ -144,6 +326,10 @@ class KanervaSDM:
     - Write: increment counters at all locations within activation radius
     - Read: sum counters from activated locations, threshold to binary
     - Capacity: SNR model - sqrt(D/N) items per location
+    Addresses are a packed ``(N, words)`` uint64 matrix so activation is a
+    single batched Hamming distance; counters are an ``(N, D)`` int32 matrix
+    allocated on the first write. Without numpy, addresses are ``int`` rows
+    and counter lists are allocated per location on its first write.
     """
 
     def __init__(
@@ -155,87 +341,145 @@ class KanervaSDM:
         self._dim = dim
         self._num_locations = num_locations
         self._radius = activation_radius
-        self._locations: list[SDMLocation] = []
+        self._addresses: PackedHV | None = None
+        self._counters: Any = None
+        self._write_counts: Any = None
+        self._last_writes: Any = None
         self._initialized = False
 
     def initialize(self) -> None:
         """Generate random hard locations."""
         if self._initialized:
             return
-        self._locations = [
-            SDMLocation(address=random_bipolar(self._dim, seed=i * 7919))
-            for i in range(self._num_locations)
-        ]
+        if np is None:
+            rng = random.Random(SDM_ADDRESS_SEED)
+            self._addresses = [rng.getrandbits(self._dim) for _ in range(self._num_locations)]
+            self._counters = {}
+            self._write_counts = [0] * self._num_locations
+            self._last_writes = [0.0] * self._num_locations
+        else:
+            words = num_words(self._dim)
+            rng = np.random.default_rng(SDM_ADDRESS_SEED)
+            raw = rng.bytes(self._num_locations * words * 8)
+            addresses = np.frombuffer(raw, dtype="<u8").astype(np.uint64)
+            self._addresses = addresses.reshape(self._num_locations, words) & _tail_mask(self._dim)
+            self._write_counts = np.zeros(self._num_locations, dtype=np.int64)
+            self._last_writes = np.zeros(self._num_locations, dtype=np.float64)
         self._initialized = True
         logger.debug("[SDM] Initialized %d hard locations (D=%d)", self._num_locations, self._dim)
 
-    def _activated_locations(self, address: list[int]) -> list[int]:
-        """Find indices of locations within activation radius."""
+    def _activated(self, address: PackedHV) -> Any:
+        """Indices of locations within activation radius (one batched popcount)."""
         if not self._initialized:
             self.initialize()
-        activated = []
-        for i, loc in enumerate(self._locations):
-            dist = hamming_distance(address, loc.address)
-            if dist <= self._radius:
-                activated.append(i)
-        return activated
+        dists = hamming_many(address, self._addresses)
+        if np is None:
+            return [i for i, dist in enumerate(dists) if dist <= self._radius]
+        return np.flatnonzero(dists <= self._radius)
 
-    def write(self, address: list[int], data: list[int]) -> int:
-        """Write data vector to all activated locations.
+    def _activated_locations(self, address: list[int]) -> list[int]:
+        """Find indices of locations within activation radius."""
+        activated = self._activated(pack(address))
+        return activated if np is None else activated.tolist()
+
+    def write_packed(self, address: PackedHV, data: PackedHV) -> int:
+        """Write packed data to all activated locations.
         Returns number of activated locations.
         """
-        if not self._initialized:
-            self.initialize()
-        activated = self._activated_locations(address)
-        now = time.monotonic()
-        for idx in activated:
-            loc = self._locations[idx]
-            for j in range(self._dim):
-                # Map binary to bipolar for counter update
-                val = 2 * data[j] - 1  # 0→-1, 1→+1
-                loc.counters[j] += val
-            loc.write_count += 1
-            loc.last_write = now
+        activated = self._activated(address)
+        if np is None:
+            deltas = [2 * b - 1 for b in unpack(data, self._dim)]
+            now = time.monotonic()
+            for idx in activated:
+                row = self._counters.get(idx)
+                if row is None:
+                    self._counters[idx] = list(deltas)
+                else:
+                    row[:] = [c + d for c, d in zip(row, deltas, strict=True)]
+                self._write_counts[idx] += 1
+                self._last_writes[idx] = now
+        elif activated.size:
+            if self._counters is None:
+                self._counters = np.zeros((self._num_locations, self._dim), dtype=np.int32)
+            raw = np.ascontiguousarray(data, dtype="<u8").view(np.uint8)
+            bits = np.unpackbits(raw, count=self._dim, bitorder="little")
+            # Map binary to bipolar for counter update: 0→-1, 1→+1
+            self._counters[activated] += 2 * bits.astype(np.int32) - 1
+            self._write_counts[activated] += 1
+            self._last_writes[activated] = time.monotonic()
         logger.debug("[SDM] Write activated %d/%d locations", len(activated), self._num_locations)
         return len(activated)
 
+    def read_packed(self, address: PackedHV) -> PackedHV:
+        """Read from all activated locations and threshold to a packed vector."""
+        activated = self._activated(address)
+        if np is None:
+            rows = [self._counters[idx] for idx in activated if idx in self._counters]
+            if not rows:
+                return 0
+            return pack([sum(col) > 0 for col in zip(*rows, strict=True)])
+        if not activated.size or self._counters is None:
+            return _zeros(self._dim)
+        sums = self._counters[activated].sum(axis=0, dtype=np.int64)
+        return pack(sums > 0)
+
+    def write(self, address: list[int], data: list[int]) -> int:
+        """Write data vector to all activated locations.
+        Returns number of activated locations.
+        """
+        return self.write_packed(pack(address), pack(data))
+
     def read(self, address: list[int]) -> list[int]:
         """Read from all activated locations and threshold.
         Returns the reconstructed binary vector.
         """
+        return unpack(self.read_packed(pack(address)), self._dim)
+
+    def location(self, index: int) -> SDMLocation:
+        """Materialize hard location ``index`` as a list-based snapshot."""
         if not self._initialized:
             self.initialize()
-        activated = self._activated_locations(address)
-        if not activated:
-            return [0] * self._dim
-        # Sum counters across activated locations
-        sums = [0] * self._dim
-        for idx in activated:
-            for j in range(self._dim):
-                sums[j] += self._locations[idx].counters[j]
-        # Threshold to binary
-        return [1 if s > 0 else 0 for s in sums]
+        if np is None:
+            counters = list(self._counters.get(index, [0] * self._dim))
+        elif self._counters is not None:
+            counters = self._counters[index].tolist()
+        else:
+            counters = [0] * self._dim
+        return SDMLocation(
+            address=unpack(self._addresses[index], self._dim),
+            counters=counters,
+            write_count=int(self._write_counts[index]),
+            last_write=float(self._last_writes[index]),
+        )
 
     def apply_decay(self, rate: float = 0.01) -> int:
         """Ebbinghaus exponential decay on all locations.
         Decays counter magnitudes by rate per cycle.
         Returns number of affected locations.
         """
-        affected = 0
-        for loc in self._locations:
-            if loc.write_count == 0:
-                continue
+        if not self._initialized or self._counters is None:
+            return 0
+        if np is None:
+            decay_factor = 1.0 - rate
+            for row in self._counters.values():
+                row[:] = [int(c * decay_factor) for c in row]
+            return len(self._counters)
+        written = np.flatnonzero(self._write_counts > 0)
+        if written.size:
             decay_factor = 1.0 - rate
-            loc.counters = [int(c * decay_factor) for c in loc.counters]
-            affected += 1
-        return affected
+            # astype truncates toward zero, like int(c * decay_factor)
+            self._counters[written] = (self._counters[written] * decay_factor).astype(np.int32)
+        return int(written.size)
 
     @property
     def stats(self) -> dict[str, Any]:
         """Memory statistics."""
         if not self._initialized:
             return {"initialized": False}
-        active = sum(1 for loc in self._locations if loc.write_count > 0)
+        if np is None:
+            active = sum(1 for count in self._write_counts if count)
+        else:
+            active = int(np.count_nonzero(self._write_counts))
         return {
             "initialized": True,
             "num_locations": self._num_locations,
@@ -252,11 +496,17 @@ class MemoryRecord:
 
     id: str
     content: str
-    vector: list[int]
+    packed: PackedHV
+    dim: int
     timestamp: float = 0.0
     tags: list[str] = field(default_factory=list)
     relevance: float = 1.0
 
+    @property
+    def vector(self) -> list[int]:
+        """Unpacked {0, 1} hypervector (compatibility view)."""
+        return unpack(self.packed, self.dim)
+
 
 class SwarmMemory:
     """Per-agent associative memory with VSA encoding + SDM storage.
@@ -264,7 +514,7 @@ class SwarmMemory:
     - record(): encode text → store in SDM
     - recall(): query by text similarity → ranked results
     - consolidate(): decay + compress stale memories
-    - persist/load(): SHA-256 verified .vsa files
+    - persist/load(): SHA-256 verified .vsa files (packed vectors)
     """
 
     def __init__(self, agent_id: str = "default", dim: int = DIMENSION):
@@ -273,12 +523,38 @@ class SwarmMemory:
         self._encoder = TextEncoder(dim=dim)
         self._sdm = KanervaSDM(dim=dim)
         self._records: dict[str, MemoryRecord] = {}
+        self._matrix: PackedHV | None = None  # Stacked record vectors, rebuilt lazily
+        self._matrix_ids: list[str] = []
         self._persistence_path = Path(PERSISTENCE_DIR) / f"{agent_id}.vsa"
 
     @property
     def agent_id(self) -> str:
         return self._agent_id
 
+    def _store(self, rid: str, content: str, packed: PackedHV, timestamp: float, tags) -> None:
+        self._sdm.write_packed(packed, packed)
+        self._records[rid] = MemoryRecord(
+            id=rid,
+            content=content,
+            packed=packed,
+            dim=self._dim,
+            timestamp=timestamp,
+            tags=tags,
+        )
+        self._matrix = None
+
+    def _record_matrix(self) -> PackedHV:
+        """Stack all record vectors into one ``(R, words)`` matrix."""
+        if self._matrix is None:
+            self._matrix_ids = list(self._records)
+            if np is None:
+                self._matrix = [self._records[rid].packed for rid in self._matrix_ids]
+            elif self._matrix_ids:
+                self._matrix = np.stack([self._records[rid].packed for rid in self._matrix_ids])
+            else:
+                self._matrix = np.zeros((0, num_words(self._dim)), dtype=np.uint64)
+        return self._matrix
+
     def record(
         self,
         content: str,
@@ -289,17 +565,8 @@ class SwarmMemory:
         Returns the record ID.
         """
         rid = record_id or cortex_hash_truncated(content.encode(), length=12)
-        vector = self._encoder.encode(content)
-        # Store in SDM
-        self._sdm.write(vector, vector)
-        # Store metadata
-        self._records[rid] = MemoryRecord(
-            id=rid,
-            content=content,
-            vector=vector,
-            timestamp=time.monotonic(),
-            tags=tags or [],
-        )
+        packed = self._encoder.encode_packed(content)
+        self._store(rid, content, packed, time.monotonic(), tags or [])
         logger.debug("[VSA] Recorded memory %s (%d chars)", rid, len(content))
         return rid
 
@@ -317,22 +584,29 @@ class SwarmMemory:
         Returns:
             List of dicts with id, content, similarity, tags
         """
-        query_vector = self._encoder.encode(query)
-        # Score all records by cosine similarity
-        scored = []
-        for _rid, rec in self._records.items():
-            sim = cosine_similarity(query_vector, rec.vector)
-            if sim >= min_similarity:
-                scored.append((sim, rec))
-        # Sort by similarity descending
-        scored.sort(key=lambda x: x[0], reverse=True)
+        matrix = self._record_matrix()
+        if not self._matrix_ids:
+            return []
+        query_vector = self._encoder.encode_packed(query)
+        # Score all records at once: cosine = (dim - 2 * hamming) / dim
+        dists = hamming_many(query_vector, matrix)
+        # Stable descending sort keeps insertion order for equal scores
+        if np is None:
+            sims = [(self._dim - 2 * dist) / self._dim for dist in dists]
+            candidates = [i for i, sim in enumerate(sims) if sim >= min_similarity]
+            order = sorted(candidates, key=lambda i: -sims[i])[:top_k]
+        else:
+            sims = (self._dim - 2 * dists) / self._dim
+            candidates = np.flatnonzero(sims >= min_similarity)
+            order = candidates[np.argsort(-sims[candidates], kind="stable")][:top_k].tolist()
         results = []
-        for sim, rec in scored[:top_k]:
+        for idx in order:
+            rec = self._records[self._matrix_ids[idx]]
             results.append(
                 {
                     "id": rec.id,
                     "content": rec.content,
-                    "similarity": round(sim, 4),
+                    "similarity": round(float(sims[idx]), 4),
                     "tags": rec.tags,
                     "timestamp": rec.timestamp,
                 }
@@ -345,34 +619,37 @@ class SwarmMemory:
         """
         self._sdm.apply_decay(decay_rate)
         # Prune records with vectors that no longer recall
-        pruned = 0
         dead_ids = []
         for rid, rec in self._records.items():
-            reconstructed = self._sdm.read(rec.vector)
-            sim = cosine_similarity(rec.vector, reconstructed)
+            reconstructed = self._sdm.read_packed(rec.packed)
+            dist = hamming_packed(rec.packed, reconstructed)
+            sim = (self._dim - 2 * dist) / self._dim if self._dim else 0.0
             if sim < 0.01:
                 dead_ids.append(rid)
-                pruned += 1
         for rid in dead_ids:
             del self._records[rid]
+        pruned = len(dead_ids)
         if pruned:
+            self._matrix = None
             logger.info("[VSA] Consolidated: pruned %d dead memories", pruned)
         return pruned
 
     def persist(self) -> str:
         """Save memory state to disk with SHA-256 integrity hash.
+        Record vectors are stored packed (little-endian uint64, base64).
         Returns the integrity hash.
         """
         self._persistence_path.parent.mkdir(parents=True, exist_ok=True)
-        # Serialize records (without vectors - too large)
         data = {
             "agent_id": self._agent_id,
             "dimension": self._dim,
+            "vector_format": PACKED_FORMAT,
             "records": {
                 rid: {
                     "content": rec.content,
                     "timestamp": rec.timestamp,
                     "tags": rec.tags,
+                    "vector": base64.b64encode(_to_bytes(rec.packed, self._dim)).decode("ascii"),
                 }
                 for rid, rec in self._records.items()
             },
@@ -393,24 +670,32 @@ class SwarmMemory:
         return integrity_hash
 
     def load(self) -> int:
-        """Load memory state from disk and re-encode vectors.
+        """Load memory state from disk.
+        Packed vectors are decoded directly; files written before the packed
+        format (or with a different dimension) are re-encoded from content.
         Returns number of records loaded.
         """
         if not self._persistence_path.exists():
             return 0
         with open(self._persistence_path, encoding="utf-8") as f:
             data = json.load(f)
+        packed_ok = (
+            data.get("vector_format") == PACKED_FORMAT and data.get("dimension") == self._dim
+        )
         count = 0
         for rid, rec_data in data.get("records", {}).items():
             content = rec_data["content"]
-            vector = self._encoder.encode(content)
-            self._sdm.write(vector, vector)
-            self._records[rid] = MemoryRecord(
-                id=rid,
-                content=content,
-                vector=vector,
-                timestamp=rec_data.get("timestamp", 0),
-                tags=rec_data.get("tags", []),
+            encoded = rec_data.get("vector") if packed_ok else None
+            if encoded:
+                packed = _from_bytes(base64.b64decode(encoded), self._dim)
+            else:
+                packed = self._encoder.encode_packed(content)
+            self._store(
+                rid,
+                content,
+                packed,
+                rec_data.get("timestamp", 0),
+                rec_data.get("tags", []),
             )
             count += 1
         logger.info("[VSA] Loaded %d memories from %s", count, self._persistence_path)
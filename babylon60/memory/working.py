@@ -7,14 +7,18 @@
 """L1 Working Memory (Sliding Window).
 
 Volatile, token-budgeted buffer that retains the N most recent
-interaction events. When the budget overflows, oldest events are
-evicted and returned for compression into L2 (Episodic Vector Store).
+interaction events. When the budget overflows, the lowest-priority
+events are evicted and returned for compression into L2 (Episodic
+Vector Store). Each tenant keeps a min-heap of eviction keys computed
+once at insert, so an eviction step is O(log n).
 
 No I/O. No async. Pure in-memory speed.
 """
 
 from __future__ import annotations
 
+import heapq
+import itertools
 import logging
 import time
 from collections import deque
@@ -48,7 +52,15 @@ class WorkingMemoryL1:
                     when this limit is exceeded.
     """
 
-    __slots__ = ("_access_log", "_buffers", "_guardrail", "_max_tokens", "_tenant_tokens")
+    __slots__ = (
+        "_access_log",
+        "_buffers",
+        "_guardrail",
+        "_heaps",
+        "_max_tokens",
+        "_seq",
+        "_tenant_tokens",
+    )
 
     def __init__(
         self,
@@ -58,8 +70,12 @@ class WorkingMemoryL1:
         if max_tokens <= 0:
             raise ValueError(f"max_tokens must be positive, got {max_tokens}")
         self._max_tokens = max_tokens
-        # Per-tenant isolation: {tenant_id: deque[MemoryEvent]}
-        self._buffers: dict[str, deque[MemoryEvent]] = {}
+        # Per-tenant isolation: {tenant_id: {seq: MemoryEvent}} in insertion order
+        self._buffers: dict[str, dict[int, MemoryEvent]] = {}
+        # Per-tenant eviction min-heap of (eviction_key, seq); entries whose seq
+        # is no longer in the buffer are skipped when popped (lazy deletion).
+        self._heaps: dict[str, list[tuple[float, int]]] = {}
+        self._seq = itertools.count()
         # Per-tenant token usage: {tenant_id: current_tokens}
         self._tenant_tokens: dict[str, int] = {}
         self._guardrail = guardrail
@@ -77,9 +93,14 @@ class WorkingMemoryL1:
         age_seconds = time.monotonic() - event.timestamp.timestamp()
         score += max(0.0, 1.0 - (age_seconds / 3600))  # higher if < 1 hour old
 
+        return score + self._static_priority(event)
+
+    @staticmethod
+    def _static_priority(event: MemoryEvent) -> float:
+        """Time-independent part of the priority (valence + role)."""
         # 2. Emotion/Valence
         meta_valence = event.metadata.get("valence", 0.0)
-        score += abs(float(meta_valence)) * 0.5
+        score = abs(float(meta_valence)) * 0.5
 
         # 3. Role importance
         if event.role == "user":
@@ -89,6 +110,22 @@ class WorkingMemoryL1:
 
         return score
 
+    def _eviction_key(self, event: MemoryEvent) -> float:
+        """Heap key ordering events like ``_calculate_priority``, computed once.
+
+        The recency term falls by ``now / 3600`` for every event alike, so
+        dropping that shared decay offset leaves the order unchanged and the
+        key stays valid for the event's lifetime (events are immutable).
+
+        That only holds while the ``max(0.0, ...)`` clamp never fires, which
+        today is an accident: ``_calculate_priority`` takes the age as
+        ``time.monotonic()`` (seconds since boot) minus an epoch timestamp,
+        so the age is hugely negative and the recency term never reaches 0.
+        Whoever fixes that clock mismatch must give this key the clamp too,
+        since events older than an hour would then tie at zero recency.
+        """
+        return 2.0 + self._static_priority(event) + event.timestamp.timestamp() / 3600
+
     def add_event(self, event: MemoryEvent) -> list[MemoryEvent]:
         """Add an event, returning any overflow for L2 compression.
 
@@ -115,26 +152,25 @@ class WorkingMemoryL1:
 
         # Initialize tenant buffer if needed
         if tenant_id not in self._buffers:
-            self._buffers[tenant_id] = deque()
+            self._buffers[tenant_id] = {}
+            self._heaps[tenant_id] = []
             self._tenant_tokens[tenant_id] = 0
 
         buffer = self._buffers[tenant_id]
-        buffer.append(event)
+        heap = self._heaps[tenant_id]
+        seq = next(self._seq)
+        buffer[seq] = event
+        # Ties go to the oldest event, as with the former linear scan.
+        heapq.heappush(heap, (self._eviction_key(event), seq))
         self._tenant_tokens[tenant_id] += event.token_count
 
         overflow: list[MemoryEvent] = []
         while self._tenant_tokens[tenant_id] > self._max_tokens and buffer:
-            # Shift from pure FIFO to priority-weighted eviction
-            lowest_priority = float("inf")
-            evict_idx = 0
-            for i, evt in enumerate(buffer):
-                p = self._calculate_priority(evt)
-                if p < lowest_priority:
-                    lowest_priority = p
-                    evict_idx = i
-
-            evicted = buffer[evict_idx]
-            buffer.remove(evicted)
+            # Priority-weighted eviction: pop the lowest live key.
+            _, victim = heapq.heappop(heap)
+            evicted = buffer.pop(victim, None)
+            if evicted is None:
+                continue
             self._tenant_tokens[tenant_id] -= evicted.token_count
             overflow.append(evicted)
 
@@ -158,12 +194,12 @@ class WorkingMemoryL1:
         seen: set[str] = set()
         buffer = self._buffers[tenant_id]
 
-        for e in buffer:
+        for e in buffer.values():
             pid = e.metadata.get("project_id", e.tenant_id)
             if pid not in seen:
                 self._access_log.append((now, f"{tenant_id}:{pid}"))
                 seen.add(pid)
-        return [{"role": e.role, "content": e.content} for e in buffer]
+        return [{"role": e.role, "content": e.content} for e in buffer.values()]
 
     def get_access_frequency(self, project_id: str, window_seconds: float = 3600.0) -> float:
         """Return normalised access frequency for a project_id in the last window_seconds.
@@ -191,14 +227,16 @@ class WorkingMemoryL1:
         flushed: list[MemoryEvent] = []
         if tenant_id:
             if tenant_id in self._buffers:
-                flushed = list(self._buffers[tenant_id])
+                flushed = list(self._buffers[tenant_id].values())
                 self._buffers[tenant_id].clear()
+                self._heaps[tenant_id].clear()
                 self._tenant_tokens[tenant_id] = 0
         else:
             # Clear all
             for buf in self._buffers.values():
-                flushed.extend(buf)
+                flushed.extend(buf.values())
             self._buffers.clear()
+            self._heaps.clear()
             self._tenant_tokens.clear()
         return flushed
 
@@ -86,3 +86,33 @@ def _migration_009_reputation_consensus(conn: sqlite3.Connection):
         );
     """)
     logger.info("Migration 009: Initialized RWC (agents, votes_v2, outcomes)")
+
+
+# Rollback strategy: the index is droppable and the backfill only copies
+# scores older builds kept in metadata into the column they already declare.
+def _migration_032_recall_score_index(conn: sqlite3.Connection):
+    """Materialize consensus scores in facts.consensus_score and index them for recall."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(facts)").fetchall()}
+    if not columns:
+        return
+    if "consensus_score" not in columns:
+        conn.execute("ALTER TABLE facts ADD COLUMN consensus_score REAL DEFAULT 1.0")
+    if "metadata" in columns:
+        # Votes update the column directly; only untouched (default) rows can
+        # still be carrying their score in metadata alone.
+        conn.execute(
+            """
+            UPDATE facts
+            SET consensus_score = json_extract(metadata, '$.consensus_score')
+            WHERE (consensus_score IS NULL OR consensus_score = 1.0)
+              AND metadata NOT LIKE 'v6_aesgcm:%'
+              AND CASE WHEN json_valid(metadata)
+                       THEN json_type(metadata, '$.consensus_score')
+                  END IN ('real', 'integer')
+            """
+        )
+    conn.execute("UPDATE facts SET consensus_score = 1.0 WHERE consensus_score IS NULL")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_facts_recall ON facts(tenant_id, project, consensus_score)"
+    )
+    logger.info("Migration 032: Indexed facts(tenant_id, project, consensus_score) for recall")
@@ -200,3 +200,15 @@ def _migration_026_ledger_replay_admission(conn: sqlite3.Connection):
             ON ledger_replay_admissions(tenant_id, accepted_at);
     """)
     logger.info("Migration 026: Added ledger replay admission reservations")
+
+
+# DOWNGRADE TARGET: 30
+# Rollback strategy: additive column. Older readers ignore it and recompute
+# every checkpoint with the v1 hex scheme, so v2 checkpoints would be reported
+# as mismatches after a downgrade.
+def _migration_031_merkle_hash_version(conn: sqlite3.Connection):
+    """Record which Merkle hashing scheme produced each checkpoint."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(merkle_roots)").fetchall()}
+    if columns and "hash_version" not in columns:
+        conn.execute("ALTER TABLE merkle_roots ADD COLUMN hash_version INTEGER NOT NULL DEFAULT 1")
+    logger.info("Migration 031: Added hash_version to merkle_roots")
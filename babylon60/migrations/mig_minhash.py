@@ -0,0 +1,21 @@
+# [C5-REAL] Exergy-Maximized
+"""
+Migration 030: MinHash signature table for compaction DEDUP.
+
+Signatures for pre-existing facts are backfilled lazily by the DEDUP
+strategy the first time it runs on a project.
+"""
+
+import sqlite3
+
+
+def _migration_030_fact_minhash(conn: sqlite3.Connection) -> None:
+    """Create the fact_minhash table."""
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS fact_minhash (
+            fact_id   INTEGER PRIMARY KEY REFERENCES facts(id),
+            signature BLOB NOT NULL
+        )
+        """
+    )
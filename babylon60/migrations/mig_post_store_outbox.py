@@ -0,0 +1,16 @@
+# [C5-REAL] Exergy-Maximized
+"""
+Migration 034: post-store outbox.
+
+Facts stored before this migration already ran their post-store work inline,
+so the table starts empty.
+"""
+
+import sqlite3
+
+from babylon60.database.schema import CREATE_POST_STORE_OUTBOX
+
+
+def _migration_034_post_store_outbox(conn: sqlite3.Connection) -> None:
+    """Create the post_store_outbox table."""
+    conn.executescript(CREATE_POST_STORE_OUTBOX)
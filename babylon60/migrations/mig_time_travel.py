@@ -0,0 +1,64 @@
+# [C5-REAL] Exergy-Maximized
+"""Migration 033 - Time-travel columns and state checkpoints.
+
+Point-in-time queries read ``facts.tx_id`` and ``facts.valid_until``
+instead of ``json_extract(metadata, ...)``. Rows that only carry those
+values in metadata (pre-column imports, tombstones recorded as
+``$.tombstoned_at``) are copied into the columns, which are then indexed,
+and the ``fact_state_checkpoints`` table is created.
+"""
+
+from __future__ import annotations
+
+import logging
+import sqlite3
+
+from babylon60.database.schema import CREATE_FACT_STATE_CHECKPOINTS
+
+logger = logging.getLogger("babylon60.migrations.mig_time_travel")
+
+# Plaintext JSON metadata only; encrypted blobs keep whatever the columns hold.
+_READABLE_META = "metadata NOT LIKE 'v6_aesgcm:%' AND json_valid(metadata)"
+
+
+def _migration_033_time_travel_checkpoints(conn: sqlite3.Connection) -> None:
+    """Promote temporal metadata to indexed columns and add state checkpoints."""
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(facts)").fetchall()}
+    if not columns:
+        return
+    for name in ("tx_id INTEGER", "valid_until TEXT"):
+        if name.split()[0] not in columns:
+            conn.execute(f"ALTER TABLE facts ADD COLUMN {name}")
+
+    if "metadata" in columns:
+        conn.execute(
+            f"""
+            UPDATE facts
+            SET tx_id = CAST(json_extract(metadata, '$.tx_id') AS INTEGER)
+            WHERE tx_id IS NULL AND {_READABLE_META}
+              AND json_type(metadata, '$.tx_id') IN ('integer', 'text')
+            """
+        )
+        conn.execute(
+            f"""
+            UPDATE facts
+            SET valid_until = coalesce(
+                json_extract(metadata, '$.valid_until'),
+                CASE WHEN is_tombstoned = 1 THEN json_extract(metadata, '$.tombstoned_at') END
+            )
+            WHERE valid_until IS NULL AND {_READABLE_META}
+            """
+            if "is_tombstoned" in columns
+            else f"""
+            UPDATE facts
+            SET valid_until = json_extract(metadata, '$.valid_until')
+            WHERE valid_until IS NULL AND {_READABLE_META}
+            """
+        )
+
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_facts_tenant_tx ON facts(tenant_id, tx_id)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_facts_tenant_valid ON facts(tenant_id, valid_until)"
+    )
+    conn.executescript(CREATE_FACT_STATE_CHECKPOINTS)
+    logger.info("Migration 033: indexed facts(tenant_id, tx_id) and added state checkpoints")
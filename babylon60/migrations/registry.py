@@ -12,6 +12,7 @@ from babylon60.migrations.mig_consensus import (
     _migration_007_consensus_layer,
     _migration_008_consensus_refinement,
     _migration_009_reputation_consensus,
+    _migration_032_recall_score_index,
 )
 from babylon60.migrations.mig_dual_identity import _migration_028_dual_identity
 from babylon60.migrations.mig_fts import _migration_017_fts_decouple
@@ -25,7 +26,10 @@ from babylon60.migrations.mig_ledger import (
     _migration_014_vote_ledger_refinement,
     _migration_025_tenant_bound_merkle_roots,
     _migration_026_ledger_replay_admission,
+    _migration_031_merkle_hash_version,
 )
+from babylon60.migrations.mig_minhash import _migration_030_fact_minhash
+from babylon60.migrations.mig_post_store_outbox import _migration_034_post_store_outbox
 from babylon60.migrations.mig_security_hardening import _migration_018_security_hardening
 from babylon60.migrations.mig_signals import _migration_019_signal_bus
 
@@ -33,6 +37,7 @@ from babylon60.migrations.mig_signals import _migration_019_signal_bus
 from babylon60.migrations.mig_solid_state import _migration_021_solid_state
 from babylon60.migrations.mig_temporal_kg import _migration_027_temporal_kg
 from babylon60.migrations.mig_tenant import _migration_015_tenant_unification
+from babylon60.migrations.mig_time_travel import _migration_033_time_travel_checkpoints
 from babylon60.migrations.mig_tombstone import _migration_020_tombstone
 
 __all__ = ["MIGRATIONS"]
@@ -67,4 +72,9 @@ MIGRATIONS = [
     (27, "Temporal Knowledge Graph columns", _migration_027_temporal_kg),
     (28, "Dual Identity Paradigm (fact_hash)", _migration_028_dual_identity),
     (29, "Thermodynamic Bridge Pointers (NEXUS_SYMLINK)", _migration_029_thermodynamic_bridges),
+    (30, "MinHash signatures for near-duplicate detection", _migration_030_fact_minhash),
+    (31, "Merkle checkpoint hash versions", _migration_031_merkle_hash_version),
+    (32, "Recall score index", _migration_032_recall_score_index),
+    (33, "Time-travel columns and state checkpoints", _migration_033_time_travel_checkpoints),
+    (34, "Post-store outbox", _migration_034_post_store_outbox),
 ]
@@ -5,7 +5,9 @@ Event Bus Adapter (SSE).
 
 from __future__ import annotations
 
-import asyncio
+import json
+import logging
+import sqlite3
 from collections.abc import AsyncGenerator
 
 from fastapi import APIRouter, Depends, Query, Request
@@ -14,10 +16,33 @@ from sse_starlette.sse import EventSourceResponse
 from babylon60.api.deps import get_async_engine
 from babylon60.auth import AuthResult, require_permission
 from babylon60.engine import CortexEngine as AsyncCortexEngine
+from babylon60.extensions.signals.fanout import get_signal_hub
+from babylon60.extensions.signals.models import Signal
 
-__all__ = ["events_router"]
+__all__ = ["events_router", "parse_last_event_id"]
 
 events_router = APIRouter(tags=["events"])
+logger = logging.getLogger("babylon60.routes.events")
+
+
+def _signal_event(sig: Signal) -> dict:
+    return {
+        "event": sig.event_type,
+        "id": str(sig.id),
+        "data": json.dumps(
+            {
+                "id": sig.id,
+                "event_type": sig.event_type,
+                "payload": sig.payload,
+                "source": sig.source,
+                "project": sig.project,
+                "created_at": sig.created_at.isoformat()
+                if hasattr(sig.created_at, "isoformat")
+                else sig.created_at,
+            },
+            default=str,
+        ),
+    }
 
 
 async def event_generator(
@@ -25,43 +50,40 @@ async def event_generator(
     engine: AsyncCortexEngine,
     tenant_id: str,
     event_types: list[str] | None = None,
+    last_event_id: int | None = None,
 ) -> AsyncGenerator[dict, None]:
-    """Generator for Server-Sent Events."""
-    bus = getattr(engine, "_signal_bus", None)
-    if not bus:
-        yield {"event": "error", "data": "Signal Bus not configured"}
-        return
-
-    consumer_id = f"sse_{id(request)}"
-
+    """Generator for Server-Sent Events.
+
+    Every client of this process shares one ``signals`` tailer
+    (:class:`SignalFanoutHub`); a client that falls behind gets a ``dropped``
+    event with the number of signals it missed.
+    """
+    hub = get_signal_hub(engine)
+    stream = hub.stream(tenant_id, event_types, last_event_id=last_event_id)
     try:
-        while True:
+        async for item in stream:
             if await request.is_disconnected():
                 break
+            if isinstance(item, int):
+                yield {"event": "dropped", "data": json.dumps({"count": item})}
+            else:
+                yield _signal_event(item)
+    except (sqlite3.Error, OSError, RuntimeError) as exc:
+        logger.warning("SSE stream for tenant %s failed: %s", tenant_id, exc)
+        yield {"event": "error", "data": "Signal stream unavailable"}
+    finally:
+        await stream.aclose()
 
-            try:
-                signals = await bus.poll(consumer=consumer_id, limit=50)
-                for sig in signals:
-                    if event_types and sig.event_type not in event_types:
-                        continue
-
-                    yield {
-                        "event": sig.event_type,
-                        "id": str(sig.id),
-                        "data": sig.model_dump_json()
-                        if hasattr(sig, "model_dump_json")
-                        else sig.json(),
-                    }
-            except Exception as exc:
-                import logging
 
-                logging.warning("Suppressed exception: %s", exc)
+def parse_last_event_id(request: Request) -> int | None:
+    """Resume point from the ``Last-Event-ID`` header or ``?last_event_id=``.
 
-            await asyncio.sleep(1.0)
-    except Exception as exc:
-        import logging
-
-        logging.warning("Suppressed exception: %s", exc)
+    The header (sent by reconnecting EventSource clients) wins; the query
+    parameter lets a first connection resume, since EventSource cannot set
+    headers. Anything that is not a non-negative integer is ignored.
+    """
+    raw = request.headers.get("last-event-id") or request.query_params.get("last_event_id")
+    return int(raw) if raw and raw.isdigit() else None
 
 
 @events_router.get("/v1/events/stream")
@@ -71,6 +93,11 @@ async def stream_events(
     auth: AuthResult = Depends(require_permission("read")),
     engine: AsyncCortexEngine = Depends(get_async_engine),
 ) -> EventSourceResponse:
-    """Subscribe to CORTEX coordination events via SSE."""
+    """Subscribe to CORTEX coordination events via SSE.
+
+    Resumes after ``Last-Event-ID`` (header) or ``?last_event_id=`` when given.
+    """
     event_types = types.split(",") if types else None
-    return EventSourceResponse(event_generator(request, engine, auth.tenant_id, event_types))
+    return EventSourceResponse(
+        event_generator(request, engine, auth.tenant_id, event_types, parse_last_event_id(request))
+    )
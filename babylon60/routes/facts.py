@@ -124,8 +124,38 @@ async def batch_store(
     auth: AuthResult = Depends(require_permission("write")),
     engine: AsyncCortexEngine = Depends(get_async_engine),
 ) -> dict:
-    """Batch store up to 100 facts in a single request."""
-    ids: list[int] = []
+    """Batch store up to 100 facts in a single request.
+
+    The batch goes through ``store_many`` (one transaction, set-based). If any
+    fact is rejected it is retried one fact at a time to report per-index errors.
+    """
+    try:
+        ids = await engine.store_many(
+            [
+                {
+                    "project": mem.project,
+                    "content": mem.content,
+                    "tenant_id": auth.tenant_id,
+                    "fact_type": mem.type,
+                    "tags": mem.tags,
+                    "source": mem.source,
+                    "meta": mem.metadata or {},
+                    "parent_decision_id": mem.parent_decision_id,
+                }
+                for mem in req.memories
+            ]
+        )
+    except (sqlite3.Error, ValueError, OSError) as e:
+        logger.info("Batch store rolled back, retrying per fact: %s", e)
+    else:
+        return {
+            "stored": len(ids),
+            "ids": ids,
+            "errors": [],
+            "total_requested": len(req.memories),
+        }
+
+    ids = []
     errors: list[dict] = []
     for i, mem in enumerate(req.memories):
         try:
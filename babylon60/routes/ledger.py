@@ -4,14 +4,18 @@ Ledger Router.
 Cryptographic integrity verification and checkpointing.
 """
 
+import asyncio
 import logging
 import sqlite3
+import time
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 
 from babylon60.api.deps import get_async_engine
 from babylon60.auth import AuthResult, require_permission
 from babylon60.engine import CortexEngine as AsyncCortexEngine
+from babylon60.ledger.store import LedgerStoreError
+from babylon60.ledger.verifier import LedgerVerifier
 from babylon60.types.models import CheckpointResponse, LedgerReportResponse
 from babylon60.utils.i18n import get_trans
 
@@ -20,6 +24,7 @@ __all__ = [
     "MerkleIntegrityError",
     "create_checkpoint",
     "get_ledger_status",
+    "verify_event_ledger",
     "verify_ledger",
 ]
 
@@ -110,3 +115,37 @@ async def verify_ledger(
 ) -> LedgerReportResponse:
     """Alias for /status - performs full integrity verification."""
     return await get_ledger_status(request, auth, engine)
+
+
+@router.get("/events/verify")
+async def verify_event_ledger(
+    request: Request,
+    auth: AuthResult = Depends(require_permission("admin")),
+    engine: AsyncCortexEngine = Depends(get_async_engine),
+    mode: str = Query("full", pattern="^(incremental|full)$"),
+) -> dict:
+    """Verify the event ledger hash chain and its checkpoint Merkle roots.
+
+    ``mode=full`` walks the chain from GENESIS; ``mode=incremental`` only
+    re-checks events appended after the last trusted checkpoint.
+    """
+    started = time.perf_counter()
+    try:
+        verifier = LedgerVerifier(engine.ledger_store)
+        report = await asyncio.to_thread(verifier.verify_chain, mode)
+    except (sqlite3.Error, OSError, RuntimeError, LedgerStoreError) as e:
+        logger.exception("Event ledger verification failed")
+        lang = request.headers.get("Accept-Language", "en")
+        raise HTTPException(
+            status_code=500,
+            detail=get_trans("error_integrity_check_failed", lang).format(detail=str(e)),
+        ) from None
+    if not report["valid"]:
+        logger.error("Event ledger violation detected! %s issues found.", len(report["violations"]))
+    return {
+        "valid": report["valid"],
+        "violations": report["violations"],
+        "events_checked": report["checked_events"],
+        "mode": report["mode"],
+        "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+    }
@@ -12,6 +12,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request, WebSocket, WebSo
 from pydantic import BaseModel, Field
 
 from babylon60.api.deps import get_async_engine
+from babylon60.auth import AuthResult, require_permission
 from babylon60.crypto.hash_registry import cortex_hash
 from babylon60.engine import CortexEngine as AsyncCortexEngine
 
@@ -76,6 +77,18 @@ async def ingest_telemetry(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/v1/telemetry/guards")
+@router.get("/api/v1/telemetry/guards")
+async def guard_profile(
+    auth: AuthResult = Depends(require_permission("admin")),
+    engine: AsyncCortexEngine = Depends(get_async_engine),
+):
+    """Per-guard latency, rejection and cache-hit profile of the pre-store pipeline."""
+    pipeline = getattr(engine, "_guard_pipeline", None)
+    guards = pipeline.profile() if pipeline is not None else []
+    return {"status": "success", "guards": guards}
+
+
 async def query_new_facts(
     engine: AsyncCortexEngine, last_id: int, fact_type: str
 ) -> tuple[int, list[dict[str, Any]]]:
@@ -12,8 +12,9 @@ import asyncio
 import logging
 import math
 import sqlite3
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timezone
-from typing import Final
+from typing import TYPE_CHECKING, Any, Final
 
 import aiosqlite
 
@@ -25,6 +26,10 @@ from babylon60.search.causal_gap import (
 from babylon60.search.models import SearchResult
 from babylon60.search.text import text_search, text_search_sync
 from babylon60.search.vector import semantic_search, semantic_search_sync
+from babylon60.telemetry.metrics import metrics
+
+if TYPE_CHECKING:
+    from babylon60.database.pool import CortexConnectionPool
 
 __all__ = ["hybrid_search", "hybrid_search_sync"]
 
@@ -73,6 +78,35 @@ def _apply_temporal_decay(results: list[SearchResult], recency_weight: float) ->
     return results
 
 
+async def _run_branch(
+    name: str,
+    search: Callable[[Any], Awaitable[list[SearchResult]]],
+    conn: Any,
+    pool: CortexConnectionPool | None,
+    timeout: float | None,
+) -> list[SearchResult] | None:
+    """Run one search branch, on its own pooled connection when a pool is given.
+
+    Returns ``None`` if the branch failed or timed out.
+    """
+
+    async def _execute() -> list[SearchResult]:
+        if pool is None:
+            return await search(conn)
+        async with pool.acquire() as branch_conn:
+            return await search(branch_conn)
+
+    try:
+        return await asyncio.wait_for(_execute(), timeout)
+    except asyncio.TimeoutError:
+        logger.warning("Hybrid %s branch timed out after %.2fs", name, timeout)
+        metrics.inc("cortex_search_branch_failures_total", {"branch": name, "reason": "timeout"})
+    except (sqlite3.Error, OSError, ValueError, RuntimeError) as exc:
+        logger.warning("Hybrid %s branch failed: %s", name, exc)
+        metrics.inc("cortex_search_branch_failures_total", {"branch": name, "reason": "error"})
+    return None
+
+
 async def hybrid_search(
     conn: aiosqlite.Connection,
     query: str,
@@ -88,42 +122,58 @@ async def hybrid_search(
     recency_weight: float = 0.1,
     include_graph: bool = False,
     graph_depth: int = 0,
+    pool: CortexConnectionPool | None = None,
+    branch_timeout: float | None = None,
     **kwargs,
 ) -> list[SearchResult]:
     """
     Sovereign Hybrid Search: Semantic + Text via RRF.
-    Executes branch searches in parallel for minimal latency.
+
+    With a read ``pool`` each branch runs on its own connection, so the two
+    queries overlap instead of queueing on ``conn``'s single worker thread.
+    A branch that fails or exceeds ``branch_timeout`` (default
+    ``config.SEARCH_BRANCH_TIMEOUT``) is dropped and the other branch is
+    ranked alone; only when both fail is the result empty.
     """
     # 1. Dispatch branch searches concurrently
     # Over-fetch by 2x to ensure sufficient overlap for RRF
     fetch_limit = top_k * 2
+    if branch_timeout is None:
+        from babylon60.core import config
+
+        branch_timeout = config.SEARCH_BRANCH_TIMEOUT
+
+    def _semantic(c: Any) -> Awaitable[list[SearchResult]]:
+        return semantic_search(
+            c,
+            query_embedding,
+            top_k=fetch_limit,
+            tenant_id=tenant_id,
+            project=project,
+            as_of=as_of,
+            confidence=confidence,
+        )
 
-    sem_task = semantic_search(
-        conn,
-        query_embedding,
-        top_k=fetch_limit,
-        tenant_id=tenant_id,
-        project=project,
-        as_of=as_of,
-        confidence=confidence,
-    )
-    txt_task = text_search(
-        conn,
-        query,
-        tenant_id=tenant_id,
-        project=project,
-        limit=fetch_limit,
-        as_of=as_of,
-        confidence=confidence,
-    )
+    def _text(c: Any) -> Awaitable[list[SearchResult]]:
+        return text_search(
+            c,
+            query,
+            tenant_id=tenant_id,
+            project=project,
+            limit=fetch_limit,
+            as_of=as_of,
+            confidence=confidence,
+        )
 
-    try:
-        sem_results, txt_results = await asyncio.gather(sem_task, txt_task)
-    except (sqlite3.Error, OSError, ValueError, RuntimeError) as exc:
-        logger.error("Hybrid branch search failed: %s", exc)
-        # Fallback to empty if both fail, or partial if one survives
-        # (non-gather approach would be needed) But here we want atomicity or failure.
+    sem_results, txt_results = await asyncio.gather(
+        _run_branch("semantic", _semantic, conn, pool, branch_timeout),
+        _run_branch("text", _text, conn, pool, branch_timeout),
+    )
+    if sem_results is None and txt_results is None:
+        logger.error("Hybrid search failed: both branches failed")
         return []
+    sem_results = sem_results or []
+    txt_results = txt_results or []
 
     # 2. Rank Fusion Logic (RRF)
     # Weights should ideally sum to 1.0 but we normalize them here
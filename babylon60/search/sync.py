@@ -16,6 +16,8 @@ import logging
 import sqlite3
 from dataclasses import dataclass, field
 
+from babylon60.search.utils import _has_fts5_sync
+
 __all__ = [
     "RRF_K",
     "SyncSearchResult",
@@ -64,7 +66,9 @@ def semantic_search_sync(
     project: str | None = None,
 ) -> list[SyncSearchResult]:
     """Vector KNN search using sqlite-vec (sync)."""
-    embedding_json = json.dumps(query_embedding)
+    from babylon60.embeddings.vec_blob import to_float32_blob
+
+    embedding_blob = to_float32_blob(query_embedding)
 
     sql = """
         SELECT
@@ -76,7 +80,7 @@ def semantic_search_sync(
             AND k = ?
             AND f.valid_until IS NULL
     """
-    params: list = [embedding_json, top_k * 3]
+    params: list = [embedding_blob, top_k * 3]
 
     if project:
         sql += _PROJECT_FILTER
@@ -128,15 +132,6 @@ def semantic_search_sync(
     return results
 
 
-def _has_fts5_sync(conn: sqlite3.Connection) -> bool:
-    """Check if facts_fts virtual table exists (sync)."""
-    try:
-        cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='facts_fts'")
-        return cursor.fetchone() is not None
-    except sqlite3.Error:
-        return False
-
-
 def _sanitize_fts_query(query: str) -> str:
     """Sanitize user input for FTS5 MATCH syntax."""
     tokens = query.split()
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import logging
 import sqlite3
+import weakref
 from typing import Any
 
 import aiosqlite
@@ -17,24 +18,53 @@ logger = logging.getLogger("babylon60.search")
 V6_PREFIX = CortexEncrypter.PREFIX
 
 
+# Connections already known to have facts_fts. Only positive probes are
+# cached: the table can be created after a connection opens, never dropped.
+_FTS5_CONNS: weakref.WeakSet[Any] = weakref.WeakSet()
+
+
+def _fts5_known(conn: Any) -> bool:
+    try:
+        return conn in _FTS5_CONNS
+    except TypeError:
+        return False
+
+
+def _remember_fts5(conn: Any) -> None:
+    try:
+        _FTS5_CONNS.add(conn)
+    except TypeError:
+        pass  # Not weak-referenceable; probe every time.
+
+
 async def _has_fts5(conn: aiosqlite.Connection) -> bool:
-    """Check if facts_fts virtual table exists."""
+    """Check if facts_fts virtual table exists (cached per connection)."""
+    if _fts5_known(conn):
+        return True
     try:
         cursor = await conn.execute(
             "SELECT 1 FROM sqlite_master WHERE type='table' AND name='facts_fts'"
         )
-        return (await cursor.fetchone()) is not None
+        found = (await cursor.fetchone()) is not None
     except (aiosqlite.Error, sqlite3.Error):
         return False
+    if found:
+        _remember_fts5(conn)
+    return found
 
 
 def _has_fts5_sync(conn: sqlite3.Connection) -> bool:
-    """Check if facts_fts virtual table exists (sync)."""
+    """Check if facts_fts virtual table exists (sync, cached per connection)."""
+    if _fts5_known(conn):
+        return True
     try:
         cursor = conn.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name='facts_fts'")
-        return cursor.fetchone() is not None
+        found = cursor.fetchone() is not None
     except sqlite3.Error:
         return False
+    if found:
+        _remember_fts5(conn)
+    return found
 
 
 def _sanitize_fts_query(query: str) -> str:
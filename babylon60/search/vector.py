@@ -89,9 +89,10 @@ async def semantic_search(
         return [_row_to_result(row, enc, tenant_id) for row in rows]
 
     # Default SQLite-vec execution path
-    embedding_json = json.dumps(query_embedding)
+    from babylon60.embeddings.vec_blob import to_float32_blob
+
     sql, params = _build_semantic_query(
-        tenant_id, embedding_json, top_k, project, as_of, confidence
+        tenant_id, to_float32_blob(query_embedding), top_k, project, as_of, confidence
     )
 
     try:
@@ -110,7 +111,7 @@ async def semantic_search(
 
 def _build_semantic_query(
     tenant_id: str,
-    embedding_json: str,
+    embedding_blob: bytes,
     top_k: int,
     project: str | None,
     as_of: str | None,
@@ -129,7 +130,7 @@ def _build_semantic_query(
             AND ve.embedding MATCH ?
             AND k = ?
     """
-    params = [tenant_id, embedding_json, top_k * 3]
+    params = [tenant_id, embedding_blob, top_k * 3]
 
     if project:
         sql += _FILTER_PROJECT
@@ -211,7 +212,9 @@ def semantic_search_sync(
     confidence: str | None = None,
 ) -> list[SearchResult]:
     """Vector KNN search (sync)."""
-    embedding_json = json.dumps(query_embedding)
+    from babylon60.embeddings.vec_blob import to_float32_blob
+
+    embedding_blob = to_float32_blob(query_embedding)
 
     sql = """
         SELECT
@@ -224,7 +227,7 @@ def semantic_search_sync(
             AND k = ?
             AND f.valid_until IS NULL
     """
-    params: list = [tenant_id, embedding_json, top_k * 3]
+    params: list = [tenant_id, embedding_blob, top_k * 3]
     if project:
         sql += _FILTER_PROJECT
         params.append(project)
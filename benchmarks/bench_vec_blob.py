@@ -0,0 +1,105 @@
+# [C5-REAL] Exergy-Maximized
+"""
+Micro-benchmark: JSON text vs packed float32 blobs on the sqlite-vec paths.
+
+Measures the per-insert cost (obfuscate + encode [+ INSERT]) and the
+per-query cost (encode [+ KNN MATCH]) of both encodings. The SQL half runs
+only when sqlite-vec can be loaded into this interpreter.
+
+    python benchmarks/bench_vec_blob.py [dim] [iterations]
+"""
+
+import json
+import sys
+import time
+from typing import Any
+
+import numpy as np
+
+from babylon60.database.core import causal_write, connect, load_sqlite_vec
+from babylon60.embeddings.obfuscation import obfuscate_vector
+from babylon60.embeddings.vec_blob import to_float32_blob
+
+
+def _per_call_us(fn, iterations: int) -> float:
+    start = time.perf_counter()
+    for i in range(iterations):
+        fn(i)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_benchmark(dim: int = 384, iterations: int = 5000) -> dict[str, Any]:
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((iterations, dim)).astype(np.float32)
+    as_lists = vectors.tolist()
+
+    results: dict[str, Any] = {"dim": dim, "iterations": iterations}
+    results["encode_insert_json_us"] = _per_call_us(
+        lambda i: json.dumps(obfuscate_vector(as_lists[i], project="bench")), iterations
+    )
+    results["encode_insert_blob_us"] = _per_call_us(
+        lambda i: to_float32_blob(obfuscate_vector(vectors[i], project="bench")), iterations
+    )
+    results["encode_query_json_us"] = _per_call_us(lambda i: json.dumps(as_lists[i]), iterations)
+    results["encode_query_blob_us"] = _per_call_us(
+        lambda i: to_float32_blob(as_lists[i]), iterations
+    )
+
+    conn = connect(":memory:")
+    if not load_sqlite_vec(conn):
+        results["sqlite_vec"] = False
+        return results
+    results["sqlite_vec"] = True
+
+    with causal_write(conn):
+        for name in ("ve_json", "ve_blob"):
+            conn.execute(
+                f"CREATE VIRTUAL TABLE {name} USING vec0("
+                f"fact_id INTEGER PRIMARY KEY, embedding FLOAT[{dim}])"
+            )
+        results["insert_json_us"] = _per_call_us(
+            lambda i: conn.execute(
+                "INSERT INTO ve_json (fact_id, embedding) VALUES (?, ?)",
+                (i, json.dumps(as_lists[i])),
+            ),
+            iterations,
+        )
+        results["insert_blob_us"] = _per_call_us(
+            lambda i: conn.execute(
+                "INSERT INTO ve_blob (fact_id, embedding) VALUES (?, ?)",
+                (i, to_float32_blob(as_lists[i])),
+            ),
+            iterations,
+        )
+        conn.commit()
+
+    queries = min(iterations, 200)
+    knn = "SELECT fact_id FROM {} WHERE embedding MATCH ? AND k = 10"
+    results["query_json_us"] = _per_call_us(
+        lambda i: conn.execute(knn.format("ve_json"), (json.dumps(as_lists[i]),)).fetchall(),
+        queries,
+    )
+    results["query_blob_us"] = _per_call_us(
+        lambda i: conn.execute(knn.format("ve_blob"), (to_float32_blob(as_lists[i]),)).fetchall(),
+        queries,
+    )
+    conn.close()
+    return results
+
+
+if __name__ == "__main__":
+    dim = int(sys.argv[1]) if len(sys.argv) > 1 else 384
+    iterations = int(sys.argv[2]) if len(sys.argv) > 2 else 5000
+    print("=" * 60)
+    print(f"sqlite-vec vector encoding: JSON vs float32 blob (dim={dim})")
+    print("=" * 60)
+    res = run_benchmark(dim, iterations)
+    for phase in ("encode_insert", "encode_query", "insert", "query"):
+        if f"{phase}_json_us" not in res:
+            continue
+        j, b = res[f"{phase}_json_us"], res[f"{phase}_blob_us"]
+        print(
+            f"{phase:<14} json={j:9.2f} µs  blob={b:9.2f} µs  saved={j - b:9.2f} µs ({j / b:.1f}x)"
+        )
+    if not res["sqlite_vec"]:
+        print("sqlite-vec unavailable: SQL insert/query phases skipped")
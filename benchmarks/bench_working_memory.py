@@ -0,0 +1,100 @@
+# [C5-REAL] Exergy-Maximized Benchmark for WorkingMemoryL1 eviction
+"""Push N events through a token-budgeted L1 window spread over many tenants.
+
+Default: 1M events, 128k-token window, 1k tenants. ``--compare`` also runs
+the former linear priority rescan on a smaller slice for reference.
+"""
+
+import argparse
+import random
+import time
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from babylon60.memory.models import MemoryEvent
+from babylon60.memory.working import WorkingMemoryL1
+
+_ROLES = ("user", "assistant", "system", "tool")
+
+
+def make_events(count: int, tenants: int, seed: int = 0) -> list[MemoryEvent]:
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    return [
+        MemoryEvent.model_construct(
+            event_id=str(i),
+            timestamp=base + timedelta(milliseconds=i),
+            role=rng.choice(_ROLES),
+            content="",
+            token_count=rng.randint(16, 512),
+            session_id="bench",
+            tenant_id=f"tenant-{rng.randrange(tenants)}",
+            prev_hash="",
+            signature="",
+            metadata={"valence": rng.choice((0.0, 0.25, -0.5))},
+        )
+        for i in range(count)
+    ]
+
+
+class _ScanL1(WorkingMemoryL1):
+    """The pre-heap eviction: rescan every buffered event per eviction step."""
+
+    def __init__(self, max_tokens: int) -> None:
+        super().__init__(max_tokens=max_tokens)
+        self.scan_buffers: dict[str, deque[MemoryEvent]] = {}
+
+    def add_event(self, event: MemoryEvent) -> list[MemoryEvent]:
+        buffer = self.scan_buffers.setdefault(event.tenant_id, deque())
+        buffer.append(event)
+        tokens = self._tenant_tokens.get(event.tenant_id, 0) + event.token_count
+        overflow = []
+        while tokens > self._max_tokens and buffer:
+            evicted = min(buffer, key=self._calculate_priority)
+            buffer.remove(evicted)
+            tokens -= evicted.token_count
+            overflow.append(evicted)
+        self._tenant_tokens[event.tenant_id] = tokens
+        return overflow
+
+
+def run(l1: WorkingMemoryL1, events: list[MemoryEvent]) -> tuple[float, int]:
+    evicted = 0
+    t0 = time.perf_counter()
+    for event in events:
+        evicted += len(l1.add_event(event))
+    return time.perf_counter() - t0, evicted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=1_000_000)
+    parser.add_argument("--tenants", type=int, default=1_000)
+    parser.add_argument("--max-tokens", type=int, default=128_000)
+    parser.add_argument("--compare", type=int, default=0, help="events for the rescan baseline")
+    args = parser.parse_args()
+
+    events = make_events(args.events, args.tenants)
+    elapsed, evicted = run(WorkingMemoryL1(max_tokens=args.max_tokens), events)
+    print(
+        f"🚀 WorkingMemoryL1: {args.events:,} events, {args.tenants:,} tenants, "
+        f"{args.max_tokens:,}-token window"
+    )
+    print(
+        f"- heap eviction: {elapsed:.2f} s ({args.events / elapsed:,.0f} events/s, "
+        f"{evicted:,} evicted)"
+    )
+
+    if args.compare:
+        # Fewer tenants so the slice actually overflows the window.
+        sample = make_events(args.compare, max(1, args.tenants // 50))
+        heap_s, _ = run(WorkingMemoryL1(max_tokens=args.max_tokens), sample)
+        scan_s, _ = run(_ScanL1(max_tokens=args.max_tokens), sample)
+        print(
+            f"- first {args.compare:,} events: heap {heap_s:.2f} s, rescan {scan_s:.2f} s "
+            f"({scan_s / heap_s:.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
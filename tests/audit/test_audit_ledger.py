@@ -164,9 +164,9 @@ class TestEnterpriseAuditLedger:
             batch1_rows = await cursor2.fetchall()
             batch1_ids = [r[0] for r in batch1_rows]
 
-            from babylon60.audit.smt import SparseMerkleTree
+            from babylon60.audit.smt import LegacyPathTree
 
-            smt_state = SparseMerkleTree()
+            smt_state = LegacyPathTree()
             for aid in batch1_ids:
                 smt_state.update(hashlib.sha256(aid.encode()).hexdigest(), aid)
             merkle_root = smt_state.root
@@ -361,6 +361,68 @@ class TestEnterpriseAuditLedger:
         await l2.ensure_table()
         assert l2._last_hash == saved_hash
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("workers", [1, 2])
+    async def test_verify_chain_streams_pages(self, ledger, workers):
+        """Paged verification (inline or pooled) reports every block and progress."""
+        for i in range(5):
+            await ledger.log_action("t", "admin", "a", f"act{i}", f"r{i}")
+
+        seen: list[dict] = []
+        result = await ledger.verify_chain(page_size=2, workers=workers, progress=seen.append)
+        assert result["status"] == "verified"
+        assert result["blocks"] == 5
+        assert result["rows"] == 5
+        assert seen and seen[-1]["rows"] == 5
+        assert "rows_per_s" in result
+
+        from babylon60.database.core import causal_write
+
+        with causal_write(ledger._conn):
+            await ledger._conn.execute(
+                "UPDATE security_audit_log SET resource = 'forged' WHERE action = 'act3'"
+            )
+        tampered = await ledger.verify_chain(page_size=2, workers=workers)
+        assert tampered["status"] == "tampered"
+        assert tampered["reason"] == "row_hash_mismatch"
+
+    @pytest.mark.asyncio
+    async def test_verify_chain_small_log_runs_inline(self, ledger):
+        """The default worker count does not spawn a pool for a small log."""
+        for i in range(3):
+            await ledger.log_action("t", "admin", "a", f"act{i}", "r")
+
+        with patch(
+            "babylon60.audit.ledger.ProcessPoolExecutor",
+            side_effect=AssertionError("pool spawned"),
+        ):
+            assert (await ledger.verify_chain())["status"] == "verified"
+
+    @pytest.mark.asyncio
+    async def test_verify_chain_resumes_from_watermark(self, ledger):
+        """resume=True only verifies rows appended after the last verified one."""
+        for i in range(3):
+            await ledger.log_action("t", "admin", "a", f"act{i}", "r")
+        assert (await ledger.verify_chain(workers=1))["rows"] == 3
+
+        for i in range(3, 5):
+            await ledger.log_action("t", "admin", "a", f"act{i}", "r")
+        resumed = await ledger.verify_chain(resume=True, workers=1)
+        assert resumed["status"] == "verified"
+        assert resumed["rows"] == 2
+        assert resumed["resumed_from"] == 3
+
+        # A watermark pointing at a rewritten row is discarded.
+        from babylon60.database.core import causal_write
+
+        with causal_write(ledger._conn):
+            await ledger._conn.execute(
+                "UPDATE security_audit_log SET signature = '00' WHERE rowid = 5"
+            )
+        stale = await ledger.verify_chain(resume=True, workers=1)
+        assert stale["resumed_from"] == 0
+        assert stale["status"] == "tampered"
+
 
 # ── AuditAnalystGrok Tests ────────────────────────────────────────────────────
 
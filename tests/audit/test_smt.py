@@ -0,0 +1,114 @@
+# [C5-REAL] Exergy-Maximized
+"""Tests for the node-store-backed Sparse Merkle Tree."""
+
+import random
+
+import pytest
+
+from babylon60.audit.smt import (
+    LegacyPathTree,
+    MemoryNodeStore,
+    SparseMerkleTree,
+    SQLiteNodeStore,
+)
+from babylon60.crypto.hash_registry import cortex_hash
+
+
+def _items(n: int, seed: int = 1) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    return [(cortex_hash(f"key-{i}"), f"value-{rng.random()}") for i in range(n)]
+
+
+def test_root_depends_on_every_leaf():
+    tree = SparseMerkleTree()
+    items = _items(3)
+    roots = [tree.update(k, v) for k, v in items]
+    assert len(set(roots)) == 3
+    assert all(tree.get(k) == v for k, v in items)
+
+
+def test_batch_update_matches_sequential_updates_in_any_order():
+    items = _items(300)
+    sequential = SparseMerkleTree()
+    for k, v in items:
+        sequential.update(k, v)
+
+    batched = SparseMerkleTree()
+    shuffled = items[:]
+    random.Random(5).shuffle(shuffled)
+    batched.batch_update(shuffled[:100])
+    batched.batch_update(shuffled[100:])
+    assert batched.root == sequential.root
+
+
+def test_overwrite_changes_root_and_value():
+    tree = SparseMerkleTree()
+    items = _items(10)
+    tree.batch_update(items)
+    before = tree.root
+    tree.update(items[4][0], "new")
+    assert tree.root != before
+    assert tree.get(items[4][0]) == "new"
+    tree.update(items[4][0], items[4][1])
+    assert tree.root == before
+
+
+def test_inclusion_and_exclusion_proofs():
+    tree = SparseMerkleTree()
+    items = _items(64)
+    tree.batch_update(items)
+    root = tree.root
+
+    for key, value in items[:10]:
+        proof = tree.get_proof(key)
+        assert tree.verify(key, value, proof, root)
+        assert tree.verify(key, value, proof.compress(), root)
+        assert not tree.verify(key, "forged", proof, root)
+
+    missing = cortex_hash("absent")
+    proof = tree.get_proof(missing)
+    assert proof.value is None
+    assert tree.verify(missing, None, proof.compress(), root)
+    assert not tree.verify(items[0][0], None, tree.get_proof(items[0][0]), root)
+
+
+def test_compressed_proof_skips_empty_siblings():
+    tree = SparseMerkleTree()
+    tree.batch_update(_items(2))
+    key = _items(2)[0][0]
+    proof = tree.get_proof(key)
+    compressed = proof.compress()
+    assert len(compressed.siblings) == 1
+    assert compressed.expand() == proof
+
+
+def test_sqlite_store_persists_root_and_nodes(tmp_path):
+    items = _items(50)
+    store = SQLiteNodeStore(tmp_path / "smt.db")
+    tree = SparseMerkleTree(store)
+    tree.batch_update(items)
+    root = tree.root
+    store.close()
+
+    reopened = SparseMerkleTree(SQLiteNodeStore(tmp_path / "smt.db"))
+    assert reopened.root == root
+    key, value = items[7]
+    assert reopened.verify(key, value, reopened.get_proof(key), root)
+
+
+def test_missing_node_raises():
+    store = MemoryNodeStore()
+    tree = SparseMerkleTree(store)
+    tree.batch_update(_items(4))
+    store._nodes.clear()
+    fresh = SparseMerkleTree(store)
+    with pytest.raises(KeyError):
+        fresh.get(_items(4)[0][0])
+
+
+def test_legacy_path_tree_root_is_last_leaf_path():
+    legacy = LegacyPathTree()
+    key = cortex_hash("aid-2")
+    legacy.update(cortex_hash("aid-1"), "aid-1")
+    legacy.update(key, "aid-2")
+    assert legacy.root == LegacyPathTree().update(key, "aid-2")
@@ -0,0 +1,112 @@
+# [C5-REAL] Exergy-Maximized
+"""Content-addressed embedding cache (babylon60.embeddings.cache)."""
+
+from __future__ import annotations
+
+import pytest
+
+from babylon60.core import config
+from babylon60.embeddings import cache as cache_mod
+from babylon60.embeddings.cache import EmbeddingCache, cached_embed_batch
+from babylon60.telemetry.metrics import metrics
+
+
+class _FakeEmbedder:
+    model_identity_hash = "fake-model"
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        return [[float(len(t)), 0.5, -1.0] for t in texts]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = EmbeddingCache(tmp_path / "emb.db", lru_size=2)
+    yield c
+    c.close()
+
+
+def test_round_trip_and_model_isolation(cache):
+    cache.put_many("m1", ["alpha", "beta"], [[1.0, 2.0], [3.0, 4.0]])
+
+    assert cache.get_many("m1", ["alpha", "gamma", "beta"]) == [[1.0, 2.0], None, [3.0, 4.0]]
+    assert cache.get("m2", "alpha") is None
+
+
+def test_disk_tier_survives_reopen(tmp_path):
+    path = tmp_path / "emb.db"
+    first = EmbeddingCache(path)
+    first.put("m", "persisted", [0.25, 0.75])
+    first.close()
+
+    second = EmbeddingCache(path)
+    try:
+        before = metrics._counters.copy()
+        assert second.get("m", "persisted") == [0.25, 0.75]
+        key = 'cortex_embedding_cache_requests_total{result="hit",tier="disk"}'
+        assert metrics._counters.get(key, 0) == before.get(key, 0) + 1
+    finally:
+        second.close()
+
+
+def test_disk_hits_buffer_access_time_until_flush(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "emb.db"
+    c = EmbeddingCache(path, lru_size=1)
+    c.put("m", "hot", [1.0])
+    c._lru.clear()
+
+    def last_used() -> float:
+        with sqlite3.connect(path) as raw:
+            return raw.execute("SELECT last_used FROM embedding_cache").fetchone()[0]
+
+    stored = last_used()
+    assert c.get("m", "hot") == [1.0]
+    assert last_used() == stored  # no write on the read path
+    c.close()
+    assert last_used() > stored
+
+
+def test_evicts_least_recently_used(tmp_path):
+    # Each 4-dim vector is 16 bytes; room for two.
+    c = EmbeddingCache(tmp_path / "emb.db", max_bytes=40, lru_size=1)
+    try:
+        c.put("m", "old", [0.0] * 4)
+        c.put("m", "warm", [1.0] * 4)
+        c.get("m", "old")  # lru_size=1 keeps "warm" in memory; this refreshes "old" on disk
+        c.put("m", "new", [2.0] * 4)
+        c._lru.clear()
+
+        assert c.get("m", "warm") is None
+        assert c.get("m", "old") == [0.0] * 4
+        assert c.get("m", "new") == [2.0] * 4
+    finally:
+        c.close()
+
+
+def test_cached_embed_batch_only_embeds_misses(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "EMBEDDING_CACHE_PATH", str(tmp_path / "shared.db"))
+    monkeypatch.setattr(cache_mod, "_default_cache", None)
+    embedder = _FakeEmbedder()
+
+    first = cached_embed_batch(embedder, ["a", "bb"])
+    second = cached_embed_batch(embedder, ["bb", "ccc", "a"])
+
+    assert first == [[1.0, 0.5, -1.0], [2.0, 0.5, -1.0]]
+    assert second == [[2.0, 0.5, -1.0], [3.0, 0.5, -1.0], [1.0, 0.5, -1.0]]
+    assert embedder.calls == [["a", "bb"], ["ccc"]]
+    cache_mod._default_cache.close()
+
+
+def test_cached_embed_batch_disabled_by_empty_path(monkeypatch):
+    monkeypatch.setattr(config, "EMBEDDING_CACHE_PATH", "")
+    embedder = _FakeEmbedder()
+
+    cached_embed_batch(embedder, ["x"])
+    cached_embed_batch(embedder, ["x"])
+
+    assert embedder.calls == [["x"], ["x"]]
@@ -119,6 +119,7 @@ async def test_cortex_engine_end_to_end_obfuscation(monkeypatch, tmp_path):
             source="agent:test_suite",
         )
         assert fact_id > 0
+        await engine.flush_post_store()
 
         # Verify it was stored with an embedding
         async with engine.session() as conn:
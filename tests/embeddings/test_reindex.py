@@ -0,0 +1,139 @@
+# [C5-REAL] Exergy-Maximized
+"""Online shadow re-index (babylon60.embeddings.reindex)."""
+
+from __future__ import annotations
+
+import aiosqlite
+import pytest
+
+from babylon60.embeddings import reindex
+from babylon60.embeddings.reindex import ReindexPipeline, shadow_table_name
+from babylon60.engine import CortexEngine
+from babylon60.engine.core.embedding_engine import embed_fact_async
+
+
+class _FakeManager:
+    def __init__(self, dimension: int) -> None:
+        self.dimension = dimension
+        self.batches: list[list[str]] = []
+
+    async def aembed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(t))] * self.dimension for t in texts]
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    e = CortexEngine(db_path=str(tmp_path / "reindex.db"), auto_embed=False)
+    await e.init_db()
+    yield e
+    await e.close()
+
+
+async def _store(engine, n: int) -> list[int]:
+    return [
+        await engine.store(project="reindex", content=f"Reindex fact number {i}", source="test")
+        for i in range(n)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_reindex_swaps_shadow_table(engine):
+    ids = await _store(engine, 5)
+    manager = _FakeManager(dimension=8)
+    pipeline = ReindexPipeline(engine, manager)
+
+    result = await pipeline.execute_reindex(batch_size=2)
+
+    assert result["success"] == 5
+    assert result["failed"] == 0
+    assert "facts_per_second" in result
+    assert [len(b) for b in manager.batches] == [2, 2, 1]
+    assert await pipeline.get_current_db_dimension() == 8
+    async with engine.session() as conn:
+        cursor = await conn.execute("SELECT fact_id FROM fact_embeddings ORDER BY fact_id")
+        assert [row[0] for row in await cursor.fetchall()] == ids
+        cursor = await conn.execute(
+            "SELECT name FROM sqlite_master WHERE name = ?", (shadow_table_name(8),)
+        )
+        assert await cursor.fetchone() is None
+    assert not await pipeline.has_pending_build()
+
+
+@pytest.mark.asyncio
+async def test_reindex_resumes_from_checkpoint(engine):
+    await _store(engine, 4)
+    first = ReindexPipeline(engine, _FakeManager(dimension=8))
+    state = await first._prepare_shadow(shadow_table_name(8), 8)
+    page = await first._fetch_page(0, 3)
+    await first._embed_page(shadow_table_name(8), page, state)
+
+    manager = _FakeManager(dimension=8)
+    pipeline = ReindexPipeline(engine, manager)
+    assert await pipeline.has_pending_build()
+    result = await pipeline.execute_reindex(batch_size=10)
+
+    # Only the fact after the checkpoint is embedded again.
+    assert manager.batches == [["Reindex fact number 3"]]
+    assert result["success"] == 4
+
+
+class _FlakyManager(_FakeManager):
+    """Fails the first ``failures`` batches."""
+
+    def __init__(self, dimension: int, failures: int) -> None:
+        super().__init__(dimension)
+        self.failures = failures
+
+    async def aembed_batch(self, texts: list[str], batch_size: int = 32) -> list[list[float]]:
+        if self.failures:
+            self.failures -= 1
+            self.batches.append(list(texts))
+            raise RuntimeError("provider down")
+        return await super().aembed_batch(texts, batch_size)
+
+
+@pytest.mark.asyncio
+async def test_reindex_retries_failed_pages_before_swapping(engine):
+    ids = await _store(engine, 3)
+    manager = _FlakyManager(dimension=8, failures=1)
+    pipeline = ReindexPipeline(engine, manager)
+
+    result = await pipeline.execute_reindex(batch_size=2)
+
+    # The failed first page is picked up again by the catch-up pass.
+    assert manager.batches[-1] == ["Reindex fact number 0", "Reindex fact number 1"]
+    assert result["swapped"] is True
+    assert (result["success"], result["failed"]) == (3, 0)
+    async with engine.session() as conn:
+        cursor = await conn.execute("SELECT fact_id FROM fact_embeddings ORDER BY fact_id")
+        assert [row[0] for row in await cursor.fetchall()] == ids
+
+
+@pytest.mark.asyncio
+async def test_reindex_keeps_old_index_while_facts_fail(engine):
+    await _store(engine, 3)
+    pipeline = ReindexPipeline(engine, _FlakyManager(dimension=8, failures=100))
+
+    result = await pipeline.execute_reindex(batch_size=2)
+
+    assert result["swapped"] is False
+    assert result["failed"] == 3
+    assert await pipeline.get_current_db_dimension() != 8
+    assert await pipeline.has_pending_build()
+
+
+@pytest.mark.asyncio
+async def test_embed_fact_dual_writes_to_active_shadow(monkeypatch):
+    monkeypatch.setattr(reindex, "_shadow_tables", {"fact_embeddings_v3"})
+    async with aiosqlite.connect(":memory:") as conn:
+        await conn.execute("CREATE TABLE fact_embeddings (fact_id INTEGER PRIMARY KEY, embedding)")
+        await conn.execute(
+            "CREATE TABLE fact_embeddings_v3 (fact_id INTEGER PRIMARY KEY, embedding)"
+        )
+
+        await embed_fact_async(conn, 7, "proj", "content", embedding=[0.1, 0.2, 0.3])
+        await embed_fact_async(conn, 7, "proj", "content", embedding=[0.1, 0.2, 0.3])
+
+        cursor = await conn.execute("SELECT fact_id FROM fact_embeddings_v3")
+        assert [row[0] for row in await cursor.fetchall()] == [7]
@@ -0,0 +1,75 @@
+# [C5-REAL] Exergy-Maximized
+"""Binary sqlite-vec encodings (babylon60.embeddings.vec_blob)."""
+
+from __future__ import annotations
+
+import struct
+
+import numpy as np
+import pytest
+
+from babylon60.embeddings import vec_blob
+from babylon60.embeddings.obfuscation import obfuscate_vector
+from babylon60.embeddings.vec_blob import (
+    from_float32_blob,
+    to_bit_blob,
+    to_float32_blob,
+    to_int8_blob,
+    vector_param,
+)
+
+
+def test_float32_blob_is_packed_little_endian():
+    vec = [0.5, -1.25, 3.0]
+    blob = to_float32_blob(vec)
+
+    assert blob == struct.pack("<3f", *vec)
+    assert from_float32_blob(blob).tolist() == vec
+    assert to_float32_blob(np.array(vec, dtype=np.float64)) == blob
+
+
+def test_int8_blob_uses_unit_quantization():
+    blob = to_int8_blob([-1.0, 0.5, 1.0, 2.0, -3.0])
+
+    # [-1, 1] spans the 256 int8 steps; out-of-range values saturate.
+    assert np.frombuffer(blob, dtype=np.int8).tolist() == [-128, 63, 127, 127, -128]
+
+
+def test_bit_blob_packs_sign_bits_lsb_first():
+    vec = [1.0, -1.0, 0.5, 0.0, -0.1, 0.2, 0.3, -0.4, 0.9]
+
+    assert to_bit_blob(vec) == bytes([0b01100101, 0b00000001])
+
+
+def test_pure_python_encoders_match_numpy(monkeypatch):
+    rng = np.random.default_rng(11)
+    vectors = [rng.uniform(-2.0, 2.0, size=37).tolist() for _ in range(20)]
+    vectors.append([-1.0, 0.5, 1.0, 2.0, -3.0])
+    encoders = (to_float32_blob, to_int8_blob, to_bit_blob)
+    expected = [[encode(v) for encode in encoders] for v in vectors]
+
+    monkeypatch.setattr(vec_blob, "np", None)
+
+    assert [[encode(v) for encode in encoders] for v in vectors] == expected
+    assert from_float32_blob(to_float32_blob([0.5, -1.25, 3.0])) == [0.5, -1.25, 3.0]
+
+
+def test_vector_param_placeholders():
+    assert vector_param([1.0], "float32")[1] == "?"
+    assert vector_param([1.0], "int8")[1] == "vec_int8(?)"
+    assert vector_param([1.0], "bit")[1] == "vec_bit(?)"
+    with pytest.raises(ValueError):
+        vector_param([1.0], "float16")
+
+
+def test_obfuscate_keeps_numpy_arrays(monkeypatch):
+    monkeypatch.setenv("CORTEX_OBFUSCATE_EMBEDDINGS", "1")
+    vec = [0.1, 0.2, 0.3, 0.4]
+
+    as_array = obfuscate_vector(np.array(vec, dtype=np.float32), project="blob")
+    as_list = obfuscate_vector(vec, project="blob")
+
+    assert isinstance(as_array, np.ndarray)
+    assert as_array.dtype == np.float32
+    assert isinstance(as_list, list)
+    assert to_float32_blob(as_array) == to_float32_blob(as_list)
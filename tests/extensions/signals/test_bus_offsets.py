@@ -0,0 +1,160 @@
+# [C5-REAL] Exergy-Maximized
+"""Consumer offsets for SignalBus / AsyncSignalBus: range polls, batch ack, GC."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+
+import aiosqlite
+import pytest
+
+from babylon60.extensions.signals.bus import AsyncSignalBus, SignalBus
+
+
+@pytest.fixture
+def bus():
+    conn = sqlite3.connect(":memory:")
+    yield SignalBus(conn)
+    conn.close()
+
+
+def _offset(bus: SignalBus, consumer: str, tenant_id: str = "default") -> int | None:
+    row = bus._conn.execute(
+        "SELECT last_rowid FROM signal_offsets WHERE consumer = ? AND tenant_id = ?",
+        (consumer, tenant_id),
+    ).fetchone()
+    return row[0] if row else None
+
+
+def test_poll_reads_past_offset_and_acks_once(bus):
+    ids = [bus.emit(f"e{i}") for i in range(5)]
+    statements: list[str] = []
+    bus._conn.set_trace_callback(statements.append)
+
+    first = bus.poll(consumer="a", limit=3)
+
+    bus._conn.set_trace_callback(None)
+    assert [s.id for s in first] == ids[:3]
+    assert _offset(bus, "a") == ids[2]
+    assert not any(s.lstrip().upper().startswith("UPDATE") for s in statements)
+    assert sum("signal_offsets (consumer" in s for s in statements) == 1
+
+    assert [s.id for s in bus.poll(consumer="a")] == ids[3:]
+    assert bus.poll(consumer="a") == []
+    # Offsets are per consumer and per tenant.
+    assert [s.id for s in bus.poll(consumer="b")] == ids
+    assert bus.poll(consumer="a", tenant_id="other") == []
+
+
+def test_peek_and_history_report_consumers(bus):
+    ids = [bus.emit("x") for _ in range(3)]
+    bus.ack("a", ids[1])
+
+    assert [s.id for s in bus.peek(consumer="a")] == [ids[2]]
+    history = {s.id: s.consumed_by for s in bus.history()}
+    assert history == {ids[0]: ["a"], ids[1]: ["a"], ids[2]: []}
+
+    stats = bus.stats()
+    assert stats["unconsumed"] == 1
+    assert stats["offsets"] == {"a": ids[1]}
+
+    bus.ack("a", ids[0])  # never moves backwards
+    assert _offset(bus, "a") == ids[1]
+
+
+def test_gc_drops_only_what_every_consumer_passed(bus):
+    ids = [bus.emit("x") for _ in range(4)]
+    bus.emit("x", tenant_id="lonely")
+    bus.ack("a", ids[3])
+    bus.ack("b", ids[1])
+
+    assert bus.gc(max_age_days=-1) == 2
+    remaining = [s.id for s in bus.history()]
+    assert sorted(remaining) == ids[2:]
+    # A tenant with no registered consumer keeps its signals.
+    assert bus.stats("lonely")["total"] == 1
+
+    bus.unregister("b")
+    assert bus.gc(max_age_days=-1) == 2
+
+
+def test_filtered_poll_keeps_skipped_rows_for_other_filters(bus):
+    a1 = bus.emit("alpha")
+    b1 = bus.emit("beta")
+    a2 = bus.emit("alpha")
+
+    assert [s.id for s in bus.poll(consumer="c", event_type="alpha")] == [a1, a2]
+    assert [s.id for s in bus.poll(consumer="c", event_type="beta")] == [b1]
+    assert bus.poll(consumer="c", event_type="alpha") == []
+    # Only the filter that matched counts the row as consumed.
+    history = {s.id: s.consumed_by for s in bus.history()}
+    assert history == {a1: ["c"], b1: ["c"], a2: ["c"]}
+    assert bus.stats()["unconsumed"] == 3
+
+    bus.unregister("c")
+    assert bus._conn.execute("SELECT COUNT(*) FROM signal_offsets").fetchone() == (0,)
+
+
+def test_legacy_consumed_by_seeds_offsets():
+    conn = sqlite3.connect(":memory:")
+    legacy = SignalBus(conn)
+    legacy.ensure_table()
+    conn.execute("DROP TABLE signal_offsets")
+    for consumed in (["reactor"], ["reactor", "pulse"], []):
+        conn.execute(
+            "INSERT INTO signals (event_type, source, consumed_by) VALUES ('x', 'cli', ?)",
+            (json.dumps(consumed),),
+        )
+    conn.commit()
+
+    bus = SignalBus(conn)
+    assert [s.id for s in bus.poll(consumer="reactor")] == [3]
+    # pulse never consumed row 1, so its offset stops before it.
+    assert [s.id for s in bus.poll(consumer="pulse")] == [1, 3]
+    conn.close()
+
+
+def test_legacy_filtered_consumer_is_not_redelivered():
+    conn = sqlite3.connect(":memory:")
+    legacy = SignalBus(conn)
+    legacy.ensure_table()
+    conn.execute("DROP TABLE signal_offsets")
+    # A pre-upgrade poll(event_type="a", consumer="w") consumed rows 1 and 3.
+    for event_type, consumed in (("a", ["w"]), ("b", []), ("a", ["w"]), ("a", [])):
+        conn.execute(
+            "INSERT INTO signals (event_type, source, consumed_by) VALUES (?, 'cli', ?)",
+            (event_type, json.dumps(consumed)),
+        )
+    conn.commit()
+
+    bus = SignalBus(conn)
+    assert [s.id for s in bus.poll(consumer="w", event_type="a")] == [4]
+    assert [s.id for s in bus.poll(consumer="w")] == [2]
+    assert bus.poll(consumer="w") == []
+    conn.close()
+
+
+def test_filtered_and_plain_polls_never_redeliver(bus):
+    a1 = bus.emit("a")
+    b1 = bus.emit("b")
+
+    assert [s.id for s in bus.poll(consumer="w", event_type="a")] == [a1]
+    assert [s.id for s in bus.poll(consumer="w")] == [b1]
+    a2 = bus.emit("a")
+    assert [s.id for s in bus.poll(consumer="w")] == [a2]
+    assert bus.poll(consumer="w", event_type="a") == []
+    assert bus.poll(consumer="w", source="cli") == []
+
+
+@pytest.mark.asyncio
+async def test_async_bus_shares_the_offset_model():
+    async with aiosqlite.connect(":memory:") as conn:
+        bus = AsyncSignalBus(conn)
+        ids = [await bus.emit("x") for _ in range(3)]
+
+        assert [s.id for s in await bus.poll(consumer="a", limit=2)] == ids[:2]
+        assert [s.id for s in await bus.peek(consumer="a")] == [ids[2]]
+        assert (await bus.stats())["offsets"] == {"a": ids[1]}
+        assert await bus.gc(max_age_days=-1) == 2
+        assert [s.id for s in await bus.poll(consumer="a")] == [ids[2]]
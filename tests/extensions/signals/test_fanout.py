@@ -0,0 +1,144 @@
+# [C5-REAL] Exergy-Maximized
+"""Tests for SignalFanoutHub - one shared signals tailer for all SSE clients."""
+
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+
+from babylon60.extensions.signals.bus import AsyncSignalBus
+from babylon60.extensions.signals.fanout import SignalFanoutHub, _SessionSource
+
+
+class _CountingSource(_SessionSource):
+    def __init__(self, conn: aiosqlite.Connection) -> None:
+        @asynccontextmanager
+        async def factory():
+            yield conn
+
+        super().__init__(factory)
+        self.reads = 0
+
+    async def rows_after(self, after_id: int, limit: int) -> list[tuple]:
+        self.reads += 1
+        return await super().rows_after(after_id, limit)
+
+
+@pytest.fixture
+async def bus_and_source():
+    async with aiosqlite.connect(":memory:") as conn:
+        bus = AsyncSignalBus(conn)
+        await bus.ensure_table()
+        yield bus, _CountingSource(conn)
+
+
+async def _next(stream):
+    return await asyncio.wait_for(stream.__anext__(), timeout=1.0)
+
+
+@pytest.mark.asyncio
+async def test_emit_wakes_tailer_without_waiting_for_poll(bus_and_source):
+    bus, source = bus_and_source
+    hub = SignalFanoutHub(source, poll_interval=30.0)
+    stream = hub.stream("default")
+    pending = asyncio.ensure_future(_next(stream))
+    await asyncio.sleep(0.05)
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await bus.emit("task:done", {"n": 1})
+    sig = await pending
+
+    assert sig.event_type == "task:done"
+    assert loop.time() - start < 0.1
+    await stream.aclose()
+    assert hub.subscriber_count == 0
+
+
+@pytest.mark.asyncio
+async def test_filters_by_tenant_and_type_with_one_reader(bus_and_source):
+    bus, source = bus_and_source
+    hub = SignalFanoutHub(source, poll_interval=30.0)
+    subs = [
+        await hub.subscribe("acme", ["deploy"]),
+        await hub.subscribe("acme"),
+        await hub.subscribe("other"),
+    ]
+    await asyncio.sleep(0.05)
+    reads_before = source.reads
+
+    await bus.emit("deploy", tenant_id="acme")
+    await bus.emit("build", tenant_id="acme")
+    await bus.emit("deploy", tenant_id="other")
+    await asyncio.sleep(0.1)
+
+    got = [[s.event_type for s in _drain(sub)] for sub, _ in subs]
+    assert got == [["deploy"], ["deploy", "build"], ["deploy"]]
+    # One tailer read per wake-up, independent of the subscriber count.
+    assert source.reads - reads_before <= 3
+    for sub, _ in subs:
+        await hub.unsubscribe(sub)
+
+
+def _drain(sub):
+    out = []
+    while not sub.queue.empty():
+        out.append(sub.queue.get_nowait())
+    return out
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_replays_missed_signals(bus_and_source):
+    bus, source = bus_and_source
+    first = await bus.emit("a")
+    await bus.emit("b")
+    await bus.emit("c")
+    hub = SignalFanoutHub(source, poll_interval=30.0)
+
+    stream = hub.stream("default", last_event_id=first)
+    assert [(await _next(stream)).event_type for _ in range(2)] == ["b", "c"]
+
+    await bus.emit("d")
+    assert (await _next(stream)).event_type == "d"
+    await stream.aclose()
+
+
+@pytest.mark.asyncio
+async def test_slow_subscriber_drops_oldest_and_is_told(bus_and_source):
+    bus, source = bus_and_source
+    hub = SignalFanoutHub(source, poll_interval=30.0, queue_size=2)
+    stream = hub.stream("default")
+    pending = asyncio.ensure_future(_next(stream))
+    await asyncio.sleep(0.05)
+    await bus.emit("e0")
+    assert (await pending).event_type == "e0"
+
+    for i in range(1, 6):
+        await bus.emit(f"e{i}")
+    await asyncio.sleep(0.1)
+
+    assert await _next(stream) == 3
+    assert [(await _next(stream)).event_type for _ in range(2)] == ["e4", "e5"]
+    await stream.aclose()
+
+
+@pytest.mark.parametrize(
+    ("headers", "query", "expected"),
+    [
+        ([(b"last-event-id", b"42")], b"", 42),
+        ([], b"last_event_id=7", 7),
+        ([(b"last-event-id", b"9")], b"last_event_id=7", 9),
+        ([(b"last-event-id", b"abc")], b"", None),
+        ([], b"", None),
+    ],
+)
+def test_parse_last_event_id_reads_header_then_query(headers, query, expected):
+    from starlette.requests import Request
+
+    from babylon60.routes.events import parse_last_event_id
+
+    request = Request({"type": "http", "headers": headers, "query_string": query})
+    assert parse_last_event_id(request) == expected
@@ -4,7 +4,14 @@ import hashlib
 import sqlite3
 import aiosqlite
 from unittest.mock import MagicMock
+from babylon60.consensus.merkle import compute_merkle_root
 from babylon60.ledger.ledger_core import MerkleTree, SovereignLedger
+from babylon60.ledger.merkle import (
+    MERKLE_HASH_V1,
+    MERKLE_HASH_V2,
+    MERKLE_HASH_VERSION,
+    merkle_root,
+)
 
 
 def test_merkle_tree_root():
@@ -123,3 +130,72 @@ async def test_sovereign_ledger_async_ops(tmp_path):
         report = await ledger.audit_integrity_async(tenant_id="t2")
         assert report["valid"] is True
         assert report["tx_count"] == 1
+
+
+@pytest.mark.parametrize("version", [MERKLE_HASH_V1, MERKLE_HASH_V2])
+def test_merkle_append_matches_full_build_and_frontier(version):
+    """Incremental appends, a fresh build and the frontier agree on every prefix."""
+    leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(37)]
+    tree = MerkleTree(version=version)
+    for n, leaf in enumerate(leaves, start=1):
+        tree.append(leaf)
+        expected = MerkleTree(leaves[:n], version=version).root_hash
+        assert tree.root_hash == expected
+        assert merkle_root(leaves[:n], version) == expected
+
+    root = tree.root_hash
+    for index, proof in enumerate(tree.get_proofs(0, len(leaves))):
+        assert MerkleTree.verify_proof(leaves[index], proof, root, version)
+
+
+def test_merkle_v1_root_is_legacy_hex_scheme():
+    leaves = [hashlib.sha256(str(i).encode()).hexdigest() for i in range(5)]
+    assert MerkleTree(leaves).root_hash == compute_merkle_root(leaves)
+    assert MerkleTree(leaves, version=MERKLE_HASH_V2).root_hash != compute_merkle_root(leaves)
+
+
+def test_checkpoint_extends_incrementally_and_verifies(tmp_path):
+    """A checkpoint below batch size keeps its frontier for the next call."""
+    conn = sqlite3.connect(tmp_path / "frontier.db")
+    ledger = SovereignLedger(conn)
+    ledger._config = MagicMock(CHECKPOINT_MAX=4)
+
+    for i in range(3):
+        ledger.record_transaction("p", "a", {"i": i})
+    assert ledger.create_checkpoint() is None
+    assert len(ledger._pending_checkpoint.frontier) == 3
+    ledger.record_transaction("p", "a", {"i": 3})
+    root = ledger.create_checkpoint()
+
+    hashes = [r[0] for r in conn.execute("SELECT hash FROM transactions ORDER BY id")]
+    assert root == MerkleTree(hashes, version=MERKLE_HASH_VERSION).root_hash
+    row = conn.execute("SELECT hash_version FROM merkle_roots WHERE root_hash = ?", (root,))
+    assert row.fetchone()[0] == MERKLE_HASH_VERSION
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_merkle_audit_and_proof_export(tmp_path):
+    """Legacy v1 and new v2 checkpoints both verify and export proofs."""
+    db_path = tmp_path / "export.db"
+    with sqlite3.connect(db_path) as s_conn:
+        ledger = SovereignLedger(s_conn)
+        ledger._config = MagicMock(CHECKPOINT_MAX=4)
+        for i in range(4):
+            ledger.record_transaction("p", "a", {"i": i})
+        ledger.create_checkpoint()
+        hashes = [r[0] for r in s_conn.execute("SELECT hash FROM transactions ORDER BY id")]
+        s_conn.execute(
+            "INSERT INTO merkle_roots (tenant_id, root_hash, tx_start_id, tx_end_id, tx_count) "
+            "VALUES ('__global__', ?, 1, 2, 2)",
+            (MerkleTree(hashes[:2]).root_hash,),
+        )
+
+    async with aiosqlite.connect(db_path) as conn:
+        ledger = SovereignLedger(conn)
+        assert await ledger._verify_merkle_roots(conn, None) == []
+        proofs = await ledger.export_merkle_proofs(2, 3)
+    by_version = {(p["tx_id"], p["hash_version"]): p for p in proofs}
+    assert set(by_version) == {(2, 2), (3, 2), (2, 1)}
+    for p in proofs:
+        assert MerkleTree.verify_proof(p["hash"], p["proof"], p["root_hash"], p["hash_version"])
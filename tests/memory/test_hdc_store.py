@@ -0,0 +1,98 @@
+# [C5-REAL] Exergy-Maximized
+import sqlite3
+
+import numpy as np
+import pytest
+
+from babylon60.memory.hdc.algebra import hamming_distances_packed, pack_bipolar, unpack_bipolar
+from babylon60.memory.hdc.codec import HDCEncoder
+from babylon60.memory.hdc.item_memory import ItemMemory
+from babylon60.memory.hdc.store import HDCVectorStoreL2
+from babylon60.memory.models import CortexFactModel, SourceMetadata
+
+
+@pytest.fixture(autouse=True)
+def _no_taint(monkeypatch):
+    monkeypatch.setenv("CORTEX_NO_TAINT_ENFORCE", "1")
+
+
+def _fact(content: str, **metadata) -> CortexFactModel:
+    return CortexFactModel(
+        tenant_id="t1",
+        project_id="p1",
+        content=content,
+        embedding=[0.1] * 8,
+        metadata=metadata,
+        confidence="C5",
+        source_metadata=SourceMetadata(origin="system", author="test", confidence_in_source=1.0),
+    )
+
+
+def test_pack_bipolar_roundtrip_and_hamming():
+    """Packed bits round-trip and popcount matches the bipolar dot product."""
+    rng = np.random.default_rng(3)
+    a = rng.choice(np.array([-1, 1], dtype=np.int8), size=200)
+    b = rng.choice(np.array([-1, 1], dtype=np.int8), size=200)
+    assert np.array_equal(unpack_bipolar(pack_bipolar(a), 200), a)
+    dist = int(
+        hamming_distances_packed(pack_bipolar(a), np.frombuffer(pack_bipolar(b), dtype=np.uint8))
+    )
+    assert 1 - 2 * dist / 200 == pytest.approx(int(np.dot(a.astype(int), b.astype(int))) / 200)
+    # Zero components map to +1, as the legacy np.sign projection did.
+    zeros = np.array([0.0, -0.5, 0.5, 0.0], dtype=np.float32)
+    assert unpack_bipolar(pack_bipolar(zeros), 4).tolist() == [1, -1, 1, 1]
+
+
+async def test_memorize_stores_packed_bits_and_recalls(tmp_path):
+    """Facts are stored at 1 bit per dimension and recalled by Hamming ranking."""
+    item_mem = ItemMemory(dim=256)
+    store = HDCVectorStoreL2(HDCEncoder(item_mem), item_mem, db_path=tmp_path / "hdc.db")
+
+    await store.memorize(_fact("sqlite write ahead log tuning"))
+    await store.memorize(_fact("bananas are yellow fruit"))
+
+    conn = store._get_conn()
+    blob = conn.execute("SELECT embedding FROM hdc_bit_facts LIMIT 1").fetchone()[0]
+    assert len(blob) == 256 // 8
+
+    results = await store.recall_secure("t1", "p1", "sqlite write ahead log", limit=2)
+    assert results[0].content == "sqlite write ahead log tuning"
+    assert set(results[0].embedding) <= {-1, 1}
+    await store.close()
+
+
+async def test_toxic_inhibition_uses_packed_vectors(tmp_path):
+    """Inhibiting a fact by id suppresses its own score."""
+    item_mem = ItemMemory(dim=256)
+    store = HDCVectorStoreL2(HDCEncoder(item_mem), item_mem, db_path=tmp_path / "hdc.db")
+    toxic = _fact("deploy failed with segfault")
+    await store.memorize(toxic)
+
+    plain = await store.recall_secure("t1", "p1", "deploy failed with segfault", limit=1)
+    inhibited = await store.recall_secure(
+        "t1", "p1", "deploy failed with segfault", limit=1, inhibit_ids=[toxic.id]
+    )
+    assert inhibited[0]._recall_score < plain[0]._recall_score
+    await store.close()
+
+
+async def test_legacy_float_vectors_are_migrated(tmp_path):
+    """A pre-existing float32 hdc_vec_facts table is rewritten into packed bits."""
+    db_file = tmp_path / "hdc.db"
+    hv = np.where(np.arange(64) % 3 == 0, 1, -1).astype(np.int8)
+    with sqlite3.connect(db_file) as legacy:
+        legacy.execute("CREATE TABLE hdc_vec_facts (rowid INTEGER PRIMARY KEY, embedding BLOB)")
+        legacy.execute(
+            "INSERT INTO hdc_vec_facts(rowid, embedding) VALUES (1, ?)",
+            (hv.astype(np.float32).tobytes(),),
+        )
+
+    item_mem = ItemMemory(dim=64)
+    store = HDCVectorStoreL2(HDCEncoder(item_mem), item_mem, db_path=db_file)
+    conn = store._get_conn()
+    assert (
+        conn.execute("SELECT 1 FROM sqlite_master WHERE name = 'hdc_vec_facts'").fetchone() is None
+    )
+    blob = conn.execute("SELECT embedding FROM hdc_bit_facts WHERE rowid = 1").fetchone()[0]
+    assert np.array_equal(unpack_bipolar(blob, 64), hv)
+    await store.close()
@@ -0,0 +1,136 @@
+# [C5-REAL] Exergy-Maximized
+"""BeliefConsolidator clustering: blocked leader assignment vs. the greedy reference."""
+
+from __future__ import annotations
+
+import aiosqlite
+import numpy as np
+import pytest
+
+from babylon60.compaction import consolidator as mod
+from babylon60.compaction.consolidator import BeliefConsolidator, _leader_assign
+
+
+def _reference(vectors: np.ndarray, threshold: float) -> list[int]:
+    """The original O(N²) greedy scan."""
+    sim = vectors @ vectors.T
+    leader = [-1] * len(vectors)
+    for i in range(len(vectors)):
+        if leader[i] != -1:
+            continue
+        leader[i] = i
+        for j in range(i + 1, len(vectors)):
+            if leader[j] == -1 and sim[i, j] >= threshold:
+                leader[j] = i
+    return leader
+
+
+def _clustered_vectors(n: int, dim: int = 16, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(n // 8, 1), dim))
+    vecs = centers[rng.integers(0, len(centers), n)] + 0.3 * rng.standard_normal((n, dim))
+    vecs = vecs.astype(np.float32)
+    return vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+
+
+@pytest.mark.parametrize("block_rows,block_cols", [(7, 11), (64, 5), (1000, 1000)])
+def test_blocked_assignment_matches_greedy_scan(block_rows, block_cols):
+    vectors = _clustered_vectors(300)
+
+    leader, sims = _leader_assign(vectors, 0.8, block_rows=block_rows, block_cols=block_cols)
+
+    assert leader.tolist() == _reference(vectors, 0.8)
+    members = leader != np.arange(len(leader))
+    expected = np.einsum("ij,ij->i", vectors[members], vectors[leader[members]])
+    np.testing.assert_allclose(sims[members], expected, rtol=1e-5)
+
+
+class _Embedder:
+    def __init__(self, table: dict[str, list[float]]) -> None:
+        self.table = table
+        self.calls: list[int] = []
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(len(texts))
+        return [self.table[t] for t in texts]
+
+
+def test_clusters_keep_event_order_and_embed_in_chunks(monkeypatch):
+    monkeypatch.setattr(mod, "_EMBED_CHUNK", 2)
+    embedder = _Embedder(
+        {
+            "a1": [1.0, 0.0],
+            "b1": [0.0, 1.0],
+            "a2": [0.99, 0.05],
+            "c": [-1.0, 0.0],
+            "b2": [0.05, 0.99],
+        }
+    )
+    contents = list(embedder.table)
+
+    clusters = BeliefConsolidator(similarity_threshold=0.9)._cluster_by_similarity(
+        contents, [10, 20, 30, 40, 50], embedder
+    )
+
+    assert [(c.cluster_id, c.event_ids) for c in clusters] == [(0, [10, 30]), (1, [20, 50])]
+    assert clusters[0].event_contents == ["a1", "a2"]
+    assert 0.9 < clusters[0].avg_similarity <= 1.0
+    assert embedder.calls == [2, 2, 1]
+
+
+def test_stored_vectors_skip_the_embedder():
+    embedder = _Embedder({"b1": [0.0, 1.0], "b2": [0.05, 0.99]})
+    stored = [
+        np.asarray([1.0, 0.0], dtype=np.float32).tobytes(),
+        None,
+        np.asarray([0.99, 0.05], dtype=np.float32).tobytes(),
+        None,
+    ]
+
+    clusters = BeliefConsolidator(similarity_threshold=0.9)._cluster_by_similarity(
+        ["a1", "b1", "a2", "b2"], [10, 20, 30, 40], embedder, stored
+    )
+
+    assert [c.event_ids for c in clusters] == [[10, 30], [20, 40]]
+    assert embedder.calls == [2]
+
+
+class _Engine:
+    def __init__(self, conn: aiosqlite.Connection, embedder: _Embedder) -> None:
+        self._conn = conn
+        self._embedder = embedder
+
+    async def get_conn(self) -> aiosqlite.Connection:
+        return self._conn
+
+    def _get_embedder(self) -> _Embedder:
+        return self._embedder
+
+
+@pytest.mark.asyncio
+async def test_consolidate_reuses_stored_vectors_and_caps_fresh_embeds(monkeypatch):
+    from babylon60.core import config
+
+    monkeypatch.setattr(config, "EMBEDDING_CACHE_PATH", "")
+    monkeypatch.setattr(mod, "_MAX_FRESH_EMBEDS", 2)
+    embedder = _Embedder({f"e{i}": [1.0, 0.0] for i in range(5)})
+    async with aiosqlite.connect(":memory:") as conn:
+        await conn.execute(
+            "CREATE TABLE facts (id INTEGER PRIMARY KEY, project TEXT, content TEXT, "
+            "fact_type TEXT, valid_until TEXT, created_at TEXT)"
+        )
+        await conn.execute("CREATE TABLE fact_embeddings (fact_id INTEGER, embedding BLOB)")
+        for i in range(5):
+            await conn.execute(
+                "INSERT INTO facts VALUES (?, 'p', ?, 'event', NULL, datetime('now', ?))",
+                (i + 1, f"e{i}", f"-{i} minutes"),
+            )
+        blob = np.asarray([1.0, 0.0], dtype=np.float32).tobytes()
+        await conn.executemany("INSERT INTO fact_embeddings VALUES (?, ?)", [(1, blob), (2, blob)])
+
+        result = await BeliefConsolidator().consolidate(_Engine(conn, embedder), "p", dry_run=True)
+
+    # Facts 1-2 reuse stored vectors, 3-4 are embedded, 5 waits for a later cycle.
+    assert result.total_events_scanned == 4
+    assert embedder.calls == [2]
+    assert result.clusters[0].event_ids == [1, 2, 3, 4]
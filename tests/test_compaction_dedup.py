@@ -0,0 +1,79 @@
+# [C5-REAL] Exergy-Maximized
+"""Tests for MinHash/LSH near-duplicate detection in compaction DEDUP."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+
+import aiosqlite
+import pytest
+
+from babylon60.compaction import minhash
+from babylon60.compaction.compactor import CompactionResult
+from babylon60.compaction.strategies.dedup import _find_near_duplicates, execute_dedup
+
+WORDS = "alpha beta gamma delta sqlite ledger vector merkle tenant cache shard index".split()
+
+
+def _corpus(n: int, seed: int = 7) -> list[tuple]:
+    rng = random.Random(seed)
+    rows = []
+    for i in range(n):
+        text = " ".join(rng.choice(WORDS) for _ in range(20))
+        rows.append((2 * i, text, "knowledge", f"2026-01-{i % 28 + 1:02d}"))
+        # Near-duplicate: one word swapped
+        near = text.replace(text.split()[3], "zulu", 1)
+        rows.append((2 * i + 1, near, "knowledge", f"2026-02-{i % 28 + 1:02d}"))
+    return rows
+
+
+def test_signature_roundtrip_and_identity():
+    sig = minhash.signature("The quick brown fox")
+    assert sig.shape == (minhash.NUM_PERM,)
+    assert (minhash.signature_from_bytes(minhash.signature_to_bytes(sig)) == sig).all()
+    assert (minhash.signature("the  QUICK brown fox ") == sig).all()
+
+
+def test_lsh_respects_partitions():
+    sig = minhash.signature("identical content for both facts")
+    assert minhash.LSHIndex([sig, sig]).candidates(0) == [1]
+    assert minhash.LSHIndex([sig, sig], partitions=["error", "decision"]).candidates(0) == []
+
+
+def test_lsh_grouping_matches_pairwise_scan():
+    rows = _corpus(40)
+    signatures = {r[0]: minhash.signature(r[1]) for r in rows}
+    pairwise = _find_near_duplicates(rows, set(), 0.85)
+    lsh = _find_near_duplicates(rows, set(), 0.85, signatures)
+    assert lsh == pairwise
+    assert len(lsh) == 40
+
+
+async def test_execute_dedup_backfills_signatures_and_recalls_once(tmp_path):
+    rows = _corpus(5)
+    facts = [SimpleNamespace(id=r[0], content=r[1], fact_type=r[2], created_at=r[3]) for r in rows]
+
+    conn = await aiosqlite.connect(tmp_path / "dedup.db")
+    await conn.execute(
+        "CREATE TABLE fact_minhash (fact_id INTEGER PRIMARY KEY, signature BLOB NOT NULL)"
+    )
+    engine = MagicMock()
+    engine.facts.recall = AsyncMock(return_value=facts)
+    engine.get_conn = AsyncMock(return_value=conn)
+    engine.deprecate = AsyncMock()
+
+    result = CompactionResult(project="p")
+    await execute_dedup(engine, "p", result, dry_run=False, threshold=0.85)
+
+    assert engine.facts.recall.await_count == 1
+    assert sorted(result.deprecated_ids) == [r[0] for r in rows if r[0] % 2]
+    async with conn.execute("SELECT COUNT(*) FROM fact_minhash") as cursor:
+        assert (await cursor.fetchone())[0] == len(rows)
+    await conn.close()
+
+
+@pytest.mark.parametrize("text", ["", "ab"])
+def test_signature_short_content(text):
+    assert minhash.signature(text).shape == (minhash.NUM_PERM,)
@@ -0,0 +1,114 @@
+# [C5-REAL] Exergy-Maximized
+"""KnowledgeIndex: incremental refresh, BM25 ranking, budget-aware loading."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import babylon60.context.assembler as assembler_mod
+from babylon60.context.assembler import ContextAssembler
+from babylon60.context.ki_index import KnowledgeIndex
+
+
+def _touch(path, text: str, bump: int = 0) -> None:
+    path.write_text(text, encoding="utf-8")
+    if bump:
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump))
+
+
+def test_refresh_rereads_only_changed_files(tmp_path):
+    (tmp_path / "sub").mkdir()
+    _touch(tmp_path / "a.md", "alpha")
+    _touch(tmp_path / "sub" / "b.txt", "beta")
+    _touch(tmp_path / "ignored.json", "alpha")
+    index = KnowledgeIndex(str(tmp_path))
+
+    assert index.refresh() == (2, 0)
+    assert index.refresh() == (0, 0)
+
+    _touch(tmp_path / "a.md", "gamma", bump=10**9)
+    (tmp_path / "sub" / "b.txt").unlink()
+    assert index.refresh() == (1, 1)
+    assert [h.relative_name for h in index.search("gamma")] == ["a.md"]
+    assert list(index.search("alpha beta")) == []
+
+
+def test_bm25_prefers_rare_and_name_terms(tmp_path):
+    _touch(tmp_path / "common.md", "sqlite sqlite sqlite notes")
+    _touch(tmp_path / "other.md", "sqlite notes")
+    _touch(tmp_path / "vector_search.md", "notes about sqlite")
+    index = KnowledgeIndex(str(tmp_path))
+
+    hits = [h.relative_name for h in index.search("vector sqlite")]
+
+    assert hits[0] == "vector_search.md"
+    assert set(hits) == {"common.md", "other.md", "vector_search.md"}
+
+
+def test_assembler_reads_only_files_that_fit(tmp_path, monkeypatch):
+    _touch(tmp_path / "raft_consensus.md", "raft consensus " * 200)
+    for i in range(5):
+        _touch(tmp_path / f"raft_note_{i}.md", "raft " * 100)
+    ContextAssembler(knowledge_dir=tmp_path).assemble("raft consensus")  # warm the index
+
+    opened: list[str] = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.path.basename(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(assembler_mod, "open", tracking_open, raising=False)
+    ctx = ContextAssembler(knowledge_dir=tmp_path).assemble("raft consensus", max_tokens=650)
+
+    assert ctx.knowledge_items[0]["source"] == "raft_consensus.md"
+    assert ctx.relevance_scores["raft_consensus.md"] == 1.0
+    assert opened == [item["source"] for item in ctx.knowledge_items]
+    assert len(opened) < 6
+
+
+def test_assembler_skips_hits_that_do_not_fit(tmp_path, monkeypatch):
+    _touch(tmp_path / "raft_election.md", "raft consensus election " * 20)
+    _touch(tmp_path / "consensus_log.md", "raft consensus " * 400)
+    _touch(tmp_path / "raft_tip.md", "raft " * 40)
+    ContextAssembler(knowledge_dir=tmp_path).assemble("raft")  # warm the index
+
+    opened: list[str] = []
+    real_open = open
+
+    def tracking_open(path, *args, **kwargs):
+        opened.append(os.path.basename(path))
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr(assembler_mod, "open", tracking_open, raising=False)
+    ctx = ContextAssembler(knowledge_dir=tmp_path).assemble(
+        "raft consensus election", max_tokens=600
+    )
+
+    # consensus_log.md outranks raft_tip.md but would overflow the budget.
+    assert opened == ["raft_election.md", "raft_tip.md"]
+    assert [item["source"] for item in ctx.knowledge_items] == opened
+
+
+def test_search_throttles_directory_walks(tmp_path):
+    _touch(tmp_path / "a.md", "alpha")
+    index = KnowledgeIndex(str(tmp_path), refresh_interval=3600)
+
+    assert [h.relative_name for h in index.search("alpha")] == ["a.md"]
+    _touch(tmp_path / "b.md", "alpha")
+    assert [h.relative_name for h in index.search("alpha")] == ["a.md"]
+
+    index.refresh_interval = 0
+    assert {h.relative_name for h in index.search("alpha")} == {"a.md", "b.md"}
+
+
+@pytest.mark.asyncio
+async def test_assemble_async_uses_the_index(tmp_path):
+    _touch(tmp_path / "paxos.md", "paxos leader election")
+
+    ctx = await ContextAssembler(knowledge_dir=tmp_path).assemble_async("explain paxos")
+
+    assert [item["source"] for item in ctx.knowledge_items] == ["paxos.md"]
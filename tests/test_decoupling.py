@@ -45,14 +45,13 @@ async def test_asynchronous_enrichment_flow(engine):
     config = CortexConfig(DB_PATH=engine._db_path)
     worker = EnrichmentWorker(engine, config)
     # We bypass the loop for deterministic testing
-    job = await worker._get_next_job()
-    assert job is not None
-    assert job["fact_id"] == fact_id
+    jobs = await worker._claim_batch()
+    assert [job["fact_id"] for job in jobs] == [fact_id]
 
     # Mocking the embedder if needed, or letting it fail to see P0 resistance
     # For now, we assume a local or mocked embedder works for this test
     try:
-        await worker._process_job(job)
+        await worker._process_batch(jobs)
         final_status = await oracle.check_enrichment_status(fact_id)
         assert final_status == "completed"
     except Exception as e:
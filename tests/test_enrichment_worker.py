@@ -4,9 +4,10 @@ Tests for cortex.enrichment.worker (EnrichmentWorker via LedgerStore + Enrichmen
 ────────────────────────────────────────────────────────────────────────────────────────
 Coverage targets:
   - start / stop lifecycle
-  - _run_loop: processes job when queue returns one, backs off when empty
-  - _process_job: happy path (store tx + mark_done), missing event, enrichment dispatch
-  - _enrich_fact: skips when no embeddings, delegates when available, surfaces errors
+  - _run_loop: processes a batch when the queue returns one, backs off when empty
+  - _process_batch: happy path (store tx + mark_done), missing event, enrichment dispatch
+  - _enrich_facts: skips when no embeddings, delegates when available, fails the batch
+  - compat claims: failed rows stop being retried after _MAX_ATTEMPTS
 """
 
 from __future__ import annotations
@@ -22,19 +23,20 @@ from babylon60.enrichment.worker import EnrichmentWorker
 # ─── Helpers ──────────────────────────────────────────────────────────
 
 
-def _make_worker(queue_jobs=None, store_row=None, engine=None):
-    """Build an EnrichmentWorker with mocked dependencies."""
+def _make_worker(queue_jobs=None, store_rows=None, engine=None):
+    """Build an EnrichmentWorker with mocked dependencies.
+
+    ``store_rows`` maps ledger event ids to their payloads.
+    """
     store = MagicMock()
     engine = engine or MagicMock()
 
     # Store tx context manager returns a connection-like object
     conn_mock = MagicMock()
-    if store_row is not None:
-        conn_mock.execute.return_value.fetchone.return_value = {
-            "payload_json": json.dumps(store_row)
-        }
-    else:
-        conn_mock.execute.return_value.fetchone.return_value = None
+    conn_mock.execute.return_value.fetchall.return_value = [
+        {"event_id": event_id, "payload_json": json.dumps(payload)}
+        for event_id, payload in (store_rows or {}).items()
+    ]
     store.tx.return_value.__enter__ = MagicMock(return_value=conn_mock)
     store.tx.return_value.__exit__ = MagicMock(return_value=False)
 
@@ -45,6 +47,10 @@ def _make_worker(queue_jobs=None, store_row=None, engine=None):
     worker.queue = MagicMock()
     job_iter = iter(queue_jobs)
     worker.queue.claim_one.side_effect = lambda: next(job_iter, None)
+    worker.queue.claim_batch.side_effect = lambda limit: [
+        job for job in (next(job_iter, None) for _ in range(limit)) if job
+    ]
+    worker.queue.depth.return_value = 0
     worker.queue.mark_done = MagicMock()
     worker.queue.mark_failed = MagicMock()
 
@@ -97,27 +103,27 @@ class TestEnrichmentWorkerLifecycle:
         assert worker.is_running is False
 
 
-# ─── _process_job ─────────────────────────────────────────────────────
+# ─── _process_batch ───────────────────────────────────────────────────
 
 
-class TestProcessJob:
+class TestProcessLedgerBatch:
     @pytest.mark.asyncio
     async def test_marks_done_on_success(self):
         payload = {"action": "query", "metadata": {}}
         job = {"job_id": "j1", "event_id": "e1", "attempts": 0}
-        worker, store, _ = _make_worker(queue_jobs=[job], store_row=payload)
+        worker, _, _ = _make_worker(store_rows={"e1": payload})
 
-        await worker._process_job(job)
+        await worker._process_batch([job])
 
-        worker.queue.mark_done.assert_called_once_with("j1", "e1")
+        worker.queue.mark_done_many.assert_called_once_with([("j1", "e1")])
         worker.queue.mark_failed.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_marks_failed_when_event_not_found(self):
         job = {"job_id": "j2", "event_id": "missing", "attempts": 1}
-        worker, _, _ = _make_worker(store_row=None)
+        worker, _, _ = _make_worker()
 
-        await worker._process_job(job)
+        await worker._process_batch([job])
 
         worker.queue.mark_failed.assert_called_once()
         args = worker.queue.mark_failed.call_args[0]
@@ -125,7 +131,7 @@ class TestProcessJob:
         assert args[1] == "missing"
 
     @pytest.mark.asyncio
-    async def test_enrich_fact_called_for_store_action(self):
+    async def test_enrich_facts_called_for_store_action(self):
         payload = {
             "action": "store",
             "target": {"identifier": "42"},
@@ -134,68 +140,100 @@ class TestProcessJob:
         job = {"job_id": "j3", "event_id": "e3", "attempts": 0}
 
         engine = MagicMock()
-        engine.embeddings = MagicMock()
-        engine.embeddings.enrich_fact = AsyncMock()
+        engine.embeddings.enrich_facts = AsyncMock(return_value=[None])
 
-        worker, _, _ = _make_worker(queue_jobs=[job], store_row=payload, engine=engine)
+        worker, _, _ = _make_worker(store_rows={"e3": payload}, engine=engine)
 
-        await worker._process_job(job)
+        await worker._process_batch([job])
 
-        engine.embeddings.enrich_fact.assert_awaited_once_with(
-            fact_id=42, content="hello", project="p", tenant_id="t"
+        engine.embeddings.enrich_facts.assert_awaited_once_with(
+            [{"fact_id": 42, "content": "hello", "project": "p", "tenant_id": "t"}],
+            batch_size=worker.batch_size,
         )
+        worker.queue.mark_done_many.assert_called_once_with([("j3", "e3")])
 
     @pytest.mark.asyncio
-    async def test_no_enrich_for_non_store_action(self):
-        payload = {"action": "search", "target": {"identifier": "7"}, "metadata": {}}
-        job = {"job_id": "j4", "event_id": "e4", "attempts": 0}
+    async def test_no_enrich_for_non_store_action_or_empty_content(self):
+        rows = {
+            "e4": {"action": "search", "target": {"identifier": "7"}, "metadata": {}},
+            "e5": {
+                "action": "store",
+                "target": {"identifier": "5"},
+                "metadata": {"content": "", "project": "p", "tenant_id": "t"},
+            },
+        }
+        jobs = [{"job_id": f"j{i}", "event_id": f"e{i}", "attempts": 0} for i in (4, 5)]
 
         engine = MagicMock()
-        engine.embeddings = MagicMock()
-        engine.embeddings.enrich_fact = AsyncMock()
+        engine.embeddings.enrich_facts = AsyncMock()
+
+        worker, _, _ = _make_worker(store_rows=rows, engine=engine)
+        await worker._process_batch(jobs)
 
-        worker, _, _ = _make_worker(queue_jobs=[job], store_row=payload, engine=engine)
-        await worker._process_job(job)
+        engine.embeddings.enrich_facts.assert_not_awaited()
+        worker.queue.mark_done_many.assert_called_once_with([("j4", "e4"), ("j5", "e5")])
 
-        engine.embeddings.enrich_fact.assert_not_awaited()
 
+# ─── _enrich_facts ────────────────────────────────────────────────────
 
-# ─── _enrich_fact ─────────────────────────────────────────────────────
 
+class TestEnrichFacts:
+    _FACTS = [{"fact_id": 1, "content": "hello", "project": "p", "tenant_id": "t"}]
 
-class TestEnrichFact:
     @pytest.mark.asyncio
     async def test_no_op_when_engine_has_no_embeddings(self):
         engine = MagicMock(spec=[])  # no embeddings attr
         worker, _, _ = _make_worker(engine=engine)
-        # Should not raise
-        await worker._enrich_fact("10", {"metadata": {"content": "x", "project": "p"}})
+        assert await worker._enrich_facts(self._FACTS) == [None]
 
     @pytest.mark.asyncio
-    async def test_skips_when_no_content(self):
+    async def test_batch_failure_fails_every_fact(self):
         engine = MagicMock()
-        engine.embeddings = MagicMock()
-        engine.embeddings.enrich_fact = AsyncMock()
+        engine.embeddings.enrich_facts = AsyncMock(side_effect=RuntimeError("embedding down"))
         worker, _, _ = _make_worker(engine=engine)
 
-        await worker._enrich_fact(
-            "5", {"metadata": {"content": "", "project": "p", "tenant_id": "t"}}
-        )
+        errors = await worker._enrich_facts(self._FACTS * 2)
+
+        assert len(errors) == 2
+        assert all(isinstance(e, RuntimeError) for e in errors)
+
+
+# ─── Compat (legacy enrichment_jobs) claims ───────────────────────────
 
-        engine.embeddings.enrich_fact.assert_not_awaited()
 
+class TestCompatClaim:
     @pytest.mark.asyncio
-    async def test_enrichment_failure_is_re_raised(self):
-        engine = MagicMock()
-        engine.embeddings = MagicMock()
-        engine.embeddings.enrich_fact = AsyncMock(side_effect=RuntimeError("embedding down"))
-        worker, _, _ = _make_worker(engine=engine)
+    async def test_failed_rows_stop_after_max_attempts(self):
+        from contextlib import asynccontextmanager
+
+        import aiosqlite
+
+        from babylon60.enrichment.worker import _MAX_ATTEMPTS
 
-        with pytest.raises(RuntimeError, match="embedding down"):
-            await worker._enrich_fact(
-                "1",
-                {"metadata": {"content": "hello", "project": "p", "tenant_id": "t"}},
+        async with aiosqlite.connect(":memory:") as conn:
+            await conn.execute(
+                "CREATE TABLE enrichment_jobs (id INTEGER PRIMARY KEY, fact_id INTEGER, "
+                "status TEXT, priority INTEGER DEFAULT 0, attempts INTEGER DEFAULT 0, "
+                "next_attempt_at TEXT, updated_at TEXT, created_at TEXT)"
             )
+            await conn.executemany(
+                "INSERT INTO enrichment_jobs (fact_id, status, attempts) VALUES (?, ?, ?)",
+                [(1, "pending", 0), (2, "failed", _MAX_ATTEMPTS - 1), (3, "failed", _MAX_ATTEMPTS)],
+            )
+            await conn.commit()
+
+            engine = MagicMock()
+
+            @asynccontextmanager
+            async def session():
+                yield conn
+
+            engine.session = session
+            worker = EnrichmentWorker(engine=engine, store=MagicMock(spec=[]))
+
+            jobs = await worker._claim_batch()
+
+        assert [job["fact_id"] for job in jobs] == [1, 2]
 
 
 # ─── _run_loop backoff ────────────────────────────────────────────────
@@ -211,29 +249,99 @@ class TestRunLoopBackoff:
         await asyncio.wait_for(worker._run_loop(), timeout=1.0)
 
     @pytest.mark.asyncio
-    async def test_loop_processes_one_job_then_stops(self):
-        """The loop should stop once is_running is False after processing one job."""
+    async def test_loop_processes_one_batch_then_stops(self):
+        """The loop should stop once is_running is False after processing one batch."""
         worker, _, _ = _make_worker()
         worker.is_running = True  # _run_loop checks while self.is_running
         processed = []
-        job = {"job_id": "x", "event_id": "e", "attempts": 0}
+        jobs = [{"job_id": f"x{i}", "event_id": f"e{i}", "attempts": 0} for i in range(3)]
 
         call_count = 0
 
-        def controlled_claim():
+        def controlled_claim(limit):
             nonlocal call_count
             call_count += 1
             if call_count == 1:
-                return job
+                return jobs
             worker.is_running = False
-            return None
+            return []
 
-        worker.queue.claim_one.side_effect = controlled_claim
+        worker.queue.claim_batch.side_effect = controlled_claim
 
-        async def intercepting_process(j):
-            processed.append(j)
+        async def intercepting_process(batch):
+            processed.append(batch)
 
-        worker._process_job = intercepting_process
+        worker._process_batch = intercepting_process
 
         await asyncio.wait_for(worker._run_loop(), timeout=2.0)
-        assert len(processed) == 1
+        assert processed == [jobs]
+
+    @pytest.mark.asyncio
+    async def test_notification_wakes_idle_worker(self):
+        from babylon60.enrichment import notify_enrichment
+
+        worker, _, _ = _make_worker()
+        await worker.start()
+        try:
+            await asyncio.sleep(0.05)  # let the loop go idle on its 1s poll
+            job = {"job_id": "w", "event_id": "ew", "attempts": 0, "created_at": None}
+            worker.queue.claim_batch.side_effect = lambda limit: [job]
+            processed = asyncio.Event()
+
+            async def record(batch):
+                worker.queue.claim_batch.side_effect = lambda limit: []
+                processed.set()
+
+            worker._process_batch = record
+            notify_enrichment()
+            await asyncio.wait_for(processed.wait(), timeout=0.5)
+        finally:
+            await worker.stop()
+
+
+# ─── Batched processing ───────────────────────────────────────────────
+
+
+class TestProcessBatch:
+    @pytest.mark.asyncio
+    async def test_ledger_batch_embeds_once_and_marks_jobs(self, tmp_path):
+        from babylon60.ledger.store import LedgerStore
+
+        store = LedgerStore(tmp_path / "ledger.db")
+        engine = MagicMock()
+        engine.embeddings.enrich_facts = AsyncMock(
+            side_effect=lambda facts, batch_size: [
+                RuntimeError("bad vector") if f["fact_id"] == 2 else None for f in facts
+            ]
+        )
+        worker = EnrichmentWorker(engine=engine, store=store, batch_size=8)
+
+        with store.tx() as conn:
+            for i, action in enumerate(["store", "store", "search"], start=1):
+                payload = {
+                    "action": action,
+                    "target": {"identifier": str(i)},
+                    "metadata": {"content": f"fact {i}", "project": "p"},
+                }
+                conn.execute(
+                    "INSERT INTO ledger_events (event_id, ts, tool, actor, action, payload_json, "
+                    "semantic_status) VALUES (?, '2026-03-18T00:00:00Z', 't', 'a', ?, ?, 'pending')",
+                    (f"e{i}", action, json.dumps(payload)),
+                )
+        job_ids = [worker.queue.enqueue(f"e{i}") for i in range(1, 4)]
+
+        jobs = worker.queue.claim_batch(8)
+        assert [j["event_id"] for j in jobs] == ["e1", "e2", "e3"]
+        assert worker.queue.claim_batch(8) == []
+
+        await worker._process_batch(jobs)
+
+        engine.embeddings.enrich_facts.assert_awaited_once()
+        facts = engine.embeddings.enrich_facts.await_args.args[0]
+        assert [f["fact_id"] for f in facts] == [1, 2]
+        with store.tx() as conn:
+            status = {
+                r["job_id"]: r["status"]
+                for r in conn.execute("SELECT job_id, status FROM enrichment_jobs")
+            }
+        assert status == {job_ids[0]: "done", job_ids[1]: "retry", job_ids[2]: "done"}
@@ -0,0 +1,117 @@
+# [C5-REAL] Exergy-Maximized
+"""Tests for the in-memory CSR adjacency cache of the SQLite graph backend."""
+
+from __future__ import annotations
+
+import random
+
+import aiosqlite
+import pytest
+
+from babylon60.database.schema_ext_1 import CREATE_ENTITIES, CREATE_ENTITY_RELATIONS
+from babylon60.graph.backends.sqlite import SQLiteBackend
+from babylon60.graph.backends.sqlite.adjacency import ADJACENCY_CACHE
+
+TS = "2026-01-01T00:00:00"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    ADJACENCY_CACHE.reset()
+    cap = ADJACENCY_CACHE.max_edges
+    yield
+    ADJACENCY_CACHE.max_edges = cap
+    ADJACENCY_CACHE.reset()
+
+
+@pytest.fixture
+async def backend(tmp_path):
+    conn = await aiosqlite.connect(tmp_path / "graph.db")
+    await conn.executescript(CREATE_ENTITIES + CREATE_ENTITY_RELATIONS)
+    yield SQLiteBackend(conn)
+    await conn.close()
+
+
+async def _random_graph(backend: SQLiteBackend, nodes: int = 40, edges: int = 90) -> list[str]:
+    rng = random.Random(11)
+    names = [f"Entity{i}" for i in range(nodes)]
+    ids = [await backend.upsert_entity(n, "concept", "p", TS) for n in names]
+    for fact_id in range(edges):
+        a, b = rng.sample(ids, 2)
+        await backend.upsert_relationship(a, b, "uses", fact_id, TS)
+    await backend.conn.commit()
+    return names
+
+
+async def _sql_answers(backend: SQLiteBackend, queries: list) -> list:
+    ADJACENCY_CACHE.max_edges = 0  # Force the SQL traversal
+    try:
+        return [await q() for q in queries]
+    finally:
+        ADJACENCY_CACHE.max_edges = 10_000
+
+
+async def test_subgraph_and_path_lengths_match_sql(backend):
+    names = await _random_graph(backend)
+    queries = [
+        lambda: backend.find_context_subgraph(names[:3], depth=2, max_nodes=25),
+        lambda: backend.find_context_subgraph([names[5]], depth=3, max_nodes=100),
+    ] + [
+        (lambda a=a, b=b: backend.find_path(a, b, max_depth=3))
+        for a, b in zip(names[:10], names[10:20], strict=True)
+    ]
+    expected = await _sql_answers(backend, queries)
+    cached = [await q() for q in queries]
+
+    assert cached[:2] == expected[:2]
+    for got, want in zip(cached[2:], expected[2:], strict=True):
+        # Bidirectional search may pick a different path of the same length.
+        assert len(got) == len(want)
+        if got:
+            assert got[0]["source"] == want[0]["source"]
+            assert got[-1]["target"] == want[-1]["target"]
+
+    stats = ADJACENCY_CACHE.stats()
+    assert stats["rebuilds"] == 1
+    assert stats["hits"] == len(queries) - 1
+
+
+async def test_writes_update_snapshot_incrementally(backend):
+    a = await backend.upsert_entity("Alpha", "concept", "p", TS)
+    b = await backend.upsert_entity("Beta", "concept", "p", TS)
+    await backend.upsert_relationship(a, b, "uses", 1, TS)
+    assert len(await backend.find_path("Alpha", "Beta")) == 1
+
+    c = await backend.upsert_entity("Gamma", "concept", "p", TS)
+    await backend.upsert_relationship(b, c, "feeds", 2, TS)
+    await backend.upsert_relationship(a, b, "uses", 3, TS)  # weight bump
+    path = await backend.find_path("Alpha", "Gamma")
+    assert [step["target"] for step in path] == ["Beta", "Gamma"]
+    assert path[0]["weight"] == 1.5
+
+    await backend.delete_fact_elements(2)
+    assert await backend.find_path("Alpha", "Gamma") == []
+    assert ADJACENCY_CACHE.stats()["rebuilds"] == 1
+
+
+async def test_external_writes_force_rebuild(backend):
+    a = await backend.upsert_entity("Alpha", "concept", "p", TS)
+    b = await backend.upsert_entity("Beta", "concept", "p", TS)
+    assert await backend.find_path("Alpha", "Beta") == []
+
+    await backend.conn.execute(
+        "INSERT INTO entity_relations (source_entity_id, target_entity_id, relation_type, "
+        "first_seen, tenant_id) VALUES (?, ?, 'raw', ?, 'default')",
+        (a, b, TS),
+    )
+    assert len(await backend.find_path("Alpha", "Beta")) == 1
+    assert ADJACENCY_CACHE.stats()["rebuilds"] == 2
+
+
+async def test_size_cap_falls_back_to_sql(backend):
+    await _random_graph(backend, nodes=10, edges=20)
+    ADJACENCY_CACHE.max_edges = 5
+    result = await backend.find_context_subgraph(["Entity0"], depth=1)
+    assert result["nodes"]
+    assert len(ADJACENCY_CACHE) == 0
+    assert ADJACENCY_CACHE.stats()["bypasses"] == 1
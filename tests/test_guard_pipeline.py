@@ -218,3 +218,100 @@ class TestCounts:
         assert pipeline.guard_count == 2
         assert pipeline.mutator_count == 1
         assert pipeline.hook_count == 3
+
+
+# ─── Profiling, Ordering, Concurrency, Cache ────────────────────────
+
+
+class _Guard:
+    def __init__(self, name: str, log: list[str], *, reject: bool = False, delay: float = 0.0):
+        self.name, self.log, self.reject, self.delay = name, log, reject, delay
+
+    async def check(self, content, project, fact_type, meta, conn, **kw):
+        self.log.append(self.name)
+        if self.delay:
+            import time
+
+            time.sleep(self.delay)
+        if self.reject:
+            raise ValueError(self.name)
+
+
+class _PureGuard(_Guard):
+    pure_cpu = True
+
+    def check_sync(self, content, project, fact_type, meta, *, tenant_id="default"):
+        import threading
+
+        self.log.append(threading.current_thread().name)
+        if self.reject:
+            raise ValueError(self.name)
+
+
+class _DeterministicGuard(_PureGuard):
+    deterministic = True
+
+
+class TestProfiledPipeline:
+    async def test_cheap_rejecting_guard_moves_first(self, pipeline, mock_conn, monkeypatch):
+        from babylon60.engine.flow import guard_pipeline
+
+        monkeypatch.setattr(guard_pipeline, "_MIN_SAMPLES", 2)
+        monkeypatch.setattr(guard_pipeline, "_REORDER_EVERY", 4)
+        log: list[str] = []
+        slow = _Guard("slow", log, delay=0.005)
+        cheap = _Guard("cheap", log, reject=True)
+        pipeline.add_guard(slow)
+        pipeline.add_guard(cheap)
+
+        for _ in range(3):
+            with pytest.raises(ValueError, match="cheap"):
+                await pipeline.run_guards("content", "project", "knowledge", {}, mock_conn)
+        assert log == ["slow", "cheap"] * 3
+
+        log.clear()
+        with pytest.raises(ValueError, match="cheap"):
+            await pipeline.run_guards("content", "project", "knowledge", {}, mock_conn)
+        assert log == ["cheap"]
+
+        profile = pipeline.profile()
+        assert [p["guard"] for p in profile] == ["_Guard#2", "_Guard"]
+        assert profile[0]["rejections"] == 4 and profile[1]["calls"] == 3
+
+    async def test_pure_guards_run_on_threads_and_report_first_rejection(self, pipeline, mock_conn):
+        log: list[str] = []
+        pipeline.add_guard(_PureGuard("a", log))
+        pipeline.add_guard(_PureGuard("b", log, reject=True))
+        pipeline.add_guard(_PureGuard("c", log, reject=True))
+        pipeline.add_guard(_Guard("after", log))
+
+        with pytest.raises(ValueError, match="^b$"):
+            await pipeline.run_guards("content", "project", "knowledge", {}, mock_conn)
+
+        assert len(log) == 3
+        assert "MainThread" not in log
+        assert [p["calls"] for p in pipeline.profile()] == [1, 1, 1, 0]
+
+    async def test_registration_names_label_profiles(self, pipeline, mock_conn):
+        log: list[str] = []
+        pipeline.add_guard(_Guard("a", log), name="HealthGuardAdapter")
+        pipeline.add_guard(_Guard("b", log), name="HealthGuardAdapter")
+        pipeline.add_guard(_Guard("c", log))
+
+        assert [p["guard"] for p in pipeline.profile()] == [
+            "HealthGuardAdapter",
+            "HealthGuardAdapter#2",
+            "_Guard",
+        ]
+
+    async def test_deterministic_passes_are_cached_by_content(self, pipeline, mock_conn):
+        log: list[str] = []
+        pipeline.add_guard(_DeterministicGuard("det", log))
+
+        for _ in range(3):
+            await pipeline.run_guards("same content", "project", "code", {}, mock_conn)
+        await pipeline.run_guards("other content", "project", "code", {}, mock_conn)
+
+        (profile,) = pipeline.profile()
+        assert (profile["calls"], profile["cache_hits"]) == (2, 2)
+        assert profile["deterministic"] and profile["pure_cpu"]
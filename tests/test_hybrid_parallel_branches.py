@@ -0,0 +1,132 @@
+# [C5-REAL] Exergy-Maximized
+"""hybrid_search branch isolation: pooled connections, timeouts, degradation."""
+
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+
+import pytest
+
+from babylon60.database.core import causal_write, connect
+from babylon60.search import hybrid
+from babylon60.search.models import SearchResult
+from babylon60.search.utils import _has_fts5_sync
+
+
+def _result(fact_id: int) -> SearchResult:
+    return SearchResult(
+        fact_id=fact_id,
+        content=f"fact {fact_id}",
+        project="p",
+        fact_type="knowledge",
+        confidence="C3",
+        valid_from="2026-01-01T00:00:00",
+        valid_until=None,
+        tags=[],
+        created_at="2026-01-01T00:00:00",
+        updated_at="2026-01-01T00:00:00",
+        score=0.5,
+    )
+
+
+class _Pool:
+    def __init__(self) -> None:
+        self.handed_out: list[object] = []
+
+    @asynccontextmanager
+    async def acquire(self):
+        conn = object()
+        self.handed_out.append(conn)
+        yield conn
+
+
+@pytest.mark.asyncio
+async def test_branches_run_concurrently_on_separate_pool_connections(monkeypatch):
+    started = {"semantic": asyncio.Event(), "text": asyncio.Event()}
+    seen: dict[str, object] = {}
+
+    async def fake_semantic(conn, *args, **kwargs):
+        seen["semantic"] = conn
+        started["semantic"].set()
+        await started["text"].wait()  # deadlocks if branches are serialized
+        return [_result(1)]
+
+    async def fake_text(conn, *args, **kwargs):
+        seen["text"] = conn
+        started["text"].set()
+        await started["semantic"].wait()
+        return [_result(2)]
+
+    monkeypatch.setattr(hybrid, "semantic_search", fake_semantic)
+    monkeypatch.setattr(hybrid, "text_search", fake_text)
+    pool = _Pool()
+
+    results = await hybrid.hybrid_search(
+        None, "q", [0.0], pool=pool, branch_timeout=1.0, recency_weight=0.0
+    )
+
+    assert {r.fact_id for r in results} == {1, 2}
+    assert seen["semantic"] is not seen["text"]
+    assert set(map(id, pool.handed_out)) == {id(seen["semantic"]), id(seen["text"])}
+
+
+@pytest.mark.asyncio
+async def test_failed_branch_degrades_to_the_other(monkeypatch):
+    async def broken_semantic(conn, *args, **kwargs):
+        raise sqlite3.OperationalError("no such module: vec0")
+
+    async def fake_text(conn, *args, **kwargs):
+        return [_result(7), _result(8)]
+
+    monkeypatch.setattr(hybrid, "semantic_search", broken_semantic)
+    monkeypatch.setattr(hybrid, "text_search", fake_text)
+
+    results = await hybrid.hybrid_search(None, "q", [0.0], recency_weight=0.0)
+
+    assert [r.fact_id for r in results] == [7, 8]
+
+
+@pytest.mark.asyncio
+async def test_slow_branch_is_dropped_after_timeout(monkeypatch):
+    async def slow_semantic(conn, *args, **kwargs):
+        await asyncio.sleep(5)
+        return [_result(1)]
+
+    async def fake_text(conn, *args, **kwargs):
+        return [_result(2)]
+
+    monkeypatch.setattr(hybrid, "semantic_search", slow_semantic)
+    monkeypatch.setattr(hybrid, "text_search", fake_text)
+
+    results = await asyncio.wait_for(
+        hybrid.hybrid_search(None, "q", [0.0], branch_timeout=0.05, recency_weight=0.0),
+        timeout=2.0,
+    )
+
+    assert [r.fact_id for r in results] == [2]
+
+
+@pytest.mark.asyncio
+async def test_both_branches_failing_returns_empty(monkeypatch):
+    async def broken(conn, *args, **kwargs):
+        raise RuntimeError("boom")
+
+    monkeypatch.setattr(hybrid, "semantic_search", broken)
+    monkeypatch.setattr(hybrid, "text_search", broken)
+
+    assert await hybrid.hybrid_search(None, "q", [0.0]) == []
+
+
+def test_fts5_probe_is_cached_per_connection():
+    conn = connect(":memory:")
+    assert _has_fts5_sync(conn) is False
+    conn.execute("CREATE TABLE facts_fts (content TEXT)")
+    # A negative probe is not cached, so a later-created table is seen.
+    assert _has_fts5_sync(conn) is True
+
+    with causal_write(conn):
+        conn.execute("DROP TABLE facts_fts")
+    assert _has_fts5_sync(conn) is True  # served from the cache
+    assert _has_fts5_sync(connect(":memory:")) is False
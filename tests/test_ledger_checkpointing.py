@@ -128,3 +128,69 @@ def test_post_quantum_checkpointing_verification(test_db):
     corrupted_report_2 = verifier.verify_checkpoint_signatures()
     assert corrupted_report_2["valid"] is False
     assert corrupted_report_2["checked_checkpoints"] == 1
+
+
+def _append_events(writer, count, start=0):
+    t = ActionTarget(app="Test")
+    r = ActionResult(ok=True, latency_ms=10)
+    for i in range(start, start + count):
+        writer.append(
+            LedgerEvent.new(
+                tool="cli", actor="test-actor", action=f"action-{i}", target=t, result=r
+            )
+        )
+
+
+def test_incremental_verification_resumes_after_trusted_checkpoint(test_db):
+    store = LedgerStore(test_db)
+    writer = LedgerWriter(store, EnrichmentQueue(store))
+    verifier = LedgerVerifier(store)
+
+    _append_events(writer, 10)
+    cp_id = verifier.create_checkpoint(batch_size=10)
+
+    # No watermark yet: incremental falls back to a full walk and records one.
+    first = verifier.verify_chain(mode="incremental")
+    assert first["valid"] and first["mode"] == "full"
+    assert first["checked_events"] == 10
+    assert first["watermark_checkpoint_id"] == cp_id
+    assert "duration_ms" in first
+
+    _append_events(writer, 3, start=10)
+    report = verifier.verify_chain(mode="incremental")
+    assert report["valid"] and report["mode"] == "incremental"
+    assert report["checked_events"] == 3
+
+    # Rewriting the watermark's boundary event invalidates it.
+    with store.tx() as conn:
+        conn.execute(
+            "UPDATE ledger_events SET hash = 'BADHASH' "
+            "WHERE rowid = (SELECT rowid FROM ledger_events ORDER BY rowid LIMIT 1 OFFSET 9)"
+        )
+    fallback = verifier.verify_chain(mode="incremental")
+    assert fallback["mode"] == "full"
+    assert not fallback["valid"]
+    assert fallback["watermark_checkpoint_id"] is None
+
+
+def test_full_verification_shards_by_checkpoint(test_db):
+    store = LedgerStore(test_db)
+    writer = LedgerWriter(store, EnrichmentQueue(store))
+    verifier = LedgerVerifier(store)
+
+    _append_events(writer, 12)
+    verifier.create_checkpoint(batch_size=5)
+    verifier.create_checkpoint(batch_size=5)
+
+    inline = verifier.verify_chain(workers=1)
+    pooled = verifier.verify_chain(workers=2)
+    assert inline["valid"] and pooled["valid"]
+    assert inline["shards"] == pooled["shards"] == 3
+    assert pooled["parallel"] is True
+    assert pooled["checked_events"] == inline["checked_events"] == 12
+
+    with store.tx() as conn:
+        conn.execute("UPDATE ledger_checkpoints SET root_hash = 'forged' WHERE checkpoint_id = 2")
+    report = verifier.verify_chain(workers=2)
+    assert not report["valid"]
+    assert "Merkle root mismatch for checkpoint 2" in report["violations"]
@@ -92,6 +92,36 @@ class TestWorkingMemoryL1:
         # The evicted event should be the one with lower priority
         assert overflow2[0].content in ("old event", "new event")
 
+    def test_heap_eviction_matches_priority_scan(self):
+        """Heap eviction picks the same victims as a full priority rescan."""
+        import random
+        from datetime import datetime, timedelta, timezone
+
+        rng = random.Random(7)
+        base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        l1 = WorkingMemoryL1(max_tokens=2000)
+        reference: list[MemoryEvent] = []
+        # Continuous timestamps: exact priority ties would be settled by float rounding.
+        for i in range(400):
+            event = _make_event(
+                role=rng.choice(["user", "assistant", "system", "tool"]),
+                content=f"event {i}",
+                token_count=rng.randint(1, 400),
+                metadata={"valence": rng.choice([0.0, 0.5, -1.0])},
+            ).model_copy(update={"timestamp": base + timedelta(seconds=rng.uniform(0, 7200))})
+
+            reference.append(event)
+            expected = []
+            while sum(e.token_count for e in reference) > 2000:
+                victim = min(reference, key=l1._calculate_priority)
+                reference.remove(victim)
+                expected.append(victim.content)
+
+            assert [e.content for e in l1.add_event(event)] == expected
+        assert [c["content"] for c in l1.get_context("test_tenant")] == [
+            e.content for e in reference
+        ]
+
     def test_get_context_returns_prompt_dicts(self):
         l1 = WorkingMemoryL1(max_tokens=1000)
         l1.add_event(_make_event(role="user", content="hello"))
@@ -87,6 +87,69 @@ def test_memory_imports_without_numpy(tmp_path: Path) -> None:
     assert result.stdout.strip() == "ok"
 
 
+@pytest.mark.parametrize(
+    "module",
+    [
+        "babylon60.search.vector",
+        "babylon60.search.hybrid",
+        "babylon60.compaction.consolidator",
+        "babylon60.engine",
+        "babylon60.memory.time_travel",
+        "babylon60.memory.sparse",
+        "babylon60.memory.vsa",
+        "babylon60.agents.loader",
+    ],
+)
+def test_module_imports_without_numpy(tmp_path: Path, module: str) -> None:
+    env = _blocked_numpy_env(tmp_path)
+
+    result = subprocess.run(
+        [sys.executable, "-c", f"import {module}; print('ok')"],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
+
+
+def test_vsa_bridge_round_trips_without_numpy(tmp_path: Path) -> None:
+    env = _blocked_numpy_env(tmp_path)
+    vsa_path = tmp_path / "bridge.vsa"
+
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "\n".join(
+                [
+                    "from pathlib import Path",
+                    "from babylon60.memory.vsa import VSAPipelineBridge",
+                    "bridge = VSAPipelineBridge(agent_id='nonp')",
+                    f"bridge._memory._persistence_path = Path(r'{vsa_path}')",
+                    "rid = bridge.ingest('vector symbolic memory', record_id='r1')",
+                    "bridge.ingest('unrelated grocery list', record_id='r2')",
+                    "bridge.persist()",
+                    "reloaded = VSAPipelineBridge(agent_id='nonp')",
+                    f"reloaded._memory._persistence_path = Path(r'{vsa_path}')",
+                    "assert reloaded._memory.load() == 2",
+                    "assert reloaded.query('symbolic memory')[0]['id'] == rid",
+                    "print('ok')",
+                ]
+            ),
+        ],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "ok"
+
+
 def test_engine_init_without_numpy_stays_quiet_about_optional_l2(tmp_path: Path) -> None:
     env = _blocked_numpy_env(tmp_path)
     db_path = tmp_path / "quiet-init.db"
@@ -0,0 +1,224 @@
+# [C5-REAL] Exergy-Maximized
+"""Post-store outbox: embedding and post-hooks run after the store commits."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+
+from babylon60.crypto import get_default_encrypter
+from babylon60.database.schema import CREATE_POST_STORE_OUTBOX
+from babylon60.engine.core.post_store_outbox import (
+    claim_post_store,
+    enqueue_post_store,
+    finish_post_store,
+    post_store_status,
+    prune_post_store,
+)
+from babylon60.engine.core.store_mixin import StoreMixin
+
+_SCHEMA = """
+CREATE TABLE facts (id INTEGER PRIMARY KEY, tenant_id TEXT NOT NULL, content TEXT);
+CREATE TABLE fact_embeddings (fact_id INTEGER PRIMARY KEY, embedding BLOB);
+"""
+
+
+class _Embedder:
+    def __init__(self, conn, fail: bool = False) -> None:
+        self.conn = conn
+        self.fail = fail
+        self.seen: list[tuple[str, bool]] = []
+
+    def embed(self, text: str) -> list[float]:
+        self.seen.append((text, self.conn.in_transaction))
+        if self.fail:
+            raise OSError("embedding service down")
+        return [0.5, 0.25]
+
+
+class _BatchEmbedder(_Embedder):
+    def __init__(self, conn) -> None:
+        super().__init__(conn)
+        self.batches: list[list[str]] = []
+
+    def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text)), 0.0] for text in texts]
+
+
+class _Hooks:
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, str, str | None]] = []
+        self.conns: list[tuple[object, bool, str | None]] = []
+
+    async def run_post_hooks(self, fact_id, project, fact_type, conn, **kwargs) -> None:
+        self.calls.append((fact_id, project, kwargs["source"]))
+        self.conns.append((conn, conn.in_transaction, await post_store_status(conn, fact_id)))
+
+
+class _Store(StoreMixin):
+    """Just enough engine for the outbox executor."""
+
+    def __init__(self, conn, embedder) -> None:
+        self._conn = conn
+        self._embedder = embedder
+        self._guard_pipeline = _Hooks()
+
+    @asynccontextmanager
+    async def session(self):
+        yield self._conn
+
+    def _get_embedder(self):
+        return self._embedder
+
+    def _post_store_embeds(self) -> bool:
+        return True
+
+
+@pytest.fixture
+async def conn():
+    async with aiosqlite.connect(":memory:") as db:
+        await db.executescript(_SCHEMA + CREATE_POST_STORE_OUTBOX)
+        enc = get_default_encrypter()
+        for fact_id in (1, 2, 3):
+            await db.execute(
+                "INSERT INTO facts VALUES (?, 'default', ?)",
+                (fact_id, enc.encrypt_str(f"fact {fact_id}", tenant_id="default")),
+            )
+            await enqueue_post_store(db, fact_id, "default", "proj", "knowledge", "test")
+        await db.commit()
+        yield db
+
+
+@pytest.mark.asyncio
+async def test_executor_embeds_outside_write_transaction(conn):
+    store = _Store(conn, _Embedder(conn))
+
+    assert await store.flush_post_store() == 3
+
+    assert store._embedder.seen == [("fact 1", False), ("fact 2", False), ("fact 3", False)]
+    assert [c[0] for c in store._guard_pipeline.calls] == [1, 2, 3]
+    cursor = await conn.execute("SELECT fact_id FROM fact_embeddings ORDER BY fact_id")
+    assert [row[0] for row in await cursor.fetchall()] == [1, 2, 3]
+    assert {await post_store_status(conn, i) for i in (1, 2, 3)} == {"done"}
+    assert not conn.in_transaction
+
+    # At-least-once redelivery is harmless.
+    await enqueue_post_store(conn, 2, "default", "proj", "knowledge", "test")
+    await conn.commit()
+    assert await store.flush_post_store() == 1
+    cursor = await conn.execute("SELECT COUNT(*) FROM fact_embeddings")
+    assert (await cursor.fetchone())[0] == 3
+
+
+@pytest.mark.asyncio
+async def test_executor_embeds_each_claimed_batch_in_one_call(conn):
+    store = _Store(conn, _BatchEmbedder(conn))
+
+    assert await store.flush_post_store() == 3
+
+    assert store._embedder.batches == [["fact 1", "fact 2", "fact 3"]]
+    assert store._embedder.seen == []
+    assert {await post_store_status(conn, i) for i in (1, 2, 3)} == {"done"}
+
+
+@pytest.mark.asyncio
+async def test_failures_are_retried_then_parked(conn, monkeypatch):
+    from babylon60.core import config
+
+    monkeypatch.setattr(config, "POST_STORE_MAX_ATTEMPTS", 2)
+    store = _Store(conn, _Embedder(conn, fail=True))
+
+    await store.flush_post_store()
+    assert await post_store_status(conn, 1) == "pending"
+    assert store._guard_pipeline.calls == []
+
+    await store.flush_post_store()
+    cursor = await conn.execute("SELECT status, attempts, last_error FROM post_store_outbox")
+    assert set(await cursor.fetchall()) == {("failed", 2, "embedding service down")}
+    assert await store.flush_post_store() == 0
+
+
+@pytest.mark.asyncio
+async def test_background_dispatch_and_flush(conn, monkeypatch):
+    from babylon60.core import config
+
+    monkeypatch.setattr(config, "POST_STORE_ASYNC", True)
+    store = _Store(conn, _Embedder(conn))
+    store._post_commit_tasks = set()
+
+    await store._dispatch_post_store()
+    assert len(store._post_commit_tasks) == 1
+    await store.flush_post_store()
+    await asyncio.sleep(0)
+
+    assert not store._post_commit_tasks
+    assert {await post_store_status(conn, i) for i in (1, 2, 3)} == {"done"}
+
+
+@pytest.mark.asyncio
+async def test_expired_claims_are_reclaimed(conn):
+    claimed = await claim_post_store(conn, 2, lease_seconds=60.0)
+    await conn.commit()
+    assert [row.fact_id for row in claimed] == [1, 2]
+    await finish_post_store(conn, 1)
+
+    assert [row.fact_id for row in await claim_post_store(conn, 10, 60.0)] == [3]
+    await conn.execute("UPDATE post_store_outbox SET claimed_at = ?", (time.time() - 120,))
+    again = await claim_post_store(conn, 10, 60.0)
+    assert [(row.fact_id, row.attempts) for row in again] == [(2, 2), (3, 2)]
+
+
+@pytest.mark.asyncio
+async def test_post_hooks_run_after_the_claim_commits(conn):
+    store = _Store(conn, _Embedder(conn))
+
+    await store.flush_post_store()
+
+    assert [(in_txn, status) for _, in_txn, status in store._guard_pipeline.conns] == [
+        (False, "running")
+    ] * 3
+
+
+@pytest.mark.asyncio
+async def test_executor_uses_its_own_connection(tmp_path):
+    db_path = tmp_path / "outbox.db"
+    async with aiosqlite.connect(db_path) as shared:
+        await shared.execute("PRAGMA journal_mode=WAL")
+        await shared.executescript(_SCHEMA + CREATE_POST_STORE_OUTBOX)
+        await shared.execute(
+            "INSERT INTO facts VALUES (1, 'default', ?)",
+            (get_default_encrypter().encrypt_str("fact 1", tenant_id="default"),),
+        )
+        await enqueue_post_store(shared, 1, "default", "proj", "knowledge", "test")
+        await shared.commit()
+        store = _Store(shared, _Embedder(shared))
+        store._db_path = db_path
+
+        # A foreground transaction on the shared connection is left alone.
+        await shared.execute("BEGIN")
+        await shared.execute("SELECT COUNT(*) FROM facts")
+        assert await store.flush_post_store() == 1
+
+        assert shared.in_transaction
+        assert all(hook_conn is not shared for hook_conn, _, _ in store._guard_pipeline.conns)
+        await shared.rollback()
+        assert await post_store_status(shared, 1) == "done"
+
+
+@pytest.mark.asyncio
+async def test_done_rows_are_pruned(conn):
+    store = _Store(conn, _Embedder(conn))
+    await finish_post_store(conn, 1)
+    await conn.execute("UPDATE post_store_outbox SET done_at = ? WHERE fact_id = 1", (1.0,))
+    await conn.commit()
+
+    assert await store.flush_post_store() == 2
+
+    assert await post_store_status(conn, 1) is None
+    assert {await post_store_status(conn, i) for i in (2, 3)} == {"done"}
+    assert await prune_post_store(conn, time.time() + 1) == 2
@@ -0,0 +1,75 @@
+# [C5-REAL] Exergy-Maximized
+"""Recall ranks by the materialized consensus_score column (idx_facts_recall)."""
+
+from __future__ import annotations
+
+import sqlite3
+
+import pytest
+
+from babylon60.database.core import causal_write
+from babylon60.engine import CortexEngine
+from babylon60.migrations import run_migrations
+
+
+def test_migration_032_backfills_scores_and_indexes() -> None:
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE schema_version (
+            version INTEGER PRIMARY KEY,
+            applied_at TEXT DEFAULT (datetime('now')),
+            description TEXT
+        );
+        INSERT INTO schema_version (version, description) VALUES (31, 'pre recall index');
+        CREATE TABLE facts (
+            id INTEGER PRIMARY KEY,
+            tenant_id TEXT DEFAULT 'default',
+            project TEXT,
+            content TEXT,
+            metadata TEXT,
+            consensus_score REAL DEFAULT 1.0
+        );
+        INSERT INTO facts (id, project, metadata, consensus_score) VALUES
+            (1, 'p', '{"consensus_score": 1.7}', 1.0),
+            (2, 'p', '{"consensus_score": 1.7}', 0.4),
+            (3, 'p', 'v6_aesgcm:opaque', NULL),
+            (4, 'p', 'not json', 1.0);
+    """)
+
+    run_migrations(conn)
+
+    scores = dict(conn.execute("SELECT id, consensus_score FROM facts").fetchall())
+    # Metadata-only scores are copied; scores already set by votes win.
+    assert scores == {1: 1.7, 2: 0.4, 3: 1.0, 4: 1.0}
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(facts)").fetchall()}
+    assert "idx_facts_recall" in indexes
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    e = CortexEngine(db_path=str(tmp_path / "recall.db"), auto_embed=False)
+    await e.init_db()
+    yield e
+    await e.close()
+
+
+@pytest.mark.asyncio
+async def test_recall_limit_matches_full_ranking(engine):
+    ids = []
+    for i in range(12):
+        ids.append(
+            await engine.store(project="recall", content=f"Recall ranking fact {i}", source="test")
+        )
+    async with engine.session() as conn:
+        with causal_write(conn):
+            for i, fact_id in enumerate(ids):
+                await conn.execute(
+                    "UPDATE facts SET consensus_score = ?, created_at = datetime('now', ?) "
+                    "WHERE id = ?",
+                    (0.1 * (i % 5) + 1.0, f"-{i * 3} days", fact_id),
+                )
+        await conn.commit()
+
+    full = [f["id"] for f in await engine.recall("recall")]
+    assert [f["id"] for f in await engine.recall("recall", limit=4)] == full[:4]
+    assert [f["id"] for f in await engine.recall("recall", limit=3, offset=5)] == full[5:8]
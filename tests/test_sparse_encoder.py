@@ -0,0 +1,106 @@
+# [C5-REAL] Exergy-Maximized
+"""MushroomBodyEncoder: NumPy engine vs. the original pure-Python encoder."""
+
+from __future__ import annotations
+
+import math
+import random
+
+import numpy as np
+import pytest
+
+from babylon60.memory import sparse
+from babylon60.memory.sparse import MushroomBodyEncoder, SparseCode
+
+
+def _reference_projection(seed: int, input_dim: int, expansion: int) -> list[list[float]]:
+    rng = random.Random(seed)
+    output_dim = input_dim * expansion
+    scale = math.sqrt(2.0 / (input_dim + output_dim))
+    return [[rng.gauss(0, scale) for _ in range(input_dim)] for _ in range(output_dim)]
+
+
+def _reference_encode(projection, embedding, sparsity) -> list[float]:
+    expanded = [
+        max(0.0, sum(w * x for w, x in zip(row, embedding, strict=True))) for row in projection
+    ]
+    k = max(1, int(len(expanded) * sparsity))
+    if k < len(expanded):
+        threshold = sorted(expanded, reverse=True)[k - 1]
+        expanded = [v if v >= threshold else 0.0 for v in expanded]
+    norm = math.sqrt(sum(v * v for v in expanded))
+    return [v / norm for v in expanded] if norm > 0 else expanded
+
+
+@pytest.fixture(scope="module")
+def embeddings() -> np.ndarray:
+    return np.random.default_rng(3).standard_normal((4, 384))
+
+
+def test_matches_original_encoder_for_the_same_seed(embeddings):
+    encoder = MushroomBodyEncoder(expansion_factor=5, sparsity=0.05, seed=42)
+    reference = _reference_projection(42, 384, 5)
+
+    assert np.array_equal(encoder._get_projection(384), np.array(reference))
+    for row in embeddings[:2]:
+        got = np.array(encoder.encode(row.tolist()))
+        want = np.array(_reference_encode(reference, row.tolist(), 0.05))
+        assert np.array_equal(np.flatnonzero(got), np.flatnonzero(want))
+        np.testing.assert_allclose(got, want, rtol=1e-12, atol=1e-15)
+
+
+def test_batch_and_sparse_outputs_agree(embeddings):
+    encoder = MushroomBodyEncoder(expansion_factor=5, sparsity=0.05)
+    batch = encoder.encode_many(embeddings)
+
+    assert batch.shape == (4, 1920)
+    np.testing.assert_allclose(batch[1], encoder.encode(embeddings[1].tolist()), rtol=1e-12)
+    np.testing.assert_allclose(np.linalg.norm(batch, axis=1), 1.0)
+
+    code = encoder.encode_sparse(embeddings[2])
+    assert isinstance(code, SparseCode) and code.dim == 1920
+    assert len(code.indices) == 96
+    np.testing.assert_allclose(code.to_dense(), batch[2], rtol=1e-12)
+    assert encoder.compute_sparsity_ratio(batch[2]) == pytest.approx(0.95)
+
+
+def test_alternative_projections(embeddings):
+    sparse = MushroomBodyEncoder(expansion_factor=5, projection="achlioptas")
+    matrix = sparse._get_projection(384)
+    assert len(np.unique(matrix)) == 3
+    assert np.mean(matrix == 0) == pytest.approx(2 / 3, abs=0.01)
+    assert np.count_nonzero(sparse.encode_many(embeddings), axis=1).tolist() == [96] * 4
+
+    f32 = MushroomBodyEncoder(expansion_factor=5, dtype="float32").encode_many(embeddings)
+    f64 = MushroomBodyEncoder(expansion_factor=5).encode_many(embeddings)
+    assert f32.dtype == np.float32
+    assert np.all(np.einsum("ij,ij->i", f32, f64) > 0.99)
+
+
+def test_empty_and_invalid_inputs():
+    encoder = MushroomBodyEncoder()
+    assert encoder.encode([]) == []
+    assert encoder.compute_sparsity_ratio([]) == 1.0
+    with pytest.raises(ValueError):
+        encoder.encode_many(np.zeros(8))
+    with pytest.raises(ValueError):
+        MushroomBodyEncoder(projection="nope")  # type: ignore[arg-type]
+    for dtype in ("int64", "float16", "nope"):
+        with pytest.raises(ValueError):
+            MushroomBodyEncoder(dtype=dtype)
+
+
+def test_pure_python_fallback_matches_numpy(embeddings, monkeypatch):
+    encoder = MushroomBodyEncoder(expansion_factor=5, sparsity=0.05, seed=7)
+    want = [encoder.encode(row.tolist()) for row in embeddings[:2]]
+
+    monkeypatch.setattr(sparse, "np", None)
+    fallback = MushroomBodyEncoder(expansion_factor=5, sparsity=0.05, seed=7)
+    for row, expected in zip(embeddings[:2], want, strict=True):
+        got = fallback.encode(row.tolist())
+        np.testing.assert_allclose(got, expected, rtol=1e-12, atol=1e-15)
+        assert fallback.compute_sparsity_ratio(got) == pytest.approx(0.95)
+    with pytest.raises(ImportError):
+        MushroomBodyEncoder(projection="achlioptas")
+    with pytest.raises(ImportError):
+        fallback.encode_many([[1.0, 2.0]])
@@ -0,0 +1,202 @@
+# [C5-REAL] Exergy-Maximized
+"""Vectorized store_many: bulk inserts, one-pass ledger chain, set-based dedup."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import pytest
+
+from babylon60.database.mixins.transaction_mixin import TransactionMixin
+from babylon60.database.schema import get_all_schema
+from babylon60.engine.core import store_validators
+from babylon60.engine.core.fact_store_core import (
+    FactRecord,
+    insert_fact_record,
+    insert_fact_records,
+)
+from babylon60.engine.core.store_mixin import StoreMixin
+from babylon60.utils.canonical import compute_fact_hash, compute_tx_hash
+
+_TS = "2026-01-01T00:00:00+00:00"
+
+
+async def _schema(db) -> None:
+    for stmt in get_all_schema():
+        try:
+            await db.executescript(stmt)
+        except aiosqlite.OperationalError:
+            pass  # vec0 and other loadable modules are not available here.
+
+
+def _record(i: int, project: str = "proj", fact_type: str | None = None) -> FactRecord:
+    return FactRecord(
+        "default",
+        project,
+        f"bulk fact number {i} about storage",
+        fact_type or ("decision" if i % 2 else "knowledge"),
+        [f"t{i}", "bulk"],
+        "stated",
+        _TS,
+        "test",
+        {"cortex_taint": "taint:test"},
+        i,
+    )
+
+
+async def _rows(db, sql: str) -> list[tuple]:
+    async with db.execute(sql) as cursor:
+        return list(await cursor.fetchall())
+
+
+class _Ledger(TransactionMixin):
+    pass
+
+
+class _Store(StoreMixin, TransactionMixin):
+    """StoreMixin with the validation pipeline reduced to a pass-through."""
+
+    def __init__(self, conn) -> None:
+        self._conn = conn
+        self._guard_pipeline = None
+        self.validated: list[str] = []
+
+    @asynccontextmanager
+    async def session(self):
+        yield self._conn
+
+    async def _run_store_validation(
+        self,
+        conn,
+        project,
+        content,
+        tenant_id,
+        fact_type,
+        tags,
+        confidence,
+        source,
+        meta,
+        dedup=True,
+    ):
+        assert dedup is False
+        if "reject" in content:
+            raise ValueError("rejected by validation")
+        self.validated.append(content)
+        return None, meta, content, fact_type
+
+    async def _dispatch_post_store(self) -> None:
+        pass
+
+
+@pytest.fixture
+async def db(monkeypatch):
+    monkeypatch.setenv("CORTEX_NO_TAINT_ENFORCE", "1")
+    async with aiosqlite.connect(":memory:") as conn:
+        await _schema(conn)
+        yield conn
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_matches_single_inserts(db):
+    records = [_record(i) for i in range(1, 7)]
+    async with aiosqlite.connect(":memory:") as single:
+        await _schema(single)
+        for rec in records:
+            await insert_fact_record(single, *rec, taint_already_verified=True)
+
+        ids = await insert_fact_records(db, records, taint_already_verified=True)
+
+        assert ids == [1, 2, 3, 4, 5, 6]
+        for sql in (
+            "SELECT id, project, fact_type, hash, tags, tx_id, parent_id FROM facts ORDER BY id",
+            "SELECT fact_id, tag FROM fact_tags ORDER BY fact_id, tag",
+            "SELECT rowid FROM facts_fts ORDER BY rowid",
+            "SELECT fact_id FROM enrichment_jobs ORDER BY fact_id",
+        ):
+            assert await _rows(db, sql) == await _rows(single, sql), sql
+    # Decisions earlier in the batch become the auto-resolved parents.
+    parents = await _rows(db, "SELECT parent_id FROM facts WHERE fact_type = 'decision'")
+    assert parents == [(None,), (1,), (3,)]
+
+
+@pytest.mark.asyncio
+async def test_log_transactions_extends_the_chain_in_one_pass(db):
+    ledger = _Ledger()
+    first = await ledger._log_transaction(db, "proj", "store", {"n": 0})
+    ids = await ledger._log_transactions(db, [("proj", "store", {"n": n}) for n in range(1, 4)])
+    last = await ledger._log_transaction(db, "proj", "store", {"n": 4})
+
+    assert [first, *ids, last] == [1, 2, 3, 4, 5]
+    rows = await _rows(
+        db,
+        "SELECT project, action, detail, prev_hash, hash, timestamp FROM transactions ORDER BY id",
+    )
+    prev = "GENESIS"
+    for project, action, detail, prev_hash, tx_hash, ts in rows:
+        assert prev_hash == prev
+        assert tx_hash == compute_tx_hash(prev, project, action, detail, ts, tenant_id="default")
+        prev = tx_hash
+
+
+@pytest.mark.asyncio
+async def test_find_duplicate_hashes_chunks_the_lookup(db, monkeypatch):
+    monkeypatch.setattr(store_validators, "_DEDUP_CHUNK", 2)
+    records = [_record(i) for i in range(1, 6)]
+    await insert_fact_records(db, records, taint_already_verified=True)
+    await db.execute("UPDATE facts SET is_tombstoned = 1 WHERE id = 3")
+
+    hashes = [compute_fact_hash(rec.content) for rec in records] + ["missing"]
+    found = await store_validators.find_duplicate_hashes(db, "default", "proj", hashes)
+
+    assert found == {hashes[0]: 1, hashes[1]: 2, hashes[3]: 4, hashes[4]: 5}
+    assert await store_validators.find_duplicate_hashes(db, "default", "other", hashes) == {}
+
+
+@pytest.mark.asyncio
+async def test_store_many_dedups_set_based(db):
+    store = _Store(db)
+    existing = await store.store_many([{"project": "proj", "content": "already stored fact one"}])
+
+    ids = await store.store_many(
+        [
+            {"project": "proj", "content": "already stored fact one"},
+            {"project": "proj", "content": "a brand new fact to keep", "tags": ["x"]},
+            {"project": "proj", "content": "a brand new fact to keep"},
+            {"project": "other", "content": "a brand new fact to keep", "tenant_id": "t2"},
+        ]
+    )
+
+    assert ids == [existing[0], 2, 2, 3]
+    assert store.validated == [
+        "already stored fact one",
+        "a brand new fact to keep",
+        "a brand new fact to keep",
+    ]
+    txs = await _rows(db, "SELECT id, tenant_id, prev_hash FROM transactions ORDER BY id")
+    assert [(tx_id, tenant) for tx_id, tenant, _ in txs] == [
+        (1, "default"),
+        (2, "default"),
+        (3, "t2"),
+    ]
+    assert txs[2][2] == "GENESIS"
+    outbox = await _rows(db, "SELECT fact_id, tenant_id FROM post_store_outbox ORDER BY fact_id")
+    assert outbox == [(1, "default"), (2, "default"), (3, "t2")]
+
+
+@pytest.mark.asyncio
+async def test_store_many_is_all_or_nothing(db):
+    store = _Store(db)
+
+    with pytest.raises(ValueError):
+        await store.store_many(
+            [
+                {"project": "proj", "content": "a perfectly fine fact"},
+                {"project": "proj", "content": "please reject this one"},
+            ]
+        )
+    with pytest.raises(TypeError):
+        await store.store_many([{"project": "proj", "content": "x" * 20, "bogus": 1}])
+
+    assert await _rows(db, "SELECT COUNT(*) FROM facts") == [(0,)]
+    assert await _rows(db, "SELECT COUNT(*) FROM transactions") == [(0,)]
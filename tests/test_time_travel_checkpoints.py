@@ -0,0 +1,214 @@
+# [C5-REAL] Exergy-Maximized
+"""Time-travel fact sets: checkpoint bitmaps + delta replay vs. a full scan."""
+
+from __future__ import annotations
+
+import sqlite3
+from contextlib import asynccontextmanager
+
+import aiosqlite
+import numpy as np
+import pytest
+
+from babylon60.database.mixins.query_mixin import QueryMixin
+from babylon60.database.schema import CREATE_FACT_STATE_CHECKPOINTS, get_all_schema
+from babylon60.memory import time_travel
+from babylon60.memory.time_travel import decode_fact_bitmap, encode_fact_bitmap, live_fact_ids
+from babylon60.migrations import run_migrations
+
+_SCHEMA = """
+CREATE TABLE transactions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tenant_id TEXT NOT NULL DEFAULT 'default',
+    timestamp TEXT NOT NULL
+);
+CREATE TABLE facts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tenant_id TEXT NOT NULL DEFAULT 'default',
+    tx_id INTEGER,
+    valid_until TEXT
+);
+CREATE INDEX idx_facts_tenant_tx ON facts(tenant_id, tx_id);
+CREATE INDEX idx_facts_tenant_valid ON facts(tenant_id, valid_until);
+"""
+
+
+def _ts(i: int) -> str:
+    return f"2026-01-01T00:{i // 60:02d}:{i % 60:02d}+00:00"
+
+
+async def _reference(conn, tenant_id: str, tx_id: int) -> list[int]:
+    cursor = await conn.execute(
+        "SELECT f.id FROM facts f WHERE f.tenant_id = ? AND f.tx_id <= ? AND "
+        "(f.valid_until IS NULL OR f.valid_until > "
+        "(SELECT timestamp FROM transactions WHERE id = ?)) ORDER BY f.id",
+        (tenant_id, tx_id, tx_id),
+    )
+    return [row[0] for row in await cursor.fetchall()]
+
+
+async def _checkpoints(conn) -> list[int]:
+    cursor = await conn.execute("SELECT tx_id FROM fact_state_checkpoints ORDER BY tx_id")
+    return [row[0] for row in await cursor.fetchall()]
+
+
+@pytest.fixture
+async def ledger():
+    """40 transactions: each stores a fact; every third deprecates an older one."""
+    async with aiosqlite.connect(":memory:") as conn:
+        await conn.executescript(_SCHEMA + CREATE_FACT_STATE_CHECKPOINTS)
+        for i in range(1, 41):
+            tenant = "other" if i % 10 == 0 else "default"
+            await conn.execute(
+                "INSERT INTO transactions (tenant_id, timestamp) VALUES (?, ?)", (tenant, _ts(i))
+            )
+            await conn.execute("INSERT INTO facts (tenant_id, tx_id) VALUES (?, ?)", (tenant, i))
+            if i % 3 == 0:
+                await conn.execute(
+                    "UPDATE facts SET valid_until = ? WHERE id = ? AND valid_until IS NULL",
+                    (_ts(i), i // 2),
+                )
+        await conn.commit()
+        yield conn
+
+
+@pytest.mark.asyncio
+async def test_replay_matches_full_scan_and_checkpoints(ledger):
+    for tx_id in [5, 17, 12, 33, 39, 21, 40]:
+        tenant = "other" if tx_id % 10 == 0 else "default"
+        got = await live_fact_ids(ledger, tenant, tx_id, checkpoint_every=4)
+        assert got.tolist() == await _reference(ledger, tenant, tx_id), tx_id
+
+    assert await _checkpoints(ledger) == [5, 12, 17, 33, 39, 40]
+    # Answers served from a checkpoint and from replay agree everywhere.
+    for tx_id in range(1, 40):
+        if tx_id % 10:
+            got = await live_fact_ids(ledger, "default", tx_id)
+            assert got.tolist() == await _reference(ledger, "default", tx_id), tx_id
+
+
+@pytest.mark.asyncio
+async def test_history_rewrites_drop_stale_checkpoints(ledger):
+    for tx_id in (9, 18, 27, 36):
+        await live_fact_ids(ledger, "default", tx_id, checkpoint_every=1)
+    assert await _checkpoints(ledger) == [9, 18, 27, 36]
+
+    # Ordinary deprecation happens "now": every checkpoint stays valid.
+    await ledger.execute("UPDATE facts SET valid_until = ? WHERE id = 35", (_ts(41),))
+    assert await _checkpoints(ledger) == [9, 18, 27, 36]
+
+    # Reactivating fact 12 (deprecated at tx 24) rewrites history from then on.
+    await ledger.execute("UPDATE facts SET valid_until = NULL WHERE id = 12")
+    assert await _checkpoints(ledger) == [9, 18]
+    assert 12 in (await live_fact_ids(ledger, "default", 31)).tolist()
+
+    # A back-dated insert invalidates checkpoints at or after its tx.
+    await ledger.execute("INSERT INTO facts (tenant_id, tx_id) VALUES ('default', 11)")
+    assert await _checkpoints(ledger) == [9]
+
+
+@pytest.mark.asyncio
+async def test_unknown_transaction_raises(ledger):
+    with pytest.raises(ValueError):
+        await live_fact_ids(ledger, "other", 5)
+
+
+def test_bitmap_roundtrip():
+    live = np.zeros(70, dtype=bool)
+    live[[0, 7, 8, 69]] = True
+
+    assert np.flatnonzero(decode_fact_bitmap(encode_fact_bitmap(live))).tolist() == [0, 7, 8, 69]
+
+
+@pytest.mark.asyncio
+async def test_pure_python_replay_matches_numpy(ledger, monkeypatch):
+    expected = {tx: (await live_fact_ids(ledger, "default", tx)).tolist() for tx in (7, 23, 39)}
+    live = np.zeros(70, dtype=bool)
+    live[[0, 7, 8, 69]] = True
+    blob = encode_fact_bitmap(live)
+
+    monkeypatch.setattr(time_travel, "np", None)
+    assert encode_fact_bitmap(bytearray(live.tobytes())) == blob
+    assert [i for i, flag in enumerate(decode_fact_bitmap(blob)) if flag] == [0, 7, 8, 69]
+    await live_fact_ids(ledger, "default", 18, checkpoint_every=1)
+    for tx_id, ids in expected.items():
+        assert await live_fact_ids(ledger, "default", tx_id, checkpoint_every=1) == ids, tx_id
+
+
+class _Query(QueryMixin):
+    def __init__(self, conn) -> None:
+        self._conn = conn
+
+    @asynccontextmanager
+    async def session(self):
+        yield self._conn
+
+
+@pytest.mark.asyncio
+async def test_snapshots_skip_tombstoned_facts_and_other_projects():
+    async with aiosqlite.connect(":memory:") as conn:
+        for stmt in get_all_schema():
+            try:
+                await conn.executescript(stmt)
+            except aiosqlite.OperationalError:
+                pass  # vec0 and other loadable modules are not available here.
+        for i, project in enumerate(["alpha", "beta", "alpha", "alpha"], start=1):
+            await conn.execute(
+                "INSERT INTO transactions (project, action, detail, prev_hash, hash, timestamp)"
+                " VALUES (?, 'store', '{}', 'p', ?, ?)",
+                (project, f"h{i}", _ts(i)),
+            )
+            await conn.execute(
+                "INSERT INTO facts (project, content, fact_type, tags, valid_from, tx_id, metadata)"
+                " VALUES (?, ?, 'knowledge', '[]', ?, ?, '{\"cortex_taint\": \"taint:test\"}')",
+                (project, f"fact {i}", _ts(i), i),
+            )
+        # Apoptosis tombstones without touching valid_until.
+        await conn.execute("UPDATE facts SET is_tombstoned = 1 WHERE id = 3")
+        await conn.commit()
+        engine = _Query(conn)
+
+        assert [f["id"] for f in await engine.time_travel(tx_id=4)] == [1, 2, 4]
+        assert [f["id"] for f in await engine.reconstruct_state("alpha", tx_id=3)] == [1]
+        assert [f["id"] for f in await engine.reconstruct_state("alpha", tx_id=4)] == [1, 4]
+
+
+def test_migration_033_promotes_metadata_fields():
+    conn = sqlite3.connect(":memory:")
+    conn.executescript("""
+        CREATE TABLE schema_version (
+            version INTEGER PRIMARY KEY,
+            applied_at TEXT DEFAULT (datetime('now')),
+            description TEXT
+        );
+        INSERT INTO schema_version (version, description) VALUES (32, 'pre time travel');
+        CREATE TABLE facts (
+            id INTEGER PRIMARY KEY,
+            tenant_id TEXT DEFAULT 'default',
+            metadata TEXT,
+            is_tombstoned INTEGER NOT NULL DEFAULT 0,
+            tx_id INTEGER,
+            valid_until TEXT
+        );
+        INSERT INTO facts (id, metadata, is_tombstoned, tx_id, valid_until) VALUES
+            (1, '{"tx_id": 7, "valid_until": "2026-02-01"}', 0, NULL, NULL),
+            (2, '{"tx_id": 8, "tombstoned_at": "2026-03-01"}', 1, 3, NULL),
+            (3, '{"tombstoned_at": "2026-03-01"}', 0, NULL, NULL),
+            (4, 'v6_aesgcm:opaque', 1, NULL, NULL);
+    """)
+
+    run_migrations(conn)
+
+    rows = conn.execute("SELECT id, tx_id, valid_until FROM facts ORDER BY id").fetchall()
+    assert rows == [
+        (1, 7, "2026-02-01"),
+        (2, 3, "2026-03-01"),  # an existing column value wins
+        (3, None, None),  # tombstoned_at only counts for tombstoned rows
+        (4, None, None),
+    ]
+    indexes = {row[1] for row in conn.execute("PRAGMA index_list(facts)").fetchall()}
+    assert {"idx_facts_tenant_tx", "idx_facts_tenant_valid"} <= indexes
+    triggers = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='trigger'")
+    }
+    assert {"trg_fact_checkpoints_insert", "trg_fact_checkpoints_update"} <= triggers
@@ -191,3 +191,67 @@ class TestCheckpoint:
         w = SqliteWriteWorker(db_path)
         result = await w.checkpoint()
         assert isinstance(result, Err)
+
+
+# ─── Group Commit ─────────────────────────────────────────────────────
+
+
+class TestGroupCommit:
+    @pytest.fixture
+    async def group_writer(self, db_path: str):
+        w = SqliteWriteWorker(db_path, queue_size=100, group_commit=True, group_max_wait_ms=20)
+        await w.start()
+        yield w
+        await w.stop()
+
+    async def test_concurrent_writes_share_one_commit(self, group_writer: SqliteWriteWorker):
+        import asyncio
+
+        from babylon60.telemetry.metrics import metrics
+
+        before = len(metrics._histograms.get("cortex_db_writer_batch_size", ()))
+        results = await asyncio.gather(
+            *(
+                group_writer.execute("INSERT INTO items (name, value) VALUES (?, ?)", (f"g{i}", i))
+                for i in range(20)
+            )
+        )
+        assert all(isinstance(r, Ok) and r.value == 1 for r in results)
+        sizes = list(metrics._histograms["cortex_db_writer_batch_size"])[before:]
+        assert sum(sizes) == 20
+        assert max(sizes) > 1
+        assert group_writer.metrics["total_ops"] == 20
+
+    async def test_failing_op_only_fails_its_own_future(self, group_writer: SqliteWriteWorker):
+        import asyncio
+        import sqlite3
+
+        results = await asyncio.gather(
+            group_writer.execute("INSERT INTO items (name) VALUES (?)", ("before",)),
+            group_writer.execute("INSERT INTO nonexistent_table VALUES (?)", ("boom",)),
+            group_writer.execute("INSERT INTO items (name) VALUES (?)", (None,)),
+            group_writer.execute("INSERT INTO items (name) VALUES (?)", ("after",)),
+        )
+        assert [type(r) for r in results] == [Ok, Err, Err, Ok]
+
+        conn = sqlite3.connect(group_writer._db_path)
+        names = {row[0] for row in conn.execute("SELECT name FROM items")}
+        conn.close()
+        assert names == {"before", "after"}
+
+    async def test_transaction_is_not_grouped(self, group_writer: SqliteWriteWorker):
+        import sqlite3
+
+        try:
+            async with group_writer.transaction() as tx:
+                await tx.execute("INSERT INTO items (name) VALUES (?)", ("tx_row",))
+                raise ValueError("Simulated error")
+        except ValueError:
+            pass
+        result = await group_writer.execute("INSERT INTO items (name) VALUES (?)", ("solo",))
+        assert isinstance(result, Ok)
+
+        conn = sqlite3.connect(group_writer._db_path)
+        names = {row[0] for row in conn.execute("SELECT name FROM items")}
+        conn.close()
+        assert names == {"solo"}
@@ -124,9 +124,9 @@ async def test_ledger_concurrency_bombing(ledger_db):
 
             # Verify cryptographic integrity of the block
             batch_audit_ids = [row[0] for row in block]
-            from babylon60.audit.smt import SparseMerkleTree
+            from babylon60.audit.smt import LegacyPathTree
 
-            local_smt = SparseMerkleTree()
+            local_smt = LegacyPathTree()
             for aid in batch_audit_ids:
                 local_smt.update(hashlib.sha256(aid.encode()).hexdigest(), aid)
             merkle_root = local_smt.root